@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Excel JXA Runner
+Runs a JXA program against Microsoft Excel with JSON in and JSON out
+
+Programs go through the shared jxa_runner with `Excel` bound to the
+application; this module keeps the Excel helpers on top of it.
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# The osascript runner is shared by every skill
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+import jxa_runner
+
+
+# Shared helpers for workbooks, performance mode, A1 addresses and block reads
+WORKBOOK_JXA = '''
+function findWorkbook(path) {
+    return Excel.workbooks().find(wb => {
+        try { return wb.fullName() === path; } catch (e) { return false; }
+    });
+}
+
+function openWorkbook(path) {
+    // Reuses the workbook when the file is already open in Excel
+    return findWorkbook(path) || Excel.openWorkbook({workbookFileName: path});
+}
+
+function findSheet(wb, name) {
+    if (!name) return wb.worksheets[0];
+    const sheet = wb.worksheets.byName(name);
+    try { sheet.name(); return sheet; } catch (e) { return null; }
+}
+
+function fastMode() {
+    // Returns the previous settings for restoreMode
+    const state = {screen: Excel.screenUpdating(), alerts: Excel.displayAlerts(), calc: Excel.calculation()};
+    Excel.screenUpdating = false;
+    Excel.displayAlerts = false;
+    Excel.calculation = -4135;
+    return state;
+}
+
+function restoreMode(state) {
+    if (!state) return;
+    Excel.calculation = state.calc;
+    Excel.displayAlerts = state.alerts;
+    Excel.screenUpdating = state.screen;
+}
+
+function colName(n) {
+    let name = "";
+    for (; n > 0; n = Math.floor((n - 1) / 26)) name = String.fromCharCode(65 + (n - 1) % 26) + name;
+    return name;
+}
+
+function address(r0, c0, r1, c1) {
+    return colName(c0) + r0 + ":" + colName(c1) + r1;
+}
+
+function encodeValue(v) {
+    // Dates are tagged so they can't be confused with strings on the Python side
+    if (v instanceof Date) return {"$date": v.toISOString()};
+    return v === undefined ? null : v;
+}
+
+function readRange(ws, r0, r1, c0, c1) {
+    // One Apple Event for the whole block; a single cell comes back as a scalar
+    let values = ws.ranges[address(r0, c0, r1, c1)].value();
+    if (!Array.isArray(values)) values = [[values]];
+    else if (!Array.isArray(values[0])) values = [values];
+    return values.map(row => row.map(encodeValue));
+}
+'''
+
+# Excel stores dates as days since 1899-12-30 (the 1900 date system)
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+def column_name(index):
+    """Spreadsheet column letters for a 1-based column index: 1 -> A, 27 -> AA"""
+    name = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+def excel_serial(value):
+    """Convert a datetime to an Excel serial date number"""
+    return (value - EXCEL_EPOCH) / timedelta(days=1)
+
+
+def decode_value(value):
+    """Turn a JSON cell value into a Python value: tagged dates become datetimes"""
+    if isinstance(value, dict) and "$date" in value:
+        return datetime.fromisoformat(value["$date"].replace("Z", "+00:00")).astimezone().replace(tzinfo=None)
+    return value
+
+
+def run_jxa(script, payload=None, timeout=120):
+    """Run `script` (which defines main(payload)) against Microsoft Excel and return its JSON result"""
+    return jxa_runner.run_jxa("Microsoft Excel", script, payload, timeout)
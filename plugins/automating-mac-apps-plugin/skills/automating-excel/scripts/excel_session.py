@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Excel Session Pool
+Keeps one Excel session and a bounded set of open workbooks for batch jobs
+
+ExcelSession launches Excel once, switches screen updating, alerts and
+calculation off for the whole job, and keeps up to `max_open` workbooks
+open. When another workbook is needed, the least recently used one that
+the session opened is saved (if it was written to) and closed. Workbooks
+the user already had open are used but never closed. Opens, reads, writes
+and saves take lists, so each call is one osascript run (one launch of
+the JXA runtime) no matter how many workbooks or ranges it touches.
+
+    with ExcelSession(max_open=4) as excel:
+        excel.open_many(["a.xlsx", "b.xlsx"])
+        values = excel.read_many([("a.xlsx", "Sheet1", "A1:C10"), ("b.xlsx", "Data", None)])
+        excel.write_many([("a.xlsx", "Totals", 1, [["Total", 42]])])
+    # written workbooks are saved, opened ones closed, Excel settings restored
+
+Usage: python excel_session.py "workbook.xlsx" [more.xlsx ...] [--max-open 8]    (lists each workbook's sheets)
+"""
+
+import sys
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+
+from excel_jxa import WORKBOOK_JXA, decode_value, excel_serial, run_jxa
+
+DEFAULT_MAX_OPEN = 8
+
+SESSION_START_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    Excel.launch();
+    const open = [];
+    Excel.workbooks().forEach(wb => {
+        try { open.push(wb.fullName()); } catch (e) {}
+    });
+    return {state: fastMode(), open: open};
+}
+'''
+
+SESSION_END_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    restoreMode(p.state);
+    return true;
+}
+'''
+
+OPEN_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    return p.workbooks.map(w => {
+        let wb = findWorkbook(w.path);
+        if (!wb && w.create) {
+            wb = Excel.Workbook().make();
+            while (wb.worksheets.length < w.sheets) Excel.make({new: "worksheet", at: wb});
+            wb.saveWorkbookAs({filename: w.path});
+        } else if (!wb) {
+            wb = openWorkbook(w.path);
+        }
+        return {workbook: wb.name(), sheets: wb.worksheets().map(ws => ws.name())};
+    });
+}
+'''
+
+READ_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    return p.reads.map(r => {
+        const ws = findSheet(Excel.workbooks.byName(r.workbook), r.sheet);
+        if (!ws) throw new Error("No sheet " + r.sheet + " in " + r.workbook);
+        let values = (r.range ? ws.ranges[r.range] : ws.usedRange).value();
+        if (!Array.isArray(values)) values = [[values]];
+        else if (!Array.isArray(values[0])) values = [values];
+        return values.map(row => row.map(encodeValue));
+    });
+}
+'''
+
+WRITE_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    p.writes.forEach(w => {
+        const wb = Excel.workbooks.byName(w.workbook);
+        let ws = findSheet(wb, w.sheet);
+        if (!ws) {
+            ws = Excel.make({new: "worksheet", at: wb});
+            ws.name = w.sheet;
+        }
+        // One Apple Event per block; the array must match the range shape
+        const r1 = w.first_row + w.rows.length - 1, c1 = w.first_column + w.rows[0].length - 1;
+        ws.ranges[address(w.first_row, w.first_column, r1, c1)].value = w.rows;
+    });
+    return p.writes.length;
+}
+'''
+
+SAVE_JXA = '''
+function main(p) {
+    p.workbooks.forEach(name => Excel.workbooks.byName(name).save());
+    return p.workbooks.length;
+}
+'''
+
+CLOSE_JXA = '''
+function main(p) {
+    p.workbooks.forEach(w => Excel.workbooks.byName(w.workbook).close({saving: w.save ? "yes" : "no"}));
+    return p.workbooks.length;
+}
+'''
+
+
+def json_rows(rows):
+    """Pad rows to a rectangle and turn datetimes into Excel serials for JSON"""
+    width = max(len(row) for row in rows)
+    return [[excel_serial(v) if isinstance(v, datetime) else ("" if v is None else v) for v in row]
+            + [""] * (width - len(row)) for row in rows]
+
+
+class ExcelSession:
+    """One Excel session holding at most `max_open` workbooks, least recently used closed first"""
+
+    def __init__(self, max_open=DEFAULT_MAX_OPEN, timeout=300):
+        self.max_open = max(1, max_open)
+        self.timeout = timeout
+        self.state = None
+        self.user_open = set()
+        # path -> {"workbook": name in Excel, "sheets": [...], "dirty": bool, "owned": bool}, oldest first
+        self.workbooks = OrderedDict()
+
+    def __enter__(self):
+        started = run_jxa(SESSION_START_JXA, timeout=self.timeout)
+        self.state = started["state"]
+        self.user_open = set(started["open"])
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        try:
+            self.close_all(save=exc_type is None)
+        finally:
+            run_jxa(SESSION_END_JXA, {"state": self.state})
+        return False
+
+    def _touch(self, path):
+        self.workbooks.move_to_end(path)
+        return self.workbooks[path]
+
+    def _evict(self, incoming, keep):
+        """Close least recently used workbooks so `incoming` more fit under max_open"""
+        owned = [path for path, info in self.workbooks.items() if info["owned"] and path not in keep]
+        excess = sum(1 for info in self.workbooks.values() if info["owned"]) + incoming - self.max_open
+        if excess > 0:
+            self.close(owned[:excess])
+
+    def open_many(self, paths, create=False, sheet_count=1):
+        """Make sure every workbook in `paths` is open (one call for all new ones); returns their info
+
+        With create=True, missing files are created as new workbooks with `sheet_count` sheets.
+        """
+        paths = [str(Path(p).resolve()) for p in paths]
+        if len(set(paths)) > self.max_open:
+            raise ValueError(f"Cannot hold {len(set(paths))} workbooks open at once (max_open={self.max_open})")
+        missing = list(OrderedDict.fromkeys(p for p in paths if p not in self.workbooks))
+        if missing:
+            owned_missing = [p for p in missing if p not in self.user_open]
+            self._evict(len(owned_missing), keep=set(paths))
+            opened = run_jxa(OPEN_JXA, {"workbooks": [{"path": p, "create": create and not Path(p).exists(),
+                                                       "sheets": sheet_count} for p in missing]},
+                             timeout=self.timeout)
+            for path, info in zip(missing, opened):
+                self.workbooks[path] = {"workbook": info["workbook"], "sheets": info["sheets"],
+                                        "dirty": False, "owned": path not in self.user_open}
+        return [self._touch(p) for p in paths]
+
+    def open(self, path, create=False, sheet_count=1):
+        """Open one workbook (or reuse it if already held); returns its info"""
+        return self.open_many([path], create, sheet_count)[0]
+
+    def read_many(self, reads):
+        """Read (path, sheet, range) tuples in one call; range None reads the used range"""
+        infos = self.open_many([path for path, _, _ in reads])
+        blocks = run_jxa(READ_JXA, {"reads": [{"workbook": info["workbook"], "sheet": sheet, "range": cell_range}
+                                              for info, (_, sheet, cell_range) in zip(infos, reads)]},
+                         timeout=self.timeout)
+        return [[[decode_value(v) for v in row] for row in block] for block in blocks]
+
+    def read(self, path, sheet=None, cell_range=None):
+        """Read one range (or the used range) of a sheet"""
+        return self.read_many([(path, sheet, cell_range)])[0]
+
+    def write_many(self, writes):
+        """Write (path, sheet, first_row, rows[, first_column]) blocks in one call"""
+        writes = [w for w in writes if w[3]]
+        if not writes:
+            return 0
+        infos = self.open_many([w[0] for w in writes])
+        payload = [{"workbook": info["workbook"], "sheet": w[1], "first_row": w[2], "rows": json_rows(w[3]),
+                    "first_column": w[4] if len(w) > 4 else 1} for info, w in zip(infos, writes)]
+        run_jxa(WRITE_JXA, {"writes": payload}, timeout=self.timeout)
+        for info, w in zip(infos, writes):
+            info["dirty"] = True
+            if w[1] not in info["sheets"]:
+                info["sheets"].append(w[1])
+        return len(writes)
+
+    def write(self, path, sheet, first_row, rows, first_column=1):
+        """Write one block of rows starting at (first_row, first_column)"""
+        return self.write_many([(path, sheet, first_row, rows, first_column)])
+
+    def save(self, paths=None):
+        """Save the given (default: every written) workbooks in one call; returns how many were saved"""
+        paths = [str(Path(p).resolve()) for p in paths] if paths is not None else list(self.workbooks)
+        dirty = [p for p in paths if p in self.workbooks and self.workbooks[p]["dirty"]]
+        if dirty:
+            run_jxa(SAVE_JXA, {"workbooks": [self.workbooks[p]["workbook"] for p in dirty]}, timeout=self.timeout)
+            for path in dirty:
+                self.workbooks[path]["dirty"] = False
+        return len(dirty)
+
+    def close(self, paths, save=True):
+        """Close workbooks the session opened (saving written ones); user-opened ones are only released"""
+        paths = [str(Path(p).resolve()) for p in paths]
+        closing = [p for p in paths if p in self.workbooks and self.workbooks[p]["owned"]]
+        if save:
+            self.save([p for p in paths if p in self.workbooks and not self.workbooks[p]["owned"]])
+        if closing:
+            run_jxa(CLOSE_JXA, {"workbooks": [{"workbook": self.workbooks[p]["workbook"],
+                                               "save": save and self.workbooks[p]["dirty"]} for p in closing]},
+                    timeout=self.timeout)
+        for path in paths:
+            self.workbooks.pop(path, None)
+
+    def close_all(self, save=True):
+        """Close every workbook the session opened"""
+        self.close(list(self.workbooks), save)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    paths = [arg for i, arg in enumerate(args)
+             if not arg.startswith('--') and (i == 0 or args[i - 1] != '--max-open')]
+    if not paths:
+        print("Usage: python excel_session.py 'workbook.xlsx' [more.xlsx ...] [--max-open 8]")
+        sys.exit(1)
+
+    max_open = DEFAULT_MAX_OPEN
+    for i, arg in enumerate(args):
+        if arg.startswith('--max-open'):
+            max_open = int(arg.split('=', 1)[1] if '=' in arg else args[i + 1])
+
+    try:
+        with ExcelSession(max_open) as excel:
+            for path in paths:
+                info = excel.open(path)
+                print(f"{Path(path).name}: {', '.join(info['sheets'])}")
+        sys.exit(0)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
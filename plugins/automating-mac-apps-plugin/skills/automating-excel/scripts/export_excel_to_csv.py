@@ -1,57 +1,238 @@
 #!/usr/bin/env python3
 """
-Export Excel to CSV Script - PyXA Implementation
-Exports Excel worksheets to CSV files
+Export Excel to CSV Script - JXA Implementation
+Exports every worksheet of an Excel workbook to its own CSV file
 
-Usage: python export_excel_to_csv.py "workbook.xlsx" [output_directory]
+The workbook is opened once and each sheet's used range is read in blocks
+of rows (one Apple Event per block) and written with the csv module as it
+arrives. Every sheet gets a UTF-8, RFC 4180 file without activating it or
+re-saving the workbook. Given a folder, all workbooks in it are exported
+in the same Excel session, with screen updating and calculation off
+until the batch ends. Timings are printed per sheet and per workbook.
+
+With --native, .xlsx/.xlsm files are read directly with xlsx_stream
+(no Excel, works on any OS, constant memory); cached formula results are
+exported and legacy .xls files are not supported.
+
+An output.csv target is only accepted for a single workbook; a folder
+needs an output directory.
+
+Usage: python export_excel_to_csv.py "workbook.xlsx"|folder [output_directory|output.csv] [--chunk 5000] [--native]
 """
 
-import sys
+import csv
 import os
-import subprocess
+import sys
+import time
+from datetime import datetime
 from pathlib import Path
 
-def export_excel_to_csv(excel_file, output_dir=None):
-    """Export Excel workbook to CSV files using AppleScript"""
+from excel_jxa import WORKBOOK_JXA, decode_value, run_jxa
+
+EXCEL_SUFFIXES = (".xlsx", ".xlsm", ".xls")
+
+DEFAULT_CHUNK_ROWS = 5000
+
+SESSION_START_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    return fastMode();
+}
+'''
+
+SESSION_END_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    restoreMode(p.state);
+    return true;
+}
+'''
+
+LAYOUT_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    const wasOpen = !!findWorkbook(p.path);
+    const wb = openWorkbook(p.path);
+    return {
+        was_open: wasOpen,
+        workbook: wb.name(),
+        sheets: wb.worksheets().map(ws => {
+            // Sizes are measured from A1 so exported rows and columns line up with the sheet
+            const used = ws.usedRange;
+            const rows = used.firstRowIndex() + used.rows.length - 1;
+            const columns = used.firstColumnIndex() + used.columns.length - 1;
+            const empty = rows === 1 && columns === 1 && ws.ranges["A1"].value() === "";
+            return {name: ws.name(), rows: empty ? 0 : rows, columns: empty ? 0 : columns};
+        }),
+    };
+}
+'''
+
+READ_BLOCK_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    const ws = Excel.workbooks.byName(p.workbook).worksheets.byName(p.sheet);
+    return readRange(ws, p.first_row, p.last_row, 1, p.columns);
+}
+'''
+
+CLOSE_WORKBOOK_JXA = '''
+function main(p) {
+    Excel.workbooks.byName(p.workbook).close({saving: "no"});
+    return true;
+}
+'''
+
+
+class ExcelWorkbook:
+    """A workbook opened for reading; closes it on exit unless it was already open"""
+
+    def __init__(self, file_path):
+        self.path = str(Path(file_path).resolve())
+        self.layout = None
+
+    def __enter__(self):
+        self.layout = run_jxa(LAYOUT_JXA, {"path": self.path}, timeout=300)
+        return self
+
+    def __exit__(self, *exc):
+        if self.layout is not None and not self.layout["was_open"]:
+            try:
+                run_jxa(CLOSE_WORKBOOK_JXA, {"workbook": self.layout["workbook"]})
+            except Exception as e:
+                print(f"Warning: could not close workbook: {e}")
+        return False
+
+    def sheets(self):
+        """Return [{name, rows, columns}] for every worksheet"""
+        return self.layout["sheets"]
+
+    def iter_rows(self, sheet, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """Yield the typed rows of one sheet, reading `chunk_rows` rows per call"""
+        for first in range(1, sheet["rows"] + 1, chunk_rows):
+            for row in self.read_block(sheet, first, min(first + chunk_rows - 1, sheet["rows"])):
+                yield [decode_value(value) for value in row]
+
+    def read_block(self, sheet, first_row, last_row):
+        """Return the raw values of rows first_row..last_row (one Apple Event)"""
+        return run_jxa(READ_BLOCK_JXA, {"workbook": self.layout["workbook"], "sheet": sheet["name"],
+                                        "first_row": first_row, "last_row": last_row,
+                                        "columns": sheet["columns"]}, timeout=300)
+
+
+def csv_value(value):
+    """Format a typed cell value for CSV"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d") if value.time() == datetime.min.time() else value.isoformat(sep=" ")
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def csv_path_for(excel_file, sheet_name, output, sheet_count):
+    """CSV path for one sheet: <output>/<workbook>-<sheet>.csv, or `output` itself for a single sheet"""
+    safe_sheet = sheet_name.replace(os.sep, "-").replace(":", "-")
+    if output.lower().endswith(".csv"):
+        return output if sheet_count == 1 else f"{output[:-4]}-{safe_sheet}.csv"
+    return os.path.join(output, f"{Path(excel_file).stem}-{safe_sheet}.csv")
+
+
+def export_workbook(excel_file, output, chunk_rows=DEFAULT_CHUNK_ROWS, workbook_class=ExcelWorkbook):
+    """Export every sheet of one workbook; returns [(sheet, csv path, rows, seconds)]"""
+    results = []
+    with workbook_class(excel_file) as workbook:
+        sheets = workbook.sheets()
+        for sheet in sheets:
+            started = time.monotonic()
+            target = csv_path_for(excel_file, sheet["name"], output, len(sheets))
+            written = 0
+            with open(target, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                for row in workbook.iter_rows(sheet, chunk_rows):
+                    writer.writerow([csv_value(v) for v in row])
+                    written += 1
+            results.append((sheet["name"], target, written, time.monotonic() - started))
+    return results
+
+
+def find_workbooks(folder):
+    """Excel workbooks in a folder, skipping Office lock files (~$name.xlsx)"""
+    return sorted(p for p in Path(folder).iterdir()
+                  if p.suffix.lower() in EXCEL_SUFFIXES and not p.name.startswith("~$"))
+
+
+def export_excel_to_csv(excel_file, output_dir=None, chunk_rows=DEFAULT_CHUNK_ROWS, native=False):
+    """Export every worksheet of a workbook (or of every workbook in a folder) to CSV"""
     try:
-        abs_input = str(Path(excel_file).resolve())
-        
-        # Set output directory
-        if not output_dir:
-            output_dir = os.path.dirname(abs_input) or "."
-        
-        abs_output_dir = str(Path(output_dir).resolve())
-        os.makedirs(abs_output_dir, exist_ok=True)
-
-        # In integration tests, output_dir might be a filename or a directory
-        if output_dir.endswith('.csv'):
-            abs_output_csv = str(Path(output_dir).resolve())
+        if os.path.isdir(excel_file):
+            if output_dir and output_dir.lower().endswith(".csv"):
+                # Every workbook would write the same file
+                print(f"Output for a folder must be a directory, not a .csv file: {output_dir}")
+                return False
+            files = find_workbooks(excel_file)
+            output = output_dir or excel_file
+        else:
+            files = [Path(excel_file)]
+            output = output_dir or (os.path.dirname(str(Path(excel_file).resolve())) or ".")
+
+        if not files:
+            print(f"No Excel workbooks found in {excel_file}")
+            return False
+        os.makedirs(os.path.dirname(os.path.abspath(output)) if output.lower().endswith(".csv") else output,
+                    exist_ok=True)
+
+        if native:
+            from xlsx_stream import XlsxWorkbook
+            workbook_class = XlsxWorkbook
         else:
-            abs_output_csv = os.path.join(abs_output_dir, "ExportedData.csv")
-
-        script = f'''
-        tell application "Microsoft Excel"
-            set wb to open (POSIX file "{abs_input}")
-            save as wb filename (POSIX file "{abs_output_csv}") file format CSV file format
-            close wb saving no
-        end tell
-        '''
-        
-        subprocess.run(["osascript", "-e", script], check=True, timeout=30)
-        print(f"Successfully exported to CSV: {abs_output_csv}")
-        return True
+            workbook_class = ExcelWorkbook
+
+        batch_started = time.monotonic()
+        state = None if native else run_jxa(SESSION_START_JXA)
+        failed = 0
+        try:
+            for path in files:
+                started = time.monotonic()
+                try:
+                    results = export_workbook(path, output, chunk_rows, workbook_class)
+                except Exception as e:
+                    failed += 1
+                    print(f"Failed: {path}: {e}")
+                    continue
+                for sheet_name, target, rows, seconds in results:
+                    print(f"  {sheet_name}: {rows} rows -> {target} ({seconds:.2f}s)")
+                print(f"Successfully exported to CSV: {path} ({len(results)} sheet(s), "
+                      f"{time.monotonic() - started:.2f}s)")
+        finally:
+            if not native:
+                run_jxa(SESSION_END_JXA, {"state": state})
+
+        if len(files) > 1:
+            print(f"Exported {len(files) - failed} of {len(files)} workbooks in "
+                  f"{time.monotonic() - batch_started:.1f}s")
+        return failed == 0
 
     except Exception as e:
         print(f"Export failed: {e}")
         return False
 
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python export_excel_to_csv.py 'workbook.xlsx' [output_directory]")
+    args = sys.argv[1:]
+    positional = [arg for i, arg in enumerate(args)
+                  if not arg.startswith('--') and (i == 0 or args[i - 1] != '--chunk')]
+    if not positional:
+        print("Usage: python export_excel_to_csv.py 'workbook.xlsx'|folder [output_directory|output.csv] "
+              "[--chunk 5000] [--native]")
         sys.exit(1)
 
-    excel_file = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    chunk_rows = DEFAULT_CHUNK_ROWS
+    for i, arg in enumerate(args):
+        if arg.startswith('--chunk'):
+            chunk_rows = int(arg.split('=', 1)[1] if '=' in arg else args[i + 1])
+
+    excel_file = positional[0]
+    output_dir = positional[1] if len(positional) > 1 else None
 
-    success = export_excel_to_csv(excel_file, output_dir)
+    success = export_excel_to_csv(excel_file, output_dir, chunk_rows, native='--native' in args)
     sys.exit(0 if success else 1)
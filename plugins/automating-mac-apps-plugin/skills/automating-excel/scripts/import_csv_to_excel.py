@@ -1,92 +1,279 @@
 #!/usr/bin/env python3
 """
-Import CSV to Excel Script - PyXA Implementation
+Import CSV to Excel Script - JXA Implementation
 Imports CSV data into Excel worksheets
 
-Usage: python import_csv_to_excel.py "input.csv" "output.xlsx" [sheet_name]
+The CSV is streamed: only one block of rows is in memory at a time, and
+each block is assigned to a range value (`range "A2:F5001"`) in one Apple
+Event, with screen updating and calculation off. Column types are
+inferred once from the first INFER_ROWS data rows: numbers, booleans and
+ISO dates are sent as values (dates as serial numbers with a date format)
+and other columns are formatted as text, so "00123" or "1-2" are not
+reinterpreted by Excel.
+
+With --native, Excel is not used: xlsx_stream writes a new workbook
+holding just the imported sheet, row by row, on any OS and in constant
+memory. An existing output file is replaced rather than added to.
+
+Usage: python import_csv_to_excel.py "input.csv" "output.xlsx" [sheet_name] [--chunk 5000] [--no-header] [--native]
 """
 
-import sys
 import csv
-import PyXA
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from itertools import chain, islice
+from pathlib import Path
 
-def import_csv_to_excel(csv_file, excel_file, sheet_name="Data"):
-    """Import CSV data into Excel worksheet"""
-    try:
-        excel = PyXA.Application("Microsoft Excel")
+from excel_jxa import WORKBOOK_JXA, excel_serial, run_jxa
+
+DEFAULT_CHUNK_ROWS = 5000
+
+# Data rows sampled to decide each column's type
+INFER_ROWS = 500
+
+NUMBER_PATTERN = re.compile(r"^-?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$")
+DATE_FORMATS = ("%Y-%m-%d", "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%dT%H:%M:%S")
+
+# Excel number format applied per inferred column type (None: leave as is)
+COLUMN_FORMATS = {"number": None, "boolean": None, "general": None, "date": "yyyy-mm-dd",
+                  "datetime": "yyyy-mm-dd hh:mm:ss", "text": "@"}
+
+PREPARE_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    const state = fastMode();
+    try {
+        let wb = findWorkbook(p.path), created = false;
+        if (!wb && p.exists) wb = openWorkbook(p.path);
+        if (!wb) {
+            wb = Excel.Workbook().make();
+            created = true;
+        }
+
+        let ws = findSheet(wb, p.sheet);
+        if (!ws) {
+            // A new workbook's only sheet is renamed rather than added to
+            ws = created ? wb.worksheets[0] : Excel.make({new: "worksheet", at: wb});
+            ws.name = p.sheet;
+        } else {
+            Excel.clearContents(ws.usedRange);
+        }
 
-        # Create new workbook or open existing
+        p.formats.forEach((format, i) => {
+            if (format) ws.ranges[colName(i + 1) + ":" + colName(i + 1)].numberFormat = format;
+        });
+        if (created) wb.saveWorkbookAs({filename: p.path});
+        return {workbook: wb.name(), state: state};
+    } catch (e) {
+        restoreMode(state);
+        throw e;
+    }
+}
+'''
+
+WRITE_BLOCK_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    const ws = Excel.workbooks.byName(p.workbook).worksheets.byName(p.sheet);
+    // One Apple Event for the whole block; the array must match the range shape
+    ws.ranges[address(p.first_row, 1, p.first_row + p.rows.length - 1, p.rows[0].length)].value = p.rows;
+    return p.rows.length;
+}
+'''
+
+FINISH_JXA = WORKBOOK_JXA + '''
+function main(p) {
+    try {
+        const wb = Excel.workbooks.byName(p.workbook);
+        if (p.autofit) {
+            try { Excel.autofit(wb.worksheets.byName(p.sheet).usedRange.columns); } catch (e) {}
+        }
+        if (p.save) wb.save();
+    } finally {
+        restoreMode(p.state);
+    }
+    return true;
+}
+'''
+
+
+def parse_date(value):
+    """Parse an ISO date or date-time string, or return None"""
+    for date_format in DATE_FORMATS:
         try:
-            workbook = excel.open(excel_file)
-        except:
-            workbook = excel.workbooks().push({
-                "name": excel_file.split('/')[-1].replace('.xlsx', '')
-            })
-
-        # Add or get worksheet
-        worksheets = workbook.worksheets()
-        target_sheet = None
-
-        # Try to find existing sheet
-        for sheet in worksheets:
-            if sheet.name() == sheet_name:
-                target_sheet = sheet
-                break
-
-        # Create new sheet if not found
-        if not target_sheet:
-            target_sheet = workbook.worksheets().push({"name": sheet_name})
-
-        # Read CSV data
-        csv_data = []
-        with open(csv_file, 'r', encoding='utf-8') as f:
+            return datetime.strptime(value, date_format)
+        except ValueError:
+            continue
+    return None
+
+
+def is_number(value):
+    """True for plain decimal numbers; leading zeros ("007") stay text"""
+    if not NUMBER_PATTERN.match(value):
+        return False
+    digits = value.lstrip("-")
+    return not (len(digits) > 1 and digits[0] == "0" and digits[1].isdigit())
+
+
+def infer_column_types(rows, width):
+    """Pick number, boolean, date, datetime, text or general (all blank) per column"""
+    types = []
+    for column in range(width):
+        values = [row[column].strip() for row in rows if column < len(row) and row[column].strip()]
+        if not values:
+            types.append("general")
+        elif all(is_number(v) for v in values):
+            types.append("number")
+        elif all(v.lower() in ("true", "false") for v in values):
+            types.append("boolean")
+        elif all(parse_date(v) for v in values):
+            types.append("datetime" if any(":" in v for v in values) else "date")
+        else:
+            types.append("text")
+    return types
+
+
+def convert_value(value, column_type):
+    """Convert one CSV field for its column type; unparsable values pass through as text"""
+    text = value.strip()
+    if not text:
+        return ""
+    if column_type == "number" and is_number(text):
+        number = float(text)
+        return int(number) if number.is_integer() and "." not in text and "e" not in text.lower() else number
+    if column_type == "boolean" and text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    if column_type in ("date", "datetime"):
+        parsed = parse_date(text)
+        if parsed:
+            return parsed
+    return value
+
+
+def iter_blocks(rows, types, chunk_rows):
+    """Yield rectangular blocks of converted rows, `chunk_rows` rows at a time"""
+    rows = iter(rows)
+    while True:
+        block = list(islice(rows, chunk_rows))
+        if not block:
+            return
+        width = max(len(types), max(len(row) for row in block))
+        yield [[convert_value(row[i], types[i] if i < len(types) else "general") if i < len(row) else ""
+                for i in range(width)] for row in block]
+
+
+def serial_dates(block):
+    """Replace datetimes in a block with Excel serial numbers (JSON has no date type)"""
+    return [[excel_serial(v) if isinstance(v, datetime) else v for v in row] for row in block]
+
+
+def report_progress(imported, started):
+    """Print rows imported so far and the throughput"""
+    elapsed = max(time.monotonic() - started, 1e-6)
+    print(f"Progress: {imported} rows ({imported / elapsed:,.0f} rows/s)")
+
+
+def write_native(excel_file, sheet_name, header_row, rows, types, width, chunk_rows, started):
+    """Write the sheet straight to an .xlsx file with xlsx_stream; returns data rows written"""
+    from xlsx_stream import XlsxWriter
+
+    counter = {"rows": 0}
+
+    def all_rows():
+        if header_row is not None:
+            yield header_row + [""] * (width - len(header_row))
+        for block in iter_blocks(rows, types, chunk_rows):
+            yield from block
+            counter["rows"] += len(block)
+            report_progress(counter["rows"], started)
+
+    with XlsxWriter(excel_file) as book:
+        book.write_sheet(sheet_name, all_rows())
+    return counter["rows"]
+
+
+def import_csv_to_excel(csv_file, excel_file, sheet_name="Data", chunk_rows=DEFAULT_CHUNK_ROWS, header=True,
+                        native=False):
+    """Import CSV data into Excel worksheet"""
+    started = time.monotonic()
+    session = None
+    try:
+        with open(csv_file, 'r', encoding='utf-8', newline='') as f:
             reader = csv.reader(f)
-            for row in reader:
-                csv_data.append(row)
-
-        if not csv_data:
-            print("CSV file is empty")
-            return False
-
-        # Import data to worksheet
-        imported_count = 0
-        for row_idx, row_data in enumerate(csv_data):
-            for col_idx, cell_value in enumerate(row_data):
-                try:
-                    # Note: PyXA Excel cell access may vary
-                    # This is conceptual implementation
-                    print(f"Setting cell [{row_idx+1},{col_idx+1}]: {cell_value}")
-                    imported_count += 1
-                except Exception as e:
-                    print(f"Error setting cell [{row_idx+1},{col_idx+1}]: {e}")
-                    continue
-
-        # Auto-fit columns
-        try:
-            target_sheet.columns().auto_fit()
-        except:
-            pass
+            header_row = next(reader, None) if header else None
+            sample = list(islice(reader, INFER_ROWS))
+            if header_row is None and not sample:
+                print("CSV file is empty")
+                return False
 
-        # Save workbook
-        workbook.save()
+            width = max([len(header_row or [])] + [len(row) for row in sample])
+            types = infer_column_types(sample, width)
+            print(f"Column types: {', '.join(types)}")
 
-        print(f"Imported {len(csv_data)} rows, {imported_count} cells from {csv_file}")
-        print(f"Data saved to {excel_file} in sheet '{sheet_name}'")
+            if native:
+                imported = write_native(excel_file, sheet_name, header_row, chain(sample, reader), types, width,
+                                        chunk_rows, started)
+            else:
+                excel_path = str(Path(excel_file).resolve())
+                session = run_jxa(PREPARE_JXA, {
+                    "path": excel_path, "exists": os.path.exists(excel_path), "sheet": sheet_name,
+                    "formats": [COLUMN_FORMATS[t] for t in types],
+                })
+
+                imported = 0
+                next_row = 1
+                if header_row is not None:
+                    run_jxa(WRITE_BLOCK_JXA, {"workbook": session["workbook"], "sheet": sheet_name, "first_row": 1,
+                                              "rows": [header_row + [""] * (width - len(header_row))]})
+                    next_row = 2
 
+                for block in iter_blocks(chain(sample, reader), types, chunk_rows):
+                    run_jxa(WRITE_BLOCK_JXA, {"workbook": session["workbook"], "sheet": sheet_name,
+                                              "first_row": next_row, "rows": serial_dates(block)}, timeout=600)
+                    next_row += len(block)
+                    imported += len(block)
+                    report_progress(imported, started)
+
+        if session:
+            run_jxa(FINISH_JXA, {"workbook": session["workbook"], "sheet": sheet_name, "state": session["state"],
+                                 "autofit": imported <= 50000, "save": True}, timeout=600)
+
+        elapsed = max(time.monotonic() - started, 1e-6)
+        print(f"Imported {imported} rows x {width} columns from {csv_file} in {elapsed:.1f}s "
+              f"({imported / elapsed:,.0f} rows/s)")
+        print(f"Data saved to {excel_file} in sheet '{sheet_name}'")
         return True
 
     except Exception as e:
         print(f"Error importing CSV to Excel: {e}")
+        if session:
+            try:
+                run_jxa(FINISH_JXA, {"workbook": session["workbook"], "sheet": sheet_name,
+                                     "state": session["state"], "autofit": False, "save": False})
+            except Exception:
+                pass
         return False
 
+
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python import_csv_to_excel.py 'input.csv' 'output.xlsx' [sheet_name]")
+    positional = [arg for i, arg in enumerate(sys.argv[1:], 1)
+                  if not arg.startswith('--') and sys.argv[i - 1] != '--chunk']
+    if len(positional) < 2:
+        print("Usage: python import_csv_to_excel.py 'input.csv' 'output.xlsx' [sheet_name] [--chunk 5000] "
+              "[--no-header] [--native]")
         sys.exit(1)
 
-    csv_file = sys.argv[1]
-    excel_file = sys.argv[2]
-    sheet_name = sys.argv[3] if len(sys.argv) > 3 else "Data"
+    chunk_rows = DEFAULT_CHUNK_ROWS
+    args = sys.argv[1:]
+    for i, arg in enumerate(args):
+        if arg.startswith('--chunk'):
+            chunk_rows = int(arg.split('=', 1)[1] if '=' in arg else args[i + 1])
+
+    csv_file = positional[0]
+    excel_file = positional[1]
+    sheet_name = positional[2] if len(positional) > 2 else "Data"
 
-    success = import_csv_to_excel(csv_file, excel_file, sheet_name)
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    success = import_csv_to_excel(csv_file, excel_file, sheet_name, chunk_rows, header='--no-header' not in args,
+                                  native='--native' in args)
+    sys.exit(0 if success else 1)
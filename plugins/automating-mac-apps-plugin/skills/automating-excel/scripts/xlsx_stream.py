@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Streaming XLSX Reader/Writer - No Excel Required
+Reads and writes .xlsx workbooks with the standard library only
+
+XlsxWorkbook reads a sheet with iterparse, one <row> at a time, and drops
+each row as soon as it has been yielded. The shared-strings table and the
+date styles are loaded once per workbook. XlsxWriter streams <row>
+elements straight into the zip entry of the sheet being written, using
+inline strings, so there is no shared-strings table to hold either. In
+both directions memory stays flat however many rows a sheet has.
+
+Values only: formulas come back as their cached results and no
+formatting is written beyond date styles. Legacy .xls files are not
+supported.
+
+    with XlsxWorkbook("book.xlsx") as book:
+        for sheet in book.sheets():
+            for row in book.iter_rows(sheet):
+                ...
+
+    with XlsxWriter("out.xlsx") as book:
+        book.write_sheet("Data", rows)
+
+Usage: python xlsx_stream.py "book.xlsx"    (prints each sheet's name and size)
+"""
+
+import os
+import posixpath
+import re
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+from excel_jxa import EXCEL_EPOCH, column_name, excel_serial
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+EPOCH_1904 = datetime(1904, 1, 1)
+
+# Built-in number formats that display dates or times
+BUILTIN_DATE_FORMATS = set(range(14, 23)) | set(range(27, 37)) | {45, 46, 47} | set(range(50, 59))
+
+# Style indexes in the styles.xml written by XlsxWriter
+DATE_STYLE = 1
+DATETIME_STYLE = 2
+
+CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+
+class XlsxError(RuntimeError):
+    """Raised when a file is not a readable .xlsx workbook"""
+
+
+def _local(tag):
+    """Tag name without its namespace (strict and transitional OOXML use different ones)"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def column_index(letters):
+    """1-based column index for column letters: A -> 1, AA -> 27"""
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+    return index
+
+
+def is_date_format(format_code):
+    """True if a custom number format displays a date or time"""
+    # Drop quoted literals, escaped characters and [color]/[$-409] sections first
+    code = re.sub(r'"[^"]*"|\\.|\[[^\]]*\]', "", format_code.lower())
+    return bool(re.search(r"[dmyhs]", code)) and "general" not in code
+
+
+def _text_of(element):
+    """Concatenated <t> text of a shared or inline string, skipping phonetic runs"""
+    parts = []
+    for child in element:
+        name = _local(child.tag)
+        if name == "t":
+            parts.append(child.text or "")
+        elif name == "r":
+            parts.extend(t.text or "" for t in child if _local(t.tag) == "t")
+    return "".join(parts)
+
+
+def _number(text):
+    """Numeric cell text as an int when it is integral, else a float"""
+    value = float(text)
+    return int(value) if value.is_integer() and abs(value) < 2 ** 53 else value
+
+
+class XlsxWorkbook:
+    """An .xlsx file read without Excel; same reading interface as export_excel_to_csv.ExcelWorkbook"""
+
+    def __init__(self, file_path):
+        self.path = str(Path(file_path).resolve())
+        self._zip = None
+        self._sheets = None
+        self._shared_strings = None
+        self._shared_strings_part = None
+        self._date_styles = set()
+        self._epoch = EXCEL_EPOCH
+
+    def __enter__(self):
+        try:
+            self._zip = zipfile.ZipFile(self.path)
+        except (zipfile.BadZipFile, OSError) as e:
+            raise XlsxError(f"Not an .xlsx workbook: {self.path} ({e})") from e
+        self._load_workbook()
+        return self
+
+    def __exit__(self, *exc):
+        if self._zip is not None:
+            self._zip.close()
+        return False
+
+    def _relationships(self, part):
+        """Map relationship id -> (type, target part) for `part`; type is the last segment of the Type URI"""
+        folder, name = posixpath.split(part)
+        rels_path = posixpath.join(folder, "_rels", name + ".rels")
+        if rels_path not in self._zip.namelist():
+            return {}
+        targets = {}
+        for rel in ET.fromstring(self._zip.read(rels_path)):
+            target = rel.get("Target", "")
+            targets[rel.get("Id")] = (rel.get("Type", "").rsplit("/", 1)[-1],
+                                      target.lstrip("/") if target.startswith("/")
+                                      else posixpath.normpath(posixpath.join(folder, target)))
+        return targets
+
+    def _load_workbook(self):
+        root_rels = self._relationships("")
+        # Excel lists docProps before the workbook, so go by type rather than order
+        workbook_part = next((target for kind, target in root_rels.values() if kind == "officeDocument"),
+                             "xl/workbook.xml")
+        if workbook_part not in self._zip.namelist():
+            raise XlsxError(f"No workbook part in {self.path} (legacy .xls files are not supported)")
+
+        workbook = ET.fromstring(self._zip.read(workbook_part))
+        rels = self._relationships(workbook_part)
+        self._sheets = []
+        for element in workbook.iter():
+            name = _local(element.tag)
+            if name == "workbookPr" and element.get("date1904") in ("1", "true"):
+                self._epoch = EPOCH_1904
+            elif name == "sheet":
+                rel_id = next(value for key, value in element.attrib.items() if _local(key) == "id")
+                self._sheets.append({"name": element.get("name"), "part": rels.get(rel_id, (None, None))[1]})
+
+        for kind, target in rels.values():
+            if kind == "sharedStrings":
+                self._shared_strings_part = target
+            elif kind == "styles":
+                self._load_styles(target)
+        for sheet in self._sheets:
+            sheet["rows"], sheet["columns"] = self._dimension(sheet["part"])
+
+    def _load_styles(self, part):
+        custom_formats = {}
+        cell_formats = []
+        in_cell_xfs = False
+        for event, element in ET.iterparse(self._zip.open(part), events=("start", "end")):
+            name = _local(element.tag)
+            if event == "start":
+                in_cell_xfs = in_cell_xfs or name == "cellXfs"
+                continue
+            if name == "numFmt":
+                custom_formats[int(element.get("numFmtId"))] = element.get("formatCode", "")
+            elif name == "xf" and in_cell_xfs:
+                cell_formats.append(int(element.get("numFmtId", 0)))
+            elif name == "cellXfs":
+                in_cell_xfs = False
+        self._date_styles = {
+            index for index, format_id in enumerate(cell_formats)
+            if format_id in BUILTIN_DATE_FORMATS
+            or (format_id in custom_formats and is_date_format(custom_formats[format_id]))
+        }
+
+    def _dimension(self, part):
+        """(rows, columns) from the sheet's <dimension ref>, read without parsing the sheet data"""
+        with self._zip.open(part) as f:
+            head = f.read(4096).decode("utf-8", errors="ignore")
+        match = re.search(r'<(?:\w+:)?dimension\s+ref="(?:[A-Z]+\d+:)?([A-Z]+)(\d+)"', head)
+        if not match:
+            return None, None
+        return int(match.group(2)), column_index(match.group(1))
+
+    def shared_strings(self):
+        """The shared-strings table, loaded on first use and kept for the workbook's lifetime"""
+        if self._shared_strings is None:
+            self._shared_strings = []
+            if self._shared_strings_part:
+                for _, element in ET.iterparse(self._zip.open(self._shared_strings_part)):
+                    if _local(element.tag) == "si":
+                        self._shared_strings.append(_text_of(element))
+                        element.clear()
+        return self._shared_strings
+
+    def sheets(self):
+        """Return [{name, rows, columns, part}] for every worksheet (sizes from <dimension>, may be None)"""
+        return self._sheets
+
+    def _cell_value(self, cell, strings):
+        cell_type = cell.get("t", "n")
+        value = None
+        for child in cell:
+            name = _local(child.tag)
+            if name == "v":
+                value = child.text
+            elif name == "is":
+                return _text_of(child)
+        if value is None:
+            return None
+        if cell_type == "s":
+            return strings[int(value)]
+        if cell_type == "b":
+            return value == "1"
+        if cell_type in ("str", "e", "inlineStr"):
+            return value
+        if int(cell.get("s", 0)) in self._date_styles:
+            return self._epoch + timedelta(seconds=round(float(value) * 86400, 3))
+        return _number(value)
+
+    def iter_rows(self, sheet, chunk_rows=None):
+        """Yield one sheet's rows as lists of typed values; missing rows and cells are filled in
+
+        `chunk_rows` is accepted for interface compatibility; rows are streamed one at a time.
+        """
+        strings = self.shared_strings()
+        width = sheet.get("columns") or 0
+        next_row = 1
+        sheet_data = None
+        for event, element in ET.iterparse(self._zip.open(sheet["part"]), events=("start", "end")):
+            name = _local(element.tag)
+            if event == "start":
+                if name == "sheetData":
+                    sheet_data = element
+                continue
+            if name != "row":
+                continue
+
+            row_number = int(element.get("r", next_row))
+            while next_row < row_number:
+                yield [None] * width
+                next_row += 1
+
+            values = []
+            for cell in element:
+                if _local(cell.tag) != "c":
+                    continue
+                ref = cell.get("r")
+                column = column_index(CELL_REF.match(ref).group(1)) if ref else len(values) + 1
+                values.extend([None] * (column - len(values) - 1))
+                values.append(self._cell_value(cell, strings))
+            values.extend([None] * (width - len(values)))
+            yield values
+            next_row = row_number + 1
+
+            # Drop the finished row so memory stays flat
+            if sheet_data is not None:
+                sheet_data.clear()
+            else:
+                element.clear()
+
+
+def _sheet_name(name, taken):
+    """A valid, unique worksheet name: at most 31 characters, none of []:*?/\\"""
+    base = INVALID_SHEET_CHARS.sub("-", name).strip("'")[:31] or "Sheet"
+    candidate, counter = base, 2
+    while candidate.lower() in taken:
+        suffix = f" ({counter})"
+        candidate, counter = base[:31 - len(suffix)] + suffix, counter + 1
+    taken.add(candidate.lower())
+    return candidate
+
+
+def _cell_xml(ref, value):
+    if value is None or value == "":
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)) and value == value and value not in (float("inf"), float("-inf")):
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    if isinstance(value, datetime):
+        style = DATE_STYLE if value.time() == datetime.min.time() else DATETIME_STYLE
+        return f'<c r="{ref}" s="{style}"><v>{excel_serial(value)!r}</v></c>'
+    if isinstance(value, date):
+        return f'<c r="{ref}" s="{DATE_STYLE}"><v>{(value - EXCEL_EPOCH.date()).days}</v></c>'
+    text = INVALID_XML_CHARS.sub("", str(value))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+
+STYLES_XML = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<styleSheet xmlns="{MAIN_NS}">'
+    '<numFmts count="2"><numFmt numFmtId="164" formatCode="yyyy-mm-dd"/>'
+    '<numFmt numFmtId="165" formatCode="yyyy-mm-dd hh:mm:ss"/></numFmts>'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '<xf numFmtId="165" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+class XlsxWriter:
+    """Writes an .xlsx workbook, streaming each sheet's rows into the zip as they come"""
+
+    def __init__(self, file_path):
+        self.path = str(file_path)
+        self._zip = None
+        self._sheet_names = []
+        self._taken = set()
+
+    def __enter__(self):
+        self._zip = zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED)
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        try:
+            if exc_type is None:
+                self._write_package()
+        finally:
+            self._zip.close()
+            if exc_type is not None and os.path.exists(self.path):
+                # Don't leave a half-written workbook behind
+                os.unlink(self.path)
+        return False
+
+    def write_sheet(self, name, rows):
+        """Write a worksheet from an iterable of rows; returns the number of rows written"""
+        index = len(self._sheet_names) + 1
+        self._sheet_names.append(_sheet_name(name, self._taken))
+        letters = []
+        count = 0
+        with self._zip.open(f"xl/worksheets/sheet{index}.xml", "w", force_zip64=True) as out:
+            out.write(f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                      f'<worksheet xmlns="{MAIN_NS}"><sheetData>'.encode("utf-8"))
+            for count, row in enumerate(rows, 1):
+                while len(letters) < len(row):
+                    letters.append(column_name(len(letters) + 1))
+                cells = "".join(_cell_xml(f"{letters[i]}{count}", value) for i, value in enumerate(row))
+                out.write(f'<row r="{count}">{cells}</row>'.encode("utf-8"))
+            out.write(b"</sheetData></worksheet>")
+        return count
+
+    def _write_package(self):
+        sheets = range(1, len(self._sheet_names) + 1)
+        overrides = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in sheets)
+        self._zip.writestr("[Content_Types].xml", (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            f'{overrides}</Types>'))
+        self._zip.writestr("_rels/.rels", (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{PACKAGE_REL_NS}">'
+            f'<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'))
+        sheet_entries = "".join(f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+                                for i, name in zip(sheets, self._sheet_names))
+        self._zip.writestr("xl/workbook.xml", (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><sheets>{sheet_entries}</sheets></workbook>'))
+        sheet_rels = "".join(f'<Relationship Id="rId{i}" Type="{REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+                             for i in sheets)
+        self._zip.writestr("xl/_rels/workbook.xml.rels", (
+            f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<Relationships xmlns="{PACKAGE_REL_NS}">'
+            f'{sheet_rels}<Relationship Id="rIdStyles" Type="{REL_NS}/styles" Target="styles.xml"/>'
+            '</Relationships>'))
+        self._zip.writestr("xl/styles.xml", STYLES_XML)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python xlsx_stream.py 'book.xlsx'")
+        sys.exit(1)
+
+    try:
+        with XlsxWorkbook(sys.argv[1]) as book:
+            for sheet in book.sheets():
+                rows = sum(1 for _ in book.iter_rows(sheet))
+                print(f"{sheet['name']}: {rows} rows")
+        sys.exit(0)
+    except Exception as e:
+        print(f"Error reading workbook: {e}")
+        sys.exit(1)
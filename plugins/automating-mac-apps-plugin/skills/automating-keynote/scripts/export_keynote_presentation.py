@@ -1,99 +1,137 @@
 #!/usr/bin/env python3
 """
-Export Keynote Presentation Script - AppleScript Implementation
-Exports Keynote presentation to various formats
+Export Keynote Presentation Script - JXA Implementation
+Exports Keynote presentations to PDF, PowerPoint, HTML or slide images
 
-Note: This script currently uses AppleScript for reliable Keynote automation.
-PyXA research showed rich Keynote APIs (XAKeynoteApplication, XAKeynoteDocument.export(),
-ExportFormat enums) but the document opening mechanism needs further investigation.
-The AppleScript approach provides consistent, working functionality.
+A single file can be exported as before. Given --output, any number of
+.key files, folders and glob patterns are exported in one Keynote
+session: Keynote is launched once, and each presentation is opened,
+exported to every requested format and closed in a single osascript call
+with a per-file timeout (presentations that were already open are left
+open). A scanner thread feeds a bounded queue, so the file walk overlaps
+with Keynote's work. Every file's outcome (status, outputs, seconds,
+error) is appended to a JSON Lines manifest; an output is skipped on the
+next run when its source has the same modification time and the output
+still exists.
 
 Usage: python export_keynote_presentation.py "presentation.key" "output.pdf" ["PDF"|"PowerPoint"|"HTML"]
+       python export_keynote_presentation.py "decks/*.key" [more files or folders] --output out_dir
+       [--formats pdf,pptx,html,png,jpeg] [--timeout 300] [--manifest results.jsonl] [--queue 8] [--force]
 """
 
+import os
+import subprocess
 import sys
 from pathlib import Path
 
-def export_keynote_presentation(input_file, output_file, format_type="PDF"):
-    """Export Keynote presentation to specified format"""
+from keynote_jxa import run_jxa
 
-    # Validate format type
-    supported_formats = ["PDF", "POWERPOINT", "HTML"]
-    if format_type.upper() not in supported_formats:
-        print(f"Unsupported format: {format_type}. Supported: {', '.join(supported_formats)}")
-        return False
+# The session, queue and manifest pipeline is shared with the Numbers batch converter
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+from batch_export import DEFAULT_QUEUE_SIZE, START_SESSION_JXA, parse_batch_args, run_batch
 
-    print("Attempting PyXA export...")
+# format -> (Keynote export type, output suffix, export properties); HTML and images export to folders
+FORMATS = {
+    "pdf": ("PDF", ".pdf", {}),
+    "pptx": ("Microsoft PowerPoint", ".pptx", {}),
+    "html": ("HTML", "-html", {}),
+    "png": ("slide images", "-png", {"imageFormat": "PNG"}),
+    "jpeg": ("slide images", "-jpeg", {"imageFormat": "JPEG"}),
+}
 
-    # Try PyXA approach first (simplified - just use AppleScript for now)
-    # TODO: Implement proper PyXA Keynote export once API is better understood
-    return export_with_applescript(input_file, output_file, format_type)
+# Names accepted by the single-file form
+FORMAT_ALIASES = {"pdf": "pdf", "powerpoint": "pptx", "pptx": "pptx", "html": "html", "png": "png",
+                  "jpeg": "jpeg", "images": "png"}
 
-def export_with_applescript(input_file, output_file, format_type="PDF"):
-    """Export using AppleScript"""
-    try:
-        import subprocess
-
-        script = f'''
-        tell application "Keynote"
-            set theDoc to open POSIX file "{Path(input_file).resolve()}"
-            tell theDoc
-                if "{format_type.upper()}" is "PDF" then
-                    export to POSIX file "{Path(output_file).resolve()}" as PDF
-                else if "{format_type.upper()}" is "POWERPOINT" then
-                    export to POSIX file "{Path(output_file).resolve()}" as Microsoft PowerPoint
-                else if "{format_type.upper()}" is "HTML" then
-                    export to POSIX file "{Path(output_file).resolve()}" as HTML
-                end if
-            end tell
-            close theDoc saving no
-        end tell
-        '''
-        subprocess.run(["osascript", "-e", script], check=True)
-        print(f"Successfully exported to: {output_file}")
-        print(f"Format: {format_type}")
-        return True
-    except Exception as e:
-        print(f"Export failed: {e}")
+DEFAULT_TIMEOUT = 300
+MANIFEST_NAME = "export-manifest.jsonl"
+
+EXPORT_JXA = '''
+function main(p) {
+    const doc = Keynote.open(Path(p.path));
+    try {
+        p.outputs.forEach(o => {
+            const options = {to: Path(o.path), as: o.as};
+            if (Object.keys(o.properties).length) options.withProperties = o.properties;
+            Keynote.export(doc, options);
+        });
+    } finally {
+        if (p.close) doc.close({saving: "no"});
+    }
+    return true;
+}
+'''
+
+
+def find_keynote_files(paths):
+    """Yield .key presentations from files and folders (package .key folders count as files)"""
+    for path in map(Path, paths):
+        if path.suffix.lower() == ".key":
+            yield path
+        elif path.is_dir():
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files) + [d for d in dirs if d.lower().endswith(".key")]:
+                    if name.lower().endswith(".key") and not name.startswith("."):
+                        yield Path(root) / name
+                dirs[:] = [d for d in dirs if not d.lower().endswith(".key") and not d.startswith(".")]
+
+
+def batch_export_keynote(inputs, output_dir, formats=("pdf",), timeout=DEFAULT_TIMEOUT, manifest_path=None,
+                         queue_size=DEFAULT_QUEUE_SIZE, force=False):
+    """Export .key files in one Keynote session; returns (exported, skipped, failed)"""
+    return run_batch(run_jxa, "Keynote", EXPORT_JXA, FORMATS, find_keynote_files, inputs, output_dir, formats,
+                     timeout, manifest_path or os.path.join(output_dir, MANIFEST_NAME), queue_size, force)
+
+
+def export_keynote_presentation(input_file, output_file, format_type="PDF", timeout=DEFAULT_TIMEOUT):
+    """Export Keynote presentation to specified format"""
+    name = FORMAT_ALIASES.get(format_type.lower())
+    if name is None:
+        print(f"Unsupported format: {format_type}. Supported: PDF, PowerPoint, HTML, PNG, JPEG")
         return False
 
+    input_path = str(Path(input_file).resolve())
     try:
-        script = f'''
-        tell application "Keynote"
-            set theDoc to open POSIX file "{Path(input_file).resolve()}"
-            tell theDoc
-                if "{format_type.upper()}" is "PDF" then
-                    export to POSIX file "{Path(output_file).resolve()}" as PDF
-                else if "{format_type.upper()}" is "POWERPOINT" then
-                    export to POSIX file "{Path(output_file).resolve()}" as Microsoft PowerPoint
-                else if "{format_type.upper()}" is "HTML" then
-                    export to POSIX file "{Path(output_file).resolve()}" as HTML
-                end if
-            end tell
-            close theDoc saving no
-        end tell
-        '''
-
-        subprocess.run(["osascript", "-e", script], check=True)
+        close = input_path not in run_jxa(START_SESSION_JXA, {"app": "Keynote"}, timeout=120)
+        target = {"path": str(Path(output_file).resolve()), "as": FORMATS[name][0], "properties": FORMATS[name][2]}
+        run_jxa(EXPORT_JXA, {"path": input_path, "outputs": [target], "close": close}, timeout=timeout)
         print(f"Successfully exported to: {output_file}")
         print(f"Format: {format_type}")
         return True
-
-    except subprocess.CalledProcessError as e:
-        print(f"AppleScript export failed: {e}")
+    except subprocess.TimeoutExpired:
+        print(f"Export failed: no result after {timeout}s")
         return False
     except Exception as e:
-        print(f"Unexpected error during export: {e}")
+        print(f"Export failed: {e}")
         return False
 
+
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python export_keynote_presentation.py 'input.key' 'output.pdf' ['PDF'|'PowerPoint'|'HTML']")
-        sys.exit(1)
+    inputs, options = parse_batch_args(sys.argv[1:], "pdf", DEFAULT_TIMEOUT)
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
-    format_type = sys.argv[3] if len(sys.argv) > 3 else "PDF"
+    if options["output"] is None:
+        if len(inputs) < 2:
+            print("Usage: python export_keynote_presentation.py 'input.key' 'output.pdf' ['PDF'|'PowerPoint'|'HTML']")
+            print("       python export_keynote_presentation.py 'decks/*.key' [more] --output out_dir "
+                  "[--formats pdf,pptx,html,png,jpeg] [--timeout 300] [--manifest results.jsonl] [--queue 8] "
+                  "[--force]")
+            sys.exit(1)
+        format_type = inputs[2] if len(inputs) > 2 else "PDF"
+        success = export_keynote_presentation(inputs[0], inputs[1], format_type, options["timeout"])
+        sys.exit(0 if success else 1)
 
-    success = export_keynote_presentation(input_file, output_file, format_type)
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    try:
+        exported, skipped, failed = batch_export_keynote(
+            inputs,
+            options["output"],
+            formats=[FORMAT_ALIASES.get(f, f) for f in options["formats"]],
+            timeout=options["timeout"],
+            manifest_path=options["manifest"],
+            queue_size=options["queue"],
+            force=options["force"],
+        )
+    except Exception as e:
+        print(f"Error exporting Keynote presentations: {e}")
+        sys.exit(1)
+    sys.exit(0 if not failed else 1)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Keynote JXA Runner
+Runs a JXA program against Keynote with JSON in and JSON out
+
+Programs go through the shared jxa_runner with `Keynote` bound to the
+application; this module keeps the Keynote helpers on top of it.
+"""
+
+import sys
+from pathlib import Path
+
+# The osascript runner is shared by every skill
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+import jxa_runner
+
+
+# Shared helpers for finding documents and masters and filling, editing and moving slides in-process
+DECK_JXA = '''
+function findDocument(id) {
+    return Keynote.documents.byId(id);
+}
+
+function findMaster(doc, candidates, cache) {
+    // First master whose name matches, looked up once per program
+    const key = candidates.join("|");
+    if (!(key in cache)) {
+        const names = cache.names || (cache.names = doc.masterSlides.name());
+        const name = candidates.find(c => names.indexOf(c) >= 0);
+        cache[key] = name ? doc.masterSlides.byName(name) : null;
+    }
+    return cache[key];
+}
+
+function setText(getItem, text) {
+    if (text === undefined || text === null) return true;
+    try { getItem().objectText = text; return true; } catch (e) { return false; }
+}
+
+function fillSlide(slide, spec) {
+    // Returns warnings instead of throwing so one odd slide doesn't stop the deck
+    const warnings = [];
+    if (!setText(() => slide.defaultTitleItem(), spec.title)) warnings.push("no title placeholder");
+    if (spec.body && !setText(() => slide.defaultBodyItem(), spec.body)) {
+        slide.textItems.push(Keynote.TextItem({objectText: spec.body}));
+    }
+    if (spec.notes) {
+        try { slide.presenterNotes = spec.notes; } catch (e) { warnings.push("notes: " + e.message); }
+    }
+    (spec.images || []).forEach(path => {
+        try { slide.images.push(Keynote.Image({file: Path(path)})); }
+        catch (e) { warnings.push("image " + path + ": " + e.message); }
+    });
+    return warnings;
+}
+
+function editSlide(slide, spec) {
+    // Replaces text in place; empty strings clear what the old version had
+    const warnings = [];
+    if (!setText(() => slide.defaultTitleItem(), spec.title || "") && spec.title) warnings.push("no title placeholder");
+    if (!setText(() => slide.defaultBodyItem(), spec.body || "") && spec.body) warnings.push("no body placeholder");
+    try { slide.presenterNotes = spec.notes || ""; } catch (e) { warnings.push("notes: " + e.message); }
+    return warnings;
+}
+
+function moveSlide(documentId, from, to) {
+    // JXA has no "before" insertion location, so the move runs as in-process AppleScript
+    const doc = 'document id "' + documentId + '"';
+    const source = 'tell application "Keynote" to move slide ' + from + ' of ' + doc +
+        ' to before slide ' + to + ' of ' + doc;
+    const result = $.NSAppleScript.alloc.initWithSource(source).executeAndReturnError(null);
+    if (result.isNil()) throw new Error("Could not move slide " + from + " to " + to);
+}
+
+function addSlides(doc, specs, masters, first) {
+    // `first` reuses the document's existing first slide for specs[0]
+    const cache = {};
+    const warnings = [];
+    specs.forEach((spec, i) => {
+        const master = findMaster(doc, masters[spec.layout] || [], cache);
+        let slide;
+        if (i === 0 && first) {
+            slide = doc.slides[0];
+            if (master) slide.baseSlide = master;
+        } else {
+            slide = master ? Keynote.Slide({baseSlide: master}) : Keynote.Slide();
+            doc.slides.push(slide);
+        }
+        fillSlide(slide, spec).forEach(w => warnings.push({slide: spec.index, warning: w}));
+    });
+    return warnings;
+}
+'''
+
+
+def run_jxa(script, payload=None, timeout=120):
+    """Run `script` (which defines main(payload)) against Keynote and return its JSON result"""
+    return jxa_runner.run_jxa("Keynote", script, payload, timeout)
@@ -1,115 +1,277 @@
 #!/usr/bin/env python3
 """
-Markdown to Keynote Script - PyXA Implementation
+Markdown to Keynote Script - JXA Implementation
 Converts a markdown file to a Keynote presentation
 
-Usage: python markdown_to_keynote.py input.md "Presentation Title"
+The markdown is parsed with the shared slide parser, turned into one
+plain spec per slide (layout, title, body, notes, images), and the deck
+is built by a few JXA programs: one creates the document and fills its
+first slide, then slides are added in chunks of --chunk slides. Every
+slide is created from its master with title, body and notes set inside
+the program, so there are no per-placeholder round trips from Python.
+
+A manifest of per-slide content hashes is saved next to the deck
+(deck.slides.json). With --sync, the new markdown is diffed against it
+and only the differences are applied to the existing presentation, in
+one JXA program: removed slides are deleted, slides whose text changed
+are edited in place, moved slides are moved and new ones are added.
+Without a deck or manifest, --sync falls back to a full build.
+
+Usage: python markdown_to_keynote.py input.md "Presentation Title" [output.key] [--theme "White"] [--chunk 50] [--sync]
 """
 
+import difflib
+import hashlib
+import json
+import os
 import sys
-import PyXA
-import re
-
-def parse_markdown_slides(markdown_content):
-    """Parse markdown content into slides based on headers"""
-    lines = markdown_content.split('\n')
-    slides = []
-    current_slide = {"title": "", "content": []}
-
-    for line in lines:
-        line = line.strip()
-        if not line:
+import time
+from pathlib import Path
+
+from keynote_jxa import DECK_JXA, run_jxa
+
+# The slide parser is shared with the other presentation skills
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+from slide_markdown import (body_text, choose_layout, default_cache_dir, default_output, parse_markdown_slides,
+                            slide_images)
+
+DEFAULT_CHUNK_SLIDES = 50
+MANIFEST_VERSION = 1
+
+# Layout -> master slide names to try, in order (names differ between themes)
+MASTERS = {
+    "title": ["Title & Subtitle", "Title", "Title - Center"],
+    "bullets": ["Title & Bullets", "Title & Body", "Bullets", "Title, Bullets & Photo"],
+    "title_only": ["Title - Top", "Title Only", "Title - Center", "Title & Subtitle"],
+    "photo": ["Title & Photo", "Photo - Horizontal", "Photo", "Title - Top"],
+}
+
+CREATE_DECK_JXA = DECK_JXA + '''
+function main(p) {
+    const props = {width: p.width, height: p.height};
+    if (p.theme) props.documentTheme = Keynote.themes.byName(p.theme);
+    const doc = Keynote.Document(props).make();
+    const warnings = addSlides(doc, p.slides, p.masters, true);
+    return {document: doc.id(), warnings: warnings};
+}
+'''
+
+ADD_SLIDES_JXA = DECK_JXA + '''
+function main(p) {
+    return {warnings: addSlides(findDocument(p.document), p.slides, p.masters, false)};
+}
+'''
+
+SAVE_DECK_JXA = DECK_JXA + '''
+function main(p) {
+    const doc = findDocument(p.document);
+    doc.save({in: Path(p.path)});
+    return doc.slides.length;
+}
+'''
+
+SYNC_DECK_JXA = DECK_JXA + '''
+function main(p) {
+    const doc = Keynote.open(Path(p.path));
+    const count = doc.slides.length;
+    if (count !== p.expected) return {error: "deck has " + count + " slides, manifest has " + p.expected};
+
+    const warnings = [];
+    // Highest first, so the remaining indexes stay valid
+    p.delete.forEach(i => doc.slides[i - 1].delete());
+    p.edit.forEach(e => editSlide(doc.slides[e.position - 1], e.spec)
+        .forEach(w => warnings.push({slide: e.spec.index, warning: w})));
+    addSlides(doc, p.add, p.masters, false).forEach(w => warnings.push(w));
+    const id = doc.id();
+    p.moves.forEach(m => moveSlide(id, m[0], m[1]));
+    doc.save();
+    return {document: id, slides: doc.slides.length, warnings: warnings};
+}
+'''
+
+
+def slide_specs(slides, base_dir="."):
+    """Turn parsed slides into the JSON specs the JXA programs build from"""
+    specs = []
+    for index, slide in enumerate(slides):
+        specs.append({
+            "index": index + 1,
+            "layout": choose_layout(slide, index),
+            "title": slide["title"],
+            "body": body_text(slide),
+            "notes": slide["notes"],
+            # Keynote needs local files; remote images are left out
+            "images": [os.path.abspath(os.path.join(base_dir, image["src"]))
+                       for image in slide_images(slide) if "://" not in image["src"]],
+        })
+    return specs
+
+
+def spec_hash(spec):
+    """Content hash of one slide spec (its position is not part of it)"""
+    content = {key: value for key, value in spec.items() if key != "index"}
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def manifest_path(output_path):
+    """The slide manifest saved next to a deck: deck.key -> deck.slides.json"""
+    return str(Path(output_path).with_suffix(".slides.json"))
+
+
+def load_manifest(output_path):
+    """Slide entries [{hash, layout, images}] from a deck's manifest, or None"""
+    try:
+        with open(manifest_path(output_path), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest["slides"] if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def write_manifest(output_path, markdown_file, specs):
+    """Record each slide's hash, layout and images for the next --sync"""
+    manifest = {"version": MANIFEST_VERSION, "source": os.path.abspath(markdown_file),
+                "slides": [{"hash": spec_hash(spec), "layout": spec["layout"], "images": spec["images"]}
+                           for spec in specs]}
+    tmp = manifest_path(output_path) + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp, manifest_path(output_path))
+
+
+def plan_sync(old_entries, specs):
+    """Diff manifest entries against new specs; returns the delete/edit/add/move plan
+
+    Slides are matched in order by hash; unmatched slides whose hash appears
+    elsewhere in the old deck are moved, and replaced slides with the same
+    layout and images are edited in place. Positions are 1-based and valid
+    at the step where they are applied (deletes, then edits, adds, moves).
+    """
+    old = [entry["hash"] for entry in old_entries]
+    new = [spec_hash(spec) for spec in specs]
+    source = [None] * len(new)      # old index each new slide reuses, or None for a new slide
+    edited = set()
+    used = set()
+
+    opcodes = difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes()
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            for k in range(i2 - i1):
+                source[j1 + k] = i1 + k
+                used.add(i1 + k)
+
+    # Moved slides: same content, different place
+    unused_by_hash = {}
+    for i, digest in enumerate(old):
+        if i not in used:
+            unused_by_hash.setdefault(digest, []).append(i)
+    for j, digest in enumerate(new):
+        if source[j] is None and unused_by_hash.get(digest):
+            source[j] = unused_by_hash[digest].pop(0)
+            used.add(source[j])
+
+    # Changed slides: reuse the old slide when only its text differs
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag != "replace":
             continue
+        candidates = [i for i in range(i1, i2) if i not in used]
+        for j in range(j1, j2):
+            if source[j] is not None or not candidates:
+                continue
+            i = candidates[0]
+            if (old_entries[i]["layout"], old_entries[i]["images"]) == (specs[j]["layout"], specs[j]["images"]):
+                candidates.pop(0)
+                source[j] = i
+                used.add(i)
+                edited.add(j)
 
-        # Check for headers (slides)
-        if line.startswith('# '):
-            # Save previous slide if it has content
-            if current_slide["title"] or current_slide["content"]:
-                slides.append(current_slide)
-
-            # Start new slide
-            current_slide = {
-                "title": line[2:].strip(),
-                "content": []
-            }
-        elif line.startswith('## '):
-            # Subheader - could be a new slide or content
-            if current_slide["content"]:  # If we have content, this might be a new slide
-                slides.append(current_slide)
-                current_slide = {
-                    "title": line[3:].strip(),
-                    "content": []
-                }
-            else:
-                current_slide["content"].append(f"## {line[3:].strip()}")
-        elif line.startswith('- ') or line.startswith('* '):
-            # List item
-            current_slide["content"].append(line)
-        else:
-            # Regular content
-            current_slide["content"].append(line)
+    survivors = [i for i in range(len(old)) if i in used]
+    position = {i: n for n, i in enumerate(survivors, 1)}
+    current = [("old", i) for i in survivors] + [("new", j) for j in range(len(new)) if source[j] is None]
+    target = [("old", source[j]) if source[j] is not None else ("new", j) for j in range(len(new))]
 
-    # Add final slide
-    if current_slide["title"] or current_slide["content"]:
-        slides.append(current_slide)
+    moves = []
+    for j, token in enumerate(target):
+        p = current.index(token)
+        if p != j:
+            moves.append([p + 1, j + 1])
+            current.insert(j, current.pop(p))
 
-    return slides
+    return {
+        "delete": sorted((i + 1 for i in range(len(old)) if i not in used), reverse=True),
+        "edit": [{"position": position[source[j]], "spec": specs[j]} for j in sorted(edited)],
+        "add": [specs[j] for j in range(len(new)) if source[j] is None],
+        "moves": moves,
+        "unchanged": sum(1 for j in range(len(new)) if source[j] is not None and j not in edited),
+    }
 
-def create_keynote_from_markdown(markdown_file, presentation_title):
+
+def sync_deck(specs, output_path, old_entries):
+    """Apply only the differences to an existing deck; returns (plan, warnings)"""
+    plan = plan_sync(old_entries, specs)
+    if not (plan["delete"] or plan["edit"] or plan["add"] or plan["moves"]):
+        return plan, []
+    result = run_jxa(SYNC_DECK_JXA, {"path": os.path.abspath(output_path), "expected": len(old_entries),
+                                     "masters": MASTERS, **{k: plan[k] for k in ("delete", "edit", "add", "moves")}},
+                     timeout=600)
+    if "error" in result:
+        raise RuntimeError(f"Cannot sync: {result['error']} (run without --sync to rebuild)")
+    return plan, result["warnings"]
+
+
+def build_deck(specs, output_path, theme=None, chunk_slides=DEFAULT_CHUNK_SLIDES, width=1920, height=1080):
+    """Build and save a deck from slide specs; returns (document id, warnings)"""
+    first, rest = specs[:chunk_slides], specs[chunk_slides:]
+    created = run_jxa(CREATE_DECK_JXA, {"slides": first, "masters": MASTERS, "theme": theme,
+                                        "width": width, "height": height}, timeout=600)
+    document = created["document"]
+    warnings = list(created["warnings"])
+    for start in range(0, len(rest), chunk_slides):
+        added = run_jxa(ADD_SLIDES_JXA, {"document": document, "slides": rest[start:start + chunk_slides],
+                                         "masters": MASTERS}, timeout=600)
+        warnings.extend(added["warnings"])
+        print(f"Progress: {len(first) + min(start + chunk_slides, len(rest))} of {len(specs)} slides")
+    run_jxa(SAVE_DECK_JXA, {"document": document, "path": os.path.abspath(output_path)}, timeout=300)
+    return document, warnings
+
+
+def create_keynote_from_markdown(markdown_file, presentation_title, output_path=None, theme=None,
+                                 chunk_slides=DEFAULT_CHUNK_SLIDES, sync=False):
     """Create a Keynote presentation from markdown file"""
+    started = time.monotonic()
     try:
         # Read markdown file
         with open(markdown_file, 'r', encoding='utf-8') as f:
             markdown_content = f.read()
 
-        # Parse into slides
-        slides = parse_markdown_slides(markdown_content)
+        # Parse into slides (cached by content hash across runs)
+        slides = parse_markdown_slides(markdown_content, default_cache_dir())
 
         if not slides:
             print("No slides found in markdown file")
             return False
 
-        # Create Keynote presentation
-        keynote = PyXA.Application("Keynote")
+        output_path = output_path or default_output(markdown_file, presentation_title, ".key")
+        specs = slide_specs(slides, os.path.dirname(os.path.abspath(markdown_file)))
+        old_entries = load_manifest(output_path) if sync and os.path.exists(output_path) else None
 
-        # Create new presentation
-        presentation = keynote.documents().push({
-            "name": presentation_title
-        })
+        if old_entries is not None:
+            plan, warnings = sync_deck(specs, output_path, old_entries)
+            summary = (f"Synced Keynote presentation '{presentation_title}': {len(plan['add'])} added, "
+                       f"{len(plan['delete'])} removed, {len(plan['edit'])} edited, {len(plan['moves'])} moved, "
+                       f"{plan['unchanged']} unchanged")
+        else:
+            if sync:
+                print("No deck or slide manifest to sync with; building the whole deck")
+            _, warnings = build_deck(specs, output_path, theme, chunk_slides)
+            summary = f"Created Keynote presentation '{presentation_title}' with {len(slides)} slides"
+        write_manifest(output_path, markdown_file, specs)
 
-        # Add slides
-        for i, slide_data in enumerate(slides):
-            if i == 0:
-                # First slide already exists, modify it
-                slide = presentation.slides()[0]
-            else:
-                # Add new slide
-                slide = presentation.slides().push()
-
-            # Set title
-            if slide_data["title"]:
-                # Find title placeholder and set text
-                title_placeholders = slide.placeholders().filter(
-                    lambda p: "title" in str(p.tag()).lower()
-                )
-                if title_placeholders:
-                    title_placeholders[0].text = slide_data["title"]
-
-            # Set content
-            content_text = "\n".join(slide_data["content"])
-            if content_text:
-                # Find body placeholder
-                body_placeholders = slide.placeholders().filter(
-                    lambda p: "body" in str(p.tag()).lower() or "content" in str(p.tag()).lower()
-                )
-                if body_placeholders:
-                    body_placeholders[0].text = content_text
-
-        # Save presentation
-        presentation.save()
-
-        print(f"Created Keynote presentation '{presentation_title}' with {len(slides)} slides")
+        for warning in warnings:
+            print(f"Warning: slide {warning['slide']}: {warning['warning']}")
+        print(f"{summary} in {time.monotonic() - started:.1f}s")
         print(f"Source: {markdown_file}")
+        print(f"Saved to: {output_path}")
 
         return True
 
@@ -117,13 +279,29 @@ def create_keynote_from_markdown(markdown_file, presentation_title):
         print(f"Error creating Keynote presentation: {e}")
         return False
 
+
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python markdown_to_keynote.py input.md 'Presentation Title'")
+    args = sys.argv[1:]
+    positional = [arg for i, arg in enumerate(args)
+                  if not arg.startswith('--') and (i == 0 or args[i - 1] not in ('--theme', '--chunk'))]
+    if len(positional) < 2:
+        print("Usage: python markdown_to_keynote.py input.md 'Presentation Title' [output.key] "
+              "[--theme 'White'] [--chunk 50] [--sync]")
         sys.exit(1)
 
-    markdown_file = sys.argv[1]
-    title = sys.argv[2]
+    theme = None
+    chunk_slides = DEFAULT_CHUNK_SLIDES
+    for i, arg in enumerate(args):
+        value = arg.split('=', 1)[1] if '=' in arg else (args[i + 1] if i + 1 < len(args) else None)
+        if arg.startswith('--theme'):
+            theme = value
+        elif arg.startswith('--chunk'):
+            chunk_slides = int(value)
+
+    markdown_file = positional[0]
+    title = positional[1]
+    output_path = positional[2] if len(positional) > 2 else None
 
-    success = create_keynote_from_markdown(markdown_file, title)
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    success = create_keynote_from_markdown(markdown_file, title, output_path, theme, chunk_slides,
+                                           sync='--sync' in args)
+    sys.exit(0 if success else 1)
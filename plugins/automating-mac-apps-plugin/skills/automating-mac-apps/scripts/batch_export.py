@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Batch Export Pipeline
+Exports many documents in one app session with a resumable manifest, shared by the iWork batch scripts
+
+The app is launched once and stays running for the whole batch. Each file
+is handed to the skill's export program (which opens, exports to every
+requested format and closes it) in a single osascript call with a
+per-file timeout; a document that times out is closed, and documents that
+were open before the batch are left open. A scanner thread expands globs
+and folders into a bounded queue, so the file walk overlaps with the
+app's work. Every file's outcome (status, outputs, seconds, error) is
+appended to a JSON Lines manifest; an output is skipped on the next run
+when its source has the same modification time and the output still
+exists.
+
+Outputs mirror each file's folder below the input folder it was found
+in (reports/q1/sales.numbers -> out/q1/sales.csv), and a name already
+written by another file in the same run gets a -2, -3, ... suffix, so
+same-named files never overwrite each other.
+
+Each skill keeps its own export program, file finder and format table:
+
+    {"pdf": ("PDF", ".pdf", {}), "png": ("slide images", "-png", {"imageFormat": "PNG"})}
+
+mapping a format name to the app's export type, the output suffix and
+extra export properties. The export program receives
+{"path", "outputs": [{"path", "as", "properties"}], "close"}.
+"""
+
+import glob
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_QUEUE_SIZE = 8
+
+START_SESSION_JXA = '''
+function main(p) {
+    const app = Application(p.app);
+    app.launch();
+    const paths = [];
+    app.documents().forEach(d => {
+        try { paths.push(d.file().toString()); } catch (e) {}
+    });
+    return paths;
+}
+'''
+
+CLOSE_DOCUMENT_JXA = '''
+function main(p) {
+    Application(p.app).documents().forEach(d => {
+        try { if (d.file().toString() === p.path) d.close({saving: "no"}); } catch (e) {}
+    });
+    return true;
+}
+'''
+
+
+def expand_inputs(items, find_files):
+    """Yield (document path, folder relative to its input) for files, folders and glob patterns"""
+    for item in items:
+        matches = sorted(glob.glob(item)) if glob.has_magic(item) else [item]
+        for match in matches:
+            for path in find_files([match]):
+                yield path, (path.parent.relative_to(match) if path != Path(match) else Path())
+
+
+def load_manifest(manifest_path):
+    """Return {path: {"mtime": mtime, "outputs": {format: output path}}} for successful exports"""
+    exported = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # a line cut short by an interrupted run
+                if entry.get("status") != "ok":
+                    continue
+                known = exported.get(entry["file"])
+                if not known or known["mtime"] != entry["mtime"]:
+                    known = exported[entry["file"]] = {"mtime": entry["mtime"], "outputs": {}}
+                known["outputs"].update(entry["outputs"])
+    return exported
+
+
+def end_partial_line(manifest_path):
+    """Terminate a last line cut short by an interrupted run, so the next entry starts on its own line"""
+    if not os.path.exists(manifest_path) or not os.path.getsize(manifest_path):
+        return
+    with open(manifest_path, 'rb+') as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def output_base(file_path, output_dir, subfolder, claimed):
+    """Output path without suffix, mirroring the input's folder; a name taken in this run gets -2, -3, ..."""
+    base = Path(output_dir).resolve() / subfolder / Path(file_path).stem
+    candidate, number = base, 1
+    while claimed.setdefault(str(candidate), file_path) != file_path:
+        number += 1
+        candidate = base.with_name(f"{base.name}-{number}")
+    return candidate
+
+
+def output_paths(base, formats, format_table):
+    """Return {format: {path, as, properties}} export targets for one file"""
+    return {name: {"path": str(base) + format_table[name][1], "as": format_table[name][0],
+                   "properties": format_table[name][2]} for name in formats}
+
+
+def pending_formats(file_path, mtime, formats, targets, exported):
+    """Formats whose output is missing or older than the source"""
+    known = exported.get(file_path)
+    return [name for name in formats
+            if not (known and known["mtime"] == mtime and known["outputs"].get(name) == targets[name]["path"]
+                    and os.path.exists(targets[name]["path"]))]
+
+
+def export_file(run_jxa, app, program, file_path, targets, timeout, close):
+    """Open, export and close one document; returns a manifest entry"""
+    entry = {"file": file_path, "mtime": os.path.getmtime(file_path),
+             "outputs": {name: target["path"] for name, target in targets.items()}}
+    started = time.monotonic()
+    try:
+        run_jxa(program, {"path": file_path, "outputs": list(targets.values()), "close": close}, timeout=timeout)
+        entry["status"] = "ok"
+    except subprocess.TimeoutExpired:
+        entry["status"] = "timeout"
+        entry["error"] = f"no result after {timeout}s"
+        if close:
+            # The app may still be working on the document; don't let it pile up
+            try:
+                run_jxa(CLOSE_DOCUMENT_JXA, {"app": app, "path": file_path}, timeout=30)
+            except Exception as e:
+                entry["error"] += f"; close failed: {e}"
+    except Exception as e:
+        entry["status"] = "failed"
+        entry["error"] = str(e)
+    entry["seconds"] = round(time.monotonic() - started, 3)
+    return entry
+
+
+def run_batch(run_jxa, app, program, format_table, find_files, inputs, output_dir, formats, timeout,
+              manifest_path, queue_size=DEFAULT_QUEUE_SIZE, force=False):
+    """Export documents in one app session; returns (exported, skipped, failed)"""
+    unknown = [name for name in formats if name not in format_table]
+    if unknown:
+        raise ValueError(f"Unknown format(s): {', '.join(unknown)} (use {', '.join(format_table)})")
+
+    os.makedirs(output_dir, exist_ok=True)
+    exported_before = {} if force else load_manifest(manifest_path)
+
+    print(f"Starting {app} session; exporting {', '.join(formats)} to {output_dir}")
+    already_open = set(run_jxa(START_SESSION_JXA, {"app": app}, timeout=120))
+
+    pending = queue.Queue(maxsize=queue_size)
+
+    def scan():
+        try:
+            for path, subfolder in expand_inputs(inputs, find_files):
+                pending.put((str(path.resolve()), subfolder))
+        finally:
+            pending.put(None)
+
+    scanner = threading.Thread(target=scan, daemon=True)
+    scanner.start()
+
+    exported = skipped = failed = 0
+    claimed = {}
+    started = time.monotonic()
+    end_partial_line(manifest_path)
+    with open(manifest_path, 'a', encoding='utf-8') as manifest:
+        while True:
+            item = pending.get()
+            if item is None:
+                break
+            file_path, subfolder = item
+            base = output_base(file_path, output_dir, subfolder, claimed)
+            targets = output_paths(base, formats, format_table)
+            needed = pending_formats(file_path, os.path.getmtime(file_path), formats, targets, exported_before)
+            if not needed:
+                skipped += 1
+                continue
+
+            os.makedirs(base.parent, exist_ok=True)
+            entry = export_file(run_jxa, app, program, file_path, {name: targets[name] for name in needed},
+                                timeout, close=file_path not in already_open)
+            manifest.write(json.dumps(entry) + "\n")
+            manifest.flush()
+
+            if entry["status"] == "ok":
+                exported += 1
+                print(f"Exported: {file_path} -> {', '.join(needed)} ({entry['seconds']:.1f}s)")
+            else:
+                failed += 1
+                print(f"{entry['status'].capitalize()}: {file_path}: {entry['error']}")
+    scanner.join()
+
+    elapsed = time.monotonic() - started
+    print(f"Exported {exported}, skipped {skipped}, failed {failed} in {elapsed:.1f}s; manifest: {manifest_path}")
+    return exported, skipped, failed
+
+
+def parse_batch_args(args, formats, timeout):
+    """Split argv into inputs and options (--output, --formats, --timeout, --manifest, --queue, --force)"""
+    options = {"output": None, "formats": formats, "timeout": timeout, "manifest": None,
+               "queue": DEFAULT_QUEUE_SIZE}
+    inputs = []
+
+    skip = False
+    for i, arg in enumerate(args):
+        name = arg.split('=', 1)[0].lstrip('-')
+        if skip:
+            skip = False
+        elif arg.startswith('--') and name in options:
+            options[name] = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+            skip = '=' not in arg
+        elif arg != '--force':
+            inputs.append(arg)
+
+    options["timeout"] = int(options["timeout"])
+    options["queue"] = int(options["queue"])
+    options["formats"] = [f.strip().lower() for f in options["formats"].split(',') if f.strip()]
+    options["force"] = '--force' in args
+    return inputs, options
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+JXA Runner
+Runs a JXA program against a Mac app with JSON in and JSON out, shared by every skill
+
+The program must define `main(payload)`. The payload is written to a
+temporary file (no argv length or quoting limits) and the return value of
+`main` is serialized with JSON.stringify, so results come back as real
+Python lists and dicts instead of AppleScript list text.
+
+The application is bound to a constant named after the last word of its
+name, so programs run with `Application("Microsoft Excel")` see `Excel`
+and programs run against Mail see `Mail`. Each skill wraps run_jxa with
+its application name and keeps its own JS helpers.
+"""
+
+import json
+import os
+import subprocess
+import tempfile
+
+PRELUDE = '''
+ObjC.import("Foundation");
+const %(variable)s = Application("%(application)s");
+
+function readPayload(path) {
+    const text = $.NSString.stringWithContentsOfFileEncodingError(
+        path, $.NSUTF8StringEncoding, null);
+    return JSON.parse(ObjC.unwrap(text));
+}
+
+function run(argv) {
+    return JSON.stringify(main(readPayload(argv[0])));
+}
+'''
+
+
+class JXAError(RuntimeError):
+    """Raised when osascript exits non-zero or returns unparsable output"""
+
+
+def prelude(application):
+    """The JXA prelude binding `application` and defining run(argv)"""
+    return PRELUDE % {"variable": application.split()[-1], "application": application}
+
+
+def run_jxa(application, script, payload=None, timeout=120):
+    """Run `script` (which defines main(payload)) against `application` and return its JSON result"""
+    fd, payload_path = tempfile.mkstemp(prefix=f"{application.split()[-1].lower()}-jxa-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload if payload is not None else {}, f)
+
+        result = subprocess.run(
+            ["osascript", "-l", "JavaScript", "-e", prelude(application) + script, payload_path],
+            capture_output=True, text=True, timeout=timeout,
+        )
+    finally:
+        os.unlink(payload_path)
+
+    if result.returncode != 0:
+        raise JXAError(result.stderr.strip() or "osascript failed without error output")
+
+    try:
+        return json.loads(result.stdout)
+    except ValueError as e:
+        raise JXAError(f"Unexpected JXA output: {result.stdout[:200]!r}") from e
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Protobuf Wire Reader
+Decodes serialized protobuf messages without their .proto files
+
+Apple stores Notes bodies and the archives inside .numbers documents as
+protobuf. Only the wire format is needed to walk them: each field is a
+varint key (field number << 3 | wire type) followed by a varint, a fixed
+8 or 4 bytes, or a length-prefixed byte string. Nested messages are
+length-delimited values decoded by calling these functions again.
+Shared by the Notes and Numbers readers.
+"""
+
+
+def read_varint(buf, pos):
+    """Decode a protobuf varint at `pos`; returns (value, new_pos)"""
+    result = 0
+    shift = 0
+    while True:
+        if pos >= len(buf):
+            raise ValueError("truncated varint")
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def iter_protobuf_fields(buf):
+    """Yield (field_number, wire_type, value) for a serialized protobuf message
+
+    Length-delimited values are returned as slices of `buf` (bytes or
+    memoryview); nested messages are decoded by calling this again on them.
+    """
+    pos = 0
+    while pos < len(buf):
+        key, pos = read_varint(buf, pos)
+        field_number, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            value, pos = read_varint(buf, pos)
+        elif wire_type == 1:
+            value, pos = buf[pos:pos + 8], pos + 8
+        elif wire_type == 2:
+            length, pos = read_varint(buf, pos)
+            value, pos = buf[pos:pos + length], pos + length
+        elif wire_type == 5:
+            value, pos = buf[pos:pos + 4], pos + 4
+        else:
+            raise ValueError(f"unsupported wire type {wire_type}")
+        yield field_number, wire_type, value
+
+
+def parse_message(buf):
+    """Decode a protobuf message into {field_number: [values]}"""
+    fields = {}
+    for field_number, _, value in iter_protobuf_fields(buf):
+        fields.setdefault(field_number, []).append(value)
+    return fields
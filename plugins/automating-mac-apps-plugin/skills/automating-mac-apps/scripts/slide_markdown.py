@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Markdown Slide Parser
+Parses presentation markdown into a slide tree shared by the Keynote and PowerPoint scripts
+
+The document is read in a single pass. `---` on its own line and `#`
+headings start slides (a `##` heading starts one when the current slide
+already has content). Each slide holds a title, a list of blocks and
+speaker notes:
+
+    {"title": "Results", "level": 1, "notes": "Mention Q3",
+     "blocks": [{"type": "paragraph", "text": "Revenue *up*"},
+                {"type": "list", "ordered": False, "items": [
+                    {"text": "North", "children": [{"type": "list", ...}]}]},
+                {"type": "code", "language": "python", "text": "print(1)"},
+                {"type": "image", "alt": "Chart", "src": "chart.png", "title": ""},
+                {"type": "table", "header": ["Region", "Q3"], "rows": [["North", "12"]]},
+                {"type": "heading", "level": 3, "text": "Details"},
+                {"type": "quote", "text": "..."}]}
+
+Fenced code is kept verbatim (headings and `---` inside it are not
+slide breaks). Speaker notes are everything after a line holding only
+`Notes:` or `???`, plus HTML comments. A leading YAML front-matter
+block is skipped.
+
+Results are memoized by a hash of the markdown, in memory and optionally
+in `cache_dir`, so rebuilding an unchanged deck skips parsing. The
+returned slides are shared with the cache: treat them as read-only.
+
+Usage: python slide_markdown.py input.md            (prints the slide tree as JSON)
+       python slide_markdown.py --benchmark [1000]  (times parsing a generated deck)
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Bump when the tree format changes so cached results are not reused
+PARSER_VERSION = 2
+
+MEMORY_CACHE_SIZE = 16
+
+FENCE = re.compile(r"^(`{3,}|~{3,})\s*([\w+-]*)")
+HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+LIST_ITEM = re.compile(r"^([-*+]|\d{1,9}[.)])\s+(.*)$")
+IMAGE = re.compile(r'^!\[([^\]]*)\]\(\s*(\S+?)(?:\s+"([^"]*)")?\s*\)$')
+TABLE_SEPARATOR = re.compile(r"^\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?$")
+NOTES_MARKER = re.compile(r"^(notes:|\?\?\?)$", re.IGNORECASE)
+SEPARATOR = re.compile(r"^(-{3,}|\*{3,}|_{3,})$")
+
+INLINE_MARKUP = [
+    (re.compile(r"!\[([^\]]*)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"\[([^\]]+)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"(\*\*|__)(.+?)\1"), r"\2"),
+    (re.compile(r"(?<![\w*])([*_])(?!\s)(.+?)(?<!\s)\1(?![\w*])"), r"\2"),
+    (re.compile(r"~~(.+?)~~"), r"\1"),
+    (re.compile(r"`([^`]+)`"), r"\1"),
+]
+
+_memory_cache = OrderedDict()
+
+
+def plain_text(text):
+    """Inline markdown without its markup: **bold**, *em*, `code`, [link](url) -> their text"""
+    for pattern, replacement in INLINE_MARKUP:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def _indent(line):
+    return len(line.expandtabs(4)) - len(line.expandtabs(4).lstrip())
+
+
+def _table_cells(line):
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", line)]
+
+
+def _new_slide(title="", level=None):
+    return {"title": title, "level": level, "blocks": [], "notes": ""}
+
+
+class _SlideBuilder:
+    """State for the single pass over the document"""
+
+    def __init__(self):
+        self.slides = []
+        self.slide = _new_slide()
+        self.paragraph = []
+        self.lists = []       # stack of (indent, list block) for nested lists
+        self.notes = None     # lines of speaker notes once a Notes: marker was seen
+
+    def flush_paragraph(self):
+        if self.paragraph:
+            self.slide["blocks"].append({"type": "paragraph", "text": " ".join(self.paragraph)})
+            self.paragraph = []
+
+    def flush(self):
+        self.flush_paragraph()
+        self.lists = []
+
+    def end_slide(self):
+        self.flush()
+        if self.notes is not None:
+            self.add_notes("\n".join(self.notes).strip())
+            self.notes = None
+        if self.slide["title"] or self.slide["blocks"] or self.slide["notes"]:
+            self.slides.append(self.slide)
+        self.slide = _new_slide()
+
+    def add_notes(self, text):
+        if text:
+            self.slide["notes"] = f"{self.slide['notes']}\n{text}" if self.slide["notes"] else text
+
+    def add_block(self, block):
+        self.flush()
+        self.slide["blocks"].append(block)
+
+    def add_list_item(self, indent, marker, text):
+        self.flush_paragraph()
+        ordered = marker[0].isdigit()
+        while self.lists and indent < self.lists[-1][0]:
+            self.lists.pop()
+        if self.lists and indent == self.lists[-1][0] and self.lists[-1][1]["ordered"] != ordered:
+            # Switching between bullets and numbers starts a sibling list
+            self.lists.pop()
+        if not self.lists or indent > self.lists[-1][0]:
+            block = {"type": "list", "ordered": ordered, "items": []}
+            if self.lists:
+                # Deeper than the current list: nest under its last item
+                self.lists[-1][1]["items"][-1]["children"].append(block)
+            else:
+                self.slide["blocks"].append(block)
+            self.lists.append((indent, block))
+        self.lists[-1][1]["items"].append({"text": text, "children": []})
+
+    def heading(self, level, text):
+        """`#` always starts a slide, `##` does once the slide has content; deeper ones are subheadings"""
+        current = self.slide
+        untitled_and_empty = not current["title"] and not current["blocks"]
+        if level == 1 or untitled_and_empty or self.notes is not None or (level == 2 and current["blocks"]):
+            if not untitled_and_empty or self.notes is not None or current["notes"]:
+                self.end_slide()
+            self.slide["title"], self.slide["level"] = text, level
+        else:
+            self.add_block({"type": "heading", "level": level, "text": text})
+
+
+def _parse(markdown_content):
+    lines = markdown_content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    builder = _SlideBuilder()
+    i = 0
+
+    # YAML front matter
+    if lines and lines[0].strip() == "---":
+        for end in range(1, len(lines)):
+            if lines[end].strip() in ("---", "..."):
+                if all(":" in line or not line.strip() or line.startswith((" ", "-", "#"))
+                       for line in lines[1:end]):
+                    i = end + 1
+                break
+
+    while i < len(lines):
+        raw = lines[i]
+        line = raw.strip()
+        i += 1
+
+        fence = FENCE.match(line)
+        if fence:
+            marker = fence.group(1)
+            code = []
+            indent = _indent(raw)
+            while i < len(lines) and not (lines[i].strip().startswith(marker[0] * len(marker))
+                                          and not lines[i].strip().strip(marker[0])):
+                code.append(lines[i][indent:] if not lines[i][:indent].strip() else lines[i].lstrip())
+                i += 1
+            i += 1  # closing fence
+            block = {"type": "code", "language": fence.group(2), "text": "\n".join(code)}
+            if builder.notes is not None:
+                builder.notes.append(block["text"])
+            else:
+                builder.add_block(block)
+            continue
+
+        if line.startswith("<!--"):
+            comment = [line[4:]]
+            while "-->" not in comment[-1] and i < len(lines):
+                comment.append(lines[i].strip())
+                i += 1
+            text = "\n".join(comment).split("-->", 1)[0].strip()
+            if text.lower().startswith(("notes:", "note:")):
+                text = text.split(":", 1)[1].strip()
+            if not text.startswith(".slide"):
+                builder.add_notes(text)
+            continue
+
+        if SEPARATOR.match(line):
+            builder.end_slide()
+            continue
+
+        if builder.notes is not None:
+            heading = HEADING.match(line)
+            if heading and len(heading.group(1)) <= 2:
+                builder.heading(len(heading.group(1)), heading.group(2))
+            else:
+                builder.notes.append(line)
+            continue
+
+        if not line:
+            builder.flush_paragraph()
+            continue
+
+        if NOTES_MARKER.match(line):
+            builder.flush()
+            builder.notes = []
+            continue
+
+        heading = HEADING.match(line)
+        if heading:
+            builder.flush()
+            builder.heading(len(heading.group(1)), heading.group(2))
+            continue
+
+        item = LIST_ITEM.match(line)
+        if item:
+            builder.add_list_item(_indent(raw), item.group(1), item.group(2))
+            continue
+
+        if builder.lists and _indent(raw) > builder.lists[-1][0] and not builder.paragraph:
+            # Continuation of the last list item
+            last = builder.lists[-1][1]["items"][-1]
+            last["text"] = f"{last['text']} {line}"
+            continue
+
+        image = IMAGE.match(line)
+        if image:
+            builder.add_block({"type": "image", "alt": image.group(1), "src": image.group(2),
+                               "title": image.group(3) or ""})
+            continue
+
+        if line.startswith("|") and i < len(lines) and TABLE_SEPARATOR.match(lines[i].strip()):
+            header = _table_cells(line)
+            i += 1
+            rows = []
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                rows.append(_table_cells(lines[i]))
+                i += 1
+            builder.add_block({"type": "table", "header": header, "rows": rows})
+            continue
+
+        if line.startswith(">"):
+            quote = [line.lstrip(">").strip()]
+            while i < len(lines) and lines[i].strip().startswith(">"):
+                quote.append(lines[i].strip().lstrip(">").strip())
+                i += 1
+            builder.add_block({"type": "quote", "text": "\n".join(quote)})
+            continue
+
+        builder.lists = []
+        builder.paragraph.append(line)
+
+    builder.end_slide()
+    return builder.slides
+
+
+def content_hash(markdown_content):
+    """Cache key for a document: SHA-256 of the parser version and the text"""
+    return hashlib.sha256(f"{PARSER_VERSION}\0{markdown_content}".encode("utf-8")).hexdigest()
+
+
+def parse_markdown_slides(markdown_content, cache_dir=None):
+    """Parse markdown into slides, reusing earlier results for the same content"""
+    key = content_hash(markdown_content)
+    if key in _memory_cache:
+        _memory_cache.move_to_end(key)
+        return _memory_cache[key]
+
+    slides = None
+    cache_file = Path(cache_dir) / f"{key}.json" if cache_dir else None
+    if cache_file and cache_file.exists():
+        try:
+            slides = json.loads(cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            slides = None
+    if slides is None:
+        slides = _parse(markdown_content)
+        if cache_file:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(slides), encoding="utf-8")
+                os.replace(tmp, cache_file)
+            except OSError as e:
+                print(f"Warning: could not write slide cache: {e}")
+
+    _memory_cache[key] = slides
+    while len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+    return slides
+
+
+def default_cache_dir():
+    """Per-user cache folder for parsed decks"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "automating-mac-apps", "slides")
+
+
+def iter_list_items(block, level=0):
+    """Yield (level, item text, number or None) for a list block and its nested lists, depth first"""
+    for number, item in enumerate(block["items"], 1):
+        yield level, item["text"], (f"{number}." if block["ordered"] else None)
+        for child in item["children"]:
+            yield from iter_list_items(child, level + 1)
+
+
+def body_lines(slide):
+    """The slide body as (indent level, plain text, kind) lines, ready for a text placeholder
+
+    kind is "bullet" for unordered list items, "code" for lines of fenced
+    code and "plain" for everything else; numbered items keep their
+    number in the text.
+    """
+    lines = []
+    for block in slide["blocks"]:
+        kind = block["type"]
+        if kind == "list":
+            lines.extend((level, f"{number} {plain_text(text)}", "plain") if number else
+                         (level, plain_text(text), "bullet") for level, text, number in iter_list_items(block))
+        elif kind == "code":
+            lines.extend((0, line, "code") for line in block["text"].split("\n"))
+        elif kind == "table":
+            lines.extend((0, "\t".join(plain_text(cell) for cell in row), "plain")
+                         for row in [block["header"]] + block["rows"])
+        elif kind in ("paragraph", "heading", "quote"):
+            lines.extend((0, plain_text(line), "plain") for line in block["text"].split("\n"))
+    return lines
+
+
+def body_text(slide):
+    """The slide body as one string, nested list levels indented with tabs"""
+    return "\n".join("\t" * level + text for level, text, _ in body_lines(slide))
+
+
+def slide_images(slide):
+    """Image blocks of a slide"""
+    return [block for block in slide["blocks"] if block["type"] == "image"]
+
+
+def choose_layout(slide, index):
+    """Pick a layout for a parsed slide: title, bullets, title_only or photo"""
+    text_blocks = [block for block in slide["blocks"] if block["type"] != "image"]
+    if index == 0 and slide["level"] == 1 and all(block["type"] == "paragraph" for block in text_blocks):
+        return "title"
+    if not text_blocks:
+        return "photo" if slide_images(slide) else "title_only"
+    return "bullets"
+
+
+def default_output(markdown_file, presentation_title, suffix):
+    """<markdown folder>/<title><suffix>, with characters Finder dislikes replaced"""
+    name = re.sub(r'[/:\\]+', "-", presentation_title).strip() or Path(markdown_file).stem
+    return os.path.join(os.path.dirname(os.path.abspath(markdown_file)), f"{name}{suffix}")
+
+
+def generate_corpus(slide_count):
+    """A synthetic deck exercising every block type, for benchmarks"""
+    parts = ["---\ntitle: Benchmark\n---"]
+    for n in range(1, slide_count + 1):
+        parts.append(
+            f"# Slide {n}\n\nIntro paragraph with **bold** and a [link](https://example.com/{n}).\n\n"
+            f"- Point {n}.1\n  - Detail *a*\n  - Detail b\n- Point {n}.2\n\n"
+            f"```python\ndef f{n}():\n    return {n}\n```\n\n"
+            f"| Key | Value |\n|-----|-------|\n| n | {n} |\n\n"
+            f"![Chart {n}](charts/{n}.png)\n\nNotes:\nRemember slide {n}.\n\n---"
+        )
+    return "\n\n".join(parts)
+
+
+def benchmark(slide_count=1000, cache_dir=None):
+    """Time cold, in-memory and on-disk cached parses of a generated deck; returns seconds per phase"""
+    markdown_content = generate_corpus(slide_count)
+    _memory_cache.clear()
+
+    started = time.perf_counter()
+    slides = parse_markdown_slides(markdown_content, cache_dir)
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parse_markdown_slides(markdown_content, cache_dir)
+    memory = time.perf_counter() - started
+
+    disk = None
+    if cache_dir:
+        _memory_cache.clear()
+        started = time.perf_counter()
+        parse_markdown_slides(markdown_content, cache_dir)
+        disk = time.perf_counter() - started
+
+    return {"slides": len(slides), "bytes": len(markdown_content), "cold": cold, "memory": memory, "disk": disk}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python slide_markdown.py input.md | --benchmark [slide_count]")
+        sys.exit(1)
+
+    if sys.argv[1] == "--benchmark":
+        import tempfile
+
+        count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+        with tempfile.TemporaryDirectory() as cache_dir:
+            result = benchmark(count, cache_dir)
+        print(f"{result['slides']} slides, {result['bytes']:,} bytes")
+        print(f"  parse:         {result['cold'] * 1000:8.1f} ms")
+        print(f"  memory cache:  {result['memory'] * 1000:8.3f} ms")
+        print(f"  disk cache:    {result['disk'] * 1000:8.1f} ms")
+        sys.exit(0)
+
+    try:
+        with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            print(json.dumps(parse_markdown_slides(f.read()), indent=2))
+        sys.exit(0)
+    except Exception as e:
+        print(f"Error parsing markdown: {e}")
+        sys.exit(1)
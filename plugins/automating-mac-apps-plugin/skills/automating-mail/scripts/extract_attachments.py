@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Extract Mail Attachments Script - JXA Implementation
+Saves attachments from a mailbox through a bounded worker pool
+
+Attachment metadata for the whole mailbox (optionally narrowed with a
+server-side date/subject filter) is read in one bulk call. Files are then
+saved in small batches by a bounded pool of osascript workers. Every saved
+attachment is appended to `index.jsonl` in the output directory; re-running
+the same command skips anything already listed there, so an interrupted
+job simply resumes.
+
+Usage: python extract_attachments.py "Mailbox" "output_dir" [--account "Name"]
+       [--since YYYY-MM-DD] [--until YYYY-MM-DD] [--subject "text"]
+       [--ext pdf] [--workers 4] [--batch 20]
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from mail_jxa import run_jxa
+
+INDEX_NAME = "index.jsonl"
+
+MAILBOX_JXA = '''
+function resolveMailbox(p) {
+    const parts = p.mailbox.split("/").filter(s => s.length > 0);
+    let box = p.account ? Mail.accounts.byName(p.account).mailboxes.byName(parts[0])
+                        : Mail.mailboxes.byName(parts[0]);
+    parts.slice(1).forEach(part => { box = box.mailboxes.byName(part); });
+    return box;
+}
+'''
+
+LIST_ATTACHMENTS_JXA = MAILBOX_JXA + '''
+function main(p) {
+    let msgs = resolveMailbox(p).messages;
+    const clauses = [];
+    if (p.since) clauses.push({dateReceived: {_greaterThanEquals: new Date(p.since)}});
+    if (p.until) clauses.push({dateReceived: {_lessThan: new Date(p.until)}});
+    if (p.subject) clauses.push({subject: {_contains: p.subject}});
+    if (clauses.length === 1) msgs = msgs.whose(clauses[0]);
+    if (clauses.length > 1) msgs = msgs.whose({_and: clauses});
+
+    // One Apple Event per column instead of one per message/attachment
+    const ids = msgs.id();
+    const messageIds = msgs.messageId();
+    const subjects = msgs.subject();
+    const senders = msgs.sender();
+    const dates = msgs.dateReceived();
+    const names = msgs.mailAttachments.name();
+    const sizes = msgs.mailAttachments.fileSize();
+
+    const rows = [];
+    for (let i = 0; i < ids.length; i++) {
+        (names[i] || []).forEach((name, j) => {
+            rows.push({
+                id: ids[i],
+                message_id: messageIds[i],
+                subject: subjects[i],
+                sender: senders[i],
+                date_received: dates[i] ? dates[i].toISOString() : null,
+                index: j,
+                name: name,
+                size: sizes[i][j],
+            });
+        });
+    }
+    return rows;
+}
+'''
+
+SAVE_ATTACHMENTS_JXA = MAILBOX_JXA + '''
+function main(p) {
+    const msgs = resolveMailbox(p).messages;
+    return p.items.map(item => {
+        try {
+            const att = msgs.byId(item.id).mailAttachments[item.index];
+            Mail.save(att, {in: Path(item.path)});
+            return {key: item.key, ok: true};
+        } catch (e) {
+            return {key: item.key, ok: false, error: e.message};
+        }
+    });
+}
+'''
+
+
+def attachment_key(message_id, name, size):
+    """Manifest key for an attachment: message ID + attachment name + size"""
+    return f"{message_id}|{name}|{size}"
+
+
+def attachment_filename(record):
+    """Stable, filesystem-safe file name for an attachment record
+
+    The name is derived from the manifest key, so a resumed run writes the
+    same attachment to the same path and two identically named attachments
+    from different messages never collide.
+    """
+    key = attachment_key(record["message_id"], record["name"], record["size"])
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+    stem, dot, ext = (record["name"] or "attachment").rpartition(".")
+    if not dot:
+        stem, ext = ext, ""
+    stem = re.sub(r"[^\w.\- ]+", "_", stem).strip(" .") or "attachment"
+    date = (record.get("date_received") or "")[:10] or "undated"
+    suffix = f".{re.sub(r'[^A-Za-z0-9]+', '', ext)}" if ext else ""
+    return f"{date}_{stem[:80]}_{digest}{suffix}"
+
+
+def load_index(index_path):
+    """Return {key: record} for attachments already saved by earlier runs"""
+    saved = {}
+    if not Path(index_path).exists():
+        return saved
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A run killed mid-write can leave a truncated last line
+                continue
+            saved[record["key"]] = record
+    return saved
+
+
+def end_partial_line(index_path):
+    """Terminate a last line cut short by a killed run, so the next record starts on its own line"""
+    if not Path(index_path).exists() or not Path(index_path).stat().st_size:
+        return
+    with open(index_path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def plan_extraction(records, output_dir, saved, extensions=None):
+    """Return the records that still need saving, with key and target path set"""
+    output_dir = Path(output_dir)
+    extensions = {e.lower().lstrip(".") for e in extensions or []}
+    pending = []
+    seen = set()
+
+    for record in records:
+        name = record.get("name") or ""
+        if extensions and name.rpartition(".")[2].lower() not in extensions:
+            continue
+
+        key = attachment_key(record["message_id"], name, record["size"])
+        if key in seen:
+            continue
+        seen.add(key)
+
+        previous = saved.get(key)
+        if previous and Path(previous["path"]).exists():
+            continue
+
+        pending.append(dict(record, key=key, path=str(output_dir / attachment_filename(record))))
+
+    return pending
+
+
+def chunked(items, size):
+    """Yield successive lists of at most `size` items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def bounded_map(fn, chunks, workers):
+    """Map `fn` over `chunks` in a thread pool with at most 2*workers in flight
+
+    Results are yielded in submission order, so the caller can append to
+    the index from a single thread without locking.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(fn, chunk))
+            if len(in_flight) >= workers * 2:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def extract_attachments(mailbox, output_dir, account=None, since=None, until=None,
+                        subject=None, extensions=None, workers=4, batch_size=20):
+    """Save every matching attachment in a mailbox, skipping ones already indexed"""
+    try:
+        output_dir = Path(output_dir).expanduser().resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        index_path = output_dir / INDEX_NAME
+
+        mailbox_args = {"mailbox": mailbox, "account": account}
+
+        started = time.monotonic()
+        records = run_jxa(LIST_ATTACHMENTS_JXA, dict(
+            mailbox_args, since=since, until=until, subject=subject), timeout=600)
+        print(f"Found {len(records)} attachments in '{mailbox}' "
+              f"({time.monotonic() - started:.1f}s)")
+
+        saved = load_index(index_path)
+        pending = plan_extraction(records, output_dir, saved, extensions)
+        print(f"{len(pending)} to extract, {len(saved)} already in index")
+
+        by_key = {item["key"]: item for item in pending}
+
+        def save_batch(items):
+            payload = dict(mailbox_args, items=[
+                {k: item[k] for k in ("key", "id", "index", "path")} for item in items])
+            try:
+                return run_jxa(SAVE_ATTACHMENTS_JXA, payload, timeout=300)
+            except Exception as e:
+                return [{"key": item["key"], "ok": False, "error": str(e)} for item in items]
+
+        extracted = 0
+        failed = 0
+        end_partial_line(index_path)
+        with open(index_path, "a", encoding="utf-8") as index:
+            for results in bounded_map(save_batch, chunked(pending, batch_size), workers):
+                for result in results:
+                    item = by_key[result["key"]]
+                    if not result["ok"]:
+                        failed += 1
+                        print(f"Failed: {item['name']} ({item['subject']}): {result['error']}")
+                        continue
+
+                    extracted += 1
+                    index.write(json.dumps({
+                        "key": item["key"],
+                        "message_id": item["message_id"],
+                        "subject": item["subject"],
+                        "sender": item["sender"],
+                        "date_received": item["date_received"],
+                        "name": item["name"],
+                        "size": item["size"],
+                        "path": item["path"],
+                        "saved_at": datetime.now().isoformat(timespec="seconds"),
+                    }) + "\n")
+                index.flush()
+                print(f"Progress: {extracted + failed}/{len(pending)}")
+
+        print(f"Extracted {extracted} attachments to {output_dir} "
+              f"({failed} failed, {time.monotonic() - started:.1f}s)")
+        print(f"Index: {index_path}")
+        return failed == 0
+
+    except Exception as e:
+        print(f"Error extracting attachments: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python extract_attachments.py 'Mailbox' 'output_dir' [--account 'Name'] "
+              "[--since YYYY-MM-DD] [--until YYYY-MM-DD] [--subject 'text'] [--ext pdf] "
+              "[--workers 4] [--batch 20]")
+        sys.exit(1)
+
+    mailbox = sys.argv[1]
+    output_dir = sys.argv[2]
+    options = {}
+    extensions = []
+
+    # Parse optional arguments (--name value or --name=value)
+    args = sys.argv[3:]
+    i = 0
+    while i < len(args):
+        name, _, value = args[i].partition('=')
+        if not value and i + 1 < len(args):
+            i += 1
+            value = args[i]
+        if name == '--ext':
+            extensions.append(value)
+        else:
+            options[name.lstrip('-')] = value
+        i += 1
+
+    success = extract_attachments(
+        mailbox,
+        output_dir,
+        account=options.get('account'),
+        since=options.get('since'),
+        until=options.get('until'),
+        subject=options.get('subject'),
+        extensions=extensions,
+        workers=int(options.get('workers', 4)),
+        batch_size=int(options.get('batch', 20)),
+    )
+    sys.exit(0 if success else 1)
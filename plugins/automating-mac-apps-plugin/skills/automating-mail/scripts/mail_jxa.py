@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Mail JXA Runner
+Runs a JXA program against Mail.app with JSON in and JSON out
+
+Programs go through the shared jxa_runner with `Mail` bound to the
+application.
+"""
+
+import sys
+from pathlib import Path
+
+# The osascript runner is shared by every skill
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+import jxa_runner
+
+
+def run_jxa(script, payload=None, timeout=120):
+    """Run `script` (which defines main(payload)) against Mail.app and return its JSON result"""
+    return jxa_runner.run_jxa("Mail", script, payload, timeout)
@@ -3,40 +3,32 @@
 Create Note Script - PyXA Implementation
 Creates a new note in Apple Notes
 
+The folder may be a nested path ("Work/Projects/Q3"); it is resolved
+through the cached folder registry (notes_folders.py) and created if
+missing.
+
 Usage: python create_note.py "Note Title" "Note Content" ["Folder Name"]
 """
 
 import sys
 import PyXA
 
-def create_note(title, content, folder_name=None):
+from notes_folders import FolderRegistry
+
+def create_note(title, content, folder_name=None, registry=None):
     """Create a new note in Notes app"""
     try:
         notes = PyXA.Application("Notes")
-
-        # Find or create target folder
-        target_folder = None
+        registry = registry or FolderRegistry()
 
         if folder_name:
-            # Try to find existing folder
-            for account in notes.accounts():
-                for folder in account.folders():
-                    if folder.name == folder_name:
-                        target_folder = folder
-                        break
-                if target_folder:
-                    break
-
-            # Create folder if it doesn't exist
-            if not target_folder:
-                # Create in first account
-                first_account = notes.accounts()[0]
-                target_folder = first_account.folders().push({"name": folder_name})
+            # Find the folder (by path or name), creating it in the first account if needed
+            folder_id = registry.folder_id(folder_name, create=True)
+        else:
+            # Use the first account's default folder
+            folder_id = registry.account()["default"]
 
-        if not target_folder:
-            # Use default folder (first account's default)
-            first_account = notes.accounts()[0]
-            target_folder = first_account.folders()[0]  # Default folder
+        target_folder = notes.folders().by_id(folder_id)
 
         # Create the note
         note = target_folder.notes().push({
@@ -64,4 +56,4 @@ if __name__ == "__main__":
     folder = sys.argv[3] if len(sys.argv) > 3 else None
 
     success = create_note(title, content, folder)
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -1,49 +1,41 @@
 #!/usr/bin/env python3
 """
-Create Notes Folder Script - PyXA Implementation
+Create Notes Folder Script - JXA Implementation
 Creates a new folder in Apple Notes
 
+The folder may be a nested path ("Work/Projects/Q3"); missing parents are
+created too. Lookups go through the cached folder registry
+(notes_folders.py), so existing folders are found without walking the
+account's folders one by one.
+
 Usage: python create_notes_folder.py "Folder Name" ["Account Name"]
 """
 
 import sys
-import PyXA
 
-def create_notes_folder(folder_name, account_name=None):
+from notes_folders import FolderRegistry, normalize_path
+
+def create_notes_folder(folder_name, account_name=None, registry=None):
     """Create a new folder in Notes app"""
     try:
-        notes = PyXA.Application("Notes")
-
-        # Find target account
-        target_account = None
-
-        if account_name:
-            # Find specific account
-            for account in notes.accounts():
-                if account.name == account_name:
-                    target_account = account
-                    break
-        else:
-            # Use first account (usually iCloud)
-            target_account = notes.accounts()[0]
+        registry = registry or FolderRegistry()
 
+        # Find target account (first account, usually iCloud, by default)
+        target_account = registry.account(account_name)
         if not target_account:
             print(f"Account '{account_name}' not found" if account_name else "No accounts found")
             return False
 
         # Check if folder already exists
-        existing_folders = target_account.folders()
-        for folder in existing_folders:
-            if folder.name == folder_name:
-                print(f"Folder '{folder_name}' already exists in account '{target_account.name}'")
-                return True
-
-        # Create new folder
-        new_folder = target_account.folders().push({
-            "name": folder_name
-        })
-
-        print(f"Created folder '{folder_name}' in account '{target_account.name}'")
+        path = normalize_path(folder_name)
+        if path in target_account["folders"]:
+            print(f"Folder '{path}' already exists in account '{target_account['name']}'")
+            return True
+
+        # Create new folder (and any missing parents)
+        registry.ensure([path], target_account["name"])
+
+        print(f"Created folder '{path}' in account '{target_account['name']}'")
         return True
 
     except Exception as e:
@@ -59,4 +51,4 @@ if __name__ == "__main__":
     account_name = sys.argv[2] if len(sys.argv) > 2 else None
 
     success = create_notes_folder(folder_name, account_name)
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
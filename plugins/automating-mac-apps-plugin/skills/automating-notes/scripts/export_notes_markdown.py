@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Export Notes to Markdown Script - JXA Implementation
+Exports Apple Notes to a directory of Markdown files, incrementally
+
+Notes are streamed folder by folder. For each folder, IDs, titles and
+dates are read as bulk columns; only notes whose modification date
+changed since the last run have their bodies fetched, converted and
+written. Attachments are saved once each into `_attachments/` and linked
+from the note. `.notes-export.json` in the output directory tracks what
+was written, so an hourly re-export touches only changed notes and
+removes files for notes that were deleted.
+
+Files are laid out as <output>/<folder path>/<slug>.md, where the slug
+is the note title plus a short hash of the note ID (stable across runs,
+unique within a folder).
+
+Usage: python export_notes_markdown.py output_dir [--account "iCloud"] [--folder "Work/Projects"]
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from pathlib import Path
+
+from notes_html import html_to_markdown
+from notes_folders import FolderRegistry
+from notes_jxa import run_jxa
+
+MANIFEST_NAME = ".notes-export.json"
+ATTACHMENTS_DIR = "_attachments"
+
+# Read a whole folder's bodies in one call once this share of it has changed
+BULK_BODY_RATIO = 0.25
+
+LIST_NOTES_JXA = '''
+function main(p) {
+    const notes = Notes.folders.byId(p.folder_id).notes;
+    const iso = d => d ? d.toISOString() : null;
+    return {
+        ids: notes.id(),
+        names: notes.name(),
+        created: notes.creationDate().map(iso),
+        modified: notes.modificationDate().map(iso),
+    };
+}
+'''
+
+FETCH_NOTES_JXA = '''
+function main(p) {
+    const folderNotes = Notes.folders.byId(p.folder_id).notes;
+    const bodies = {};
+    if (p.bulk) {
+        const ids = folderNotes.id(), all = folderNotes.body();
+        ids.forEach((id, i) => { bodies[id] = all[i]; });
+    }
+    return p.ids.map(id => {
+        const note = Notes.notes.byId(id);
+        const attachments = note.attachments;
+        const attNames = attachments.name();
+        return {
+            id: id,
+            body: id in bodies ? bodies[id] : note.body(),
+            attachments: attachments.id().map((attId, i) => ({id: attId, name: attNames[i]})),
+        };
+    });
+}
+'''
+
+SAVE_ATTACHMENTS_JXA = '''
+function main(p) {
+    return p.items.map(item => {
+        try {
+            Notes.attachments.byId(item.id).save({in: Path(item.path)});
+            return {id: item.id, ok: true};
+        } catch (e) {
+            return {id: item.id, ok: false, error: e.message};
+        }
+    });
+}
+'''
+
+
+def slugify(title, note_id):
+    """Stable file name stem: ascii title slug + short hash of the note ID"""
+    text = unicodedata.normalize("NFKD", title or "").encode("ascii", "ignore").decode("ascii")
+    slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")[:60] or "note"
+    return f"{slug}-{hashlib.sha1(note_id.encode('utf-8')).hexdigest()[:6]}"
+
+
+def attachment_filename(attachment):
+    """File name for an attachment, unique by attachment ID"""
+    name = re.sub(r"[^\w.\- ]+", "_", attachment.get("name") or "attachment").strip(" .") or "attachment"
+    return f"{hashlib.sha1(attachment['id'].encode('utf-8')).hexdigest()[:8]}-{name}"
+
+
+def render_note(title, folder_path, note_id, created, modified, body_markdown, attachment_links):
+    """Markdown file contents with a small YAML front matter block"""
+    front_matter = [
+        "---",
+        f"title: {json.dumps(title or '', ensure_ascii=False)}",
+        f"id: {json.dumps(note_id)}",
+        f"folder: {json.dumps(folder_path, ensure_ascii=False)}",
+        f"created: {created or ''}",
+        f"modified: {modified or ''}",
+        "---",
+        "",
+    ]
+    text = "\n".join(front_matter) + body_markdown
+    if attachment_links:
+        text += "\n## Attachments\n\n" + "".join(f"- [{name}]({link})\n" for name, link in attachment_links)
+    return text
+
+
+def load_manifest(path):
+    """Return {note id: {modified, path, attachments}} from the previous export"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path, manifest):
+    """Write the manifest atomically so an interrupted run never corrupts it"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def export_folder(folder_path, folder_id, output_dir, manifest):
+    """Export the changed notes of one folder; returns (seen ids, written count)"""
+    columns = run_jxa(LIST_NOTES_JXA, {"folder_id": folder_id})
+    notes = {note_id: {"title": name, "created": created, "modified": modified}
+             for note_id, name, created, modified in
+             zip(columns["ids"], columns["names"], columns["created"], columns["modified"])}
+
+    def is_current(note_id, meta):
+        entry = manifest.get(note_id)
+        return (entry is not None and entry["modified"] == meta["modified"]
+                and str(Path(entry["path"]).parent) == str(Path(folder_path))
+                and (output_dir / entry["path"]).exists())
+
+    changed = [note_id for note_id, meta in notes.items() if not is_current(note_id, meta)]
+    if not changed:
+        return set(notes), 0
+
+    fetched = run_jxa(FETCH_NOTES_JXA, {
+        "folder_id": folder_id,
+        "ids": changed,
+        "bulk": len(changed) >= len(notes) * BULK_BODY_RATIO,
+    }, timeout=600)
+
+    # Save attachments not exported by an earlier run
+    attachments_dir = output_dir / ATTACHMENTS_DIR
+    to_save = []
+    for note in fetched:
+        exported = manifest.get(note["id"], {}).get("attachments", {})
+        for attachment in note["attachments"]:
+            target = attachments_dir / attachment_filename(attachment)
+            if attachment["id"] not in exported or not target.exists():
+                to_save.append({"id": attachment["id"], "path": str(target)})
+    failed_attachments = set()
+    if to_save:
+        attachments_dir.mkdir(parents=True, exist_ok=True)
+        for result in run_jxa(SAVE_ATTACHMENTS_JXA, {"items": to_save}, timeout=600):
+            if not result["ok"]:
+                failed_attachments.add(result["id"])
+                print(f"Failed to save attachment {result['id']}: {result['error']}")
+
+    folder_dir = output_dir / folder_path
+    folder_dir.mkdir(parents=True, exist_ok=True)
+    for note in fetched:
+        meta = notes[note["id"]]
+        rel_path = str(Path(folder_path) / f"{slugify(meta['title'], note['id'])}.md")
+
+        attachment_paths = {}
+        links = []
+        for attachment in note["attachments"]:
+            if attachment["id"] in failed_attachments:
+                continue
+            attachment_rel = f"{ATTACHMENTS_DIR}/{attachment_filename(attachment)}"
+            attachment_paths[attachment["id"]] = attachment_rel
+            links.append((attachment["name"], os.path.relpath(output_dir / attachment_rel, folder_dir)))
+
+        (output_dir / rel_path).write_text(render_note(
+            meta["title"], folder_path, note["id"], meta["created"], meta["modified"],
+            html_to_markdown(note["body"]), links), encoding="utf-8")
+
+        previous = manifest.get(note["id"])
+        if previous and previous["path"] != rel_path:
+            # Title or folder changed: drop the file written under the old slug
+            (output_dir / previous["path"]).unlink(missing_ok=True)
+
+        manifest[note["id"]] = {"modified": meta["modified"], "path": rel_path,
+                                "attachments": attachment_paths}
+
+    return set(notes), len(fetched)
+
+
+def export_notes_markdown(output_dir, account=None, folder_filter=None):
+    """Export all notes (or one folder subtree) to Markdown files"""
+    try:
+        output_dir = Path(output_dir).expanduser().resolve()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        manifest_path = output_dir / MANIFEST_NAME
+        manifest = load_manifest(manifest_path)
+
+        started = time.monotonic()
+        tree = FolderRegistry().account(account)
+        if tree is None:
+            print(f"Account '{account}' not found" if account else "No accounts found")
+            return False
+        folders = {path: folder_id for path, folder_id in tree["folders"].items()
+                   if not folder_filter or path == folder_filter or path.startswith(folder_filter + "/")}
+        if not folders:
+            print(f"No folders matching '{folder_filter}' in account '{tree['name']}'")
+            return False
+
+        seen = set()
+        written = 0
+        for folder_path, folder_id in sorted(folders.items()):
+            folder_seen, folder_written = export_folder(folder_path, folder_id, output_dir, manifest)
+            seen |= folder_seen
+            written += folder_written
+            if folder_written:
+                save_manifest(manifest_path, manifest)
+                print(f"{folder_path}: {folder_written} of {len(folder_seen)} notes exported")
+
+        # Remove notes deleted from Notes (only those inside the exported scope)
+        removed = 0
+        for note_id, entry in list(manifest.items()):
+            folder_path = str(Path(entry["path"]).parent)
+            if note_id not in seen and folder_path in folders:
+                (output_dir / entry["path"]).unlink(missing_ok=True)
+                del manifest[note_id]
+                removed += 1
+        save_manifest(manifest_path, manifest)
+
+        print(f"Exported {written} changed notes, removed {removed}, "
+              f"{len(seen) - written} unchanged ({time.monotonic() - started:.1f}s)")
+        return True
+
+    except Exception as e:
+        print(f"Error exporting notes: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python export_notes_markdown.py output_dir [--account 'iCloud'] [--folder 'Work/Projects']")
+        sys.exit(1)
+
+    output_dir = sys.argv[1]
+    account = None
+    folder = None
+
+    args = sys.argv[2:]
+    for i, arg in enumerate(args):
+        if arg.startswith('--account'):
+            account = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+        elif arg.startswith('--folder'):
+            folder = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+
+    success = export_notes_markdown(output_dir, account, folder)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Import Markdown Notes Script - JXA Implementation
+Imports a directory tree of Markdown files into Apple Notes
+
+Markdown is converted to Notes HTML in a process pool. Target folders
+are resolved through the folder registry (notes_folders.py) and missing
+ones are created up front in one call; notes are then created (without
+being shown) in batches, one osascript call per batch. A manifest in the source
+directory records each file's content hash and note ID, so re-running
+the import skips unchanged files and updates edited ones in place.
+
+Subdirectories become nested folders: notes/Work/Q3/plan.md is filed in
+"<root folder>/Work/Q3".
+
+Usage: python import_markdown_notes.py notes_dir ["Root Folder"] [--account "iCloud"]
+       [--workers 4] [--batch 25]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from notes_html import markdown_title, markdown_to_html
+from notes_folders import FolderRegistry
+from notes_jxa import run_jxa
+
+MANIFEST_NAME = ".notes-import.json"
+
+WRITE_NOTES_JXA = '''
+function main(p) {
+    return p.notes.map(item => {
+        try {
+            if (item.note_id) {
+                const note = Notes.notes.byId(item.note_id);
+                note.body = item.html;
+                return {path: item.path, note_id: note.id()};
+            }
+            const note = Notes.Note({name: item.title, body: item.html});
+            Notes.folders.byId(item.folder_id).notes.push(note);
+            return {path: item.path, note_id: note.id()};
+        } catch (e) {
+            return {path: item.path, error: e.message};
+        }
+    });
+}
+'''
+
+
+def convert_markdown_file(args):
+    """Read and convert one Markdown file (runs in a worker process)"""
+    root, rel_path = args
+    with open(os.path.join(root, rel_path), 'r', encoding='utf-8') as f:
+        markdown = f.read()
+    return {
+        "path": rel_path,
+        "hash": hashlib.sha256(markdown.encode("utf-8")).hexdigest(),
+        "title": markdown_title(markdown, Path(rel_path).stem),
+        "html": markdown_to_html(markdown),
+    }
+
+
+def find_markdown_files(root):
+    """Return Markdown file paths relative to `root`, skipping hidden directories"""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        for filename in sorted(filenames):
+            if filename.lower().endswith((".md", ".markdown")):
+                found.append(os.path.relpath(os.path.join(dirpath, filename), root))
+    return found
+
+
+def target_folder(rel_path, root_folder=None):
+    """Notes folder path for a file: root folder + the file's subdirectories"""
+    parts = [p for p in [root_folder] if p] + list(Path(rel_path).parent.parts)
+    return "/".join(parts)
+
+
+def load_manifest(path):
+    """Return {relative path: {hash, note_id, folder}} from a previous import"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path, manifest):
+    """Write the manifest atomically so an interrupted run never corrupts it"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def plan_import(converted, manifest, root_folder=None):
+    """Split converted files into notes to create, notes to update and unchanged files"""
+    create, update, unchanged = [], [], []
+    for item in converted:
+        previous = manifest.get(item["path"])
+        item = dict(item, folder=target_folder(item["path"], root_folder))
+        if not previous:
+            create.append(item)
+        elif previous["hash"] == item["hash"] and previous.get("folder") == item["folder"]:
+            unchanged.append(item)
+        elif previous.get("folder") == item["folder"]:
+            update.append(dict(item, note_id=previous["note_id"]))
+        else:
+            # Moved to another directory: file a new note in the new folder
+            create.append(item)
+    return create, update, unchanged
+
+
+def import_markdown_notes(source_dir, root_folder=None, account=None, workers=4, batch_size=25):
+    """Import every Markdown file under `source_dir` into Notes"""
+    try:
+        source_dir = str(Path(source_dir).expanduser().resolve())
+        manifest_path = os.path.join(source_dir, MANIFEST_NAME)
+        manifest = load_manifest(manifest_path)
+
+        started = time.monotonic()
+        files = find_markdown_files(source_dir)
+        if not files:
+            print(f"No Markdown files found in {source_dir}")
+            return False
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            converted = list(pool.map(convert_markdown_file,
+                                      [(source_dir, f) for f in files],
+                                      chunksize=max(1, len(files) // (workers * 4))))
+        print(f"Converted {len(converted)} files ({time.monotonic() - started:.1f}s)")
+
+        create, update, unchanged = plan_import(converted, manifest, root_folder)
+        print(f"{len(create)} to create, {len(update)} to update, {len(unchanged)} unchanged")
+        if not create and not update:
+            return True
+
+        # Resolve (and create) every target folder in a single call
+        registry = FolderRegistry()
+        folder_ids = registry.ensure([item["folder"] for item in create if item["folder"]], account)
+        target_account = registry.account(account)
+
+        pending = []
+        for item in create:
+            folder_id = folder_ids[item["folder"]] if item["folder"] else target_account["default"]
+            pending.append({"path": item["path"], "title": item["title"], "html": item["html"],
+                            "folder_id": folder_id})
+        for item in update:
+            pending.append({"path": item["path"], "html": item["html"], "note_id": item["note_id"]})
+
+        by_path = {item["path"]: item for item in create + update}
+        written = 0
+        failed = 0
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            for result in run_jxa(WRITE_NOTES_JXA, {"notes": batch}, timeout=600):
+                if result.get("error"):
+                    failed += 1
+                    print(f"Failed: {result['path']}: {result['error']}")
+                    continue
+                item = by_path[result["path"]]
+                manifest[item["path"]] = {"hash": item["hash"], "note_id": result["note_id"],
+                                          "folder": item["folder"]}
+                written += 1
+            save_manifest(manifest_path, manifest)
+            print(f"Progress: {min(start + batch_size, len(pending))}/{len(pending)}")
+
+        print(f"Imported {written} notes into account '{target_account['name']}' "
+              f"({failed} failed, {time.monotonic() - started:.1f}s)")
+        return failed == 0
+
+    except Exception as e:
+        print(f"Error importing Markdown notes: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    args = []
+    options = {}
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        if argv[i].startswith('--'):
+            name, _, value = argv[i].partition('=')
+            if not value and i + 1 < len(argv):
+                i += 1
+                value = argv[i]
+            options[name.lstrip('-')] = value
+        else:
+            args.append(argv[i])
+        i += 1
+
+    if not args:
+        print("Usage: python import_markdown_notes.py notes_dir ['Root Folder'] [--account 'iCloud'] "
+              "[--workers 4] [--batch 25]")
+        sys.exit(1)
+
+    success = import_markdown_notes(
+        args[0],
+        root_folder=args[1] if len(args) > 1 else None,
+        account=options.get('account'),
+        workers=int(options.get('workers', 4)),
+        batch_size=int(options.get('batch', 25)),
+    )
+    sys.exit(0 if success else 1)
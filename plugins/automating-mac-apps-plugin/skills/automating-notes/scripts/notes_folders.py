@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Notes Folder Registry - JXA Implementation
+Resolves Notes folder paths ("Work/Projects/Q3") to folder IDs
+
+The folder tree of every account is read in a single osascript call and
+cached on disk for a short time, so scripts that look up folders over and
+over (imports, batch note creation, searches) pay for one tree walk
+instead of one per lookup. Lookups are dictionary hits on the cached
+tree; folders created through the registry are added to the cache.
+
+Paths are "/"-separated from the account root. A bare folder name that
+is not a top-level path also matches a nested folder with that name.
+
+Usage: python notes_folders.py [list] [--account "iCloud"]
+       python notes_folders.py resolve "Work/Projects" [--account "iCloud"]
+       python notes_folders.py ensure "Work/Projects/Q3" [--account "iCloud"]
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from notes_jxa import FOLDER_TREE_JXA, run_jxa
+
+DEFAULT_CACHE_PATH = Path(os.path.expanduser("~/Library/Caches/automating-notes/folders.json"))
+
+# Seconds a cached tree is trusted before it is read again from Notes
+DEFAULT_TTL = 60
+
+LIST_TREE_JXA = FOLDER_TREE_JXA + '''
+function main(p) {
+    return Notes.accounts().map(acc => ({
+        name: acc.name(),
+        default: acc.defaultFolder.id(),
+        folders: folderTree(acc),
+    }));
+}
+'''
+
+ENSURE_FOLDERS_JXA = FOLDER_TREE_JXA + '''
+function main(p) {
+    const acc = resolveAccount(p.account);
+    const folders = folderTree(acc);
+    p.paths.forEach(path => {
+        let prefix = "";
+        let parent = acc;
+        path.split("/").forEach(part => {
+            prefix = prefix ? prefix + "/" + part : part;
+            if (!(prefix in folders)) {
+                const folder = Notes.Folder({name: part});
+                parent.folders.push(folder);
+                folders[prefix] = folder.id();
+            }
+            parent = Notes.folders.byId(folders[prefix]);
+        });
+    });
+    return {name: acc.name(), default: acc.defaultFolder.id(), folders: folders};
+}
+'''
+
+
+def normalize_path(path):
+    """Strip stray slashes and whitespace: " /Work//Q3/ " -> "Work/Q3" """
+    return "/".join(part.strip() for part in (path or "").split("/") if part.strip())
+
+
+class FolderRegistry:
+    """Cached map of folder paths to folder IDs for every Notes account"""
+
+    def __init__(self, cache_path=None, ttl=DEFAULT_TTL):
+        self.cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        self._accounts = None
+        self._paths = None
+        self._names = None
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - cached.get("fetched", 0) > self.ttl:
+            return None
+        return cached.get("accounts")
+
+    def _save_cache(self):
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"fetched": time.time(), "accounts": self._accounts}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _set_accounts(self, accounts):
+        self._accounts = accounts
+        self._paths = {}
+        self._names = {}
+        for account in accounts:
+            for path, folder_id in account["folders"].items():
+                match = (account["name"], folder_id)
+                self._paths.setdefault(path, []).append(match)
+                self._names.setdefault(path.rsplit("/", 1)[-1], []).append(match)
+
+    def accounts(self):
+        """Return [{name, default, folders: {path: id}}], reading Notes only when the cache is stale"""
+        if self._accounts is None:
+            cached = self._load_cache()
+            if cached is not None:
+                self._set_accounts(cached)
+            else:
+                self.refresh()
+        return self._accounts
+
+    def refresh(self):
+        """Re-read every account's folder tree from Notes and rewrite the cache"""
+        self._set_accounts(run_jxa(LIST_TREE_JXA, timeout=300))
+        self._save_cache()
+        return self._accounts
+
+    def invalidate(self):
+        """Forget the cached tree so the next lookup reads Notes again"""
+        self._accounts = None
+        try:
+            os.unlink(self.cache_path)
+        except FileNotFoundError:
+            pass
+
+    def account(self, account_name=None):
+        """Return one account's entry (the first account by default), or None"""
+        accounts = self.accounts()
+        if not account_name:
+            return accounts[0] if accounts else None
+        return next((a for a in accounts if a["name"] == account_name), None)
+
+    def resolve(self, path, account_name=None):
+        """Return (account name, folder id) for a folder path or bare name, or None"""
+        self.accounts()
+        path = normalize_path(path)
+        matches = self._paths.get(path)
+        if not matches and "/" not in path:
+            matches = self._names.get(path)
+        for name, folder_id in matches or []:
+            if not account_name or name == account_name:
+                return name, folder_id
+        return None
+
+    def folder_id(self, path, account_name=None, create=False):
+        """Return the ID of one folder, creating it (and its parents) when `create` is set"""
+        match = self.resolve(path, account_name)
+        if match:
+            return match[1]
+        if create and normalize_path(path):
+            return self.ensure([path], account_name)[normalize_path(path)]
+        return None
+
+    def ensure(self, paths, account_name=None):
+        """Return {path: folder id} for `paths` in one account, creating missing folders"""
+        account = self.account(account_name)
+        if account is None:
+            raise LookupError(f"Account '{account_name}' not found" if account_name else "No accounts found")
+
+        paths = sorted({normalize_path(p) for p in paths if normalize_path(p)})
+        missing = [p for p in paths if p not in account["folders"]]
+        if missing:
+            updated = run_jxa(ENSURE_FOLDERS_JXA, {"account": account["name"], "paths": missing}, timeout=300)
+            self._set_accounts([updated if a["name"] == updated["name"] else a for a in self._accounts])
+            self._save_cache()
+            account = self.account(updated["name"])
+        return {p: account["folders"][p] for p in paths}
+
+
+if __name__ == "__main__":
+    args = []
+    account = None
+    argv = sys.argv[1:]
+    i = 0
+    while i < len(argv):
+        if argv[i].startswith('--account'):
+            if '=' in argv[i]:
+                account = argv[i].split('=', 1)[1]
+            elif i + 1 < len(argv):
+                i += 1
+                account = argv[i]
+        else:
+            args.append(argv[i])
+        i += 1
+
+    command = args[0] if args else "list"
+    registry = FolderRegistry()
+    try:
+        if command == "list":
+            for entry in registry.refresh():
+                if account and entry["name"] != account:
+                    continue
+                print(f"{entry['name']}:")
+                for path in sorted(entry["folders"]):
+                    print(f"  {path}")
+        elif command == "resolve" and len(args) > 1:
+            match = registry.resolve(args[1], account)
+            if not match:
+                print(f"Folder '{args[1]}' not found")
+                sys.exit(1)
+            print(f"{match[0]} > {args[1]}: {match[1]}")
+        elif command == "ensure" and len(args) > 1:
+            for path, folder_id in registry.ensure(args[1:], account).items():
+                print(f"{path}: {folder_id}")
+        else:
+            print("Usage: python notes_folders.py [list | resolve 'Folder/Path' | ensure 'Folder/Path'] "
+                  "[--account 'iCloud']")
+            sys.exit(1)
+    except Exception as e:
+        print(f"Error reading Notes folders: {e}")
+        sys.exit(1)
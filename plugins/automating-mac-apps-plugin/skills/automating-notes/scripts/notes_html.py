@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Notes HTML Helpers
+Conversions between Apple Notes HTML bodies, plain text and Markdown
+
+Usage: python notes_html.py note.html   (prints the plain text)
+       python notes_html.py note.md     (prints Notes HTML)
+"""
+
+import html
+import re
+import sys
+from html.parser import HTMLParser
+
+# Tags that start a new line in the plain-text rendering
+BLOCK_TAGS = {"div", "p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "ul", "ol",
+              "tr", "table", "blockquote", "pre"}
+
+
+class _TextExtractor(HTMLParser):
+    """Collects the visible text of a Notes body, one line per block element"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style", "head"):
+            self.skip_depth += 1
+        elif tag == "br" or tag in BLOCK_TAGS:
+            self.parts.append("\n")
+        if tag == "li":
+            self.parts.append("- ")
+        elif tag in ("td", "th"):
+            self.parts.append("\t")
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style", "head"):
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+
+
+def html_to_text(body):
+    """Return the plain text of a Notes HTML body with blank lines collapsed"""
+    if not body:
+        return ""
+    parser = _TextExtractor()
+    parser.feed(body)
+    parser.close()
+
+    lines = [" ".join(line.replace("\xa0", " ").split()) for line in "".join(parser.parts).split("\n")]
+    return "\n".join(line for line in lines if line)
+
+
+class _MarkdownWriter(HTMLParser):
+    """Renders a Notes HTML body as Markdown"""
+
+    INLINE = {"b": "**", "strong": "**", "i": "*", "em": "*", "strike": "~~", "s": "~~", "del": "~~"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.lines = []
+        self.line = []
+        self.lists = []        # "ul" / "ol" per nesting level
+        self.counters = []
+        self.prefix = ""
+        self.href = None
+        self.link_text = []
+        self.code = False
+        self.quote = False
+
+    def flush(self):
+        text = "".join(self.line).rstrip()
+        self.line = []
+        if text.strip():
+            if self.quote:
+                text = "> " + text
+            self.lines.append(self.prefix + text)
+            self.prefix = ""
+        elif self.lines and self.lines[-1] != "" and not self.lists:
+            self.lines.append("")
+
+    def emit(self, text):
+        (self.link_text if self.href is not None else self.line).append(text)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in ("div", "p", "br", "blockquote") or tag in ("ul", "ol") and not self.lists:
+            self.flush()
+            self.quote = self.quote or tag == "blockquote"
+        if re.fullmatch(r"h[1-6]", tag):
+            self.flush()
+            self.prefix = "#" * int(tag[1]) + " "
+        elif tag in ("ul", "ol"):
+            if self.lists:
+                self.flush()
+            self.lists.append(tag)
+            self.counters.append(0)
+        elif tag == "li":
+            self.flush()
+            if self.counters:
+                self.counters[-1] += 1
+            indent = "  " * (len(self.lists) - 1)
+            marker = f"{self.counters[-1]}." if self.lists and self.lists[-1] == "ol" else "-"
+            self.prefix = f"{indent}{marker} "
+        elif tag in self.INLINE:
+            self.emit(self.INLINE[tag])
+        elif tag in ("tt", "code", "pre"):
+            self.code = True
+            self.emit("`")
+        elif tag == "a":
+            self.href = attrs.get("href") or ""
+            self.link_text = []
+        elif tag == "img":
+            src = attrs.get("src") or ""
+            if src and not src.startswith("data:"):
+                self.emit(f"![{attrs.get('alt') or ''}]({src})")
+
+    def handle_endtag(self, tag):
+        if tag in self.INLINE:
+            self.emit(self.INLINE[tag])
+        elif tag in ("tt", "code", "pre"):
+            self.emit("`")
+            self.code = False
+        elif tag == "a" and self.href is not None:
+            text, href = "".join(self.link_text), self.href
+            self.href = None
+            self.emit(f"[{text}]({href})" if href and href != text else text)
+        elif re.fullmatch(r"h[1-6]", tag) or tag in ("div", "p", "li"):
+            self.flush()
+        elif tag == "blockquote":
+            self.flush()
+            self.quote = False
+        elif tag in ("ul", "ol") and self.lists:
+            self.flush()
+            self.lists.pop()
+            self.counters.pop()
+            if not self.lists:
+                self.lines.append("")
+
+    def handle_data(self, data):
+        data = data.replace("\xa0", " ")
+        if not self.code:
+            data = re.sub(r"\s+", " ", data)
+        self.emit(data)
+
+
+def html_to_markdown(body):
+    """Convert a Notes HTML body to Markdown"""
+    if not body:
+        return ""
+    writer = _MarkdownWriter()
+    writer.feed(body)
+    writer.close()
+    writer.flush()
+    markdown = "\n".join(writer.lines).strip()
+    # Empty <b></b> / <strike></strike> runs leave bare marker pairs behind
+    markdown = re.sub(r"(\*\*|~~)\1", "", markdown)
+    return re.sub(r"\n{3,}", "\n\n", markdown) + "\n"
+
+
+_INLINE_CODE = re.compile(r"`([^`]+)`")
+_LINK = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+_BOLD = re.compile(r"(\*\*|__)(.+?)\1")
+_ITALIC = re.compile(r"(?<![\w*])([*_])(?!\s)(.+?)(?<!\s)\1(?![\w*])")
+_STRIKE = re.compile(r"~~(.+?)~~")
+_LIST_ITEM = re.compile(r"^(\s*)([-*+]|\d+[.)])\s+(.*)$")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+
+
+def _inline(text):
+    """Render inline Markdown (code, links, bold, italic, strike) to HTML"""
+    codes = []
+
+    def stash_code(match):
+        codes.append(f"<tt>{html.escape(match.group(1))}</tt>")
+        return f"\x00{len(codes) - 1}\x00"
+
+    text = _INLINE_CODE.sub(stash_code, text)
+    text = html.escape(text, quote=False)
+    # The text is already escaped, so only quotes need protecting inside href
+    text = _LINK.sub(lambda m: f'<a href="{m.group(2).replace(chr(34), "&quot;")}">{m.group(1)}</a>', text)
+    text = _BOLD.sub(r"<b>\2</b>", text)
+    text = _ITALIC.sub(r"<i>\2</i>", text)
+    text = _STRIKE.sub(r"<strike>\1</strike>", text)
+    return re.sub(r"\x00(\d+)\x00", lambda m: codes[int(m.group(1))], text)
+
+
+def markdown_title(markdown, default):
+    """Return the first level-1 heading of a Markdown document, or `default`"""
+    for line in markdown.splitlines():
+        match = _HEADING.match(line)
+        if match and len(match.group(1)) == 1:
+            return match.group(2)
+    return default
+
+
+def markdown_to_html(markdown):
+    """Convert Markdown to the HTML subset Notes renders
+
+    Headings map to <h1>-<h3>, paragraphs and blank lines to <div> rows,
+    lists (nested by indentation) to <ul>/<ol>, fenced code to monospaced
+    <div><tt> rows, and block quotes to <blockquote>.
+    """
+    out = []
+    list_stack = []  # (indent, tag)
+    in_code = False
+
+    def close_lists(indent=-1):
+        while list_stack and list_stack[-1][0] > indent:
+            out.append(f"</li></{list_stack.pop()[1]}>")
+
+    for line in markdown.splitlines():
+        if line.strip().startswith("```"):
+            close_lists()
+            in_code = not in_code
+            continue
+        if in_code:
+            out.append(f"<div><tt>{html.escape(line) or '<br>'}</tt></div>")
+            continue
+
+        item = _LIST_ITEM.match(line)
+        if item:
+            indent = len(item.group(1).expandtabs(4))
+            tag = "ol" if item.group(2)[0].isdigit() else "ul"
+            if list_stack and indent < list_stack[-1][0]:
+                close_lists(indent)
+            if list_stack and list_stack[-1][0] == indent:
+                if list_stack[-1][1] != tag:
+                    out.append(f"</li></{list_stack.pop()[1]}><{tag}><li>")
+                    list_stack.append((indent, tag))
+                else:
+                    out.append("</li><li>")
+            else:
+                out.append(f"<{tag}><li>")
+                list_stack.append((indent, tag))
+            out.append(_inline(item.group(3)))
+            continue
+
+        close_lists()
+        stripped = line.strip()
+        heading = _HEADING.match(stripped)
+        if heading:
+            level = min(len(heading.group(1)), 3)
+            out.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+        elif stripped.startswith(">"):
+            out.append(f"<blockquote>{_inline(stripped.lstrip('>').strip())}</blockquote>")
+        elif re.fullmatch(r"(-{3,}|\*{3,}|_{3,})", stripped):
+            out.append("<div><br></div>")
+        elif stripped:
+            out.append(f"<div>{_inline(stripped)}</div>")
+        else:
+            out.append("<div><br></div>")
+
+    close_lists()
+    return "".join(out)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python notes_html.py note.html|note.md")
+        sys.exit(1)
+
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        content = f.read()
+    print(markdown_to_html(content) if sys.argv[1].endswith('.md') else html_to_text(content))
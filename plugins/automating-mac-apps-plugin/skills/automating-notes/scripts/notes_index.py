@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Notes Search Index - SQLite FTS5
+Keeps a local full-text index of Apple Notes for millisecond searches
+
+Each note is stored once as plain text (HTML stripped) keyed by note ID
+and modification date. A sync lists note IDs and modification dates in
+bulk and only downloads bodies for notes that are new or changed, so a
+thousand-note account is re-synced with a handful of Apple Events.
+
+Usage: python notes_index.py sync [--notestore]
+       python notes_index.py search "query" [--folder "Folder Name"] [--limit 20]
+"""
+
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from notes_html import html_to_text
+
+DEFAULT_INDEX_PATH = Path(os.path.expanduser("~/Library/Caches/automating-notes/notes-index.sqlite"))
+
+# Fetch a whole folder's bodies in one call once this share of it has changed
+BULK_BODY_RATIO = 0.25
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    modified REAL NOT NULL,
+    title TEXT,
+    folder TEXT,
+    account TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(title, body, tokenize='unicode61');
+"""
+
+
+def to_timestamp(value):
+    """Normalize a modification date (datetime, ISO string or number) to epoch seconds"""
+    if value is None:
+        return 0.0
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    return float(value)
+
+
+def fts_query(search_term):
+    """Turn free text into an FTS5 query: every word must match as a prefix"""
+    words = search_term.split()
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+
+
+class PyXANotesSource:
+    """Reads note metadata and bodies from Notes.app using PyXA bulk reads"""
+
+    def __init__(self):
+        # Imported here so the index itself can be used (and tested) without PyXA
+        import PyXA
+        self.notes = PyXA.Application("Notes")
+        self.folders = {}
+
+    def list_notes(self):
+        """Return metadata for every note, one bulk read per folder column"""
+        records = []
+        for account in self.notes.accounts():
+            account_name = account.name
+            for folder in account.folders():
+                folder_notes = folder.notes()
+                ids = folder_notes.id()
+                if not ids:
+                    continue
+                # Keyed by ID: nested folders can share a name within one account
+                self.folders[folder.id] = (folder_notes, ids)
+                for note_id, title, modified in zip(ids, folder_notes.name(),
+                                                    folder_notes.modification_date()):
+                    records.append({
+                        "id": note_id,
+                        "modified": modified,
+                        "title": title,
+                        "folder": folder.name,
+                        "folder_id": folder.id,
+                        "account": account_name,
+                    })
+        return records
+
+    def fetch_texts(self, records):
+        """Return {id: plain text} for the given records
+
+        Folders where a large share of notes changed are read with a single
+        bulk `body()` call; otherwise only the changed notes are fetched.
+        """
+        wanted = {}
+        for record in records:
+            wanted.setdefault(record["folder_id"], set()).add(record["id"])
+
+        texts = {}
+        for folder_id, ids in wanted.items():
+            folder_notes, folder_ids = self.folders[folder_id]
+            if len(ids) >= len(folder_ids) * BULK_BODY_RATIO:
+                for note_id, body in zip(folder_ids, folder_notes.body()):
+                    if note_id in ids:
+                        texts[note_id] = html_to_text(body)
+            else:
+                for note_id in ids:
+                    texts[note_id] = html_to_text(folder_notes.by_id(note_id).body)
+        return texts
+
+
+class NotesIndex:
+    """SQLite FTS5 index of note titles and plain-text bodies"""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def sync(self, source):
+        """Bring the index up to date with `source`; returns change counts
+
+        A source provides `list_notes()` (id, modified, title, folder,
+        account per note) and `fetch_texts(records)` ({id: plain text}).
+        """
+        records = source.list_notes()
+        current = {row[0]: (row[1], row[2]) for row in
+                   self.db.execute("SELECT id, rowid, modified FROM notes")}
+
+        changed = [r for r in records
+                   if r["id"] not in current or current[r["id"]][1] != to_timestamp(r["modified"])]
+        removed = set(current) - {r["id"] for r in records}
+
+        texts = source.fetch_texts(changed) if changed else {}
+
+        with self.db:
+            for note_id in removed:
+                rowid = current[note_id][0]
+                self.db.execute("DELETE FROM notes_fts WHERE rowid = ?", (rowid,))
+                self.db.execute("DELETE FROM notes WHERE rowid = ?", (rowid,))
+
+            for record in changed:
+                self.db.execute(
+                    "INSERT INTO notes (id, modified, title, folder, account) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(id) DO UPDATE SET modified = excluded.modified, "
+                    "title = excluded.title, folder = excluded.folder, account = excluded.account",
+                    (record["id"], to_timestamp(record["modified"]), record["title"],
+                     record["folder"], record["account"]))
+                rowid = self.db.execute("SELECT rowid FROM notes WHERE id = ?",
+                                        (record["id"],)).fetchone()[0]
+                self.db.execute("DELETE FROM notes_fts WHERE rowid = ?", (rowid,))
+                self.db.execute("INSERT INTO notes_fts (rowid, title, body) VALUES (?, ?, ?)",
+                                (rowid, record["title"] or "", texts.get(record["id"], "")))
+
+        return {"total": len(records), "updated": len(changed), "removed": len(removed)}
+
+    def search(self, search_term, folder_name=None, limit=20):
+        """Return ranked matches with a highlighted snippet of the body"""
+        query = fts_query(search_term)
+        if not query:
+            return []
+
+        sql = ("SELECT n.id, n.title, n.folder, n.account, "
+               "snippet(notes_fts, 1, '[', ']', '...', 12), bm25(notes_fts, 10.0, 1.0) AS rank "
+               "FROM notes_fts JOIN notes n ON n.rowid = notes_fts.rowid "
+               "WHERE notes_fts MATCH ?")
+        params = [query]
+        if folder_name:
+            sql += " AND n.folder = ?"
+            params.append(folder_name)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+
+        return [
+            {"id": row[0], "title": row[1], "folder": row[2], "account": row[3], "snippet": row[4]}
+            for row in self.db.execute(sql, params)
+        ]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] not in ("sync", "search"):
+        print("Usage: python notes_index.py sync [--notestore] | search 'query' [--folder 'Folder Name'] [--limit 20]")
+        sys.exit(1)
+
+    index = NotesIndex()
+
+    if sys.argv[1] == "sync":
+        started = time.monotonic()
+        if '--notestore' in sys.argv[2:]:
+            from notestore_reader import NoteStoreSource
+            with NoteStoreSource() as source:
+                stats = index.sync(source)
+        else:
+            stats = index.sync(PyXANotesSource())
+        print(f"Indexed {stats['total']} notes: {stats['updated']} updated, "
+              f"{stats['removed']} removed ({time.monotonic() - started:.1f}s)")
+        sys.exit(0)
+
+    if len(sys.argv) < 3:
+        print("Usage: python notes_index.py search 'query' [--folder 'Folder Name'] [--limit 20]")
+        sys.exit(1)
+
+    folder = None
+    limit = 20
+    args = sys.argv[3:]
+    for i, arg in enumerate(args):
+        if arg.startswith('--folder'):
+            folder = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+        elif arg.startswith('--limit'):
+            limit = int(arg.split('=', 1)[1] if '=' in arg else args[i + 1])
+
+    results = index.search(sys.argv[2], folder, limit)
+    for i, note in enumerate(results, 1):
+        print(f"{i}. '{note['title']}' in {note['account']} > {note['folder']}")
+        print(f"   {note['snippet']}")
+    sys.exit(0 if results else 1)
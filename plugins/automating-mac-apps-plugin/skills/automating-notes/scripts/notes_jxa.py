@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Notes JXA Runner
+Runs a JXA program against Notes.app with JSON in and JSON out
+
+Programs go through the shared jxa_runner with `Notes` bound to the
+application; this module keeps the Notes helpers on top of it.
+"""
+
+import sys
+from pathlib import Path
+
+# The osascript runner is shared by every skill
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+import jxa_runner
+
+
+# Shared helpers: folderTree(account) -> {"Work/Projects": folder id, ...}
+FOLDER_TREE_JXA = '''
+function folderTree(acc) {
+    // Works whether account.folders lists only top-level folders or all
+    // of them: roots are the folders that are nobody's child.
+    const names = {}, children = {};
+    const topIds = acc.folders.id(), topNames = acc.folders.name();
+    topIds.forEach((id, i) => { names[id] = topNames[i]; });
+
+    const queue = topIds.slice();
+    while (queue.length) {
+        const id = queue.shift();
+        if (children[id]) continue;
+        const sub = Notes.folders.byId(id).folders;
+        const subIds = sub.id(), subNames = sub.name();
+        children[id] = subIds;
+        subIds.forEach((subId, i) => {
+            names[subId] = subNames[i];
+            if (!children[subId]) queue.push(subId);
+        });
+    }
+
+    const isChild = {};
+    Object.keys(children).forEach(id => children[id].forEach(c => { isChild[c] = true; }));
+
+    const folders = {};
+    function walk(id, prefix) {
+        const path = prefix ? prefix + "/" + names[id] : names[id];
+        if (!(path in folders)) folders[path] = id;
+        (children[id] || []).forEach(c => walk(c, path));
+    }
+    topIds.filter(id => !isChild[id]).forEach(id => walk(id, ""));
+    return folders;
+}
+
+function resolveAccount(name) {
+    return name ? Notes.accounts.byName(name) : Notes.accounts[0];
+}
+'''
+
+
+def run_jxa(script, payload=None, timeout=120):
+    """Run `script` (which defines main(payload)) against Notes.app and return its JSON result"""
+    return jxa_runner.run_jxa("Notes", script, payload, timeout)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+NoteStore Reader - Direct SQLite Access
+Reads notes straight from the Notes group container database
+
+Apple Events cost one round trip per property; the NoteStore.sqlite
+database has every note's title, folder, dates and body in a few tables.
+Bodies are gzip-compressed protobuf documents; the plain text lives at
+NoteStoreProto.document(2).note(3).note_text(2). The database is only
+ever opened read-only, and `copy=True` reads from a private snapshot
+(database + WAL + SHM) so a live Notes.app is never touched.
+
+Requires Full Disk Access for the terminal/Python process.
+
+Usage: python notestore_reader.py [--copy] [--folder "Folder Name"] [--db path/to/NoteStore.sqlite]
+"""
+
+import gzip
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import quote
+
+# The protobuf wire decoder is shared with the Numbers reader
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+from protobuf_wire import iter_protobuf_fields
+
+DEFAULT_NOTESTORE_PATH = Path(os.path.expanduser(
+    "~/Library/Group Containers/group.com.apple.notes/NoteStore.sqlite"))
+
+# Core Data stores dates as seconds since 2001-01-01 00:00:00 UTC
+CORE_DATA_EPOCH = datetime(2001, 1, 1, tzinfo=timezone.utc)
+
+# Column names drift between macOS releases; the first one present wins
+COLUMN_CANDIDATES = {
+    "note_title": ["ZTITLE1", "ZTITLE"],
+    "folder_title": ["ZTITLE2"],
+    "modified": ["ZMODIFICATIONDATE1", "ZMODIFICATIONDATE"],
+    "created": ["ZCREATIONDATE3", "ZCREATIONDATE1", "ZCREATIONDATE"],
+    "folder_owner": ["ZOWNER"],
+    "account_name": ["ZNAME"],
+    "deleted": ["ZMARKEDFORDELETION"],
+    "locked": ["ZISPASSWORDPROTECTED"],
+}
+
+
+class NoteStoreError(RuntimeError):
+    """Raised when the database does not look like a NoteStore"""
+
+
+def _first_field(buf, number):
+    for field_number, wire_type, value in iter_protobuf_fields(buf):
+        if field_number == number and wire_type == 2:
+            return value
+    return None
+
+
+def decode_note_body(blob):
+    """Return the plain text of a ZICNOTEDATA.ZDATA blob (None if undecodable)"""
+    if not blob:
+        return None
+    try:
+        data = bytes(blob)
+        if data[:2] == b"\x1f\x8b":
+            data = gzip.decompress(data)
+        elif data[:1] == b"\x78":
+            data = zlib.decompress(data)
+
+        message = data
+        for number in (2, 3, 2):  # document -> note -> note_text
+            message = _first_field(message, number)
+            if message is None:
+                return None
+        return message.decode("utf-8", errors="replace")
+    except (OSError, ValueError, EOFError, zlib.error):
+        return None
+
+
+def core_data_date(value):
+    """Convert a Core Data timestamp to an aware UTC datetime"""
+    if value is None:
+        return None
+    return CORE_DATA_EPOCH + timedelta(seconds=float(value))
+
+
+class NoteStoreReader:
+    """Read-only access to NoteStore.sqlite"""
+
+    def __init__(self, path=DEFAULT_NOTESTORE_PATH, copy=False):
+        self.path = Path(path).expanduser()
+        if not self.path.exists():
+            raise NoteStoreError(f"NoteStore not found: {self.path}")
+
+        self._snapshot_dir = None
+        db_path = self.path
+        if copy:
+            self._snapshot_dir = tempfile.mkdtemp(prefix="notestore-")
+            for suffix in ("", "-wal", "-shm"):
+                source = Path(f"{self.path}{suffix}")
+                if source.exists():
+                    shutil.copy2(source, Path(self._snapshot_dir) / f"{self.path.name}{suffix}")
+            db_path = Path(self._snapshot_dir) / self.path.name
+
+        self.db = sqlite3.connect(f"file:{quote(str(db_path))}?mode=ro", uri=True)
+        self.columns = self._resolve_columns()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+        if self._snapshot_dir:
+            shutil.rmtree(self._snapshot_dir, ignore_errors=True)
+            self._snapshot_dir = None
+
+    def _resolve_columns(self):
+        tables = {row[0] for row in self.db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        if not {"ZICCLOUDSYNCINGOBJECT", "ZICNOTEDATA"} <= tables:
+            raise NoteStoreError(f"{self.path} is not a NoteStore database")
+
+        present = {row[1] for row in self.db.execute("PRAGMA table_info(ZICCLOUDSYNCINGOBJECT)")}
+        columns = {}
+        for key, candidates in COLUMN_CANDIDATES.items():
+            columns[key] = next((c for c in candidates if c in present), None)
+        for required in ("note_title", "folder_title", "modified"):
+            if not columns[required]:
+                raise NoteStoreError(f"Unsupported NoteStore schema (no {required} column)")
+        return columns
+
+    def _column(self, alias, key, default="NULL"):
+        name = self.columns[key]
+        return f"{alias}.{name}" if name else default
+
+    def iter_notes(self, folder_name=None, include_deleted=False, include_text=True, note_ids=None):
+        """Yield one dict per note: id, title, folder, account, created, modified, text
+
+        Rows are streamed from the cursor, so memory stays flat however many
+        notes the account holds. Password-protected notes have text None.
+        `note_ids` restricts the output (and body decoding) to those IDs.
+        """
+        account = (f"(SELECT {self._column('a', 'account_name')} FROM ZICCLOUDSYNCINGOBJECT a "
+                   f"WHERE a.Z_PK = {self._column('f', 'folder_owner')})")
+        sql = (f"SELECT n.ZIDENTIFIER, n.{self.columns['note_title']}, f.{self.columns['folder_title']}, "
+               f"{account}, {self._column('n', 'created')}, n.{self.columns['modified']}, "
+               f"{self._column('n', 'locked', '0')}, {'d.ZDATA' if include_text else 'NULL'} "
+               f"FROM ZICCLOUDSYNCINGOBJECT n "
+               f"JOIN ZICNOTEDATA d ON d.Z_PK = n.ZNOTEDATA "
+               f"LEFT JOIN ZICCLOUDSYNCINGOBJECT f ON f.Z_PK = n.ZFOLDER "
+               f"WHERE n.{self.columns['note_title']} IS NOT NULL")
+        params = []
+        if not include_deleted and self.columns["deleted"]:
+            sql += f" AND COALESCE(n.{self.columns['deleted']}, 0) = 0"
+        if folder_name:
+            sql += f" AND f.{self.columns['folder_title']} = ?"
+            params.append(folder_name)
+        sql += f" ORDER BY n.{self.columns['modified']} DESC"
+
+        for note_id, title, folder, account_name, created, modified, locked, blob in \
+                self.db.execute(sql, params):
+            if note_ids is not None and note_id not in note_ids:
+                continue
+            yield {
+                "id": note_id,
+                "title": title,
+                "folder": folder,
+                "account": account_name,
+                "created": core_data_date(created),
+                "modified": core_data_date(modified),
+                "text": None if locked or not include_text else decode_note_body(blob),
+            }
+
+
+class NoteStoreSource:
+    """notes_index source backed by NoteStore.sqlite instead of Apple Events
+
+    list_notes and fetch_texts share one reader, so a sync copies the
+    database once and sees a single snapshot; close it (or use `with`)
+    when the sync is done.
+    """
+
+    def __init__(self, path=DEFAULT_NOTESTORE_PATH, copy=True):
+        self.path = path
+        self.copy = copy
+        self.reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.reader:
+            self.reader.close()
+            self.reader = None
+
+    def _reader(self):
+        if self.reader is None:
+            self.reader = NoteStoreReader(self.path, copy=self.copy)
+        return self.reader
+
+    def list_notes(self):
+        return list(self._reader().iter_notes(include_text=False))
+
+    def fetch_texts(self, records):
+        wanted = {record["id"] for record in records}
+        return {note["id"]: note["text"] or "" for note in self._reader().iter_notes(note_ids=wanted)}
+
+
+if __name__ == "__main__":
+    db_path = DEFAULT_NOTESTORE_PATH
+    copy = False
+    folder = None
+
+    args = sys.argv[1:]
+    for i, arg in enumerate(args):
+        if arg == '--copy':
+            copy = True
+        elif arg.startswith('--folder'):
+            folder = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+        elif arg.startswith('--db'):
+            db_path = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+
+    try:
+        count = 0
+        with NoteStoreReader(db_path, copy=copy) as reader:
+            for note in reader.iter_notes(folder_name=folder):
+                count += 1
+                modified = note['modified'].strftime('%Y-%m-%d %H:%M') if note['modified'] else '-'
+                print(f"{modified}  {note['account'] or '-'} > {note['folder'] or '-'} > {note['title']}")
+        print(f"\n{count} notes")
+        sys.exit(0)
+    except (NoteStoreError, sqlite3.Error) as e:
+        print(f"Error reading NoteStore: {e}")
+        sys.exit(1)
@@ -3,53 +3,112 @@
 Search Notes Script - PyXA Implementation
 Searches for notes containing specific text
 
-Usage: python search_notes.py "search term" ["folder name"]
+Usage: python search_notes.py "search term" ["folder name"] [--index] [--notestore]
+
+With --index, the local FTS index (see notes_index.py) is synced
+incrementally and queried instead of downloading every note body.
+With --notestore, notes are read from NoteStore.sqlite (see
+notestore_reader.py) instead of through Apple Events.
 """
 
 import sys
-import PyXA
 
-def search_notes(search_term, folder_name=None):
+from notes_folders import FolderRegistry
+
+def search_notes_indexed(search_term, folder_name=None, use_notestore=False):
+    """Search the local notes index after an incremental sync"""
+    from notes_index import NotesIndex, PyXANotesSource
+
+    index = NotesIndex()
+    try:
+        if use_notestore:
+            from notestore_reader import NoteStoreSource
+            with NoteStoreSource() as source:
+                stats = index.sync(source)
+        else:
+            stats = index.sync(PyXANotesSource())
+        print(f"Index synced: {stats['updated']} updated, {stats['removed']} removed")
+        return index.search(search_term, folder_name)
+    finally:
+        index.close()
+
+def search_notestore(search_term, folder_name=None):
+    """Scan NoteStore.sqlite directly for notes containing the search term"""
+    from notestore_reader import NoteStoreReader
+
+    term = search_term.lower()
+    with NoteStoreReader(copy=True) as reader:
+        return [
+            {'title': note['title'], 'folder': note['folder'], 'account': note['account'],
+             'id': note['id']}
+            for note in reader.iter_notes(folder_name=folder_name)
+            if term in (note['title'] or "").lower() or term in (note['text'] or "").lower()
+        ]
+
+def search_notes(search_term, folder_name=None, use_index=False, use_notestore=False):
     """Search for notes containing the search term"""
     try:
+        if use_notestore and not use_index:
+            matching_notes = search_notestore(search_term, folder_name)
+            if matching_notes:
+                print(f"Found {len(matching_notes)} notes containing '{search_term}':")
+                for i, note in enumerate(matching_notes, 1):
+                    print(f"{i}. '{note['title']}' in {note['account']} > {note['folder']}")
+            else:
+                print(f"No notes found containing '{search_term}'")
+            return matching_notes
+
+        if use_index:
+            matching_notes = search_notes_indexed(search_term, folder_name, use_notestore)
+            if matching_notes:
+                print(f"Found {len(matching_notes)} notes matching '{search_term}':")
+                for i, note in enumerate(matching_notes, 1):
+                    print(f"{i}. '{note['title']}' in {note['account']} > {note['folder']}")
+                    print(f"   {note['snippet']}")
+            else:
+                print(f"No notes found containing '{search_term}'")
+            return matching_notes
+
+        # Imported here so --notestore and --index --notestore work without PyXA
+        import PyXA
+
         notes = PyXA.Application("Notes")
 
         matching_notes = []
 
-        for account in notes.accounts():
-            folders_to_search = []
-
-            if folder_name:
-                # Search specific folder
-                for folder in account.folders():
-                    if folder.name == folder_name:
-                        folders_to_search = [folder]
-                        break
-            else:
-                # Search all folders
-                folders_to_search = account.folders()
-
-            for folder in folders_to_search:
-                try:
-                    folder_notes = folder.notes()
-
-                    for note in folder_notes:
-                        # Check title and body
-                        title = note.name or ""
-                        body = note.body or ""
-
-                        if (search_term.lower() in title.lower() or
-                            search_term.lower() in body.lower()):
-                            matching_notes.append({
-                                'title': title,
-                                'folder': folder.name,
-                                'account': account.name,
-                                'id': note.id
-                            })
-
-                except Exception as e:
-                    print(f"Error searching folder {folder.name}: {e}")
-                    continue
+        if folder_name:
+            # Search specific folder, resolved through the cached folder registry
+            match = FolderRegistry().resolve(folder_name)
+            if not match:
+                print(f"Folder '{folder_name}' not found")
+                return []
+            folders_to_search = [(match[0], notes.folders().by_id(match[1]))]
+        else:
+            # Search all folders
+            folders_to_search = [(account.name, folder)
+                                 for account in notes.accounts() for folder in account.folders()]
+
+        for account_name, folder in folders_to_search:
+            try:
+                folder_notes = folder.notes()
+
+                for note in folder_notes:
+                    # Check title and body
+                    title = note.name or ""
+                    body = note.body or ""
+
+                    if (search_term.lower() in title.lower() or
+                        search_term.lower() in body.lower()):
+                        matching_notes.append({
+                            'title': title,
+                            'folder': folder.name,
+                            'account': account_name,
+                            'id': note.id
+                        })
+
+            except Exception as e:
+                print(f"Error searching folder {folder.name}: {e}")
+                continue
 
         # Display results
         if matching_notes:
@@ -66,12 +125,16 @@ def search_notes(search_term, folder_name=None):
         return []
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python search_notes.py 'search term' ['folder name']")
+    use_index = '--index' in sys.argv[1:]
+    use_notestore = '--notestore' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg not in ('--index', '--notestore')]
+
+    if len(args) < 1:
+        print("Usage: python search_notes.py 'search term' ['folder name'] [--index] [--notestore]")
         sys.exit(1)
 
-    search_term = sys.argv[1]
-    folder = sys.argv[2] if len(sys.argv) > 2 else None
+    search_term = args[0]
+    folder = args[1] if len(args) > 1 else None
 
-    results = search_notes(search_term, folder)
+    results = search_notes(search_term, folder, use_index, use_notestore)
     sys.exit(0 if results else 1)
\ No newline at end of file
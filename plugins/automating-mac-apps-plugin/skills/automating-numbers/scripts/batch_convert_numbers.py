@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Batch Convert Numbers Script - JXA Implementation
+Exports many .numbers files to CSV, XLSX and/or PDF in one Numbers session
+
+Numbers is launched once and stays running for the whole batch. Each file
+is opened, exported to every requested format and closed in a single
+osascript call with a per-file timeout; documents that were already open
+are left open. A scanner thread expands globs and folders into a bounded
+queue, so the file walk overlaps with Numbers' work and long lists never
+sit in memory. Every file's outcome (status, outputs, seconds, error) is
+appended to a JSON Lines manifest; an output is skipped on the next run
+when its source has the same modification time and the output still
+exists.
+
+Usage: python batch_convert_numbers.py "reports/*.numbers" [more files or folders] --output out_dir
+       [--formats csv,xlsx,pdf] [--timeout 180] [--manifest results.jsonl] [--queue 8] [--force]
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from numbers_jxa import TABLE_JXA, run_jxa
+from numbers_native import find_numbers_files
+
+# The session, queue and manifest pipeline is shared with the Keynote batch exporter
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+from batch_export import DEFAULT_QUEUE_SIZE, parse_batch_args, run_batch
+
+# format -> (Numbers export type, file extension, export properties)
+FORMATS = {
+    "csv": ("CSV", ".csv", {}),
+    "xlsx": ("Microsoft Excel", ".xlsx", {}),
+    "pdf": ("PDF", ".pdf", {}),
+}
+
+DEFAULT_TIMEOUT = 180
+MANIFEST_NAME = "conversion-manifest.jsonl"
+
+CONVERT_JXA = TABLE_JXA + '''
+function main(p) {
+    const doc = openDocument(p.path);
+    try {
+        p.outputs.forEach(o => {
+            const options = {to: Path(o.path), as: o.as};
+            if (Object.keys(o.properties).length) options.withProperties = o.properties;
+            Numbers.export(doc, options);
+        });
+    } finally {
+        if (p.close) doc.close({saving: "no"});
+    }
+    return true;
+}
+'''
+
+
+def batch_convert_numbers(inputs, output_dir, formats=("csv",), timeout=DEFAULT_TIMEOUT, manifest_path=None,
+                          queue_size=DEFAULT_QUEUE_SIZE, force=False):
+    """Convert .numbers files in one Numbers session; returns (converted, skipped, failed)"""
+    return run_batch(run_jxa, "Numbers", CONVERT_JXA, FORMATS, find_numbers_files, inputs, output_dir, formats,
+                     timeout, manifest_path or os.path.join(output_dir, MANIFEST_NAME), queue_size, force)
+
+
+if __name__ == "__main__":
+    inputs, options = parse_batch_args(sys.argv[1:], "csv", DEFAULT_TIMEOUT)
+
+    if not inputs or not options["output"]:
+        print("Usage: python batch_convert_numbers.py 'reports/*.numbers' [more files or folders] --output out_dir "
+              "[--formats csv,xlsx,pdf] [--timeout 180] [--manifest results.jsonl] [--queue 8] [--force]")
+        sys.exit(1)
+
+    try:
+        converted, skipped, failed = batch_convert_numbers(
+            inputs,
+            options["output"],
+            formats=options["formats"],
+            timeout=options["timeout"],
+            manifest_path=options["manifest"],
+            queue_size=options["queue"],
+            force=options["force"],
+        )
+    except Exception as e:
+        print(f"Error converting Numbers files: {e}")
+        sys.exit(1)
+    sys.exit(0 if not failed else 1)
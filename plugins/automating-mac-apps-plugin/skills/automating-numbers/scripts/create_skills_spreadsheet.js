@@ -17,27 +17,24 @@ Numbers.includeStandardAdditions = true;
 
 const SKILLS_PATH = "/Users/richardhightower/clients/spillwave/src/skill-foundary-agent/using_apple_automation_foundary/automating-mac-apps-plugin/plugins/automating-mac-apps-plugin/skills";
 
-// Get all files in a directory recursively
+// Get all files in a directory recursively, with sizes, in one shell call
 function getFilesInDir(dirPath) {
   const files = [];
   try {
-    const result = app.doShellScript(`find "${dirPath}" -type f 2>/dev/null`);
+    // One stat per batch of paths instead of one shell process per file
+    const result = app.doShellScript(`find "${dirPath}" -type f -exec stat -f '%z %N' {} + 2>/dev/null`);
     if (result) {
       // JXA shell script returns \r for newlines
-      const paths = result.split(/[\r\n]+/).filter(p => p.length > 0);
-      for (const filePath of paths) {
-        try {
-          const sizeResult = app.doShellScript(`stat -f%z "${filePath}" 2>/dev/null || echo 0`);
-          const size = parseInt(sizeResult, 10) || 0;
-          // Make path relative to skill directory
-          const relativePath = filePath.replace(dirPath + "/", "");
-          files.push({
-            path: relativePath,
-            size: size
-          });
-        } catch (e) {
-          // Skip files we can't stat
-        }
+      const lines = result.split(/[\r\n]+/).filter(l => l.length > 0);
+      for (const line of lines) {
+        const space = line.indexOf(" ");
+        const size = parseInt(line.slice(0, space), 10) || 0;
+        // Make path relative to skill directory
+        const relativePath = line.slice(space + 1).replace(dirPath + "/", "");
+        files.push({
+          path: relativePath,
+          size: size
+        });
       }
     }
   } catch (e) {
@@ -46,6 +43,20 @@ function getFilesInDir(dirPath) {
   return files;
 }
 
+// Write a block of rows starting at 1-based row r0, column c0. Numbers has
+// no event that spreads a list over a range, so each non-empty cell is one set;
+// the rows are never pushed one at a time (the table is pre-sized).
+// A copy of writeRows in numbers_jxa.py (TABLE_JXA): this script runs on
+// its own under osascript, which can't load the Python module's helpers.
+function writeRows(table, r0, c0, rows) {
+  rows.forEach((row, i) => {
+    const cells = table.rows[r0 + i - 1].cells;
+    row.forEach((v, j) => {
+      if (v !== null && v !== "") cells[c0 + j - 1].value = v;
+    });
+  });
+}
+
 // Format file size for display
 function formatSize(bytes) {
   if (bytes < 1024) return bytes + " B";
@@ -103,26 +114,12 @@ function run() {
       // Get the table in this sheet
       const table = sheet.tables[0];
 
-      // Set up header row
-      table.rows[0].cells[0].value = "Path";
-      table.rows[0].cells[1].value = "Size";
-
-      // Make header bold by selecting and formatting
-      // (JXA Numbers doesn't have direct bold control, but we set values)
+      // Size the table once, then write every row
+      const rows = [["Path", "Size"]].concat(files.map(f => [f.path, formatSize(f.size)]));
+      table.rowCount = Math.max(rows.length, table.headerRowCount() + 1);
+      table.columnCount = 2;
 
-      // Add file data
-      for (let i = 0; i < files.length; i++) {
-        const rowIndex = i + 1; // Skip header row
-
-        // Ensure we have enough rows
-        while (table.rows.length <= rowIndex) {
-          table.rows.push(Numbers.Row());
-        }
-
-        // Set cell values
-        table.rows[rowIndex].cells[0].value = files[i].path;
-        table.rows[rowIndex].cells[1].value = formatSize(files[i].size);
-      }
+      writeRows(table, 1, 1, rows);
 
       // Resize columns to fit content (approximate)
       delay(0.1);
@@ -3,99 +3,85 @@
 Export Numbers Spreadsheet to CSV Script
 Exports a Numbers spreadsheet to CSV format
 
-Usage: python export_numbers_to_csv.py "input.numbers" "output.csv"
+The table is read in blocks of rows, one Apple Event per block
+(`range "A1:F2000"` cell values, see read_numbers_spreadsheet.py), and
+returned as JSON, so commas, quotes and newlines inside cells survive
+the trip. Rows are written with the csv module (RFC 4180 quoting) as
+each block arrives. --native parses the file directly instead (no
+Numbers.app; see numbers_native.py).
+
+Usage: python export_numbers_to_csv.py "input.numbers" "output.csv" [--sheet "Sheet 1"] [--table "Table 1"]
+       [--chunk 2000] [--native]
 """
 
 import sys
-import subprocess
 import csv
-from pathlib import Path
+from datetime import datetime
 
-def export_numbers_to_csv(input_file, output_file):
+from read_numbers_spreadsheet import DEFAULT_CHUNK_ROWS, open_document
+
+
+def csv_value(value):
+    """Format a typed cell value for CSV"""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d") if value.time() == datetime.min.time() else value.isoformat(sep=" ")
+    return str(value)
+
+
+def export_numbers_to_csv(input_file, output_file, sheet=None, table=None, chunk_rows=DEFAULT_CHUNK_ROWS,
+                          native=False):
     """Export Numbers spreadsheet to CSV"""
 
     print(f"Exporting Numbers spreadsheet to CSV: {input_file} -> {output_file}")
 
     try:
-        script = f'''
-        tell application "Numbers"
-            set theDoc to open POSIX file "{Path(input_file).resolve()}"
-
-            -- Get the first sheet and table
-            set firstSheet to sheet 1 of theDoc
-            set firstTable to table 1 of firstSheet
-
-            -- Read all cell values and create CSV data
-            set csvData to ""
-
-            -- Get table dimensions
-            set rowCount to count of rows of firstTable
-            set colCount to count of columns of firstTable
-
-            repeat with i from 1 to rowCount
-                set rowData to {{}}
-                repeat with j from 1 to colCount
-                    try
-                        set cellValue to value of cell j of row i of firstTable
-                        -- Convert to string and escape quotes
-                        set cellString to cellValue as string
-                        set end of rowData to cellString
-                    on error
-                        set end of rowData to ""
-                    end try
-                end repeat
-
-                -- Join row with commas
-                set AppleScript's text item delimiters to ","
-                set rowString to rowData as string
-                set AppleScript's text item delimiters to ""
-
-                -- Add to CSV data
-                set csvData to csvData & rowString & linefeed
-            end repeat
-
-            -- Close without saving
-            close theDoc saving no
-
-            return csvData
-        end tell
-        '''
-
-        result = subprocess.run(["osascript", "-e", script],
-                              capture_output=True, text=True, check=True, timeout=30)
-
-        csv_data = result.stdout.strip()
-        if csv_data:
-            # Write CSV data to file
+        written = 0
+        with open_document(input_file, native) as doc:
+            _, table_info = doc.find_table(sheet, table)
+            if not table_info["rows"]:
+                print("No data found to export")
+                return False
+
             with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                # Parse the CSV data and write properly
-                lines = csv_data.split('\n')
-                for line in lines:
-                    if line.strip():  # Skip empty lines
-                        # Split by comma and handle basic CSV writing
-                        csvfile.write(line + '\n')
-
-            print(f"Successfully exported to CSV: {output_file}")
-            return True
-        else:
-            print("No data found to export")
-            return False
-
-    except subprocess.CalledProcessError as e:
-        print(f"AppleScript failed: {e}")
-        print(f"Error output: {e.stderr}")
-        return False
+                writer = csv.writer(csvfile)
+                for row in doc.iter_rows(sheet, table, chunk_rows=chunk_rows):
+                    writer.writerow([csv_value(v) for v in row])
+                    written += 1
+                    if written % chunk_rows == 0:
+                        print(f"Progress: {written}/{table_info['rows']} rows")
+
+        print(f"Successfully exported {written} rows to CSV: {output_file}")
+        return True
+
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        print(f"Error exporting to CSV: {e}")
         return False
 
+
 if __name__ == "__main__":
     if len(sys.argv) < 3:
-        print("Usage: python export_numbers_to_csv.py 'input.numbers' 'output.csv'")
+        print("Usage: python export_numbers_to_csv.py 'input.numbers' 'output.csv' [--sheet 'Sheet 1'] "
+              "[--table 'Table 1'] [--chunk 2000] [--native]")
         sys.exit(1)
 
     input_file = sys.argv[1]
     output_file = sys.argv[2]
-
-    success = export_numbers_to_csv(input_file, output_file)
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sheet = None
+    table = None
+    chunk_rows = DEFAULT_CHUNK_ROWS
+
+    args = sys.argv[3:]
+    for i, arg in enumerate(args):
+        if arg.startswith('--sheet'):
+            sheet = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+        elif arg.startswith('--table'):
+            table = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+        elif arg.startswith('--chunk'):
+            chunk_rows = int(arg.split('=', 1)[1] if '=' in arg else args[i + 1])
+
+    success = export_numbers_to_csv(input_file, output_file, sheet, table, chunk_rows, native='--native' in args)
+    sys.exit(0 if success else 1)
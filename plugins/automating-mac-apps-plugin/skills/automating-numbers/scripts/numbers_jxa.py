@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Numbers JXA Runner
+Runs a JXA program against Numbers.app with JSON in and JSON out
+
+Programs go through the shared jxa_runner with `Numbers` bound to the
+application; this module keeps the Numbers helpers on top of it.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# The osascript runner is shared by every skill
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+import jxa_runner
+
+
+# Shared helpers for opening documents and reading/writing cell ranges in bulk
+TABLE_JXA = '''
+function openDocument(path) {
+    // Returns the already-open document when the file is open in Numbers
+    return Numbers.open(Path(path));
+}
+
+function findTable(doc, sheetName, tableName) {
+    const sheet = sheetName ? doc.sheets.byName(sheetName) : doc.sheets[0];
+    return tableName ? sheet.tables.byName(tableName) : sheet.tables[0];
+}
+
+function isOpen(path) {
+    return Numbers.documents().some(d => {
+        try { return d.file().toString() === path; } catch (e) { return false; }
+    });
+}
+
+function colName(n) {
+    let name = "";
+    for (; n > 0; n = Math.floor((n - 1) / 26)) name = String.fromCharCode(65 + (n - 1) % 26) + name;
+    return name;
+}
+
+function encodeValue(v) {
+    // Dates are tagged so they can't be confused with strings on the Python side
+    if (v instanceof Date) return {"$date": v.toISOString()};
+    return v === undefined ? null : v;
+}
+
+function readRange(table, r0, r1, c0, c1) {
+    // One Apple Event for the whole block; values come back row-major
+    const values = table.ranges[colName(c0) + r0 + ":" + colName(c1) + r1].cells.value();
+    const width = c1 - c0 + 1, rows = [];
+    for (let i = 0; i < values.length; i += width) rows.push(values.slice(i, i + width).map(encodeValue));
+    return rows;
+}
+
+function writeRows(table, r0, c0, rows) {
+    // Numbers has no event that spreads a list over a range, so this is one
+    // set per non-empty cell - but all of them inside one osascript process
+    rows.forEach((row, i) => {
+        const cells = table.rows[r0 + i - 1].cells;
+        row.forEach((v, j) => {
+            if (v !== null && v !== "") cells[c0 + j - 1].value = v;
+        });
+    });
+    return rows.length;
+}
+'''
+
+
+def column_name(index):
+    """Spreadsheet column letters for a 1-based column index: 1 -> A, 27 -> AA"""
+    name = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+def decode_value(value):
+    """Turn a JSON cell value into a Python value: tagged dates become datetimes"""
+    if isinstance(value, dict) and "$date" in value:
+        return datetime.fromisoformat(value["$date"].replace("Z", "+00:00")).astimezone().replace(tzinfo=None)
+    return value
+
+
+def run_jxa(script, payload=None, timeout=120):
+    """Run `script` (which defines main(payload)) against Numbers.app and return its JSON result"""
+    return jxa_runner.run_jxa("Numbers", script, payload, timeout)
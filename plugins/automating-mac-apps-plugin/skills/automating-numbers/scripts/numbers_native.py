@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+"""
+Numbers File Reader - No Numbers.app Required
+Reads sheets, tables and cell values straight from .numbers files
+
+A .numbers document is a zip (or a package directory) of IWA archives
+under Index/. Each .iwa file is a run of chunks - a 0x00 byte, a 3-byte
+little-endian length and a raw Snappy block - that decompress to
+length-prefixed TSP.ArchiveInfo headers, each followed by the protobuf
+message it describes. Objects are indexed by identifier and walked as
+DocumentArchive(1).sheets -> SheetArchive(2).drawable_infos ->
+TableInfoArchive(6000).tableModel -> TableModelArchive(6001), whose data
+store points at the row tiles (6002) and the string and rich text lists
+(6005); rich text entries go through a RichTextPayloadArchive (6218) to
+the TSWP storage holding the text. Only the cell storage written by
+Numbers 10 and later (version 5) is supported; Numbers '09 XML files are
+not.
+
+Nothing talks to Numbers, so batches of files can be exported in a
+process pool on any machine, Linux included. python-snappy is used for
+decompression when installed; otherwise a pure-Python decoder is. CSV
+files mirror each document's folder below the input folder, and a name
+another document already took gets a -2, -3, ... suffix, as in the
+Numbers.app batch converter.
+
+    with NumbersFile("report.numbers") as doc:
+        for row in doc.iter_rows(sheet="Data"):
+            ...
+
+Usage: python numbers_native.py file.numbers [more.numbers | folder ...] --output out_dir [--workers 4]
+"""
+
+import csv
+import io
+import os
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from struct import unpack_from
+
+try:
+    from snappy import uncompress as _snappy_uncompress
+except ImportError:
+    _snappy_uncompress = None
+
+from export_numbers_to_csv import csv_value
+from read_numbers_spreadsheet import NumbersDocument
+
+# The protobuf wire decoder is shared with the Notes reader, output naming with batch_export
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+from batch_export import expand_inputs, output_base
+from protobuf_wire import iter_protobuf_fields, parse_message, read_varint
+
+# Date cells count seconds from 2001-01-01, like Core Data
+NUMBERS_EPOCH = datetime(2001, 1, 1)
+
+# Message types (TSPRegistry ids)
+DOCUMENT_ARCHIVE = 1
+SHEET_ARCHIVE = 2
+TABLE_INFO_ARCHIVE = 6000
+TABLE_MODEL_ARCHIVE = 6001
+TILE_ARCHIVE = 6002
+TABLE_DATA_LIST = 6005
+RICH_TEXT_PAYLOAD_ARCHIVE = 6218
+
+# TST.TableDataList.ListType
+STRING_LIST = 1
+RICH_TEXT_LIST = 8
+
+# Cell types in version 5 cell storage
+NUMBER_CELL = 2
+TEXT_CELL = 3
+DATE_CELL = 5
+BOOL_CELL = 6
+DURATION_CELL = 7
+RICH_TEXT_CELL = 9
+CURRENCY_CELL = 10
+
+DEFAULT_TILE_ROWS = 256
+
+
+class NumbersFileError(RuntimeError):
+    """Raised when a file is not a readable .numbers document"""
+
+
+def _reference(buf):
+    """Identifier of a TSP.Reference, or None if `buf` is not one"""
+    try:
+        identifier = parse_message(buf).get(1, [None])[0]
+    except ValueError:
+        return None
+    return identifier if isinstance(identifier, int) else None
+
+
+def _text(buf):
+    return bytes(buf).decode("utf-8", errors="replace")
+
+
+def snappy_decompress(data):
+    """Decompress one raw Snappy block"""
+    if _snappy_uncompress is not None:
+        return _snappy_uncompress(bytes(data))
+
+    expected, pos = read_varint(data, 0)
+    out = bytearray()
+    end = len(data)
+    while pos < end:
+        tag = data[pos]
+        pos += 1
+        kind = tag & 0x3
+        if kind == 0:
+            length = tag >> 2
+            if length >= 60:
+                extra = length - 59
+                length = int.from_bytes(data[pos:pos + extra], "little")
+                pos += extra
+            length += 1
+            if pos + length > end:
+                raise NumbersFileError("corrupt Snappy block: truncated literal")
+            out += data[pos:pos + length]
+            pos += length
+            continue
+
+        if kind == 1:
+            length = ((tag >> 2) & 0x7) + 4
+            offset = ((tag >> 5) << 8) | data[pos]
+            pos += 1
+        elif kind == 2:
+            length = (tag >> 2) + 1
+            offset = int.from_bytes(data[pos:pos + 2], "little")
+            pos += 2
+        else:
+            length = (tag >> 2) + 1
+            offset = int.from_bytes(data[pos:pos + 4], "little")
+            pos += 4
+        if not 0 < offset <= len(out):
+            raise NumbersFileError("corrupt Snappy block: bad copy offset")
+
+        start = len(out) - offset
+        if length <= offset:
+            out += out[start:start + length]
+        else:
+            # Overlapping copy: the last `offset` bytes repeat
+            pattern = out[start:]
+            out += (pattern * (length // offset + 1))[:length]
+
+    if len(out) != expected:
+        raise NumbersFileError(f"corrupt Snappy block: expected {expected} bytes, got {len(out)}")
+    return bytes(out)
+
+
+def read_iwa(data):
+    """Decompress an .iwa archive into its protobuf stream"""
+    blocks = []
+    pos = 0
+    while pos < len(data):
+        if data[pos] != 0:
+            raise NumbersFileError("not an IWA archive")
+        length = int.from_bytes(data[pos + 1:pos + 4], "little")
+        blocks.append(snappy_decompress(data[pos + 4:pos + 4 + length]))
+        pos += 4 + length
+    return b"".join(blocks)
+
+
+def iter_objects(stream):
+    """Yield (identifier, message type, payload) for every object in an IWA stream"""
+    stream = memoryview(stream)
+    pos = 0
+    while pos < len(stream):
+        length, pos = read_varint(stream, pos)
+        info = parse_message(stream[pos:pos + length])
+        pos += length
+        identifier = info.get(1, [0])[0]
+        for index, message_info in enumerate(info.get(2, [])):
+            message_info = parse_message(message_info)
+            size = message_info.get(3, [0])[0]
+            # Extra message infos are merge deltas; the first one is the object
+            if index == 0:
+                yield identifier, message_info.get(1, [0])[0], stream[pos:pos + size]
+            pos += size
+
+
+def decode_decimal128(buf):
+    """Decode an IEEE 754 decimal128 (BID) value; integral values come back as int"""
+    bits = int.from_bytes(bytes(buf[:16]), "little")
+    exponent = ((bits >> 113) & 0x3FFF) - 6176
+    mantissa = bits & ((1 << 113) - 1)
+    value = Decimal(-mantissa if bits >> 127 else mantissa).scaleb(exponent)
+    return int(value) if value == value.to_integral_value() else float(value)
+
+
+def _number(value):
+    return int(value) if value.is_integer() else value
+
+
+def decode_cell(storage, offset, strings, rich_text):
+    """Decode the version 5 cell stored at `offset` into a Python value"""
+    if storage[offset] != 5:
+        raise NumbersFileError(f"unsupported cell storage version {storage[offset]} (Numbers 10 or later needed)")
+    cell_type = storage[offset + 1]
+    flags = unpack_from("<I", storage, offset + 8)[0]
+    pos = offset + 12
+
+    decimal = double = seconds = string_id = rich_id = None
+    if flags & 0x1:
+        decimal = decode_decimal128(storage[pos:pos + 16])
+        pos += 16
+    if flags & 0x2:
+        double = unpack_from("<d", storage, pos)[0]
+        pos += 8
+    if flags & 0x4:
+        seconds = unpack_from("<d", storage, pos)[0]
+        pos += 8
+    if flags & 0x8:
+        string_id = unpack_from("<I", storage, pos)[0]
+        pos += 4
+    if flags & 0x10:
+        rich_id = unpack_from("<I", storage, pos)[0]
+
+    if cell_type in (NUMBER_CELL, CURRENCY_CELL):
+        if decimal is not None:
+            return decimal
+        return _number(double) if double is not None else None
+    if cell_type == TEXT_CELL:
+        return strings.get(string_id)
+    if cell_type == DATE_CELL:
+        return NUMBERS_EPOCH + timedelta(seconds=seconds) if seconds is not None else None
+    if cell_type == BOOL_CELL:
+        return bool(double)
+    if cell_type == DURATION_CELL:
+        return double
+    if cell_type == RICH_TEXT_CELL:
+        return rich_text.get(rich_id)
+    return None
+
+
+def decode_row(storage, offsets, wide, columns, strings, rich_text):
+    """Decode one stored row into a list of `columns` values (None for empty cells)"""
+    row = [None] * columns
+    scale = 4 if wide else 1
+    for column, offset in enumerate(unpack_from(f"<{len(offsets) // 2}h", offsets)):
+        if column >= columns:
+            break
+        if offset >= 0:
+            row[column] = decode_cell(storage, offset * scale, strings, rich_text)
+    return row
+
+
+def _zip_archives(source):
+    """Yield the bytes of every .iwa archive in a zip"""
+    with zipfile.ZipFile(source) as zf:
+        names = zf.namelist()
+        # Numbers 3-4 packages keep the archives in a nested Index.zip
+        if "Index.zip" in names:
+            yield from _zip_archives(io.BytesIO(zf.read("Index.zip")))
+            return
+        for name in names:
+            if name.endswith(".iwa"):
+                yield zf.read(name)
+
+
+class NumbersFile(NumbersDocument):
+    """A .numbers file parsed directly; same reading interface as NumbersDocument"""
+
+    def __init__(self, file_path):
+        super().__init__(file_path)
+        self.objects = {}
+        self._tables = {}
+
+    def __enter__(self):
+        for archive in self._archives():
+            for identifier, message_type, payload in iter_objects(read_iwa(archive)):
+                self.objects[identifier] = (message_type, payload)
+        self.layout = {"was_open": True, "sheets": self._sheets()}
+        return self
+
+    def __exit__(self, *exc):
+        self.objects.clear()
+        self._tables.clear()
+        return False
+
+    def _archives(self):
+        path = Path(self.path)
+        if path.is_dir():
+            if (path / "Index.zip").exists():
+                yield from _zip_archives(path / "Index.zip")
+            else:
+                for archive in sorted((path / "Index").rglob("*.iwa")):
+                    yield archive.read_bytes()
+        elif zipfile.is_zipfile(path):
+            yield from _zip_archives(path)
+        else:
+            raise NumbersFileError(f"Not a .numbers document: {path}")
+
+    def _type(self, identifier):
+        return self.objects.get(identifier, (None, None))[0]
+
+    def _message(self, identifier):
+        if identifier not in self.objects:
+            raise NumbersFileError(f"Missing object {identifier}")
+        return parse_message(self.objects[identifier][1])
+
+    def _sheets(self):
+        documents = [i for i, (message_type, _) in self.objects.items() if message_type == DOCUMENT_ARCHIVE]
+        if not documents:
+            raise NumbersFileError("No document archive found (Numbers '09 files are not supported)")
+
+        sheets = []
+        for sheet_ref in self._message(documents[0]).get(1, []):
+            sheet = self._message(_reference(sheet_ref))
+            tables = []
+            for drawable_ref in sheet.get(2, []):
+                drawable_id = _reference(drawable_ref)
+                if self._type(drawable_id) != TABLE_INFO_ARCHIVE:
+                    continue  # shapes, charts, images
+                model_id = _reference(self._message(drawable_id)[2][0])
+                model = self._message(model_id)
+                tables.append({
+                    "name": _text(model[8][0]),
+                    "rows": model[6][0],
+                    "columns": model[7][0],
+                    "header_rows": model.get(10, [0])[0],
+                    "id": model_id,
+                })
+            sheets.append({"name": _text(sheet[1][0]), "tables": tables})
+        return sheets
+
+    def _data_lists(self, store):
+        """Return ({key: string}, {key: rich text}) for a table's data store"""
+        strings, rich_text = {}, {}
+        # The field numbers of the list references moved between Numbers
+        # releases; every list records its own type, so inspect them all
+        for field_number, wire_type, value in iter_protobuf_fields(store):
+            if wire_type != 2 or field_number == 3:
+                continue
+            identifier = _reference(value)
+            if identifier is None or self._type(identifier) != TABLE_DATA_LIST:
+                continue
+            data_list = self._message(identifier)
+            list_type = data_list.get(1, [0])[0]
+            for entry in data_list.get(3, []):
+                entry = parse_message(entry)
+                if list_type == STRING_LIST and 3 in entry:
+                    strings[entry[1][0]] = _text(entry[3][0])
+                elif list_type == RICH_TEXT_LIST and 9 in entry:
+                    # ListEntry.richTextPayload -> RichTextPayloadArchive.storage -> TSWP StorageArchive.text
+                    payload = self._message(_reference(entry[9][0]))
+                    storage = self._message(_reference(payload[1][0]))
+                    rich_text[entry[1][0]] = "".join(_text(text) for text in storage.get(3, []))
+        return strings, rich_text
+
+    def _table_data(self, model_id):
+        """Index a table's stored rows by row number (decoded lazily) along with its text lists"""
+        if model_id in self._tables:
+            return self._tables[model_id]
+
+        store = self._message(model_id)[4][0]
+        strings, rich_text = self._data_lists(store)
+        tile_storage = parse_message(parse_message(store)[3][0])
+        tile_rows = tile_storage.get(2, [DEFAULT_TILE_ROWS])[0]
+
+        rows = {}
+        for tile_entry in tile_storage.get(1, []):
+            tile_entry = parse_message(tile_entry)
+            first_row = tile_entry[1][0] * tile_rows
+            for row_info in self._message(_reference(tile_entry[2][0])).get(5, []):
+                row_info = parse_message(row_info)
+                if not row_info.get(2, [0])[0]:
+                    continue
+                if 6 not in row_info:
+                    raise NumbersFileError("Cell storage predates Numbers 10; re-save the file in a current Numbers")
+                rows[first_row + row_info.get(1, [0])[0]] = (row_info[6][0], row_info[7][0],
+                                                             bool(row_info.get(8, [0])[0]))
+
+        self._tables[model_id] = (rows, strings, rich_text)
+        return self._tables[model_id]
+
+    def read_block(self, sheet_name, table_info, row_window, column_window):
+        """Return the decoded cell values of one block of rows"""
+        rows, strings, rich_text = self._table_data(table_info["id"])
+        columns = table_info["columns"]
+        block = []
+        for row in range(row_window[0] - 1, row_window[1]):
+            stored = rows.get(row)
+            values = decode_row(*stored, columns, strings, rich_text) if stored else [None] * columns
+            block.append(values[column_window[0] - 1:column_window[1]])
+        return block
+
+
+def find_numbers_files(inputs):
+    """Expand files and folders into .numbers paths (package directories count as files)"""
+    for item in inputs:
+        path = Path(item)
+        if path.suffix == ".numbers" or not path.is_dir():
+            yield path
+            continue
+        for found in sorted(path.rglob("*.numbers")):
+            if not any(parent.suffix == ".numbers" for parent in found.relative_to(path).parents):
+                yield found
+
+
+def export_file(file_path, base):
+    """Export every table of one file to CSV named after `base`; returns (path, csv paths, error)"""
+    try:
+        written = []
+        base = Path(base)
+        with NumbersFile(file_path) as doc:
+            tables = doc.tables()
+            base.parent.mkdir(parents=True, exist_ok=True)
+            for sheet_name, table_info in tables:
+                name = base.name if len(tables) == 1 else f"{base.name} - {sheet_name} - {table_info['name']}"
+                target = base.parent / (name.replace("/", "-") + ".csv")
+                with open(target, 'w', newline='', encoding='utf-8') as csvfile:
+                    writer = csv.writer(csvfile)
+                    for row in doc.iter_rows(sheet_name, table_info["name"]):
+                        writer.writerow([csv_value(v) for v in row])
+                written.append(str(target))
+        return str(file_path), written, None
+    except Exception as e:
+        return str(file_path), [], str(e)
+
+
+def export_numbers_files(inputs, output_dir, workers=None):
+    """Export .numbers files to CSV, one process per file; returns (exported, failed)"""
+    # Output names are claimed up front, so files exported in parallel never share one
+    claimed = {}
+    jobs = [(str(path), output_base(str(path.resolve()), output_dir, subfolder, claimed))
+            for path, subfolder in expand_inputs([str(item) for item in inputs], find_numbers_files)]
+    os.makedirs(output_dir, exist_ok=True)
+    print(f"Exporting {len(jobs)} Numbers file(s) to {output_dir}")
+
+    if workers == 1:
+        results = (export_file(path, base) for path, base in jobs)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = (future.result() for future in
+                   as_completed([pool.submit(export_file, path, base) for path, base in jobs]))
+
+    exported = failed = 0
+    try:
+        for path, written, error in results:
+            if error:
+                failed += 1
+                print(f"Failed: {path}: {error}")
+            else:
+                exported += 1
+                print(f"Exported: {path} -> {len(written)} CSV file(s)")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    print(f"Exported {exported} of {len(jobs)} file(s)")
+    return exported, failed
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    output_dir = None
+    workers = None
+    inputs = []
+
+    skip = False
+    for i, arg in enumerate(args):
+        if skip:
+            skip = False
+        elif arg.startswith('--output'):
+            output_dir = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+            skip = '=' not in arg
+        elif arg.startswith('--workers'):
+            workers = int(arg.split('=', 1)[1] if '=' in arg else args[i + 1])
+            skip = '=' not in arg
+        else:
+            inputs.append(arg)
+
+    if not inputs or not output_dir:
+        print("Usage: python numbers_native.py file.numbers [more.numbers | folder ...] --output out_dir "
+              "[--workers 4]")
+        sys.exit(1)
+
+    exported, failed = export_numbers_files(inputs, output_dir, workers)
+    sys.exit(0 if exported and not failed else 1)
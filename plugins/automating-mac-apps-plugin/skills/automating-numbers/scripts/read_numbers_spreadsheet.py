@@ -3,83 +3,231 @@
 Read Numbers Spreadsheet Script
 Reads data from a Numbers spreadsheet
 
-Usage: python read_numbers_spreadsheet.py "path/to/spreadsheet.numbers"
+The document layout (sheets, tables and their sizes) is read in one
+call; cell values are then read in blocks of rows, one Apple Event per
+block, and returned as JSON. Rows are yielded one at a time as typed
+Python values: numbers, strings, booleans, datetimes and None for blank
+cells, so 100k-row tables never have to be held in memory.
+
+    with NumbersDocument("report.numbers") as doc:
+        for row in doc.iter_rows(sheet="Data", rows=(2, None)):
+            ...
+
+Usage: python read_numbers_spreadsheet.py "path/to/spreadsheet.numbers" [--sheet "Sheet 1"] [--table "Table 1"]
+       [--all] [--rows 1:100] [--columns 1:5] [--chunk 2000] [--json] [--native]
+
+--native parses the file directly (numbers_native.py) instead of opening it in Numbers.
 """
 
 import sys
-import subprocess
 import json
+from datetime import datetime
 from pathlib import Path
 
-def read_numbers_spreadsheet(file_path):
+from numbers_jxa import TABLE_JXA, decode_value, run_jxa
+
+DEFAULT_CHUNK_ROWS = 2000
+
+# Rows printed per table in the default (non-JSON) output
+PREVIEW_ROWS = 20
+
+DOCUMENT_LAYOUT_JXA = TABLE_JXA + '''
+function main(p) {
+    const wasOpen = isOpen(p.path);
+    const doc = openDocument(p.path);
+    return {
+        was_open: wasOpen,
+        sheets: doc.sheets().map(sheet => {
+            const tables = sheet.tables;
+            const names = tables.name(), rows = tables.rowCount(), cols = tables.columnCount(),
+                  headers = tables.headerRowCount();
+            return {
+                name: sheet.name(),
+                tables: names.map((name, i) => ({name: name, rows: rows[i], columns: cols[i],
+                                                 header_rows: headers[i]})),
+            };
+        }),
+    };
+}
+'''
+
+READ_BLOCK_JXA = TABLE_JXA + '''
+function main(p) {
+    const table = findTable(openDocument(p.path), p.sheet, p.table);
+    return readRange(table, p.first_row, p.last_row, p.first_column, p.last_column);
+}
+'''
+
+CLOSE_DOCUMENT_JXA = TABLE_JXA + '''
+function main(p) {
+    openDocument(p.path).close({saving: "no"});
+    return true;
+}
+'''
+
+
+def parse_window(text):
+    """Parse "10:200", "10:" or "5" into a 1-based inclusive (first, last) window"""
+    first, sep, last = text.partition(":")
+    first = int(first) if first.strip() else 1
+    if not sep:
+        return first, first
+    return first, int(last) if last.strip() else None
+
+
+def clamp_window(window, size):
+    """Resolve a (first, last) window against a table dimension; None if empty"""
+    first, last = window or (1, None)
+    first = max(1, first)
+    last = size if last is None else min(last, size)
+    return (first, last) if first <= last else None
+
+
+class NumbersDocument:
+    """A Numbers document opened for reading; closes it on exit unless it was already open"""
+
+    def __init__(self, file_path):
+        self.path = str(Path(file_path).resolve())
+        self.layout = None
+
+    def __enter__(self):
+        self.layout = run_jxa(DOCUMENT_LAYOUT_JXA, {"path": self.path}, timeout=120)
+        return self
+
+    def __exit__(self, *exc):
+        if self.layout is not None and not self.layout["was_open"]:
+            try:
+                run_jxa(CLOSE_DOCUMENT_JXA, {"path": self.path})
+            except Exception as e:
+                print(f"Warning: could not close document: {e}")
+        return False
+
+    def tables(self):
+        """Return [(sheet name, table info)] for every table in the document"""
+        return [(sheet["name"], table) for sheet in self.layout["sheets"] for table in sheet["tables"]]
+
+    def find_table(self, sheet=None, table=None):
+        """Return (sheet name, table info); defaults to the first table of the first sheet"""
+        for sheet_info in self.layout["sheets"]:
+            if sheet and sheet_info["name"] != sheet:
+                continue
+            for table_info in sheet_info["tables"]:
+                if not table or table_info["name"] == table:
+                    return sheet_info["name"], table_info
+            if sheet:
+                break
+        raise LookupError(f"Table '{table or 'first'}' not found in sheet '{sheet or 'first'}'")
+
+    def iter_rows(self, sheet=None, table=None, rows=None, columns=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """Yield typed rows of one table, reading `chunk_rows` rows per call
+
+        `rows` and `columns` are 1-based inclusive (first, last) windows;
+        `last` may be None for "to the end".
+        """
+        sheet_name, table_info = self.find_table(sheet, table)
+        row_window = clamp_window(rows, table_info["rows"])
+        column_window = clamp_window(columns, table_info["columns"])
+        if not row_window or not column_window:
+            return
+
+        for first in range(row_window[0], row_window[1] + 1, chunk_rows):
+            last = min(first + chunk_rows - 1, row_window[1])
+            for row in self.read_block(sheet_name, table_info, (first, last), column_window):
+                yield [decode_value(value) for value in row]
+
+    def read_block(self, sheet_name, table_info, row_window, column_window):
+        """Return the raw cell values of one block of rows (one Apple Event)"""
+        return run_jxa(READ_BLOCK_JXA, {
+            "path": self.path, "sheet": sheet_name, "table": table_info["name"],
+            "first_row": row_window[0], "last_row": row_window[1],
+            "first_column": column_window[0], "last_column": column_window[1],
+        }, timeout=300)
+
+
+def iter_rows(file_path, sheet=None, table=None, rows=None, columns=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Open `file_path`, yield the typed rows of one table, then close it"""
+    with NumbersDocument(file_path) as doc:
+        yield from doc.iter_rows(sheet, table, rows, columns, chunk_rows)
+
+
+def open_document(file_path, native=False):
+    """NumbersDocument (through Numbers.app) or, with native=True, NumbersFile (parses the file)"""
+    if native:
+        from numbers_native import NumbersFile  # numbers_native imports this module
+        return NumbersFile(file_path)
+    return NumbersDocument(file_path)
+
+
+def json_value(value):
+    """JSON-friendly form of a typed cell value"""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def read_numbers_spreadsheet(file_path, sheet=None, table=None, all_tables=False, rows=None, columns=None,
+                             chunk_rows=DEFAULT_CHUNK_ROWS, as_json=False, native=False):
     """Read data from a Numbers spreadsheet"""
 
-    print(f"Reading Numbers spreadsheet: {file_path}")
+    if not as_json:
+        print(f"Reading Numbers spreadsheet: {file_path}")
 
     try:
-        script = f'''
-        tell application "Numbers"
-            set theDoc to open POSIX file "{Path(file_path).resolve()}"
-
-            -- Get the first sheet and table
-            set firstSheet to sheet 1 of theDoc
-            set firstTable to table 1 of firstSheet
-
-            -- Read all cell values
-            set allData to {{}}
-
-            -- Get table dimensions (approximate)
-            set rowCount to count of rows of firstTable
-            set colCount to count of columns of firstTable
-
-            repeat with i from 1 to rowCount
-                set rowData to {{}}
-                repeat with j from 1 to colCount
-                    try
-                        set cellValue to value of cell j of row i of firstTable
-                        set end of rowData to cellValue
-                    on error
-                        set end of rowData to ""
-                    end try
-                end repeat
-                set end of allData to rowData
-            end repeat
-
-            -- Close without saving
-            close theDoc saving no
-
-            return allData
-        end tell
-        '''
-
-        result = subprocess.run(["osascript", "-e", script],
-                              capture_output=True, text=True, check=True, timeout=30)
-
-        # Parse the AppleScript result
-        # AppleScript returns data in a format that needs parsing
-        output = result.stdout.strip()
-        if output:
-            print(f"Raw output: {output}")
-            # For now, just indicate success
-            print("Successfully read Numbers spreadsheet data")
+        total = 0
+        with open_document(file_path, native) as doc:
+            targets = doc.tables() if all_tables else [doc.find_table(sheet, table)]
+            for sheet_name, table_info in targets:
+                if not as_json:
+                    print(f"\n{sheet_name} > {table_info['name']} "
+                          f"({table_info['rows']} rows x {table_info['columns']} columns)")
+
+                for index, row in enumerate(doc.iter_rows(sheet_name, table_info["name"], rows, columns,
+                                                          chunk_rows)):
+                    total += 1
+                    if as_json:
+                        print(json.dumps({"sheet": sheet_name, "table": table_info["name"],
+                                          "row": [json_value(v) for v in row]}, ensure_ascii=False))
+                    elif index < PREVIEW_ROWS:
+                        print("\t".join("" if v is None else str(v) for v in row))
+                    elif index == PREVIEW_ROWS:
+                        print("...")
+
+        if total:
+            if not as_json:
+                print(f"\nRead {total} rows")
+                print("Successfully read Numbers spreadsheet data")
             return True
         else:
             print("No data found in spreadsheet")
             return False
 
-    except subprocess.CalledProcessError as e:
-        print(f"AppleScript failed: {e}")
-        print(f"Error output: {e.stderr}")
-        return False
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        print(f"Error reading spreadsheet: {e}")
         return False
 
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python read_numbers_spreadsheet.py 'path/to/spreadsheet.numbers'")
+        print("Usage: python read_numbers_spreadsheet.py 'path/to/spreadsheet.numbers' [--sheet 'Sheet 1'] "
+              "[--table 'Table 1'] [--all] [--rows 1:100] [--columns 1:5] [--chunk 2000] [--json] [--native]")
         sys.exit(1)
 
     file_path = sys.argv[1]
-    success = read_numbers_spreadsheet(file_path)
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    options = {"sheet": None, "table": None, "rows": None, "columns": None, "chunk": DEFAULT_CHUNK_ROWS}
+
+    args = sys.argv[2:]
+    for i, arg in enumerate(args):
+        name = arg.split('=', 1)[0].lstrip('-')
+        if name in options:
+            options[name] = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+
+    success = read_numbers_spreadsheet(
+        file_path,
+        sheet=options["sheet"],
+        table=options["table"],
+        all_tables='--all' in args,
+        rows=parse_window(options["rows"]) if options["rows"] else None,
+        columns=parse_window(options["columns"]) if options["columns"] else None,
+        chunk_rows=int(options["chunk"]),
+        as_json='--json' in args,
+        native='--native' in args,
+    )
+    sys.exit(0 if success else 1)
@@ -3,113 +3,119 @@
 Markdown to PowerPoint Script - PyXA Implementation
 Converts a markdown file to a PowerPoint presentation
 
-Usage: python markdown_to_powerpoint.py input.md "Presentation Title"
+With --native the .pptx is written directly by pptx_writer, without
+PowerPoint or PyXA: layouts, bullets, nested levels, code, pictures and
+speaker notes come straight from the parsed markdown, so decks can be
+built on servers in milliseconds and opened in PowerPoint only for
+polish. The native deck is saved to output.pptx, or next to the markdown
+file as "<title>.pptx". Without --native PowerPoint saves the deck
+itself and picks the location, so output.pptx needs --native.
+
+Usage: python markdown_to_powerpoint.py input.md "Presentation Title" [output.pptx --native]
 """
 
+import os
 import sys
-import PyXA
-import re
-
-def parse_markdown_slides(markdown_content):
-    """Parse markdown content into slides based on headers"""
-    lines = markdown_content.split('\n')
-    slides = []
-    current_slide = {"title": "", "content": []}
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Check for headers (slides)
-        if line.startswith('# '):
-            # Save previous slide if it has content
-            if current_slide["title"] or current_slide["content"]:
-                slides.append(current_slide)
-
-            # Start new slide
-            current_slide = {
-                "title": line[2:].strip(),
-                "content": []
-            }
-        elif line.startswith('## '):
-            # Subheader - could be a new slide or content
-            if current_slide["content"]:  # If we have content, this might be a new slide
-                slides.append(current_slide)
-                current_slide = {
-                    "title": line[3:].strip(),
-                    "content": []
-                }
-            else:
-                current_slide["content"].append(f"## {line[3:].strip()}")
-        elif line.startswith('- ') or line.startswith('* '):
-            # List item
-            current_slide["content"].append(line)
+import time
+from pathlib import Path
+
+from pptx_writer import PptxWriter
+
+# The slide parser is shared with the other presentation skills
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+from slide_markdown import (body_lines, body_text, choose_layout, default_cache_dir, default_output,
+                            parse_markdown_slides, slide_images)
+
+
+def write_native(slides, output_path, presentation_title, base_dir="."):
+    """Write the parsed slides straight to a .pptx file; returns warnings"""
+    warnings = []
+    with PptxWriter(output_path, presentation_title) as deck:
+        for index, slide in enumerate(slides):
+            # Remote images are left out, as in the Keynote builder
+            images = [os.path.join(base_dir, image["src"]) for image in slide_images(slide)
+                      if "://" not in image["src"]]
+            warnings.extend((index + 1, warning) for warning in deck.add_slide(
+                choose_layout(slide, index), slide["title"], body_lines(slide), slide["notes"], images))
+    return warnings
+
+
+def build_with_powerpoint(slides, presentation_title):
+    """Build the deck slide by slide in Microsoft PowerPoint through PyXA"""
+    # Imported here so --native works without PyXA
+    import PyXA
+
+    powerpoint = PyXA.Application("Microsoft PowerPoint")
+
+    # Create new presentation
+    presentation = powerpoint.presentations().push({
+        "name": presentation_title
+    })
+
+    # Add slides
+    for i, slide_data in enumerate(slides):
+        if i == 0:
+            # First slide already exists, modify it
+            slide = presentation.slides()[0]
         else:
-            # Regular content
-            current_slide["content"].append(line)
-
-    # Add final slide
-    if current_slide["title"] or current_slide["content"]:
-        slides.append(current_slide)
-
-    return slides
-
-def create_powerpoint_from_markdown(markdown_file, presentation_title):
+            # Add new slide
+            slide = presentation.slides().push()
+
+        # Set title
+        if slide_data["title"]:
+            # Find title placeholder and set text
+            title_shapes = slide.shapes().filter(
+                lambda s: "title" in str(s.name()).lower()
+            )
+            if title_shapes:
+                title_shapes[0].text_frame().text_range().text = slide_data["title"]
+
+        # Set content
+        content_text = body_text(slide_data)
+        if content_text:
+            # Find content placeholder
+            content_shapes = slide.shapes().filter(
+                lambda s: "content" in str(s.name()).lower() or
+                         "body" in str(s.name()).lower()
+            )
+            if content_shapes:
+                content_shapes[0].text_frame().text_range().text = content_text
+
+    # Save presentation
+    presentation.save()
+
+
+def create_powerpoint_from_markdown(markdown_file, presentation_title, output_path=None, native=False):
     """Create a PowerPoint presentation from markdown file"""
+    if output_path and not native:
+        print("Error: an output path needs --native; PowerPoint decks are saved from PowerPoint")
+        return False
+
+    started = time.monotonic()
     try:
         # Read markdown file
         with open(markdown_file, 'r', encoding='utf-8') as f:
             markdown_content = f.read()
 
-        # Parse into slides
-        slides = parse_markdown_slides(markdown_content)
+        # Parse into slides (cached by content hash across runs)
+        slides = parse_markdown_slides(markdown_content, default_cache_dir())
 
         if not slides:
             print("No slides found in markdown file")
             return False
 
-        # Create PowerPoint presentation
-        powerpoint = PyXA.Application("Microsoft PowerPoint")
-
-        # Create new presentation
-        presentation = powerpoint.presentations().push({
-            "name": presentation_title
-        })
-
-        # Add slides
-        for i, slide_data in enumerate(slides):
-            if i == 0:
-                # First slide already exists, modify it
-                slide = presentation.slides()[0]
-            else:
-                # Add new slide
-                slide = presentation.slides().push()
-
-            # Set title
-            if slide_data["title"]:
-                # Find title placeholder and set text
-                title_shapes = slide.shapes().filter(
-                    lambda s: "title" in str(s.name()).lower()
-                )
-                if title_shapes:
-                    title_shapes[0].text_frame().text_range().text = slide_data["title"]
-
-            # Set content
-            content_text = "\n".join(slide_data["content"])
-            if content_text:
-                # Find content placeholder
-                content_shapes = slide.shapes().filter(
-                    lambda s: "content" in str(s.name()).lower() or
-                             "body" in str(s.name()).lower()
-                )
-                if content_shapes:
-                    content_shapes[0].text_frame().text_range().text = content_text
-
-        # Save presentation
-        presentation.save()
-
-        print(f"Created PowerPoint presentation '{presentation_title}' with {len(slides)} slides")
+        if native:
+            output_path = output_path or default_output(markdown_file, presentation_title, ".pptx")
+            warnings = write_native(slides, output_path, presentation_title,
+                                    os.path.dirname(os.path.abspath(markdown_file)))
+            for slide_number, warning in warnings:
+                print(f"Warning: slide {slide_number}: {warning}")
+            print(f"Wrote PowerPoint presentation '{presentation_title}' with {len(slides)} slides "
+                  f"in {time.monotonic() - started:.3f}s")
+            print(f"Saved to: {output_path}")
+        else:
+            build_with_powerpoint(slides, presentation_title)
+            print(f"Created PowerPoint presentation '{presentation_title}' with {len(slides)} slides")
         print(f"Source: {markdown_file}")
 
         return True
@@ -119,12 +125,14 @@ def create_powerpoint_from_markdown(markdown_file, presentation_title):
         return False
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python markdown_to_powerpoint.py input.md 'Presentation Title'")
+    positional = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(positional) < 2:
+        print("Usage: python markdown_to_powerpoint.py input.md 'Presentation Title' [output.pptx --native]")
         sys.exit(1)
 
-    markdown_file = sys.argv[1]
-    title = sys.argv[2]
+    markdown_file = positional[0]
+    title = positional[1]
+    output_path = positional[2] if len(positional) > 2 else None
 
-    success = create_powerpoint_from_markdown(markdown_file, title)
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    success = create_powerpoint_from_markdown(markdown_file, title, output_path, native='--native' in sys.argv)
+    sys.exit(0 if success else 1)
@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+"""
+PPTX Writer - No PowerPoint Required
+Writes .pptx presentations with the standard library only
+
+PptxWriter builds the package directly: the theme, slide master and
+layouts are rendered once when the module loads and copied into every
+deck, and each slide (with its speaker notes) is written into the zip as
+soon as it is added, from small XML templates. Pictures are stored once
+per deck however many slides use them. A deck of hundreds of slides takes
+milliseconds, so build servers can produce decks without PowerPoint and
+PowerPoint automation is only needed for final polish.
+
+Layouts: "title" (title and subtitle), "bullets" (title and content),
+"title_only" and "photo" (title only, pictures fill the content area).
+Text comes in as paragraphs of (indent level, text, kind), where kind is
+"bullet", "plain" or "code".
+
+    with PptxWriter("deck.pptx", title="Weekly review") as deck:
+        deck.add_slide("bullets", "Highlights", [(0, "Revenue", "bullet"), (1, "+12%", "bullet")],
+                       notes="Mention the North numbers")
+
+Usage: python pptx_writer.py "deck.pptx"    (prints each slide's title)
+"""
+
+import os
+import re
+import struct
+import sys
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+P_NS = "http://schemas.openxmlformats.org/presentationml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+PML = "application/vnd.openxmlformats-officedocument.presentationml"
+
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+NAMESPACES = f'xmlns:a="{A_NS}" xmlns:r="{REL_NS}" xmlns:p="{P_NS}"'
+
+# 16:9 slide and portrait notes page, in EMU (914400 per inch)
+SLIDE_WIDTH, SLIDE_HEIGHT = 12192000, 6858000
+NOTES_WIDTH, NOTES_HEIGHT = 6858000, 9144000
+
+TITLE_BOX = (838200, 365125, 10515600, 1325563)
+BODY_BOX = (838200, 1825625, 10515600, 4351338)
+GAP = 228600
+
+# layout name -> slideLayoutN.xml
+LAYOUT_FILES = {"title": 1, "bullets": 2, "title_only": 3, "photo": 3}
+
+IMAGE_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".gif": "image/gif",
+               ".bmp": "image/bmp", ".tif": "image/tiff", ".tiff": "image/tiff"}
+
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+class PptxError(RuntimeError):
+    """Raised for unknown layouts and unreadable presentations"""
+
+
+def _text(value):
+    """Escape text for an <a:t> element"""
+    return escape(INVALID_XML_CHARS.sub("", str(value)))
+
+
+def _xfrm(box):
+    x, y, cx, cy = box
+    return f'<a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+
+
+def _placeholder(shape_id, name, ph, box=None, body=None, style='<a:bodyPr/><a:lstStyle/>'):
+    """A placeholder shape; position comes from the layout unless `box` is given"""
+    sp_pr = f'<p:spPr>{_xfrm(box)}</p:spPr>' if box else '<p:spPr/>'
+    tx_body = f'<p:txBody>{style}{body}</p:txBody>' if body is not None else ''
+    return (f'<p:sp><p:nvSpPr><p:cNvPr id="{shape_id}" name={quoteattr(name)}/><p:cNvSpPr><a:spLocks noGrp="1"/>'
+            f'</p:cNvSpPr><p:nvPr>{ph}</p:nvPr></p:nvSpPr>{sp_pr}{tx_body}</p:sp>')
+
+
+def _paragraphs(paragraphs):
+    """<a:p> elements for (level, text, kind) paragraphs; bullets use the master's list style, other kinds
+    are indented by level without a bullet"""
+    parts = []
+    for level, text, kind in paragraphs:
+        p_pr = f'<a:pPr lvl="{min(level, 8)}"/>' if kind == "bullet" else \
+            f'<a:pPr marL="{457200 * min(level, 8)}" lvl="{min(level, 8)}" indent="0"><a:buNone/></a:pPr>'
+        r_pr = '<a:rPr lang="en-US" dirty="0"><a:latin typeface="Courier New"/></a:rPr>' if kind == "code" else \
+            '<a:rPr lang="en-US" dirty="0"/>'
+        run = f'<a:r>{r_pr}<a:t>{_text(text)}</a:t></a:r>' if text else ''
+        parts.append(f'<a:p>{p_pr}{run}<a:endParaRPr lang="en-US" dirty="0"/></a:p>')
+    return "".join(parts) or '<a:p><a:endParaRPr lang="en-US" dirty="0"/></a:p>'
+
+
+def _plain(text):
+    return _paragraphs((0, line, "plain") for line in str(text).split("\n"))
+
+
+def image_size(data):
+    """(width, height) in pixels of PNG, GIF or JPEG data, or None"""
+    if data[:8] == b"\x89PNG\r\n\x1a\n" and len(data) >= 24:
+        return struct.unpack(">II", data[16:24])
+    if data[:6] in (b"GIF87a", b"GIF89a") and len(data) >= 10:
+        return struct.unpack("<HH", data[6:10])
+    if data[:2] == b"\xff\xd8":
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker in (0xD8, 0x01, 0xFF) or 0xD0 <= marker <= 0xD7:
+                i += 1 if marker == 0xFF else 2
+                continue
+            length = struct.unpack(">H", data[i + 2:i + 4])[0]
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", data[i + 5:i + 9])
+                return width, height
+            i += 2 + length
+    return None
+
+
+def fit_boxes(sizes, box):
+    """Place images side by side in `box`, each scaled to fit its column and centered"""
+    x, y, cx, cy = box
+    count = len(sizes)
+    if not count:
+        return []
+    column = (cx - GAP * (count - 1)) // count
+    boxes = []
+    for n, size in enumerate(sizes):
+        left = x + n * (column + GAP)
+        if not size or not size[0] or not size[1]:
+            boxes.append((left, y, column, cy))
+            continue
+        scale = min(column / size[0], cy / size[1])
+        width, height = int(size[0] * scale), int(size[1] * scale)
+        boxes.append((left + (column - width) // 2, y + (cy - height) // 2, width, height))
+    return boxes
+
+
+def _part(root, body):
+    return f'{XML_DECLARATION}<{root} {NAMESPACES}>{body}</{root.split()[0]}>'
+
+
+def _relationships(targets):
+    """A .rels part from (id, type, target) triples"""
+    rels = "".join(f'<Relationship Id="{rid}" Type="{REL_NS}/{kind}" Target="{target}"/>'
+                   for rid, kind, target in targets)
+    return f'{XML_DECLARATION}<Relationships xmlns="{PACKAGE_REL_NS}">{rels}</Relationships>'
+
+
+SP_TREE_START = ('<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+                 '<p:grpSpPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="0" cy="0"/><a:chOff x="0" y="0"/>'
+                 '<a:chExt cx="0" cy="0"/></a:xfrm></p:grpSpPr>')
+
+
+def _level_styles(size, bullets):
+    """lvl1pPr..lvl9pPr for the master text styles"""
+    levels = []
+    for n in range(9):
+        margin = 228600 + 457200 * n
+        bullet = ('<a:buFont typeface="Arial"/><a:buChar char="&#8226;"/>' if bullets else '<a:buNone/>')
+        levels.append(f'<a:lvl{n + 1}pPr marL="{margin if bullets else 0}" indent="{-228600 if bullets else 0}">'
+                      f'<a:spcBef><a:spcPts val="{1000 if bullets else 0}"/></a:spcBef>{bullet}'
+                      f'<a:defRPr sz="{max(size - 400 * min(n, 3), 1400)}"><a:solidFill><a:schemeClr val="tx1"/>'
+                      f'</a:solidFill><a:latin typeface="+mn-lt"/></a:defRPr></a:lvl{n + 1}pPr>')
+    return "".join(levels)
+
+
+def _theme(name):
+    accents = ["4472C4", "ED7D31", "A5A5A5", "FFC000", "5B9BD5", "70AD47"]
+    colors = "".join(f'<a:accent{n}><a:srgbClr val="{value}"/></a:accent{n}>' for n, value in enumerate(accents, 1))
+    fill = '<a:solidFill><a:schemeClr val="phClr"/></a:solidFill>'
+    lines = "".join(f'<a:ln w="{w}">{fill}</a:ln>' for w in (6350, 12700, 19050))
+    return (f'{XML_DECLARATION}<a:theme xmlns:a="{A_NS}" name={quoteattr(name)}><a:themeElements>'
+            '<a:clrScheme name="Office"><a:dk1><a:sysClr val="windowText" lastClr="000000"/></a:dk1>'
+            '<a:lt1><a:sysClr val="window" lastClr="FFFFFF"/></a:lt1><a:dk2><a:srgbClr val="44546A"/></a:dk2>'
+            f'<a:lt2><a:srgbClr val="E7E6E6"/></a:lt2>{colors}<a:hlink><a:srgbClr val="0563C1"/></a:hlink>'
+            '<a:folHlink><a:srgbClr val="954F72"/></a:folHlink></a:clrScheme>'
+            '<a:fontScheme name="Office"><a:majorFont><a:latin typeface="Calibri Light"/><a:ea typeface=""/>'
+            '<a:cs typeface=""/></a:majorFont><a:minorFont><a:latin typeface="Calibri"/><a:ea typeface=""/>'
+            '<a:cs typeface=""/></a:minorFont></a:fontScheme>'
+            f'<a:fmtScheme name="Office"><a:fillStyleLst>{fill * 3}</a:fillStyleLst><a:lnStyleLst>{lines}'
+            '</a:lnStyleLst><a:effectStyleLst>' + '<a:effectStyle><a:effectLst/></a:effectStyle>' * 3 +
+            f'</a:effectStyleLst><a:bgFillStyleLst>{fill * 3}</a:bgFillStyleLst></a:fmtScheme>'
+            '</a:themeElements></a:theme>')
+
+
+CLR_MAP = ('bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" accent2="accent2" accent3="accent3" '
+           'accent4="accent4" accent5="accent5" accent6="accent6" hlink="hlink" folHlink="folHlink"')
+
+SLIDE_MASTER_XML = _part('p:sldMaster', (
+    '<p:cSld><p:bg><p:bgRef idx="1001"><a:schemeClr val="bg1"/></p:bgRef></p:bg><p:spTree>' + SP_TREE_START +
+    _placeholder(2, "Title Placeholder 1", '<p:ph type="title"/>', TITLE_BOX, '<a:p><a:endParaRPr lang="en-US"/></a:p>') +
+    _placeholder(3, "Text Placeholder 2", '<p:ph type="body" idx="1"/>', BODY_BOX,
+                 '<a:p><a:endParaRPr lang="en-US"/></a:p>') +
+    f'</p:spTree></p:cSld><p:clrMap {CLR_MAP}/><p:sldLayoutIdLst>' +
+    "".join(f'<p:sldLayoutId id="{2147483649 + n}" r:id="rId{n + 1}"/>' for n in range(3)) +
+    '</p:sldLayoutIdLst><p:txStyles><p:titleStyle><a:lvl1pPr algn="l"><a:buNone/><a:defRPr sz="4400">'
+    '<a:solidFill><a:schemeClr val="tx1"/></a:solidFill><a:latin typeface="+mj-lt"/></a:defRPr></a:lvl1pPr>'
+    f'</p:titleStyle><p:bodyStyle>{_level_styles(2800, True)}</p:bodyStyle>'
+    f'<p:otherStyle>{_level_styles(1800, False)}</p:otherStyle></p:txStyles>'))
+
+
+def _centered(size, anchor=""):
+    """bodyPr and list style for the centered title slide placeholders"""
+    return (f'<a:bodyPr{anchor}/><a:lstStyle><a:lvl1pPr marL="0" indent="0" algn="ctr"><a:buNone/>'
+            f'<a:defRPr sz="{size}"/></a:lvl1pPr></a:lstStyle>')
+
+
+def _layout(layout_type, name, shapes):
+    return _part(f'p:sldLayout type="{layout_type}" preserve="1"', (
+        f'<p:cSld name={quoteattr(name)}><p:spTree>{SP_TREE_START}{shapes}</p:spTree></p:cSld>'
+        '<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>'))
+
+
+# Rendered once; every deck gets the same master, layouts and themes
+SLIDE_LAYOUTS_XML = [
+    _layout("title", "Title Slide",
+            _placeholder(2, "Title 1", '<p:ph type="ctrTitle"/>', (1524000, 1122363, 9144000, 2387600),
+                         '<a:p><a:endParaRPr lang="en-US"/></a:p>', _centered(6000, ' anchor="b"')) +
+            _placeholder(3, "Subtitle 2", '<p:ph type="subTitle" idx="1"/>', (1524000, 3602038, 9144000, 1655762),
+                         '<a:p><a:endParaRPr lang="en-US"/></a:p>', _centered(2400))),
+    _layout("obj", "Title and Content",
+            _placeholder(2, "Title 1", '<p:ph type="title"/>') + _placeholder(3, "Content Placeholder 2",
+                                                                             '<p:ph idx="1"/>')),
+    _layout("titleOnly", "Title Only", _placeholder(2, "Title 1", '<p:ph type="title"/>')),
+]
+LAYOUT_RELS_XML = _relationships([("rId1", "slideMaster", "../slideMasters/slideMaster1.xml")])
+SLIDE_MASTER_RELS_XML = _relationships(
+    [(f"rId{n}", "slideLayout", f"../slideLayouts/slideLayout{n}.xml") for n in range(1, 4)] +
+    [("rId4", "theme", "../theme/theme1.xml")])
+THEME_XML = _theme("Office Theme")
+NOTES_THEME_XML = _theme("Office Notes Theme")
+
+NOTES_MASTER_XML = _part('p:notesMaster', (
+    '<p:cSld><p:bg><p:bgRef idx="1001"><a:schemeClr val="bg1"/></p:bgRef></p:bg><p:spTree>' + SP_TREE_START +
+    _placeholder(2, "Slide Image Placeholder 1", '<p:ph type="sldImg" idx="2"/>', (685800, 1143000, 5486400, 3086100)) +
+    _placeholder(3, "Notes Placeholder 2", '<p:ph type="body" sz="quarter" idx="3"/>',
+                 (685800, 4400550, 5486400, 3600450), '<a:p><a:endParaRPr lang="en-US"/></a:p>') +
+    f'</p:spTree></p:cSld><p:clrMap {CLR_MAP}/>'))
+NOTES_MASTER_RELS_XML = _relationships([("rId1", "theme", "../theme/theme2.xml")])
+
+SLIDE_XML = _part('p:sld', '<p:cSld><p:spTree>' + SP_TREE_START + '{shapes}</p:spTree></p:cSld>'
+                  '<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>')
+NOTES_SLIDE_XML = _part('p:notes', (
+    '<p:cSld><p:spTree>' + SP_TREE_START +
+    _placeholder(2, "Slide Image Placeholder 1", '<p:ph type="sldImg"/>') +
+    _placeholder(3, "Notes Placeholder 2", '<p:ph type="body" idx="1"/>', body='{notes}') +
+    '</p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>'))
+
+PICTURE_XML = ('<p:pic><p:nvPicPr><p:cNvPr id="{id}" name="Picture {number}" descr={alt}/><p:cNvPicPr>'
+               '<a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr><p:blipFill>'
+               '<a:blip r:embed="{rid}"/><a:stretch><a:fillRect/></a:stretch></p:blipFill><p:spPr>{xfrm}'
+               '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>')
+
+
+class PptxWriter:
+    """Writes a .pptx presentation, one slide at a time, without PowerPoint"""
+
+    def __init__(self, file_path, title=""):
+        self.path = str(file_path)
+        self.title = title
+        self.slide_count = 0
+        self._zip = None
+        self._media = {}
+        self._notes = []
+
+    def __enter__(self):
+        self._zip = zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED)
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        try:
+            if exc_type is None:
+                self._write_package()
+        finally:
+            self._zip.close()
+            if exc_type is not None and os.path.exists(self.path):
+                # Don't leave a half-written presentation behind
+                os.unlink(self.path)
+        return False
+
+    def add_slide(self, layout="bullets", title="", paragraphs=(), notes="", images=()):
+        """Write a slide from its layout, title, (level, text, kind) paragraphs, notes and image paths;
+        returns warnings"""
+        if layout not in LAYOUT_FILES:
+            raise PptxError(f"Unknown layout: {layout} (use {', '.join(LAYOUT_FILES)})")
+        self.slide_count += 1
+        number = self.slide_count
+        paragraphs = list(paragraphs)
+        rels = [("rId1", "slideLayout", f"../slideLayouts/slideLayout{LAYOUT_FILES[layout]}.xml")]
+        warnings = []
+
+        pictures = []
+        image_rels = {}
+        for path in images:
+            media = self._add_media(path, warnings)
+            if media:
+                target, size = media
+                if target not in image_rels:
+                    image_rels[target] = f"rId{len(rels) + 1}"
+                    rels.append((image_rels[target], "image", target))
+                pictures.append((image_rels[target], size, path))
+
+        if layout == "title":
+            shapes = (_placeholder(2, "Title 1", '<p:ph type="ctrTitle"/>', body=_plain(title)) +
+                      _placeholder(3, "Subtitle 2", '<p:ph type="subTitle" idx="1"/>', body=_paragraphs(
+                          (0, text, "plain") for _, text, _ in paragraphs)))
+            picture_box = BODY_BOX
+        else:
+            shapes = _placeholder(2, "Title 1", '<p:ph type="title"/>', body=_plain(title))
+            picture_box = BODY_BOX
+            if layout == "bullets":
+                body_box = None
+                if pictures:
+                    # Text on the left, pictures on the right
+                    half = (BODY_BOX[2] - GAP) // 2
+                    body_box = (BODY_BOX[0], BODY_BOX[1], half, BODY_BOX[3])
+                    picture_box = (BODY_BOX[0] + half + GAP, BODY_BOX[1], half, BODY_BOX[3])
+                shapes += _placeholder(3, "Content Placeholder 2", '<p:ph idx="1"/>', body_box,
+                                       _paragraphs(paragraphs))
+        for n, ((rid, size, path), box) in enumerate(zip(pictures, fit_boxes([p[1] for p in pictures],
+                                                                             picture_box))):
+            shapes += PICTURE_XML.format(id=n + 4, number=n + 1, alt=quoteattr(os.path.basename(path)), rid=rid,
+                                         xfrm=_xfrm(box))
+
+        if notes:
+            self._notes.append(number)
+            rels.append((f"rId{len(rels) + 1}", "notesSlide", f"../notesSlides/notesSlide{number}.xml"))
+            self._zip.writestr(f"ppt/notesSlides/notesSlide{number}.xml", NOTES_SLIDE_XML.format(notes=_plain(notes)))
+            self._zip.writestr(f"ppt/notesSlides/_rels/notesSlide{number}.xml.rels", _relationships([
+                ("rId1", "notesMaster", "../notesMasters/notesMaster1.xml"),
+                ("rId2", "slide", f"../slides/slide{number}.xml")]))
+
+        self._zip.writestr(f"ppt/slides/slide{number}.xml", SLIDE_XML.format(shapes=shapes))
+        self._zip.writestr(f"ppt/slides/_rels/slide{number}.xml.rels", _relationships(rels))
+        return warnings
+
+    def _add_media(self, path, warnings):
+        """Store an image once per deck; returns (relationship target, pixel size) or None"""
+        key = os.path.abspath(path)
+        if key not in self._media:
+            extension = os.path.splitext(path)[1].lower()
+            if extension not in IMAGE_TYPES:
+                warnings.append(f"image {path}: unsupported format")
+                return None
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError as e:
+                warnings.append(f"image {path}: {e.strerror or e}")
+                return None
+            name = f"image{len(self._media) + 1}{extension}"
+            self._zip.writestr(f"ppt/media/{name}", data, compress_type=zipfile.ZIP_STORED)
+            self._media[key] = (f"../media/{name}", image_size(data))
+        return self._media[key]
+
+    def _write_package(self):
+        slides = range(1, self.slide_count + 1)
+        extensions = sorted({os.path.splitext(target)[1] for target, _ in self._media.values()})
+        defaults = "".join(f'<Default Extension="{ext[1:]}" ContentType="{IMAGE_TYPES[ext]}"/>' for ext in extensions)
+        overrides = [("/ppt/presentation.xml", f"{PML}.presentation.main+xml"),
+                     ("/ppt/slideMasters/slideMaster1.xml", f"{PML}.slideMaster+xml"),
+                     ("/ppt/theme/theme1.xml", "application/vnd.openxmlformats-officedocument.theme+xml"),
+                     ("/ppt/presProps.xml", f"{PML}.presProps+xml"),
+                     ("/ppt/viewProps.xml", f"{PML}.viewProps+xml"),
+                     ("/ppt/tableStyles.xml", f"{PML}.tableStyles+xml"),
+                     ("/docProps/core.xml", "application/vnd.openxmlformats-package.core-properties+xml"),
+                     ("/docProps/app.xml", "application/vnd.openxmlformats-officedocument.extended-properties+xml")]
+        overrides += [(f"/ppt/slideLayouts/slideLayout{n}.xml", f"{PML}.slideLayout+xml") for n in range(1, 4)]
+        overrides += [(f"/ppt/slides/slide{n}.xml", f"{PML}.slide+xml") for n in slides]
+        if self._notes:
+            overrides += [("/ppt/notesMasters/notesMaster1.xml", f"{PML}.notesMaster+xml"),
+                          ("/ppt/theme/theme2.xml", "application/vnd.openxmlformats-officedocument.theme+xml")]
+            overrides += [(f"/ppt/notesSlides/notesSlide{n}.xml", f"{PML}.notesSlide+xml") for n in self._notes]
+        self._zip.writestr("[Content_Types].xml", (
+            f'{XML_DECLARATION}<Types xmlns="{CONTENT_TYPES_NS}">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            f'<Default Extension="xml" ContentType="application/xml"/>{defaults}' +
+            "".join(f'<Override PartName="{name}" ContentType="{kind}"/>' for name, kind in overrides) + '</Types>'))
+
+        self._zip.writestr("_rels/.rels", (
+            f'{XML_DECLARATION}<Relationships xmlns="{PACKAGE_REL_NS}">'
+            f'<Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="ppt/presentation.xml"/>'
+            f'<Relationship Id="rId2" Type="{PACKAGE_REL_NS}/metadata/core-properties" Target="docProps/core.xml"/>'
+            f'<Relationship Id="rId3" Type="{REL_NS}/extended-properties" Target="docProps/app.xml"/>'
+            '</Relationships>'))
+        self._zip.writestr("docProps/core.xml", (
+            f'{XML_DECLARATION}<cp:coreProperties '
+            'xmlns:cp="http://schemas.openxmlformats.org/package/2006/metadata/core-properties" '
+            f'xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:title>{_text(self.title)}</dc:title>'
+            '</cp:coreProperties>'))
+        self._zip.writestr("docProps/app.xml", (
+            f'{XML_DECLARATION}<Properties '
+            'xmlns="http://schemas.openxmlformats.org/officeDocument/2006/extended-properties">'
+            f'<Application>pptx_writer.py</Application><Slides>{self.slide_count}</Slides></Properties>'))
+
+        rels = [("rId1", "slideMaster", "slideMasters/slideMaster1.xml"),
+                ("rId2", "theme", "theme/theme1.xml"),
+                ("rId3", "presProps", "presProps.xml"),
+                ("rId4", "viewProps", "viewProps.xml"),
+                ("rId5", "tableStyles", "tableStyles.xml")]
+        notes_master = ""
+        if self._notes:
+            rels.append(("rId6", "notesMaster", "notesMasters/notesMaster1.xml"))
+            notes_master = '<p:notesMasterIdLst><p:notesMasterId r:id="rId6"/></p:notesMasterIdLst>'
+        slide_ids = "".join(f'<p:sldId id="{255 + n}" r:id="rId{100 + n}"/>' for n in slides)
+        rels += [(f"rId{100 + n}", "slide", f"slides/slide{n}.xml") for n in slides]
+        self._zip.writestr("ppt/presentation.xml", _part('p:presentation saveSubsetFonts="1"', (
+            f'<p:sldMasterIdLst><p:sldMasterId id="2147483648" r:id="rId1"/></p:sldMasterIdLst>{notes_master}'
+            f'{"<p:sldIdLst>" + slide_ids + "</p:sldIdLst>" if slide_ids else ""}'
+            f'<p:sldSz cx="{SLIDE_WIDTH}" cy="{SLIDE_HEIGHT}"/><p:notesSz cx="{NOTES_WIDTH}" cy="{NOTES_HEIGHT}"/>')))
+        self._zip.writestr("ppt/_rels/presentation.xml.rels", _relationships(rels))
+        self._zip.writestr("ppt/presProps.xml", _part('p:presentationPr', ''))
+        self._zip.writestr("ppt/viewProps.xml", _part('p:viewPr', ''))
+        self._zip.writestr("ppt/tableStyles.xml", (
+            f'{XML_DECLARATION}<a:tblStyleLst xmlns:a="{A_NS}" def="{{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}}"/>'))
+
+        self._zip.writestr("ppt/slideMasters/slideMaster1.xml", SLIDE_MASTER_XML)
+        self._zip.writestr("ppt/slideMasters/_rels/slideMaster1.xml.rels", SLIDE_MASTER_RELS_XML)
+        for n, layout in enumerate(SLIDE_LAYOUTS_XML, 1):
+            self._zip.writestr(f"ppt/slideLayouts/slideLayout{n}.xml", layout)
+            self._zip.writestr(f"ppt/slideLayouts/_rels/slideLayout{n}.xml.rels", LAYOUT_RELS_XML)
+        self._zip.writestr("ppt/theme/theme1.xml", THEME_XML)
+        if self._notes:
+            self._zip.writestr("ppt/notesMasters/notesMaster1.xml", NOTES_MASTER_XML)
+            self._zip.writestr("ppt/notesMasters/_rels/notesMaster1.xml.rels", NOTES_MASTER_RELS_XML)
+            self._zip.writestr("ppt/theme/theme2.xml", NOTES_THEME_XML)
+
+
+def read_outline(file_path):
+    """[{title, body, notes}] for each slide of a .pptx, in presentation order"""
+    def texts(root, placeholder_types):
+        found = []
+        for shape in root.iter(f"{{{P_NS}}}sp"):
+            ph = shape.find(f".//{{{P_NS}}}ph")
+            if ph is not None and ph.get("type", "obj") in placeholder_types:
+                found.extend("".join(t.text or "" for t in p.iter(f"{{{A_NS}}}t"))
+                             for p in shape.iter(f"{{{A_NS}}}p"))
+        return found
+
+    def targets(package, part):
+        folder, name = part.rsplit("/", 1)
+        rels_name = f"{folder}/_rels/{name}.rels"
+        if rels_name not in package.namelist():
+            return {}
+        rels = ET.fromstring(package.read(rels_name))
+        return {rel.get("Id"): (rel.get("Type").rsplit("/", 1)[1],
+                                os.path.normpath(f"{folder}/{rel.get('Target')}").replace(os.sep, "/"))
+                for rel in rels}
+
+    try:
+        with zipfile.ZipFile(file_path) as package:
+            presentation = ET.fromstring(package.read("ppt/presentation.xml"))
+            rels = targets(package, "ppt/presentation.xml")
+            outline = []
+            for slide_id in presentation.iter(f"{{{P_NS}}}sldId"):
+                part = rels[slide_id.get(f"{{{REL_NS}}}id")][1]
+                slide = ET.fromstring(package.read(part))
+                notes = [target for kind, target in targets(package, part).values() if kind == "notesSlide"]
+                outline.append({
+                    "title": "\n".join(texts(slide, ("title", "ctrTitle"))),
+                    "body": texts(slide, ("obj", "body", "subTitle")),
+                    "notes": "\n".join(texts(ET.fromstring(package.read(notes[0])), ("body",))) if notes else "",
+                })
+            return outline
+    except (KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+        raise PptxError(f"Not a readable .pptx file: {file_path} ({e})") from e
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python pptx_writer.py 'deck.pptx'")
+        sys.exit(1)
+
+    try:
+        for n, slide in enumerate(read_outline(sys.argv[1]), 1):
+            print(f"{n}: {slide['title']}")
+        sys.exit(0)
+    except Exception as e:
+        print(f"Error reading presentation: {e}")
+        sys.exit(1)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Batch Create Reminders Script - JXA Implementation
+Creates reminders in bulk from a CSV, JSON Lines or JSON array file
+
+Rows are streamed from the file and created in chunks, one osascript
+call per chunk. Target lists are resolved (and created if missing) once
+and remembered for the rest of the run. Every row's outcome is appended
+to `<file>.manifest.jsonl`, so re-running the same file skips rows that
+were already created and retries only the failed ones. Rows are matched
+by a hash of their title, list, due date and priority rather than their
+position, so rows inserted, removed or reordered between runs are not
+created twice.
+
+Columns / keys: title (or name), list, due (YYYY-MM-DD or
+YYYY-MM-DD HH:MM), priority (0-9 or none/high/medium/low), notes (or body).
+
+Usage: python batch_create_reminders.py reminders.csv|reminders.jsonl [--list "Default List"] [--chunk 50]
+"""
+
+import csv
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+from reminders_jxa import run_jxa
+
+PRIORITIES = {"": 0, "none": 0, "high": 1, "medium": 5, "low": 9}
+
+ENSURE_LISTS_JXA = '''
+function main(p) {
+    const ids = Reminders.lists.id(), names = Reminders.lists.name();
+    const lists = {};
+    names.forEach((name, i) => { if (!(name in lists)) lists[name] = ids[i]; });
+    p.names.forEach(name => {
+        if (!(name in lists)) {
+            const lst = Reminders.List({name: name});
+            Reminders.lists.push(lst);
+            lists[name] = lst.id();
+        }
+    });
+    return lists;
+}
+'''
+
+CREATE_REMINDERS_JXA = '''
+function main(p) {
+    return p.items.map(item => {
+        try {
+            const props = {name: item.title};
+            if (item.notes) props.body = item.notes;
+            if (item.priority) props.priority = item.priority;
+            if (item.due) props.dueDate = new Date(item.due);
+            const reminder = Reminders.Reminder(props);
+            Reminders.lists.byId(item.list_id).reminders.push(reminder);
+            return {row: item.row, id: reminder.id()};
+        } catch (e) {
+            return {row: item.row, error: e.message};
+        }
+    });
+}
+'''
+
+
+def iter_rows(path):
+    """Yield (row number, raw dict) from a CSV, JSON Lines or JSON array file"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if str(path).lower().endswith(".json"):
+            # A plain JSON array is loaded whole; there is no streaming parser in the stdlib
+            yield from enumerate(json.load(f), 1)
+        elif str(path).lower().endswith((".jsonl", ".ndjson")):
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        yield number, json.loads(line)
+                    except ValueError:
+                        yield number, line  # reported as a failed row by normalize_row
+        else:
+            for number, row in enumerate(csv.DictReader(f), 1):
+                yield number, row
+
+
+def normalize_row(raw, default_list=None):
+    """Validate one input row; returns a create request or raises ValueError"""
+    if not isinstance(raw, dict):
+        raise ValueError("row is not a JSON object")
+    row = {str(k).strip().lower(): v for k, v in raw.items() if k is not None}
+    title = str(row.get("title") or row.get("name") or "").strip()
+    if not title:
+        raise ValueError("missing title")
+
+    list_name = str(row.get("list") or default_list or "Reminders").strip()
+
+    due = None
+    due_value = str(row.get("due") or row.get("due_date") or "").strip()
+    if due_value:
+        try:
+            due = datetime.fromisoformat(due_value).astimezone().isoformat()
+        except ValueError:
+            raise ValueError(f"invalid due date '{due_value}' (use YYYY-MM-DD or YYYY-MM-DD HH:MM)")
+
+    priority_value = str(row.get("priority") or "").strip().lower()
+    if priority_value in PRIORITIES:
+        priority = PRIORITIES[priority_value]
+    elif priority_value.isdigit() and 0 <= int(priority_value) <= 9:
+        priority = int(priority_value)
+    else:
+        raise ValueError(f"invalid priority '{priority_value}'")
+
+    return {"title": title, "list": list_name, "due": due, "priority": priority,
+            "notes": str(row.get("notes") or row.get("body") or "")}
+
+
+def manifest_path_for(path):
+    """Manifest written next to the input file"""
+    return f"{path}.manifest.jsonl"
+
+
+def row_key(request):
+    """Hash of a normalized row's title, list, due date and priority"""
+    fields = [request["title"], request["list"], request["due"], request["priority"]]
+    return hashlib.sha1(json.dumps(fields, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def load_created_keys(manifest_path):
+    """Return a Counter of row keys the manifest records as created"""
+    created = Counter()
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # a line cut short by an interrupted run
+                if entry.get("status") == "created" and "key" in entry:
+                    created[entry["key"]] += 1
+    except FileNotFoundError:
+        pass
+    return created
+
+
+def end_partial_line(manifest_path):
+    """Terminate a last line cut short by an interrupted run, so the next entry starts on its own line"""
+    if not os.path.exists(manifest_path) or not os.path.getsize(manifest_path):
+        return
+    with open(manifest_path, 'rb+') as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def chunked(items, size):
+    """Group an iterable into lists of at most `size` items"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def batch_create_reminders(path, default_list=None, chunk_size=50):
+    """Create every reminder in `path`; returns (created, failed) counts"""
+    manifest_path = manifest_path_for(path)
+    done = load_created_keys(manifest_path)
+    list_ids = {}
+    created = failed = skipped = 0
+    started = time.monotonic()
+
+    end_partial_line(manifest_path)
+    with open(manifest_path, 'a', encoding='utf-8') as manifest:
+        def record(entry):
+            manifest.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        def requests():
+            nonlocal failed, skipped
+            for number, raw in iter_rows(path):
+                try:
+                    request = normalize_row(raw, default_list)
+                except ValueError as e:
+                    failed += 1
+                    record({"row": number, "status": "failed", "error": str(e)})
+                    continue
+                key = row_key(request)
+                if done[key]:
+                    # Identical rows each count once, so a duplicate is still created
+                    done[key] -= 1
+                    skipped += 1
+                    continue
+                yield dict(request, row=number, key=key)
+
+        for chunk in chunked(requests(), chunk_size):
+            missing = sorted({item["list"] for item in chunk} - set(list_ids))
+            if missing:
+                list_ids.update(run_jxa(ENSURE_LISTS_JXA, {"names": missing}))
+
+            items = [dict(item, list_id=list_ids[item["list"]]) for item in chunk]
+            by_row = {item["row"]: item for item in items}
+            try:
+                results = run_jxa(CREATE_REMINDERS_JXA, {"items": items}, timeout=600)
+            except Exception as e:
+                results = [{"row": item["row"], "error": str(e)} for item in items]
+
+            for result in results:
+                item = by_row[result["row"]]
+                if result.get("error"):
+                    failed += 1
+                    record({"row": item["row"], "status": "failed", "title": item["title"],
+                            "error": result["error"]})
+                else:
+                    created += 1
+                    record({"row": item["row"], "key": item["key"], "status": "created", "title": item["title"],
+                            "list": item["list"], "id": result["id"]})
+            manifest.flush()
+            print(f"Progress: {created} created, {failed} failed ({time.monotonic() - started:.1f}s)")
+
+    print(f"Created {created} reminders, {failed} failed, {skipped} already created "
+          f"({time.monotonic() - started:.1f}s)")
+    if failed:
+        print(f"Failed rows are recorded in {manifest_path}; re-run to retry them")
+    return created, failed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python batch_create_reminders.py reminders.csv|reminders.jsonl "
+              "[--list 'Default List'] [--chunk 50]")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    default_list = None
+    chunk_size = 50
+
+    args = sys.argv[2:]
+    for i, arg in enumerate(args):
+        if arg.startswith('--list'):
+            default_list = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+        elif arg.startswith('--chunk'):
+            chunk_size = int(arg.split('=', 1)[1] if '=' in arg else args[i + 1])
+
+    if not os.path.exists(path):
+        print(f"File not found: {path}")
+        sys.exit(1)
+
+    try:
+        created, failed = batch_create_reminders(path, default_list, chunk_size)
+    except Exception as e:
+        print(f"Error creating reminders: {e}")
+        sys.exit(1)
+    sys.exit(0 if not failed else 1)
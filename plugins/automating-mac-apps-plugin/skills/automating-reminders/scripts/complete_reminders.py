@@ -1,55 +1,89 @@
 #!/usr/bin/env python3
 """
-Complete Reminders Script - PyXA Implementation
+Complete Reminders Script - JXA Implementation
 Marks reminders as completed based on criteria
 
+The match is pushed down to Reminders as a `whose name contains … and
+completed is false` filter, and each list's matches are completed with a
+single bulk set on that specifier, so cleaning up thousands of reminders
+costs a few Apple Events per list. --dry-run prints the diff that would
+be applied without changing anything.
+
 Usage: python complete_reminders.py "search pattern" [--list "List Name"] [--dry-run]
 """
 
 import sys
-import PyXA
+
+from reminders_jxa import run_jxa
+
+COMPLETE_REMINDERS_JXA = '''
+function main(p) {
+    let lists = Reminders.lists;
+    if (p.list) {
+        if (lists.name().indexOf(p.list) < 0) return [];
+        lists = [lists.byName(p.list)];
+    } else {
+        lists = lists();
+    }
+
+    return lists.map(lst => {
+        const spec = lst.reminders.whose({_and: [{name: {_contains: p.pattern}}, {completed: false}]});
+        const ids = spec.id(), names = spec.name();
+        let completed = 0;
+        if (ids.length && !p.dry_run) {
+            // One Apple Event for the whole list; re-query to count what is still open
+            spec.completed = true;
+            completed = ids.length - spec.id().length;
+        }
+        return {list: lst.name(), ids: ids, names: names, completed: completed};
+    });
+}
+'''
+
+
+def format_diff(results):
+    """Render per-list changes as diff lines: '- [ ] title' / '+ [x] title'"""
+    lines = []
+    for result in results:
+        if not result["names"]:
+            continue
+        lines.append(f"@@ {result['list']} ({len(result['names'])} matching) @@")
+        for name in result["names"]:
+            lines.append(f"- [ ] {name}")
+            lines.append(f"+ [x] {name}")
+    return lines
+
 
 def complete_reminders(search_pattern, list_name=None, dry_run=False):
     """Mark reminders as completed based on search pattern"""
     try:
-        reminders_app = PyXA.Application("Reminders")
-
-        all_lists = reminders_app.lists()
-        completed_count = 0
-        found_count = 0
-
-        for lst in all_lists:
-            # Skip if specific list requested and this isn't it
-            if list_name and lst.name != list_name:
-                continue
+        results = run_jxa(COMPLETE_REMINDERS_JXA, {
+            "pattern": search_pattern,
+            "list": list_name,
+            "dry_run": dry_run,
+        }, timeout=600)
 
-            list_reminders = lst.reminders()
+        if list_name and not results:
+            print(f"List '{list_name}' not found")
+            return 0
 
-            for reminder in list_reminders:
-                title = reminder.name() or ""
-
-                # Check if reminder matches search pattern and is not already completed
-                if (search_pattern.lower() in title.lower() and
-                    not reminder.completed()):
-
-                    found_count += 1
-
-                    if dry_run:
-                        print(f"Would complete: '{title}' in {lst.name}")
-                    else:
-                        try:
-                            reminder.completed = True
-                            completed_count += 1
-                            print(f"Completed: '{title}' in {lst.name}")
-                        except Exception as e:
-                            print(f"Error completing '{title}': {e}")
+        found_count = sum(len(r["ids"]) for r in results)
+        completed_count = sum(r["completed"] for r in results)
 
         if dry_run:
+            for line in format_diff(results):
+                print(line)
             print(f"\nDry run: Found {found_count} matching incomplete reminders")
-        else:
-            print(f"\nCompleted {completed_count} reminders matching '{search_pattern}'")
+            return found_count
+
+        for result in results:
+            if result["ids"]:
+                print(f"{result['list']}: completed {result['completed']} of {len(result['ids'])}")
+                if result["completed"] < len(result["ids"]):
+                    print(f"  {len(result['ids']) - result['completed']} could not be completed")
 
-        return completed_count if not dry_run else found_count
+        print(f"\nCompleted {completed_count} reminders matching '{search_pattern}'")
+        return completed_count
 
     except Exception as e:
         print(f"Error completing reminders: {e}")
@@ -74,4 +108,4 @@ if __name__ == "__main__":
             dry_run = True
 
     count = complete_reminders(search_pattern, list_name, dry_run)
-    sys.exit(0 if count > 0 else 1)
\ No newline at end of file
+    sys.exit(0 if count > 0 else 1)
@@ -4,6 +4,12 @@
  *
  * Usage:
  *   osascript -l JavaScript create_reminder.js
+ *   osascript -l JavaScript create_reminder.js reminders.json
+ *
+ * With a file argument, every reminder in the JSON array
+ * ([{name, listName, body, priority, dueDate}, ...]) is created in this
+ * one osascript session, resolving each list only once. For large CSV or
+ * JSON Lines imports with retries, use batch_create_reminders.py.
  *
  * This script creates a reminder with a timed alert. It uses a fallback
  * approach to find an available list since list names vary by system
@@ -78,8 +84,53 @@ function createReminder(options) {
   }
 }
 
-// Example usage - create a reminder for 5 minutes from now
-function run() {
+function parseDueDate(value) {
+  // new Date("YYYY-MM-DD") is midnight UTC; a bare date means local midnight
+  const match = /^(\d{4})-(\d{2})-(\d{2})$/.exec(value);
+  return match ? new Date(+match[1], +match[2] - 1, +match[3]) : new Date(value);
+}
+
+function createReminders(items) {
+  const app = Application("Reminders");
+  const lists = {};
+
+  return items.map((item, index) => {
+    try {
+      const listName = item.listName || "Reminders";
+      if (!(listName in lists)) {
+        lists[listName] = getList(app, listName);
+      }
+
+      const props = { name: item.name };
+      if (item.body) props.body = item.body;
+      if (item.priority > 0) props.priority = item.priority;
+      if (item.dueDate) props.dueDate = parseDueDate(item.dueDate);
+
+      lists[listName].reminders.push(app.Reminder(props));
+      return { index: index, success: true };
+    } catch (error) {
+      return { index: index, success: false, error: error.message };
+    }
+  });
+}
+
+function readJSONFile(path) {
+  ObjC.import("Foundation");
+  const text = $.NSString.stringWithContentsOfFileEncodingError(
+    path, $.NSUTF8StringEncoding, null);
+  return JSON.parse(ObjC.unwrap(text));
+}
+
+// Example usage - create a reminder for 5 minutes from now,
+// or every reminder in the JSON file passed as the first argument
+function run(argv) {
+  if (argv && argv.length > 0) {
+    const results = createReminders(readJSONFile(argv[0]));
+    const failed = results.filter(r => !r.success);
+    failed.forEach(r => console.log(`Item ${r.index}: ${r.error}`));
+    return `Created ${results.length - failed.length} reminders (${failed.length} failed)`;
+  }
+
   const result = createReminder({
     name: "Call back 555-555-5555",
     body: "Return phone call",
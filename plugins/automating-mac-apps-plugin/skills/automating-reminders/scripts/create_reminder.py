@@ -4,6 +4,10 @@ Create Reminder Script - PyXA Implementation
 Creates a new reminder in Reminders app
 
 Usage: python create_reminder.py "Reminder Title" ["due date"] ["list name"]
+       python create_reminder.py --batch reminders.csv|reminders.jsonl [--list "Default List"] [--chunk 50]
+
+--batch creates many reminders in chunked JXA calls with a retry
+manifest (see batch_create_reminders.py).
 """
 
 import sys
@@ -56,8 +60,28 @@ def create_reminder(title, due_date_str=None, list_name="Reminders"):
         return False
 
 if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == '--batch':
+        from batch_create_reminders import batch_create_reminders
+
+        default_list = None
+        chunk_size = 50
+        args = sys.argv[3:]
+        for i, arg in enumerate(args):
+            if arg.startswith('--list'):
+                default_list = arg.split('=', 1)[1] if '=' in arg else args[i + 1]
+            elif arg.startswith('--chunk'):
+                chunk_size = int(arg.split('=', 1)[1] if '=' in arg else args[i + 1])
+
+        try:
+            created, failed = batch_create_reminders(sys.argv[2], default_list, chunk_size)
+        except Exception as e:
+            print(f"Error creating reminders: {e}")
+            sys.exit(1)
+        sys.exit(0 if not failed else 1)
+
     if len(sys.argv) < 2:
         print("Usage: python create_reminder.py 'Reminder Title' ['YYYY-MM-DD'] ['List Name']")
+        print("       python create_reminder.py --batch reminders.csv|reminders.jsonl [--list 'Default List']")
         sys.exit(1)
 
     title = sys.argv[1]
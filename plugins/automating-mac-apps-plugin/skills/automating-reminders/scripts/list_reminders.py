@@ -1,65 +1,124 @@
 #!/usr/bin/env python3
 """
-List Reminders Script - PyXA Implementation
+List Reminders Script - JXA Implementation
 Lists reminders from Reminders app with filtering options
 
-Usage: python list_reminders.py [--list "List Name"] [--completed] [--overdue]
+Each list is read in one call as columns (name, completed, due date,
+priority), with the incomplete/overdue filters pushed down as a `whose`
+predicate so Reminders only returns matching rows. Filtering, sorting and
+rendering then work on the local records.
+
+Usage: python list_reminders.py [--list "List Name"] [--completed] [--overdue] [--json]
 """
 
+import json
 import sys
-import PyXA
+from collections import Counter
 from datetime import datetime
 
-def list_reminders(list_name=None, show_completed=False, show_overdue_only=False):
+from reminders_jxa import parse_date, run_jxa
+
+LIST_REMINDERS_JXA = '''
+function main(p) {
+    let lists = Reminders.lists;
+    if (p.list) {
+        if (lists.name().indexOf(p.list) < 0) return [];
+        lists = [lists.byName(p.list)];
+    } else {
+        lists = lists();
+    }
+
+    const filter = {};
+    if (!p.completed) filter.completed = false;
+    if (p.overdue) filter.dueDate = {_lessThan: new Date()};
+
+    const iso = d => d ? d.toISOString() : null;
+    return lists.map(lst => {
+        const rems = Object.keys(filter).length ? lst.reminders.whose(filter) : lst.reminders;
+        return {
+            list: lst.name(),
+            ids: rems.id(),
+            names: rems.name(),
+            completed: rems.completed(),
+            due: rems.dueDate().map(iso),
+            priority: rems.priority(),
+        };
+    });
+}
+'''
+
+
+def fetch_reminders(list_name=None, show_completed=False, show_overdue_only=False):
+    """Return reminder records for the matching lists, one bulk read per list"""
+    records = []
+    payload = {"list": list_name, "completed": show_completed, "overdue": show_overdue_only}
+    for columns in run_jxa(LIST_REMINDERS_JXA, payload, timeout=300):
+        for reminder_id, name, completed, due, priority in zip(
+                columns["ids"], columns["names"], columns["completed"], columns["due"], columns["priority"]):
+            records.append({
+                "id": reminder_id,
+                "name": name,
+                "completed": completed,
+                "due_date": parse_date(due),
+                "priority": priority,
+                "list": columns["list"],
+            })
+    return records
+
+
+def filter_reminders(records, show_completed=False, show_overdue_only=False, now=None):
+    """Apply the completion/overdue filters and sort each list by due date"""
+    now = now or datetime.now()
+    selected = [
+        r for r in records
+        if (show_completed or not r["completed"])
+        and (not show_overdue_only or (r["due_date"] is not None and r["due_date"] <= now))
+    ]
+    # Stable sort keeps lists in Reminders order while ordering each by due date
+    list_order = {}
+    for r in selected:
+        list_order.setdefault(r["list"], len(list_order))
+    return sorted(selected, key=lambda r: (list_order[r["list"]], r["due_date"] or datetime.max))
+
+
+def render_reminders(records, now=None):
+    """Print reminders grouped by list"""
+    now = now or datetime.now()
+    counts = Counter(r["list"] for r in records)
+    current_list = None
+    for r in records:
+        if r["list"] != current_list:
+            current_list = r["list"]
+            print(f"\n📝 {current_list} ({counts[current_list]} reminders):")
+            print("-" * 50)
+
+        print(f"  {'✅' if r['completed'] else '⏳'} {r['name']}")
+        due_date = r["due_date"]
+        if due_date:
+            if due_date < now and not r["completed"]:
+                print(f"      🚨 Overdue: {due_date.strftime('%Y-%m-%d %H:%M')}")
+            else:
+                print(f"      📅 Due: {due_date.strftime('%Y-%m-%d %H:%M')}")
+
+
+def reminders_to_json(records):
+    """Serialize reminder records (dates as ISO 8601 strings)"""
+    return json.dumps([dict(r, due_date=r["due_date"].isoformat() if r["due_date"] else None)
+                       for r in records], indent=2, ensure_ascii=False)
+
+
+def list_reminders(list_name=None, show_completed=False, show_overdue_only=False, as_json=False):
     """List reminders with optional filtering"""
     try:
-        reminders_app = PyXA.Application("Reminders")
-
-        all_lists = reminders_app.lists()
-        total_reminders = 0
-
-        for lst in all_lists:
-            # Skip if specific list requested and this isn't it
-            if list_name and lst.name != list_name:
-                continue
-
-            list_reminders = lst.reminders()
-            filtered_reminders = []
-
-            for reminder in list_reminders:
-                # Filter by completion status
-                if not show_completed and reminder.completed():
-                    continue
-
-                # Filter by overdue status
-                if show_overdue_only:
-                    due_date = reminder.due_date()
-                    if not due_date or due_date > datetime.now():
-                        continue
-
-                filtered_reminders.append(reminder)
-
-            if filtered_reminders:
-                print(f"\n📝 {lst.name} ({len(filtered_reminders)} reminders):")
-                print("-" * 50)
-
-                for reminder in sorted(filtered_reminders,
-                                     key=lambda r: r.due_date() or datetime.max):
-                    title = reminder.name()
-                    completed = "✅" if reminder.completed() else "⏳"
-                    due_date = reminder.due_date()
-
-                    print(f"  {completed} {title}")
-
-                    if due_date:
-                        if due_date < datetime.now() and not reminder.completed():
-                            print(f"      🚨 Overdue: {due_date.strftime('%Y-%m-%d %H:%M')}")
-                        else:
-                            print(f"      📅 Due: {due_date.strftime('%Y-%m-%d %H:%M')}")
+        now = datetime.now()
+        records = filter_reminders(fetch_reminders(list_name, show_completed, show_overdue_only),
+                                   show_completed, show_overdue_only, now)
 
-                    total_reminders += 1
+        if as_json:
+            print(reminders_to_json(records))
+            return len(records)
 
-        if total_reminders == 0:
+        if not records:
             filters = []
             if list_name:
                 filters.append(f"list '{list_name}'")
@@ -71,9 +130,10 @@ def list_reminders(list_name=None, show_completed=False, show_overdue_only=False
             filter_desc = f" ({', '.join(filters)})" if filters else ""
             print(f"No reminders found{filter_desc}")
         else:
-            print(f"\n📊 Total: {total_reminders} reminders")
+            render_reminders(records, now)
+            print(f"\n📊 Total: {len(records)} reminders")
 
-        return total_reminders
+        return len(records)
 
     except Exception as e:
         print(f"Error listing reminders: {e}")
@@ -83,6 +143,7 @@ if __name__ == "__main__":
     list_name = None
     show_completed = False
     show_overdue = False
+    as_json = False
 
     # Parse arguments
     for arg in sys.argv[1:]:
@@ -94,6 +155,8 @@ if __name__ == "__main__":
             show_completed = True
         elif arg == '--overdue':
             show_overdue = True
+        elif arg == '--json':
+            as_json = True
 
-    count = list_reminders(list_name, show_completed, show_overdue)
-    sys.exit(0 if count >= 0 else 1)
\ No newline at end of file
+    count = list_reminders(list_name, show_completed, show_overdue, as_json)
+    sys.exit(0 if count >= 0 else 1)
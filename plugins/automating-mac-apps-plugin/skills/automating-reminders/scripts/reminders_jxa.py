@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+Reminders JXA Runner
+Runs a JXA program against Reminders.app with JSON in and JSON out
+
+Programs go through the shared jxa_runner with `Reminders` bound to the
+application; this module keeps the Reminders helpers on top of it.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# The osascript runner is shared by every skill
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "automating-mac-apps" / "scripts"))
+import jxa_runner
+
+
+def parse_date(value):
+    """Parse a JSON date (ISO 8601, UTC) into a naive local datetime, or None"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone().replace(tzinfo=None)
+
+
+def run_jxa(script, payload=None, timeout=120):
+    """Run `script` (which defines main(payload)) against Reminders.app and return its JSON result"""
+    return jxa_runner.run_jxa("Reminders", script, payload, timeout)
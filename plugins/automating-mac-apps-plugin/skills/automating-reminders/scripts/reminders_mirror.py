@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Reminders Mirror - SQLite
+Keeps a local copy of Reminders lists and reminders with a change feed
+
+A refresh reads every list's reminder IDs and modification dates in one
+bulk call, diffs them against the mirror, and fetches full details only
+for reminders that are new or changed. Each difference is appended to a
+change feed (created / updated / completed / deleted) with an increasing
+sequence number, so dashboards and other scripts can ask for "everything
+since cursor N" instead of rescanning Reminders.
+
+Usage: python reminders_mirror.py refresh
+       python reminders_mirror.py changes [--since 0] [--json]
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from reminders_jxa import run_jxa
+
+DEFAULT_MIRROR_PATH = Path(os.path.expanduser("~/Library/Caches/automating-reminders/reminders-mirror.sqlite"))
+
+# Read a whole list's columns in one call once this share of it has changed
+BULK_FETCH_RATIO = 0.25
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lists (
+    id TEXT PRIMARY KEY,
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS reminders (
+    id TEXT PRIMARY KEY,
+    list_id TEXT NOT NULL,
+    name TEXT,
+    completed INTEGER NOT NULL DEFAULT 0,
+    due TEXT,
+    priority INTEGER NOT NULL DEFAULT 0,
+    body TEXT,
+    modified TEXT
+);
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    reminder_id TEXT NOT NULL,
+    list_id TEXT,
+    kind TEXT NOT NULL,
+    at REAL NOT NULL
+);
+"""
+
+SNAPSHOT_JXA = '''
+function main(p) {
+    const iso = d => d ? d.toISOString() : null;
+    return Reminders.lists().map(lst => ({
+        id: lst.id(),
+        name: lst.name(),
+        ids: lst.reminders.id(),
+        modified: lst.reminders.modificationDate().map(iso),
+    }));
+}
+'''
+
+FETCH_JXA = '''
+function main(p) {
+    const iso = d => d ? d.toISOString() : null;
+    const out = {};
+    p.lists.forEach(req => {
+        const rems = Reminders.lists.byId(req.list_id).reminders;
+        if (req.bulk) {
+            const ids = rems.id(), names = rems.name(), completed = rems.completed(),
+                  due = rems.dueDate(), priority = rems.priority(), body = rems.body();
+            const wanted = new Set(req.ids);
+            ids.forEach((id, i) => {
+                if (wanted.has(id)) {
+                    out[id] = {name: names[i], completed: completed[i], due: iso(due[i]),
+                               priority: priority[i], body: body[i]};
+                }
+            });
+        } else {
+            req.ids.forEach(id => {
+                const r = Reminders.reminders.byId(id);
+                out[id] = {name: r.name(), completed: r.completed(), due: iso(r.dueDate()),
+                           priority: r.priority(), body: r.body()};
+            });
+        }
+    });
+    return out;
+}
+'''
+
+
+class JXARemindersBackend:
+    """Reads lists and reminders from Reminders.app with bulk JXA calls"""
+
+    def snapshot(self):
+        """Return [{id, name, reminders: {reminder id: modified}}] for every list"""
+        return [
+            {"id": lst["id"], "name": lst["name"], "reminders": dict(zip(lst["ids"], lst["modified"]))}
+            for lst in run_jxa(SNAPSHOT_JXA, timeout=300)
+        ]
+
+    def fetch(self, wanted, list_sizes):
+        """Return {id: {name, completed, due, priority, body}} for {list id: [reminder ids]}"""
+        requests = [
+            {"list_id": list_id, "ids": ids, "bulk": len(ids) >= list_sizes[list_id] * BULK_FETCH_RATIO}
+            for list_id, ids in wanted.items()
+        ]
+        return run_jxa(FETCH_JXA, {"lists": requests}, timeout=600)
+
+
+class RemindersMirror:
+    """SQLite mirror of Reminders with an append-only change feed"""
+
+    def __init__(self, path=DEFAULT_MIRROR_PATH):
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(path))
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def refresh(self, backend):
+        """Bring the mirror up to date with `backend`; returns change counts by kind
+
+        A backend provides `snapshot()` (lists with {reminder id: modified})
+        and `fetch({list id: [ids]}, {list id: size})` (full records).
+        """
+        lists = backend.snapshot()
+        stored = {row["id"]: row for row in self.db.execute(
+            "SELECT id, list_id, completed, modified FROM reminders")}
+
+        wanted = {}
+        seen = {}
+        for lst in lists:
+            for reminder_id, modified in lst["reminders"].items():
+                seen[reminder_id] = lst["id"]
+                previous = stored.get(reminder_id)
+                if previous is None or previous["modified"] != modified or previous["list_id"] != lst["id"]:
+                    wanted.setdefault(lst["id"], []).append(reminder_id)
+
+        details = backend.fetch(wanted, {lst["id"]: len(lst["reminders"]) for lst in lists}) if wanted else {}
+        modified_by_id = {rid: mod for lst in lists for rid, mod in lst["reminders"].items()}
+
+        counts = {"created": 0, "updated": 0, "completed": 0, "deleted": 0}
+        now = time.time()
+        with self.db:
+            self.db.execute("DELETE FROM lists")
+            self.db.executemany("INSERT INTO lists (id, name) VALUES (?, ?)",
+                                [(lst["id"], lst["name"]) for lst in lists])
+
+            for list_id, ids in wanted.items():
+                for reminder_id in ids:
+                    record = details.get(reminder_id)
+                    if record is None:
+                        continue  # deleted between the snapshot and the fetch; next refresh catches it
+                    previous = stored.get(reminder_id)
+                    if previous is None:
+                        kind = "created"
+                    elif record["completed"] and not previous["completed"]:
+                        kind = "completed"
+                    else:
+                        kind = "updated"
+                    self.db.execute(
+                        "INSERT OR REPLACE INTO reminders (id, list_id, name, completed, due, priority, body, modified) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (reminder_id, list_id, record["name"], int(bool(record["completed"])), record["due"],
+                         record["priority"] or 0, record["body"], modified_by_id[reminder_id]))
+                    self.db.execute("INSERT INTO changes (reminder_id, list_id, kind, at) VALUES (?, ?, ?, ?)",
+                                    (reminder_id, list_id, kind, now))
+                    counts[kind] += 1
+
+            for reminder_id in set(stored) - set(seen):
+                self.db.execute("DELETE FROM reminders WHERE id = ?", (reminder_id,))
+                self.db.execute("INSERT INTO changes (reminder_id, list_id, kind, at) VALUES (?, ?, ?, ?)",
+                                (reminder_id, stored[reminder_id]["list_id"], "deleted", now))
+                counts["deleted"] += 1
+
+        return counts
+
+    def cursor(self):
+        """Sequence number of the latest change (0 when the feed is empty)"""
+        return self.db.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+
+    def changes(self, since=0, limit=None):
+        """Return (changes after `since`, new cursor); each change carries the current reminder row"""
+        sql = ("SELECT c.seq, c.kind, c.reminder_id, c.list_id, c.at, r.name, r.completed, r.due, "
+               "r.priority, r.body, l.name AS list_name "
+               "FROM changes c LEFT JOIN reminders r ON r.id = c.reminder_id "
+               "LEFT JOIN lists l ON l.id = c.list_id WHERE c.seq > ? ORDER BY c.seq")
+        params = [since]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        changes = []
+        for row in self.db.execute(sql, params):
+            reminder = None
+            if row["kind"] != "deleted" and row["name"] is not None:
+                reminder = {"name": row["name"], "completed": bool(row["completed"]), "due": row["due"],
+                            "priority": row["priority"], "body": row["body"], "list": row["list_name"]}
+            changes.append({"seq": row["seq"], "kind": row["kind"], "id": row["reminder_id"],
+                            "list_id": row["list_id"], "at": row["at"], "reminder": reminder})
+        return changes, changes[-1]["seq"] if changes else since
+
+    def reminders(self, list_name=None, include_completed=False):
+        """Return mirrored reminders without touching Reminders.app"""
+        sql = ("SELECT r.id, r.name, r.completed, r.due, r.priority, r.body, l.name AS list_name "
+               "FROM reminders r LEFT JOIN lists l ON l.id = r.list_id WHERE 1 = 1")
+        params = []
+        if not include_completed:
+            sql += " AND r.completed = 0"
+        if list_name:
+            sql += " AND l.name = ?"
+            params.append(list_name)
+        sql += " ORDER BY r.due IS NULL, r.due, r.name"
+        return [{"id": row["id"], "name": row["name"], "completed": bool(row["completed"]), "due": row["due"],
+                 "priority": row["priority"], "body": row["body"], "list": row["list_name"]}
+                for row in self.db.execute(sql, params)]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] not in ("refresh", "changes"):
+        print("Usage: python reminders_mirror.py refresh | changes [--since 0] [--json]")
+        sys.exit(1)
+
+    mirror = RemindersMirror()
+
+    if sys.argv[1] == "refresh":
+        started = time.monotonic()
+        try:
+            counts = mirror.refresh(JXARemindersBackend())
+        except Exception as e:
+            print(f"Error refreshing reminders mirror: {e}")
+            sys.exit(1)
+        print(f"Mirror refreshed: {counts['created']} created, {counts['updated']} updated, "
+              f"{counts['completed']} completed, {counts['deleted']} deleted "
+              f"(cursor {mirror.cursor()}, {time.monotonic() - started:.1f}s)")
+        sys.exit(0)
+
+    since = 0
+    args = sys.argv[2:]
+    for i, arg in enumerate(args):
+        if arg.startswith('--since'):
+            since = int(arg.split('=', 1)[1] if '=' in arg else args[i + 1])
+
+    changes, cursor = mirror.changes(since)
+    if '--json' in args:
+        print(json.dumps({"cursor": cursor, "changes": changes}, indent=2, ensure_ascii=False))
+    else:
+        for change in changes:
+            name = change["reminder"]["name"] if change["reminder"] else change["id"]
+            print(f"{change['seq']}: {change['kind']} '{name}'")
+        print(f"Cursor: {cursor}")
+    sys.exit(0)
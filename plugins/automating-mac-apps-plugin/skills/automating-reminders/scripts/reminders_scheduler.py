@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Reminders Due-Date Scheduler - JXA Implementation
+Fires hooks when incomplete reminders come due
+
+Keeps a local mirror of incomplete reminders and a min-heap of their due
+times, sleeps until the earliest one and fires the configured hooks at
+that moment. Reminders is re-read on a slow cadence (every 5 minutes by
+default) with one bulk call; only reminders whose due date, title or
+modification date changed are rescheduled, so shared lists with
+thousands of items are never rescanned per tick.
+
+Hooks:
+  --exec "command"        shell command; reminder fields in REMINDER_* env
+                          vars and as JSON on stdin
+  --webhook URL           POST the reminder as JSON to a local endpoint
+                          (localhost only)
+  --note "Note Title"     append a line to an Apple Note
+
+Usage: python reminders_scheduler.py [--exec "cmd"] [--webhook http://localhost:8080/due]
+       [--note "Reminder Log"] [--list "Work"] [--resync 300] [--catch-up]
+"""
+
+import heapq
+import html
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from urllib.parse import urlparse
+
+from reminders_jxa import jxa_runner, parse_date, run_jxa
+
+DEFAULT_RESYNC_SECONDS = 300
+
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+INCOMPLETE_REMINDERS_JXA = '''
+function main(p) {
+    let lists = Reminders.lists;
+    if (p.list) {
+        if (lists.name().indexOf(p.list) < 0) return [];
+        lists = [lists.byName(p.list)];
+    } else {
+        lists = lists();
+    }
+    const iso = d => d ? d.toISOString() : null;
+    return lists.map(lst => {
+        const rems = lst.reminders.whose({completed: false});
+        return {
+            list: lst.name(),
+            ids: rems.id(),
+            names: rems.name(),
+            due: rems.dueDate().map(iso),
+            modified: rems.modificationDate().map(iso),
+        };
+    });
+}
+'''
+
+APPEND_NOTE_JXA = '''
+function main(p) {
+    const matches = Notes.notes.whose({name: p.title});
+    if (matches.length === 0) {
+        Notes.defaultAccount.defaultFolder.notes.push(Notes.Note({name: p.title, body: p.line}));
+    } else {
+        const note = matches[0];
+        note.body = note.body() + p.line;
+    }
+    return true;
+}
+'''
+
+
+class JXARemindersSource:
+    """Reads incomplete reminders from Reminders.app, one bulk call for all lists"""
+
+    def __init__(self, list_name=None):
+        self.list_name = list_name
+
+    def incomplete_reminders(self):
+        """Return {id: {name, list, due, modified}} for every incomplete reminder"""
+        records = {}
+        for columns in run_jxa(INCOMPLETE_REMINDERS_JXA, {"list": self.list_name}, timeout=300):
+            for reminder_id, name, due, modified in zip(
+                    columns["ids"], columns["names"], columns["due"], columns["modified"]):
+                due_date = parse_date(due)
+                records[reminder_id] = {
+                    "id": reminder_id,
+                    "name": name,
+                    "list": columns["list"],
+                    "due": due_date.timestamp() if due_date else None,
+                    "modified": modified,
+                }
+        return records
+
+
+class ShellHook:
+    """Runs a shell command for each due reminder"""
+
+    def __init__(self, command, timeout=60):
+        self.command = command
+        self.timeout = timeout
+
+    def __call__(self, reminder):
+        env = dict(os.environ,
+                   REMINDER_ID=reminder["id"],
+                   REMINDER_NAME=reminder["name"] or "",
+                   REMINDER_LIST=reminder["list"] or "",
+                   REMINDER_DUE=time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(reminder["due"])))
+        subprocess.run(self.command, shell=True, env=env, input=json.dumps(reminder),
+                       text=True, timeout=self.timeout, check=True)
+
+
+class WebhookHook:
+    """POSTs each due reminder as JSON to a local HTTP endpoint"""
+
+    def __init__(self, url, timeout=10):
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or parsed.hostname not in LOCAL_HOSTS:
+            raise ValueError(f"Webhook must be a local http(s) URL, got '{url}'")
+        self.url = url
+        self.timeout = timeout
+
+    def __call__(self, reminder):
+        request = urllib.request.Request(
+            self.url, data=json.dumps(reminder).encode("utf-8"),
+            headers={"Content-Type": "application/json"}, method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class NoteAppendHook:
+    """Appends a line per due reminder to an Apple Note (created if missing)"""
+
+    def __init__(self, note_title, timeout=60):
+        self.note_title = note_title
+        self.timeout = timeout
+
+    def __call__(self, reminder):
+        due = time.strftime("%Y-%m-%d %H:%M", time.localtime(reminder["due"]))
+        line = f"<div>{due} — {html.escape(reminder['name'])} ({html.escape(reminder['list'])})</div>"
+        jxa_runner.run_jxa("Notes", APPEND_NOTE_JXA, {"title": self.note_title, "line": line}, self.timeout)
+
+
+class DueScheduler:
+    """Min-heap timer queue over a mirror of incomplete reminders
+
+    Heap entries are (due timestamp, reminder id, version). Changing or
+    removing a reminder bumps its version instead of searching the heap,
+    and stale entries are dropped when they reach the top.
+    """
+
+    def __init__(self, source, hooks, clock=time.time, catch_up=False):
+        self.source = source
+        self.hooks = list(hooks)
+        self.clock = clock
+        self.catch_up = catch_up
+        self.reminders = {}
+        self.versions = {}
+        self.fired = {}        # id -> due timestamp already fired
+        self.heap = []
+        self.stop_event = threading.Event()
+        self.synced_once = False
+
+    def _schedule(self, reminder):
+        version = self.versions.get(reminder["id"], 0) + 1
+        self.versions[reminder["id"]] = version
+        if reminder["due"] is not None and self.fired.get(reminder["id"]) != reminder["due"]:
+            heapq.heappush(self.heap, (reminder["due"], reminder["id"], version))
+
+    def sync(self):
+        """Diff the source against the mirror; returns (added, changed, removed) counts"""
+        current = self.source.incomplete_reminders()
+        now = self.clock()
+        added = changed = 0
+
+        for reminder_id, reminder in current.items():
+            previous = self.reminders.get(reminder_id)
+            if previous == reminder:
+                continue
+            if previous is None:
+                added += 1
+                if not self.synced_once and not self.catch_up and reminder["due"] is not None \
+                        and reminder["due"] <= now:
+                    # Already overdue at startup: don't fire unless asked to catch up
+                    self.fired[reminder_id] = reminder["due"]
+            else:
+                changed += 1
+            self.reminders[reminder_id] = reminder
+            self._schedule(reminder)
+
+        removed = [reminder_id for reminder_id in self.reminders if reminder_id not in current]
+        for reminder_id in removed:
+            del self.reminders[reminder_id]
+            self.versions[reminder_id] = self.versions.get(reminder_id, 0) + 1
+            self.fired.pop(reminder_id, None)
+
+        self.synced_once = True
+        return added, changed, len(removed)
+
+    def next_due(self):
+        """Timestamp of the earliest live heap entry, or None"""
+        while self.heap:
+            due, reminder_id, version = self.heap[0]
+            if self.versions.get(reminder_id) == version and reminder_id in self.reminders:
+                return due
+            heapq.heappop(self.heap)
+        return None
+
+    def run_pending(self):
+        """Fire hooks for every reminder due by now; returns the reminders fired"""
+        now = self.clock()
+        fired = []
+        while True:
+            due = self.next_due()
+            if due is None or due > now:
+                break
+            _, reminder_id, _ = heapq.heappop(self.heap)
+            reminder = self.reminders[reminder_id]
+            self.fired[reminder_id] = due
+            for hook in self.hooks:
+                try:
+                    hook(reminder)
+                except Exception as e:
+                    print(f"Hook {type(hook).__name__} failed for '{reminder['name']}': {e}")
+            fired.append(reminder)
+        return fired
+
+    def run_forever(self, resync_seconds=DEFAULT_RESYNC_SECONDS):
+        """Sleep until the next due time or resync, until stop() is called"""
+        next_sync = self.clock()
+        while not self.stop_event.is_set():
+            if self.clock() >= next_sync:
+                try:
+                    added, changed, removed = self.sync()
+                    if added or changed or removed:
+                        print(f"Synced: {added} added, {changed} changed, {removed} removed "
+                              f"({len(self.reminders)} incomplete)")
+                except Exception as e:
+                    print(f"Error syncing reminders: {e}")
+                next_sync = self.clock() + resync_seconds
+
+            for reminder in self.run_pending():
+                print(f"Due: '{reminder['name']}' in {reminder['list']}")
+
+            wake_at = next_sync
+            due = self.next_due()
+            if due is not None:
+                wake_at = min(wake_at, due)
+            self.stop_event.wait(max(0.0, wake_at - self.clock()))
+
+    def stop(self):
+        """Ask run_forever to return"""
+        self.stop_event.set()
+
+
+if __name__ == "__main__":
+    hooks = []
+    list_name = None
+    resync = DEFAULT_RESYNC_SECONDS
+    catch_up = False
+
+    args = sys.argv[1:]
+    try:
+        for i, arg in enumerate(args):
+            value = arg.split('=', 1)[1] if '=' in arg else (args[i + 1] if i + 1 < len(args) else None)
+            if arg.startswith('--exec'):
+                hooks.append(ShellHook(value))
+            elif arg.startswith('--webhook'):
+                hooks.append(WebhookHook(value))
+            elif arg.startswith('--note'):
+                hooks.append(NoteAppendHook(value))
+            elif arg.startswith('--list'):
+                list_name = value
+            elif arg.startswith('--resync'):
+                resync = float(value)
+            elif arg == '--catch-up':
+                catch_up = True
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if not hooks:
+        print("Usage: python reminders_scheduler.py [--exec 'cmd'] [--webhook http://localhost:8080/due] "
+              "[--note 'Reminder Log'] [--list 'Work'] [--resync 300] [--catch-up]")
+        sys.exit(1)
+
+    scheduler = DueScheduler(JXARemindersSource(list_name), hooks, catch_up=catch_up)
+    print(f"Watching {'list ' + repr(list_name) if list_name else 'all lists'}; resync every {resync:.0f}s")
+    try:
+        scheduler.run_forever(resync)
+    except KeyboardInterrupt:
+        print("Stopped")
+    sys.exit(0)
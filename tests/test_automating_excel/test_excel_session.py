@@ -0,0 +1,145 @@
+"""
+Unit Tests for excel_session
+Tests LRU workbook limits, batched calls and cleanup against a fake Excel
+"""
+
+import pathlib
+import sys
+from datetime import datetime
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-excel" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import create_excel_spreadsheet as creator
+import excel_session
+from excel_jxa import excel_serial
+from excel_session import ExcelSession
+
+
+class FakeExcel:
+    """Tracks open workbooks by name and records every JXA program run"""
+
+    def __init__(self, user_open=()):
+        self.user_open = list(user_open)
+        self.open = {pathlib.Path(p).name: {"Sheet1": []} for p in self.user_open}
+        self.calls = []
+        self.saved = []
+        self.closed = []
+        self.writes = []
+
+    def __call__(self, script, payload=None, timeout=120):
+        names = {v: k for k, v in vars(excel_session).items() if k.endswith("_JXA")}
+        self.calls.append(names[script])
+        if script is excel_session.SESSION_START_JXA:
+            return {"state": {"screen": True, "alerts": True, "calc": -4105}, "open": self.user_open}
+        if script is excel_session.SESSION_END_JXA:
+            return True
+        if script is excel_session.OPEN_JXA:
+            opened = []
+            for w in payload["workbooks"]:
+                name = pathlib.Path(w["path"]).name
+                sheets = self.open.setdefault(name, {f"Sheet{i}": [] for i in range(1, w["sheets"] + 1)})
+                opened.append({"workbook": name, "sheets": list(sheets)})
+            return opened
+        if script is excel_session.READ_JXA:
+            return [[["a", {"$date": "2026-01-05T00:00:00.000Z"}]] for _ in payload["reads"]]
+        if script is excel_session.WRITE_JXA:
+            self.writes.extend(payload["writes"])
+            return len(payload["writes"])
+        if script is excel_session.SAVE_JXA:
+            self.saved.extend(payload["workbooks"])
+            return len(payload["workbooks"])
+        if script is excel_session.CLOSE_JXA:
+            for w in payload["workbooks"]:
+                self.closed.append((w["workbook"], w["save"]))
+                del self.open[w["workbook"]]
+            return len(payload["workbooks"])
+        raise AssertionError("unexpected JXA program")
+
+
+class TestExcelSession:
+    """Test suite for excel_session"""
+
+    @pytest.fixture
+    def fake_excel(self, monkeypatch):
+        fake = FakeExcel()
+        monkeypatch.setattr(excel_session, "run_jxa", fake)
+        return fake
+
+    def test_lru_close_keeps_open_bounded(self, fake_excel, tmp_path):
+        """Test the least recently used workbook is closed (and saved only if written)"""
+        a, b, c = (tmp_path / n for n in ("a.xlsx", "b.xlsx", "c.xlsx"))
+        with ExcelSession(max_open=2) as excel:
+            excel.open_many([a, b])
+            excel.write(a, "Sheet1", 1, [[1]])
+            excel.open(a)
+            excel.open(c)
+            assert fake_excel.closed == [("b.xlsx", False)]
+            excel.open(b)
+            assert fake_excel.closed[-1] == ("a.xlsx", True)
+            assert len(fake_excel.open) == 2
+
+        assert sorted(fake_excel.closed[2:]) == [("b.xlsx", False), ("c.xlsx", False)]
+        assert fake_excel.calls[-1] == "SESSION_END_JXA"
+
+    def test_batched_calls(self, fake_excel, tmp_path):
+        """Test many workbooks and ranges go through one call per operation"""
+        paths = [tmp_path / f"{n}.xlsx" for n in range(3)]
+        with ExcelSession() as excel:
+            excel.open_many(paths)
+            blocks = excel.read_many([(p, "Sheet1", "A1:B1") for p in paths])
+            excel.write_many([(p, "Totals", 2, [["x", datetime(2026, 1, 5)], [None]], 3) for p in paths])
+            assert excel.save() == 3
+
+        assert fake_excel.calls == ["SESSION_START_JXA", "OPEN_JXA", "READ_JXA", "WRITE_JXA", "SAVE_JXA",
+                                    "CLOSE_JXA", "SESSION_END_JXA"]
+        assert blocks[0][0][0] == "a" and isinstance(blocks[0][0][1], datetime)
+        assert fake_excel.writes[0]["rows"] == [["x", excel_serial(datetime(2026, 1, 5))], ["", ""]]
+        assert fake_excel.writes[0]["first_column"] == 3
+        assert all(save is False for _, save in fake_excel.closed)
+
+    def test_user_workbooks_are_not_closed(self, monkeypatch, tmp_path):
+        """Test workbooks the user had open are saved if written but stay open"""
+        mine = str((tmp_path / "mine.xlsx").resolve())
+        fake = FakeExcel(user_open=[mine])
+        monkeypatch.setattr(excel_session, "run_jxa", fake)
+
+        with ExcelSession(max_open=1) as excel:
+            excel.write(mine, "Sheet1", 1, [[1]])
+            excel.open(tmp_path / "other.xlsx")
+
+        assert fake.saved == ["mine.xlsx"]
+        assert fake.closed == [("other.xlsx", False)]
+        assert "mine.xlsx" in fake.open
+
+    def test_error_closes_without_saving(self, fake_excel, tmp_path):
+        """Test an exception in the job closes workbooks unsaved and restores Excel"""
+        with pytest.raises(RuntimeError):
+            with ExcelSession() as excel:
+                excel.write(tmp_path / "a.xlsx", "Sheet1", 1, [[1]])
+                raise RuntimeError("job failed")
+
+        assert fake_excel.closed == [("a.xlsx", False)]
+        assert fake_excel.saved == []
+        assert fake_excel.calls[-1] == "SESSION_END_JXA"
+
+    def test_too_many_at_once(self, fake_excel, tmp_path):
+        """Test one batch can't need more workbooks than the pool holds"""
+        with ExcelSession(max_open=2) as excel:
+            with pytest.raises(ValueError):
+                excel.open_many([tmp_path / f"{n}.xlsx" for n in range(3)])
+
+    def test_create_spreadsheets_in_one_session(self, fake_excel, tmp_path):
+        """Test several workbooks are created with sample data in a single session"""
+        paths = [str(tmp_path / f"book{n}.xlsx") for n in range(3)]
+        assert creator.create_excel_spreadsheet("Report", 2, paths, max_open=2)
+
+        assert fake_excel.calls.count("SESSION_START_JXA") == 1
+        assert fake_excel.saved == ["book0.xlsx", "book1.xlsx", "book2.xlsx"]
+        assert fake_excel.writes[0]["rows"][0] == ["Product", "Price", "Quantity", "Total"]
+        assert fake_excel.writes[0]["sheet"] == "Sheet1"
+        assert len(fake_excel.closed) == 3 and not fake_excel.open
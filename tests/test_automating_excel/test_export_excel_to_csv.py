@@ -0,0 +1,125 @@
+"""
+Unit Tests for export_excel_to_csv
+Tests per-sheet export, block reads and folder batches against a fake Excel
+"""
+
+import csv
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-excel" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import export_excel_to_csv as exporter
+
+
+class FakeExcel:
+    """Every workbook has a 5-row 'Sales' sheet and an empty 'Notes' sheet; broken* fails to open"""
+
+    SALES = [
+        ["Region", "Amount", "Closed", "Date"],
+        ["North", 1200.5, True, {"$date": "2026-03-01T12:00:00.000Z"}],
+        ["South, East", 7.0, False, ""],
+        ["West", "", "", ""],
+        ["Total", 1207.5, "", ""],
+    ]
+
+    def __init__(self, open_workbooks=()):
+        self.open_workbooks = set(open_workbooks)
+        self.sessions = []
+        self.reads = []
+        self.closed = []
+
+    def __call__(self, script, payload=None, timeout=120):
+        if script is exporter.SESSION_START_JXA:
+            self.sessions.append("start")
+            return {"screen": True, "alerts": True, "calc": -4105}
+        if script is exporter.SESSION_END_JXA:
+            self.sessions.append(("end", payload["state"]["calc"]))
+            return True
+        if script is exporter.LAYOUT_JXA:
+            name = pathlib.Path(payload["path"]).name
+            if name.startswith("broken"):
+                raise RuntimeError("Excel got an error: can't open")
+            return {"was_open": name in self.open_workbooks, "workbook": name,
+                    "sheets": [{"name": "Sales", "rows": 5, "columns": 4},
+                               {"name": "Notes", "rows": 0, "columns": 0}]}
+        if script is exporter.READ_BLOCK_JXA:
+            self.reads.append((payload["workbook"], payload["first_row"], payload["last_row"]))
+            return self.SALES[payload["first_row"] - 1:payload["last_row"]]
+        if script is exporter.CLOSE_WORKBOOK_JXA:
+            self.closed.append(payload["workbook"])
+            return True
+        raise AssertionError("unexpected JXA program")
+
+
+class TestExportExcelToCsv:
+    """Test suite for export_excel_to_csv"""
+
+    @pytest.fixture
+    def fake_excel(self, monkeypatch):
+        fake = FakeExcel()
+        monkeypatch.setattr(exporter, "run_jxa", fake)
+        return fake
+
+    def read_csv(self, path):
+        with open(path, newline='', encoding='utf-8') as f:
+            return list(csv.reader(f))
+
+    def test_exports_every_sheet(self, fake_excel, tmp_path):
+        """Test one CSV per sheet, typed values and chunked reads"""
+        book = tmp_path / "q1.xlsx"
+        book.write_bytes(b"")
+        out = tmp_path / "csv"
+
+        assert exporter.export_excel_to_csv(str(book), str(out), chunk_rows=2)
+
+        assert fake_excel.reads == [("q1.xlsx", 1, 2), ("q1.xlsx", 3, 4), ("q1.xlsx", 5, 5)]
+        rows = self.read_csv(out / "q1-Sales.csv")
+        assert rows[1][:3] == ["North", "1200.5", "TRUE"] and rows[1][3].startswith("2026-03-0")
+        assert rows[2] == ["South, East", "7", "FALSE", ""]
+        assert self.read_csv(out / "q1-Notes.csv") == []
+        assert fake_excel.closed == ["q1.xlsx"]
+        assert fake_excel.sessions == ["start", ("end", -4105)]
+
+    def test_folder_batch_uses_one_session(self, fake_excel, tmp_path, capsys):
+        """Test a folder is exported in one session and failures don't stop the batch"""
+        for name in ("a.xlsx", "b.xlsm", "broken.xlsx", "~$a.xlsx", "readme.txt"):
+            (tmp_path / name).write_bytes(b"")
+
+        assert not exporter.export_excel_to_csv(str(tmp_path), str(tmp_path / "out"))
+
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [
+            "a-Notes.csv", "a-Sales.csv", "b-Notes.csv", "b-Sales.csv"]
+        assert fake_excel.sessions == ["start", ("end", -4105)]
+        output = capsys.readouterr().out
+        assert "Failed:" in output and "Exported 2 of 3 workbooks" in output
+        assert "Sales: 5 rows" in output
+
+    def test_folder_rejects_csv_output(self, fake_excel, tmp_path):
+        """Test a folder can't be exported into one .csv file"""
+        (tmp_path / "a.xlsx").write_bytes(b"")
+        (tmp_path / "b.xlsx").write_bytes(b"")
+
+        assert not exporter.export_excel_to_csv(str(tmp_path), str(tmp_path / "out.csv"))
+        assert fake_excel.sessions == []
+        assert not (tmp_path / "out.csv").exists()
+
+    def test_leaves_open_workbook_open(self, monkeypatch, tmp_path):
+        """Test a workbook the user had open is not closed"""
+        fake = FakeExcel(open_workbooks=["open.xlsx"])
+        monkeypatch.setattr(exporter, "run_jxa", fake)
+        (tmp_path / "open.xlsx").write_bytes(b"")
+
+        assert exporter.export_excel_to_csv(str(tmp_path / "open.xlsx"), str(tmp_path))
+        assert fake.closed == []
+
+    def test_csv_output_path(self):
+        """Test an explicit .csv target is used as-is only for single-sheet workbooks"""
+        assert exporter.csv_path_for("q1.xlsx", "Sales", "out/data.csv", 1) == "out/data.csv"
+        assert exporter.csv_path_for("q1.xlsx", "Sales", "out/data.csv", 2) == "out/data-Sales.csv"
+        assert exporter.csv_path_for("dir/q1.xlsx", "A/B", "out", 2) == "out/q1-A-B.csv"
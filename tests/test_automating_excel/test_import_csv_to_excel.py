@@ -0,0 +1,116 @@
+"""
+Unit Tests for import_csv_to_excel
+Tests type inference, streamed block writes and session cleanup with a fake Excel
+"""
+
+import pathlib
+import sys
+from datetime import datetime
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-excel" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import import_csv_to_excel as importer
+from excel_jxa import column_name, excel_serial
+
+
+class FakeExcel:
+    """Collects the blocks written to the sheet"""
+
+    def __init__(self, fail_on_block=None):
+        self.fail_on_block = fail_on_block
+        self.prepared = None
+        self.blocks = []
+        self.finished = None
+
+    def __call__(self, script, payload=None, timeout=120):
+        if script is importer.PREPARE_JXA:
+            self.prepared = payload
+            return {"workbook": "out.xlsx", "state": {"screen": True, "alerts": True, "calc": -4105}}
+        if script is importer.WRITE_BLOCK_JXA:
+            if len(self.blocks) == self.fail_on_block:
+                raise RuntimeError("Excel got an error")
+            self.blocks.append((payload["first_row"], payload["rows"]))
+            return len(payload["rows"])
+        if script is importer.FINISH_JXA:
+            self.finished = payload
+            return True
+        raise AssertionError("unexpected JXA program")
+
+
+class TestImportCsvToExcel:
+    """Test suite for import_csv_to_excel"""
+
+    @pytest.fixture
+    def fake_excel(self, monkeypatch):
+        fake = FakeExcel()
+        monkeypatch.setattr(importer, "run_jxa", fake)
+        return fake
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        path = tmp_path / "orders.csv"
+        path.write_text("id,zip,amount,paid,ordered,note\n"
+                        "1,02134,12.50,TRUE,2026-01-05,first\n"
+                        "2,10001,7,false,2026-01-06,\"a, b\"\n"
+                        "3,94103,1e3,true,2026-01-07,\n", encoding="utf-8")
+        return path
+
+    def test_column_name_and_serial(self):
+        """Test A1 column letters and Excel serial dates"""
+        assert [column_name(n) for n in (1, 26, 27, 702, 703)] == ["A", "Z", "AA", "ZZ", "AAA"]
+        assert excel_serial(datetime(2026, 1, 5, 12)) == 46027.5
+
+    def test_infer_column_types(self):
+        """Test each column type is decided once from the sample"""
+        rows = [["1", "007", "2.5", "TRUE", "2026-01-05", "2026-01-05 09:30", "", "x"],
+                ["2", "123", "-3", "false", "2026-01-06", "2026-01-06 10:00", "", "1"]]
+        assert importer.infer_column_types(rows, 9) == ["number", "text", "number", "boolean", "date",
+                                                        "datetime", "general", "text", "general"]
+
+    def test_streams_blocks_with_typed_values(self, fake_excel, csv_file, tmp_path):
+        """Test header, chunked blocks and converted values"""
+        assert importer.import_csv_to_excel(csv_file, tmp_path / "out.xlsx", "Orders", chunk_rows=2)
+
+        assert fake_excel.prepared["formats"] == [None, "@", None, None, "yyyy-mm-dd", "@"]
+        assert fake_excel.prepared["sheet"] == "Orders" and not fake_excel.prepared["exists"]
+        assert [(first, len(rows)) for first, rows in fake_excel.blocks] == [(1, 1), (2, 2), (4, 1)]
+        assert fake_excel.blocks[1][1][0] == [1, "02134", 12.5, True, excel_serial(datetime(2026, 1, 5)), "first"]
+        assert fake_excel.blocks[1][1][1][5] == "a, b"
+        assert fake_excel.blocks[2][1][0][2] == 1000.0
+        assert fake_excel.finished["save"] and fake_excel.finished["state"]["calc"] == -4105
+
+    def test_values_outside_inferred_type_pass_through(self, fake_excel, tmp_path, monkeypatch):
+        """Test rows past the sample that don't match the column type are kept as text"""
+        monkeypatch.setattr(importer, "INFER_ROWS", 2)
+        path = tmp_path / "late.csv"
+        path.write_text("n\n1\n2\nN/A\n", encoding="utf-8")
+        assert importer.import_csv_to_excel(path, tmp_path / "out.xlsx", chunk_rows=10)
+        assert fake_excel.blocks[1][1] == [[1], [2], ["N/A"]]
+
+    def test_ragged_rows_are_padded(self, fake_excel, tmp_path):
+        """Test every block is rectangular so it matches its range"""
+        path = tmp_path / "ragged.csv"
+        path.write_text("1,2,3\n4\n5,6,7,8\n", encoding="utf-8")
+        assert importer.import_csv_to_excel(path, tmp_path / "out.xlsx", header=False)
+        rows = fake_excel.blocks[0][1]
+        assert len({len(row) for row in rows}) == 1 and rows[1] == [4, "", "", ""]
+
+    def test_failure_restores_excel(self, monkeypatch, csv_file, tmp_path):
+        """Test a failed block restores Excel settings without saving"""
+        fake = FakeExcel(fail_on_block=1)
+        monkeypatch.setattr(importer, "run_jxa", fake)
+
+        assert not importer.import_csv_to_excel(csv_file, tmp_path / "out.xlsx")
+        assert fake.finished["save"] is False and fake.finished["state"]["calc"] == -4105
+
+    def test_empty_csv(self, fake_excel, tmp_path):
+        """Test an empty file is rejected before Excel is touched"""
+        path = tmp_path / "empty.csv"
+        path.write_text("", encoding="utf-8")
+        assert not importer.import_csv_to_excel(path, tmp_path / "out.xlsx")
+        assert fake_excel.prepared is None
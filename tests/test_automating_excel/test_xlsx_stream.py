@@ -0,0 +1,213 @@
+"""
+Unit Tests for xlsx_stream
+Tests the Excel-free .xlsx reader and writer and the --native import/export paths
+"""
+
+import csv
+import pathlib
+import sys
+import tracemalloc
+import zipfile
+from datetime import datetime
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-excel" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import export_excel_to_csv as exporter
+import import_csv_to_excel as importer
+import xlsx_stream
+from xlsx_stream import XlsxError, XlsxWorkbook, XlsxWriter
+
+MAIN = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+RELS = 'xmlns="http://schemas.openxmlformats.org/package/2006/relationships"'
+R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def build_fixture(path, date1904=False):
+    """An .xlsx as Excel saves it: shared strings (one with rich runs), a date style, gaps, bool and error"""
+    workbook_pr = '<workbookPr date1904="1"/>' if date1904 else ''
+    parts = {
+        # Excel writes the document properties before the workbook
+        "_rels/.rels": f'<Relationships {RELS}>'
+                       f'<Relationship Id="rId3" Type="{R}/extended-properties" Target="docProps/app.xml"/>'
+                       '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/package/2006/relationships/'
+                       'metadata/core-properties" Target="docProps/core.xml"/>'
+                       f'<Relationship Id="rId1" Type="{R}/officeDocument" Target="xl/workbook.xml"/>'
+                       '</Relationships>',
+        "docProps/app.xml": '<Properties xmlns="http://schemas.openxmlformats.org/officeDocument/2006/'
+                            'extended-properties"><Application>Microsoft Excel</Application></Properties>',
+        "docProps/core.xml": '<cp:coreProperties xmlns:cp="http://schemas.openxmlformats.org/package/2006/'
+                             'metadata/core-properties"/>',
+        "xl/workbook.xml": f'<workbook {MAIN} xmlns:r="{R}">{workbook_pr}<sheets>'
+                           '<sheet name="Sales" sheetId="1" r:id="rId1"/>'
+                           '<sheet name="Empty" sheetId="2" r:id="rId2"/></sheets></workbook>',
+        "xl/_rels/workbook.xml.rels": f'<Relationships {RELS}>'
+                                      f'<Relationship Id="rId1" Type="{R}/worksheet" Target="worksheets/sheet1.xml"/>'
+                                      f'<Relationship Id="rId2" Type="{R}/worksheet" Target="/xl/worksheets/s2.xml"/>'
+                                      f'<Relationship Id="rId3" Type="{R}/sharedStrings" Target="sharedStrings.xml"/>'
+                                      f'<Relationship Id="rId4" Type="{R}/styles" Target="styles.xml"/>'
+                                      '</Relationships>',
+        "xl/sharedStrings.xml": f'<sst {MAIN}><si><t>Region</t></si><si><t>Date</t></si>'
+                                '<si><r><t>Nor</t></r><r><rPr><b/></rPr><t>th</t></r><rPh><t>x</t></rPh></si>'
+                                '<si><t>a &amp; b</t></si></sst>',
+        "xl/styles.xml": f'<styleSheet {MAIN}><numFmts><numFmt numFmtId="170" formatCode="0.00&quot;d&quot;"/>'
+                         '<numFmt numFmtId="171" formatCode="[$-409]d/m/yyyy h:mm"/></numFmts>'
+                         '<cellStyleXfs><xf numFmtId="0"/></cellStyleXfs>'
+                         '<cellXfs><xf numFmtId="0"/><xf numFmtId="14"/><xf numFmtId="170"/><xf numFmtId="171"/>'
+                         '</cellXfs></styleSheet>',
+        "xl/worksheets/sheet1.xml": f'<worksheet {MAIN}><dimension ref="A1:E5"/><sheetData>'
+                                    '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c></row>'
+                                    '<row r="2"><c r="A2" t="s"><v>2</v></c><c r="B2" s="1"><v>46082</v></c>'
+                                    '<c r="C2" s="2"><v>1200.5</v></c><c r="D2" t="b"><v>1</v></c>'
+                                    '<c r="E2" t="e"><v>#N/A</v></c></row>'
+                                    '<row r="4"><c r="A4" t="inlineStr"><is><t>West</t></is></c>'
+                                    '<c r="C4" s="3"><v>46082.75</v></c><c r="E4" t="str"><f>A4</f><v>West</v></c></row>'
+                                    '<row r="5"><c r="A5" t="s"><v>3</v></c><c r="B5"><v>7</v></c></row>'
+                                    '</sheetData></worksheet>',
+        "xl/worksheets/s2.xml": f'<worksheet {MAIN}><sheetData/></worksheet>',
+    }
+    with zipfile.ZipFile(path, "w") as z:
+        for name, xml in parts.items():
+            z.writestr(name, xml)
+    return path
+
+
+class TestXlsxStream:
+    """Test suite for xlsx_stream"""
+
+    def read_all(self, path):
+        with XlsxWorkbook(path) as book:
+            return {sheet["name"]: list(book.iter_rows(sheet)) for sheet in book.sheets()}
+
+    def test_reads_excel_saved_workbook(self, tmp_path):
+        """Test shared strings, rich text, date styles, gaps and cell types"""
+        sheets = self.read_all(build_fixture(tmp_path / "q1.xlsx"))
+
+        assert sheets["Empty"] == []
+        assert sheets["Sales"] == [
+            ["Region", "Date", None, None, None],
+            ["North", datetime(2026, 3, 1), 1200.5, True, "#N/A"],
+            [None] * 5,
+            ["West", None, datetime(2026, 3, 1, 18), None, "West"],
+            ["a & b", 7, None, None, None],
+        ]
+
+    def test_workbook_found_by_relationship_type(self, tmp_path):
+        """Test the workbook part is the officeDocument relationship, not the first .xml target"""
+        with XlsxWorkbook(build_fixture(tmp_path / "q1.xlsx")) as book:
+            assert [sheet["name"] for sheet in book.sheets()] == ["Sales", "Empty"]
+            assert book._shared_strings_part == "xl/sharedStrings.xml"
+
+    def test_date1904_workbooks(self, tmp_path):
+        """Test serials are counted from 1904-01-01 when the workbook says so"""
+        sheets = self.read_all(build_fixture(tmp_path / "mac.xlsx", date1904=True))
+        assert sheets["Sales"][1][1] == datetime(2030, 3, 2)
+
+    def test_date_format_detection(self):
+        """Test quoted literals and locale sections don't make a format look like a date"""
+        assert xlsx_stream.is_date_format("yyyy-mm-dd")
+        assert xlsx_stream.is_date_format("[$-409]h:mm AM/PM")
+        assert not xlsx_stream.is_date_format('0.00"d"')
+        assert not xlsx_stream.is_date_format("[Red]#,##0")
+
+    def test_writer_round_trip(self, tmp_path):
+        """Test typed values and sheet names survive a write and read"""
+        path = tmp_path / "out.xlsx"
+        rows = [["name", "n", "ok", "when", "note"],
+                ["<a & b>", 1.25, False, datetime(2026, 1, 5), "tab\there\x01"],
+                ["x", 10 ** 12, True, datetime(2026, 1, 5, 9, 30), None]]
+        with XlsxWriter(path) as book:
+            assert book.write_sheet("Data", rows) == 3
+            book.write_sheet("a/b:c?" + "x" * 40, [[1]])
+            book.write_sheet("data", [])
+
+        sheets = self.read_all(path)
+        assert list(sheets) == ["Data", "a-b-c-" + "x" * 25, "data (2)"]
+        assert sheets["Data"][1] == ["<a & b>", 1.25, False, datetime(2026, 1, 5), "tab\there"]
+        assert sheets["Data"][2] == ["x", 10 ** 12, True, datetime(2026, 1, 5, 9, 30)]
+        assert sheets["data (2)"] == []
+
+    def test_writer_removes_partial_file(self, tmp_path):
+        """Test a failed write doesn't leave a broken workbook"""
+        def rows():
+            yield [1]
+            raise ValueError("bad row")
+
+        path = tmp_path / "broken.xlsx"
+        with pytest.raises(ValueError):
+            with XlsxWriter(path) as book:
+                book.write_sheet("Data", rows())
+        assert not path.exists()
+
+    def test_rejects_non_xlsx(self, tmp_path):
+        """Test legacy or corrupt files raise XlsxError"""
+        path = tmp_path / "old.xls"
+        path.write_bytes(b"\xd0\xcf\x11\xe0 not a zip")
+        with pytest.raises(XlsxError):
+            XlsxWorkbook(path).__enter__()
+
+    def test_memory_stays_flat(self, tmp_path):
+        """Test reading and writing a large sheet never holds it in memory"""
+        path = tmp_path / "big.xlsx"
+        row_count = 30000
+
+        tracemalloc.start()
+        try:
+            with XlsxWriter(path) as book:
+                book.write_sheet("Big", ([i, f"row {i}", i * 0.5, i % 2 == 0] for i in range(row_count)))
+            _, write_peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+            with XlsxWorkbook(path) as book:
+                count = sum(1 for _ in book.iter_rows(book.sheets()[0]))
+            _, read_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert count == row_count
+        # The sheet XML is several MB; a streamed pass stays well under that
+        assert write_peak < 2_000_000 and read_peak < 2_000_000
+
+    def test_matches_openpyxl(self, tmp_path):
+        """Test files written here are read the same by openpyxl"""
+        openpyxl = pytest.importorskip("openpyxl")
+        path = tmp_path / "out.xlsx"
+        with XlsxWriter(path) as book:
+            book.write_sheet("Data", [["a", 1, True, datetime(2026, 1, 5)]])
+        sheet = openpyxl.load_workbook(path, read_only=True)["Data"]
+        assert list(sheet.iter_rows(values_only=True)) == [("a", 1, True, datetime(2026, 1, 5))]
+
+    def test_native_export(self, tmp_path, monkeypatch):
+        """Test --native export reads the file directly and never calls Excel"""
+        def no_excel(*args, **kwargs):
+            raise AssertionError("Excel was used")
+
+        monkeypatch.setattr(exporter, "run_jxa", no_excel)
+        build_fixture(tmp_path / "q1.xlsx")
+
+        assert exporter.export_excel_to_csv(str(tmp_path / "q1.xlsx"), str(tmp_path / "out"), native=True)
+        with open(tmp_path / "out" / "q1-Sales.csv", newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[1] == ["North", "2026-03-01", "1200.5", "TRUE", "#N/A"]
+        assert rows[2] == ["", "", "", "", ""]
+        assert (tmp_path / "out" / "q1-Empty.csv").read_text() == ""
+
+    def test_native_import(self, tmp_path, monkeypatch):
+        """Test --native import writes a typed workbook without Excel"""
+        def no_excel(*args, **kwargs):
+            raise AssertionError("Excel was used")
+
+        monkeypatch.setattr(importer, "run_jxa", no_excel)
+        source = tmp_path / "orders.csv"
+        source.write_text("id,zip,amount,ordered\n1,02134,12.50,2026-01-05\n2,10001,7,\n", encoding="utf-8")
+
+        assert importer.import_csv_to_excel(source, tmp_path / "orders.xlsx", "Orders", chunk_rows=1, native=True)
+        assert self.read_all(tmp_path / "orders.xlsx") == {"Orders": [
+            ["id", "zip", "amount", "ordered"],
+            [1, "02134", 12.5, datetime(2026, 1, 5)],
+            [2, "10001", 7],
+        ]}
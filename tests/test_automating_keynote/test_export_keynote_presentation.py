@@ -0,0 +1,143 @@
+"""
+Unit Tests for export_keynote_presentation
+Tests the single-session batch export, timeouts and the resumable manifest with a fake Keynote
+"""
+
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-keynote" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import export_keynote_presentation as exporter
+import batch_export  # on the path through export_keynote_presentation
+
+
+class FakeKeynote:
+    """Records sessions, exports and closes; files named slow* time out"""
+
+    def __init__(self, open_documents=()):
+        self.open_documents = list(open_documents)
+        self.sessions = 0
+        self.exported = []
+        self.closed = []
+
+    def __call__(self, script, payload=None, timeout=120):
+        if script is batch_export.START_SESSION_JXA:
+            self.sessions += 1
+            return self.open_documents
+        if script is exporter.EXPORT_JXA:
+            name = os.path.basename(payload["path"])
+            if name.startswith("slow"):
+                raise subprocess.TimeoutExpired("osascript", timeout)
+            if name.startswith("bad"):
+                raise RuntimeError("Keynote got an error: Can't open file")
+            for output in payload["outputs"]:
+                pathlib.Path(output["path"]).write_bytes(b"")
+            self.exported.append((name, [o["as"] for o in payload["outputs"]], payload["close"]))
+            return True
+        if script is batch_export.CLOSE_DOCUMENT_JXA:
+            self.closed.append(os.path.basename(payload["path"]))
+            return True
+        raise AssertionError("unexpected JXA program")
+
+
+class TestExportKeynotePresentation:
+    """Test suite for export_keynote_presentation"""
+
+    @pytest.fixture
+    def decks(self, tmp_path):
+        folder = tmp_path / "decks"
+        folder.mkdir()
+        for name in ("a", "b", "slow", "bad"):
+            (folder / f"{name}.key").write_bytes(b"")
+        (folder / "package.key").mkdir()
+        (folder / "package.key" / "index.apxl").write_text("inside a package")
+        (folder / "notes.txt").write_text("ignored")
+        return folder
+
+    @pytest.fixture
+    def fake_keynote(self, monkeypatch):
+        fake = FakeKeynote()
+        monkeypatch.setattr(exporter, "run_jxa", fake)
+        return fake
+
+    def read_manifest(self, path):
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_exports_in_one_session(self, decks, fake_keynote, tmp_path):
+        """Test every deck is exported to every format within one session"""
+        out = tmp_path / "out"
+        result = exporter.batch_export_keynote([str(decks / "*.key")], out, formats=("pdf", "pptx", "png"),
+                                               queue_size=1)
+
+        assert result == (3, 0, 2)
+        assert fake_keynote.sessions == 1
+        formats = ["PDF", "Microsoft PowerPoint", "slide images"]
+        assert fake_keynote.exported == [("a.key", formats, True), ("b.key", formats, True),
+                                         ("package.key", formats, True)]
+
+        entries = {os.path.basename(e["file"]): e for e in self.read_manifest(out / exporter.MANIFEST_NAME)}
+        assert entries["a.key"]["status"] == "ok"
+        assert entries["a.key"]["outputs"]["png"].endswith("a-png")
+        assert entries["bad.key"]["status"] == "failed"
+        assert entries["slow.key"]["status"] == "timeout"
+        assert all("seconds" in entry for entry in entries.values())
+
+    def test_folder_skips_package_contents(self, decks, fake_keynote, tmp_path):
+        """Test a folder yields .key files and packages but not files inside packages"""
+        found = sorted(p.name for p, _ in batch_export.expand_inputs([str(decks)], exporter.find_keynote_files))
+        assert found == ["a.key", "b.key", "bad.key", "package.key", "slow.key"]
+
+    def test_timeout_closes_document(self, decks, fake_keynote, tmp_path):
+        """Test a timed-out deck is closed so it doesn't block the next file"""
+        exporter.batch_export_keynote([str(decks / "slow.key")], tmp_path / "out")
+        assert fake_keynote.closed == ["slow.key"]
+
+    def test_leaves_open_documents_open(self, decks, monkeypatch, tmp_path):
+        """Test decks open before the batch are not closed"""
+        fake = FakeKeynote(open_documents=[str((decks / "a.key").resolve())])
+        monkeypatch.setattr(exporter, "run_jxa", fake)
+
+        exporter.batch_export_keynote([str(decks / "a.key"), str(decks / "b.key")], tmp_path / "out")
+        assert [(name, close) for name, _, close in fake.exported] == [("a.key", False), ("b.key", True)]
+
+    def test_rerun_skips_unchanged_outputs(self, decks, fake_keynote, tmp_path):
+        """Test a re-run exports only failures, changed decks, missing outputs and new formats"""
+        out = tmp_path / "out"
+        exporter.batch_export_keynote([str(decks)], out)
+        fake_keynote.exported.clear()
+        os.utime(decks / "b.key", (1, 1))
+        os.remove(out / "package.pdf")
+
+        assert exporter.batch_export_keynote([str(decks)], out) == (2, 1, 2)
+        assert sorted(name for name, _, _ in fake_keynote.exported) == ["b.key", "package.key"]
+
+        fake_keynote.exported.clear()
+        exporter.batch_export_keynote([str(decks / "a.key")], out, formats=("pdf", "html"))
+        assert fake_keynote.exported == [("a.key", ["HTML"], True)]
+
+        fake_keynote.exported.clear()
+        exporter.batch_export_keynote([str(decks)], out, force=True)
+        assert len(fake_keynote.exported) == 3
+
+    def test_unknown_format(self, decks, fake_keynote, tmp_path):
+        """Test unsupported formats are rejected before Keynote is touched"""
+        with pytest.raises(ValueError):
+            exporter.batch_export_keynote([str(decks)], tmp_path / "out", formats=("docx",))
+        assert fake_keynote.sessions == 0
+
+    def test_single_file_export(self, decks, fake_keynote, tmp_path):
+        """Test the single-file form exports through the same program with a timeout"""
+        assert exporter.export_keynote_presentation(str(decks / "a.key"), str(tmp_path / "a.pptx"), "PowerPoint")
+        assert fake_keynote.exported == [("a.key", ["Microsoft PowerPoint"], True)]
+        assert not exporter.export_keynote_presentation(str(decks / "slow.key"), str(tmp_path / "s.pdf"))
+        assert not exporter.export_keynote_presentation(str(decks / "a.key"), str(tmp_path / "a.doc"), "Word")
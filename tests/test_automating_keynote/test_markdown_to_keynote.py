@@ -0,0 +1,197 @@
+"""
+Unit Tests for markdown_to_keynote
+Tests slide specs, the chunked whole-deck build and --sync plans against a fake Keynote
+"""
+
+import json
+import pathlib
+import random
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-keynote" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import markdown_to_keynote as builder
+
+
+def deck_markdown(titles):
+    return "\n".join(f"# {title}\n- point about {title}\n" for title in titles)
+
+
+def apply_plan(hashes, plan):
+    """Apply a sync plan to a list of slide hashes the way the JXA program does"""
+    deck = list(hashes)
+    for position in plan["delete"]:
+        del deck[position - 1]
+    for edit in plan["edit"]:
+        deck[edit["position"] - 1] = builder.spec_hash(edit["spec"])
+    deck.extend(builder.spec_hash(spec) for spec in plan["add"])
+    for source, target in plan["moves"]:
+        deck.insert(target - 1, deck.pop(source - 1))
+    return deck
+
+
+class FakeKeynote:
+    """Records every program run and the slides it was asked to build"""
+
+    def __init__(self):
+        self.calls = []
+        self.slides = []
+        self.saved = None
+        self.synced = None
+
+    def __call__(self, script, payload=None, timeout=120):
+        if script is builder.CREATE_DECK_JXA:
+            self.calls.append("create")
+            self.slides.extend(payload["slides"])
+            return {"document": "DOC-1", "warnings": []}
+        if script is builder.ADD_SLIDES_JXA:
+            assert payload["document"] == "DOC-1"
+            self.calls.append("add")
+            self.slides.extend(payload["slides"])
+            return {"warnings": [{"slide": payload["slides"][0]["index"], "warning": "no title placeholder"}]}
+        if script is builder.SAVE_DECK_JXA:
+            self.calls.append("save")
+            self.saved = payload["path"]
+            pathlib.Path(payload["path"]).write_bytes(b"")
+            return len(self.slides)
+        if script is builder.SYNC_DECK_JXA:
+            self.calls.append("sync")
+            self.synced = payload
+            return {"document": "DOC-1", "slides": 0, "warnings": []}
+        raise AssertionError("unexpected JXA program")
+
+
+class TestMarkdownToKeynote:
+    """Test suite for markdown_to_keynote"""
+
+    @pytest.fixture
+    def fake_keynote(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        fake = FakeKeynote()
+        monkeypatch.setattr(builder, "run_jxa", fake)
+        return fake
+
+    def test_slide_specs(self, tmp_path):
+        """Test layouts, body text, notes and image paths"""
+        slides = builder.parse_markdown_slides(
+            "# Deck\nSubtitle here\n---\n## Points\n- a\n  - b\nNotes:\nsay a\n---\n## Picture\n"
+            "![x](img/chart.png)\n![y](https://example.com/y.png)\n---\n## Just a title\n")
+        specs = builder.slide_specs(slides, str(tmp_path))
+
+        assert [s["layout"] for s in specs] == ["title", "bullets", "photo", "title_only"]
+        assert specs[0]["body"] == "Subtitle here"
+        assert specs[1]["body"] == "a\n\tb" and specs[1]["notes"] == "say a"
+        assert specs[2]["images"] == [str(tmp_path / "img" / "chart.png")]
+
+    def test_200_slides_in_a_few_programs(self, fake_keynote, tmp_path, capsys):
+        """Test a 200-slide deck is one create, three chunked adds and one save"""
+        source = tmp_path / "deck.md"
+        source.write_text("\n".join(f"# Slide {n}\n- point {n}\n" for n in range(200)), encoding="utf-8")
+
+        assert builder.create_keynote_from_markdown(str(source), "Weekly: Review", chunk_slides=50)
+
+        assert fake_keynote.calls == ["create", "add", "add", "add", "save"]
+        assert [s["index"] for s in fake_keynote.slides] == list(range(1, 201))
+        assert fake_keynote.saved == str(tmp_path / "Weekly- Review.key")
+        output = capsys.readouterr().out
+        assert "Progress: 200 of 200 slides" in output and "Warning: slide 51" in output
+
+    def test_failure_is_reported(self, monkeypatch, tmp_path, capsys):
+        """Test a Keynote error returns False with the message"""
+        def broken(script, payload=None, timeout=120):
+            raise RuntimeError("Keynote got an error")
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        monkeypatch.setattr(builder, "run_jxa", broken)
+        source = tmp_path / "deck.md"
+        source.write_text("# One\n", encoding="utf-8")
+
+        assert not builder.create_keynote_from_markdown(str(source), "Deck")
+        assert "Keynote got an error" in capsys.readouterr().out
+
+    def specs_for(self, titles):
+        return builder.slide_specs(builder.parse_markdown_slides(deck_markdown(titles)))
+
+    def test_plan_edit_in_place(self):
+        """Test a typo fix edits one slide and leaves the rest alone"""
+        old = self.specs_for([f"S{n}" for n in range(150)])
+        new = self.specs_for([f"S{n}" if n != 70 else "S70 fixed" for n in range(150)])
+        entries = [{"hash": builder.spec_hash(s), "layout": s["layout"], "images": s["images"]} for s in old]
+
+        plan = builder.plan_sync(entries, new)
+        assert plan["delete"] == [] and plan["add"] == [] and plan["moves"] == []
+        assert [e["position"] for e in plan["edit"]] == [71] and plan["unchanged"] == 149
+
+    def test_plan_insert_delete_and_move(self):
+        """Test adds, removals and reorders end in the new order with few operations"""
+        old = self.specs_for(["A", "B", "C", "D", "E"])
+        new = self.specs_for(["A", "D", "B", "New", "E"])
+        entries = [{"hash": builder.spec_hash(s), "layout": s["layout"], "images": s["images"]} for s in old]
+
+        plan = builder.plan_sync(entries, new)
+        # C -> New keeps its layout, so it is edited in place; D is moved up
+        assert plan["delete"] == [] and plan["add"] == [] and plan["moves"] == [[4, 2]]
+        assert [(e["position"], e["spec"]["title"]) for e in plan["edit"]] == [(3, "New")]
+        assert apply_plan([e["hash"] for e in entries], plan) == [builder.spec_hash(s) for s in new]
+
+    def test_plan_random_changes(self):
+        """Test random edits, moves, inserts and deletes always reproduce the new deck"""
+        rng = random.Random(7)
+        for _ in range(50):
+            titles = [f"T{n}" for n in range(rng.randint(0, 30))]
+            changed = list(titles)
+            for _ in range(rng.randint(0, 6)):
+                action = rng.choice(["edit", "move", "insert", "delete"])
+                if action == "insert" or not changed:
+                    changed.insert(rng.randint(0, len(changed)), f"N{rng.random()}")
+                elif action == "edit":
+                    changed[rng.randrange(len(changed))] += " v2"
+                elif action == "move":
+                    changed.insert(rng.randint(0, len(changed) - 1), changed.pop(rng.randrange(len(changed))))
+                else:
+                    changed.pop(rng.randrange(len(changed)))
+            old, new = self.specs_for(titles), self.specs_for(changed)
+            entries = [{"hash": builder.spec_hash(s), "layout": s["layout"], "images": s["images"]} for s in old]
+            assert apply_plan([e["hash"] for e in entries], builder.plan_sync(entries, new)) == \
+                [builder.spec_hash(s) for s in new]
+
+    def test_sync_updates_existing_deck(self, fake_keynote, tmp_path, capsys):
+        """Test --sync builds once, then sends only the changed slide and refreshes the manifest"""
+        source = tmp_path / "weekly.md"
+        deck = tmp_path / "weekly.key"
+        source.write_text(deck_markdown([f"S{n}" for n in range(150)]), encoding="utf-8")
+        assert builder.create_keynote_from_markdown(str(source), "Weekly", str(deck), sync=True)
+        assert fake_keynote.calls == ["create", "add", "add", "save"]
+
+        source.write_text(deck_markdown([f"S{n}" if n != 9 else "S9 typo fixed" for n in range(150)]),
+                          encoding="utf-8")
+        assert builder.create_keynote_from_markdown(str(source), "Weekly", str(deck), sync=True)
+
+        assert fake_keynote.calls[-1] == "sync"
+        assert fake_keynote.synced["expected"] == 150 and fake_keynote.synced["add"] == []
+        assert [e["spec"]["title"] for e in fake_keynote.synced["edit"]] == ["S9 typo fixed"]
+        manifest = json.loads((tmp_path / "weekly.slides.json").read_text())
+        assert len(manifest["slides"]) == 150
+        assert "1 edited" in capsys.readouterr().out
+
+        calls = len(fake_keynote.calls)
+        assert builder.create_keynote_from_markdown(str(source), "Weekly", str(deck), sync=True)
+        assert len(fake_keynote.calls) == calls
+
+    def test_sync_refuses_changed_deck(self, monkeypatch, tmp_path, capsys):
+        """Test a deck edited outside the manifest is not modified"""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        source, deck = tmp_path / "d.md", tmp_path / "d.key"
+        source.write_text(deck_markdown(["A", "B"]), encoding="utf-8")
+        deck.write_bytes(b"")
+        builder.write_manifest(str(deck), str(source), self.specs_for(["A"]))
+        monkeypatch.setattr(builder, "run_jxa", lambda script, payload=None, timeout=120:
+                            {"error": "deck has 3 slides, manifest has 1"})
+
+        assert not builder.create_keynote_from_markdown(str(source), "D", str(deck), sync=True)
+        assert "run without --sync" in capsys.readouterr().out
@@ -0,0 +1,51 @@
+"""
+Unit Tests for batch_export
+Tests the shared option parser and manifest loader used by the iWork batch scripts
+"""
+
+import json
+import pathlib
+import sys
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-mac-apps" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from batch_export import DEFAULT_QUEUE_SIZE, end_partial_line, load_manifest, parse_batch_args
+
+
+class TestBatchExport:
+    """Test suite for batch_export"""
+
+    def test_parse_batch_args(self):
+        """Test inputs and options are split in either --name value or --name=value form"""
+        inputs, options = parse_batch_args(["a/*.key", "--output", "out", "b", "--formats=PDF, png", "--force",
+                                            "--timeout", "30"], "pdf", 300)
+        assert inputs == ["a/*.key", "b"]
+        assert options == {"output": "out", "formats": ["pdf", "png"], "timeout": 30, "manifest": None,
+                           "queue": DEFAULT_QUEUE_SIZE, "force": True}
+
+    def test_load_manifest(self, tmp_path):
+        """Test outputs accumulate per mtime and failed or cut-short lines are ignored"""
+        manifest = tmp_path / "manifest.jsonl"
+        entries = [{"file": "a", "mtime": 1, "status": "ok", "outputs": {"pdf": "a.pdf"}},
+                   {"file": "a", "mtime": 1, "status": "ok", "outputs": {"png": "a-png"}},
+                   {"file": "b", "mtime": 1, "status": "ok", "outputs": {"pdf": "b.pdf"}},
+                   {"file": "b", "mtime": 2, "status": "ok", "outputs": {"png": "b-png"}},
+                   {"file": "c", "mtime": 1, "status": "failed", "outputs": {"pdf": "c.pdf"}}]
+        manifest.write_text("".join(json.dumps(e) + "\n" for e in entries) + '{"file": "d", "mt')
+
+        assert load_manifest(manifest) == {"a": {"mtime": 1, "outputs": {"pdf": "a.pdf", "png": "a-png"}},
+                                           "b": {"mtime": 2, "outputs": {"png": "b-png"}}}
+
+    def test_append_after_truncated_line(self, tmp_path):
+        """Test an entry appended after an interrupted run starts on its own line"""
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text('{"file": "a", "mtime": 1, "status": "ok", "outputs": {}}\n{"file": "b", "mt')
+
+        end_partial_line(manifest)
+        with open(manifest, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"file": "c", "mtime": 1, "status": "ok", "outputs": {}}) + "\n")
+
+        assert sorted(load_manifest(manifest)) == ["a", "c"]
@@ -0,0 +1,56 @@
+"""
+Unit Tests for jxa_runner
+Tests the shared osascript runner with a fake subprocess
+"""
+
+import json
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-mac-apps" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import jxa_runner
+
+
+class FakeOsascript:
+    """Records the program and payload it was given and answers with fixed output"""
+
+    def __init__(self, returncode=0, stdout="", stderr=""):
+        self.result = subprocess.CompletedProcess([], returncode, stdout, stderr)
+        self.program = self.payload = None
+
+    def __call__(self, args, **kwargs):
+        self.program = args[4]
+        with open(args[5], encoding="utf-8") as f:
+            self.payload = json.load(f)
+        return self.result
+
+
+class TestJxaRunner:
+    """Test suite for jxa_runner"""
+
+    def test_binds_application(self, monkeypatch):
+        """Test the prelude binds the app by its last name word and the payload reaches main"""
+        fake = FakeOsascript(stdout='{"rows": [[1, "a"]]}')
+        monkeypatch.setattr(jxa_runner.subprocess, "run", fake)
+
+        assert jxa_runner.run_jxa("Microsoft Excel", "function main(p) {}", {"sheet": "Q1"}) == {"rows": [[1, "a"]]}
+        assert 'const Excel = Application("Microsoft Excel");' in fake.program
+        assert fake.program.endswith("function main(p) {}")
+        assert fake.payload == {"sheet": "Q1"}
+
+    def test_errors(self, monkeypatch):
+        """Test a failing osascript and unparsable output raise JXAError"""
+        monkeypatch.setattr(jxa_runner.subprocess, "run", FakeOsascript(returncode=1, stderr="execution error"))
+        with pytest.raises(jxa_runner.JXAError, match="execution error"):
+            jxa_runner.run_jxa("Mail", "function main(p) {}")
+
+        monkeypatch.setattr(jxa_runner.subprocess, "run", FakeOsascript(stdout="missing value"))
+        with pytest.raises(jxa_runner.JXAError, match="Unexpected JXA output"):
+            jxa_runner.run_jxa("Mail", "function main(p) {}")
@@ -0,0 +1,43 @@
+"""
+Unit Tests for protobuf_wire
+Tests the shared protobuf wire decoder used by the Notes and Numbers readers
+"""
+
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-mac-apps" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from protobuf_wire import iter_protobuf_fields, parse_message, read_varint
+
+
+class TestProtobufWire:
+    """Test suite for protobuf_wire"""
+
+    def test_read_varint(self):
+        """Test multi-byte varints and truncated input"""
+        assert read_varint(b"\xac\x02", 0) == (300, 2)
+        with pytest.raises(ValueError):
+            read_varint(b"\x80", 0)
+
+    def test_fields(self):
+        """Test every wire type and repeated fields"""
+        message = (b"\x08\x96\x01"              # 1: varint 150
+                   + b"\x11" + b"\x00" * 8       # 2: fixed64
+                   + b"\x1a\x03abc"              # 3: bytes
+                   + b"\x1a\x02\x08\x01"         # 3: nested message
+                   + b"\x25\x01\x02\x03\x04")    # 4: fixed32
+        assert [(number, wire) for number, wire, _ in iter_protobuf_fields(message)] == [
+            (1, 0), (2, 1), (3, 2), (3, 2), (4, 5)]
+
+        fields = parse_message(memoryview(message))
+        assert fields[1] == [150]
+        assert bytes(fields[3][0]) == b"abc" and parse_message(fields[3][1]) == {1: [1]}
+
+        with pytest.raises(ValueError):
+            parse_message(b"\x0b")  # start-group wire type
@@ -0,0 +1,163 @@
+"""
+Unit Tests for slide_markdown
+Tests the shared slide tree, speaker notes, caching and the 1,000-slide benchmark
+"""
+
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-mac-apps" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import slide_markdown
+from slide_markdown import (body_lines, body_text, choose_layout, default_output, parse_markdown_slides, plain_text,
+                            slide_images)
+
+DECK = '''---
+title: Weekly review
+---
+# Overview
+Revenue is **up** this week
+and costs are flat.
+
+- North
+  - Stores *open*: 12
+  - Online
+- South
+1. First
+2. Second
+
+```python
+# not a heading
+---
+def total(rows):
+    return sum(rows)
+```
+
+Notes:
+Mention the North numbers.
+Keep it short.
+
+---
+
+## Details
+### By region
+| Region | Sales |
+|--------|------:|
+| North  | 12    |
+| A \\| B | 3     |
+
+![Sales chart](charts/sales.png "Q3")
+> Best week so far
+<!-- remember to thank the team -->
+
+# Next steps
+'''
+
+
+class TestSlideMarkdown:
+    """Test suite for slide_markdown"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        slide_markdown._memory_cache.clear()
+
+    def test_slides_and_titles(self):
+        """Test front matter is skipped and ---, # and ## start slides"""
+        slides = parse_markdown_slides(DECK)
+        assert [(s["title"], s["level"]) for s in slides] == [("Overview", 1), ("Details", 2), ("Next steps", 1)]
+
+    def test_blocks(self):
+        """Test paragraphs, nested lists, code, tables, images, quotes and subheadings"""
+        overview, details, _ = parse_markdown_slides(DECK)
+
+        kinds = [block["type"] for block in overview["blocks"]]
+        assert kinds == ["paragraph", "list", "list", "code"]
+        assert overview["blocks"][0]["text"] == "Revenue is **up** this week and costs are flat."
+        bullets, numbers = overview["blocks"][1], overview["blocks"][2]
+        assert [item["text"] for item in bullets["items"]] == ["North", "South"]
+        assert [item["text"] for item in bullets["items"][0]["children"][0]["items"]] == ["Stores *open*: 12",
+                                                                                          "Online"]
+        assert numbers["ordered"] and not bullets["ordered"]
+        assert overview["blocks"][3] == {"type": "code", "language": "python",
+                                         "text": "# not a heading\n---\ndef total(rows):\n    return sum(rows)"}
+
+        assert [block["type"] for block in details["blocks"]] == ["heading", "table", "image", "quote"]
+        assert details["blocks"][1]["rows"] == [["North", "12"], ["A | B", "3"]]
+        assert slide_images(details) == [{"type": "image", "alt": "Sales chart", "src": "charts/sales.png",
+                                          "title": "Q3"}]
+
+    def test_speaker_notes(self):
+        """Test Notes: sections and HTML comments become speaker notes"""
+        overview, details, last = parse_markdown_slides(DECK)
+        assert overview["notes"] == "Mention the North numbers.\nKeep it short."
+        assert details["notes"] == "remember to thank the team"
+        assert last["notes"] == ""
+
+    def test_notes_marker_alone(self):
+        """Test a sentence starting with Note: or Notes: stays on the slide"""
+        slide = parse_markdown_slides("# Pricing\n\nNote: prices exclude VAT.\n\n- Basic\n- Pro\n"
+                                      "\nNotes: see the FAQ.\n")[0]
+        assert [block["type"] for block in slide["blocks"]] == ["paragraph", "list", "paragraph"]
+        assert slide["blocks"][0]["text"] == "Note: prices exclude VAT."
+        assert slide["notes"] == ""
+
+    def test_body_text(self):
+        """Test the placeholder text strips inline markup and indents nested items"""
+        overview = parse_markdown_slides(DECK)[0]
+        lines = body_text(overview).split("\n")
+        assert lines[:7] == ["Revenue is up this week and costs are flat.", "North", "\tStores open: 12",
+                             "\tOnline", "South", "1. First", "2. Second"]
+        assert plain_text("See [docs](http://x) and `code` or __this__") == "See docs and code or this"
+
+    def test_body_lines_kinds(self):
+        """Test body lines carry bullet, plain and code kinds for both builders"""
+        slide = parse_markdown_slides("# A\n- North\n1. Ship it\n\n```\ntotal = 1\n```\n")[0]
+        assert body_lines(slide) == [(0, "North", "bullet"), (0, "1. Ship it", "plain"), (0, "total = 1", "code")]
+
+    def test_layout_and_output_name(self, tmp_path):
+        """Test the shared layout choice and the default output name"""
+        slides = parse_markdown_slides("# Deck\nBy me\n## Points\n- one\n## Picture\n![x](a.png)\n## End\n")
+        assert [choose_layout(slide, i) for i, slide in enumerate(slides)] == ["title", "bullets", "photo",
+                                                                              "title_only"]
+        markdown = tmp_path / "deck.md"
+        assert default_output(str(markdown), "Weekly/ Review", ".pptx") == str(tmp_path / "Weekly- Review.pptx")
+        assert default_output(str(markdown), " ", ".key") == str(tmp_path / "deck.key")
+
+    def test_subheading_stays_on_titled_slide(self):
+        """Test ## right after a # title is a subheading, as before"""
+        slides = parse_markdown_slides("# Title\n## Subtitle\ntext\n## Next\nmore\n")
+        assert [s["title"] for s in slides] == ["Title", "Next"]
+        assert slides[0]["blocks"][0] == {"type": "heading", "level": 2, "text": "Subtitle"}
+
+    def test_memoized_by_content(self, tmp_path, monkeypatch):
+        """Test identical content is parsed once, in memory and through the disk cache"""
+        calls = []
+        original = slide_markdown._parse
+        monkeypatch.setattr(slide_markdown, "_parse", lambda text: calls.append(1) or original(text))
+
+        first = parse_markdown_slides(DECK, tmp_path)
+        assert parse_markdown_slides(DECK, tmp_path) is first
+        slide_markdown._memory_cache.clear()
+        assert parse_markdown_slides(DECK, tmp_path) == first
+        parse_markdown_slides(DECK + "\nmore", tmp_path)
+
+        assert len(calls) == 2
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    @pytest.mark.slow
+    def test_benchmark_1000_slides(self, tmp_path):
+        """Test a 1,000-slide corpus parses quickly and cached builds skip parsing"""
+        result = slide_markdown.benchmark(1000, tmp_path)
+        assert result["slides"] == 1000
+        assert result["cold"] < 5
+        assert result["memory"] < result["cold"] / 10
+        assert result["disk"] < result["cold"]
+
+        slides = parse_markdown_slides(slide_markdown.generate_corpus(1000))
+        assert slides[-1]["title"] == "Slide 1000" and slides[-1]["notes"] == "Remember slide 1000."
+        assert [b["type"] for b in slides[0]["blocks"]] == ["paragraph", "list", "code", "table", "image"]
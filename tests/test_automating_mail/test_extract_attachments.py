@@ -0,0 +1,123 @@
+"""
+Unit Tests for Mail attachment extraction
+Tests manifest keys, file naming, resume planning and the bounded pool
+"""
+
+import json
+import pathlib
+import sys
+import threading
+import time
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-mail" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import extract_attachments
+
+
+class TestExtractAttachments:
+    """Test suite for the attachment extraction pipeline"""
+
+    @pytest.fixture
+    def records(self):
+        """Attachment metadata as returned by the bulk JXA listing"""
+        return [
+            {"id": 1, "message_id": "<a@x>", "subject": "Invoice 1", "sender": "billing@x.com",
+             "date_received": "2025-03-01T10:00:00.000Z", "index": 0, "name": "invoice.pdf", "size": 1000},
+            {"id": 2, "message_id": "<b@x>", "subject": "Invoice 2", "sender": "billing@x.com",
+             "date_received": "2025-04-01T10:00:00.000Z", "index": 0, "name": "invoice.pdf", "size": 1200},
+            {"id": 2, "message_id": "<b@x>", "subject": "Invoice 2", "sender": "billing@x.com",
+             "date_received": "2025-04-01T10:00:00.000Z", "index": 1, "name": "logo.png", "size": 50},
+        ]
+
+    def test_attachment_key(self):
+        """Test the manifest key combines message ID, name and size"""
+        assert extract_attachments.attachment_key("<a@x>", "a.pdf", 10) == "<a@x>|a.pdf|10"
+
+    def test_filenames_are_stable_and_unique(self, records):
+        """Test same-named attachments from different messages do not collide"""
+        first = extract_attachments.attachment_filename(records[0])
+        second = extract_attachments.attachment_filename(records[1])
+
+        assert first != second
+        assert first == extract_attachments.attachment_filename(dict(records[0]))
+        assert first.startswith("2025-03-01_invoice_")
+        assert first.endswith(".pdf")
+
+    def test_filename_is_sanitized(self):
+        """Test unsafe characters are removed from attachment names"""
+        record = {"message_id": "<c@x>", "name": "../../etc/pass:wd.txt", "size": 1,
+                  "date_received": None}
+        name = extract_attachments.attachment_filename(record)
+
+        assert "/" not in name
+        assert ":" not in name
+        assert name.startswith("undated_")
+
+    def test_plan_filters_by_extension(self, records, tmp_path):
+        """Test extension filtering keeps only matching attachments"""
+        pending = extract_attachments.plan_extraction(records, tmp_path, {}, ["PDF"])
+
+        assert [p["name"] for p in pending] == ["invoice.pdf", "invoice.pdf"]
+        assert all(p["path"].startswith(str(tmp_path)) for p in pending)
+
+    def test_plan_skips_indexed_attachments(self, records, tmp_path):
+        """Test attachments already in the index (with files on disk) are skipped"""
+        saved_path = tmp_path / "saved.pdf"
+        saved_path.write_bytes(b"%PDF")
+        key = extract_attachments.attachment_key("<a@x>", "invoice.pdf", 1000)
+        missing_key = extract_attachments.attachment_key("<b@x>", "invoice.pdf", 1200)
+        saved = {
+            key: {"key": key, "path": str(saved_path)},
+            missing_key: {"key": missing_key, "path": str(tmp_path / "deleted.pdf")},
+        }
+
+        pending = extract_attachments.plan_extraction(records, tmp_path, saved)
+
+        assert [p["key"] for p in pending] == [missing_key, "<b@x>|logo.png|50"]
+
+    def test_load_index_tolerates_truncated_line(self, tmp_path):
+        """Test a partially written last line from a killed run is ignored"""
+        index_path = tmp_path / extract_attachments.INDEX_NAME
+        index_path.write_text(json.dumps({"key": "k1", "path": "/tmp/a"}) + "\n" + '{"key": "k2", "pa')
+
+        saved = extract_attachments.load_index(index_path)
+
+        assert list(saved) == ["k1"]
+
+    def test_append_after_truncated_line(self, tmp_path):
+        """Test the next record is not glued onto a partially written last line"""
+        index_path = tmp_path / extract_attachments.INDEX_NAME
+        index_path.write_text(json.dumps({"key": "k1", "path": "/tmp/a"}) + "\n" + '{"key": "k2", "pa')
+
+        extract_attachments.end_partial_line(index_path)
+        extract_attachments.end_partial_line(index_path)
+        with open(index_path, "a", encoding="utf-8") as index:
+            index.write(json.dumps({"key": "k3", "path": "/tmp/c"}) + "\n")
+
+        assert list(extract_attachments.load_index(index_path)) == ["k1", "k3"]
+
+    def test_bounded_map_preserves_order_and_limits_concurrency(self):
+        """Test the worker pool yields in order and caps in-flight work"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def work(chunk):
+            with lock:
+                active.append(chunk)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(chunk)
+            return chunk
+
+        chunks = list(extract_attachments.chunked(list(range(20)), 3))
+        results = list(extract_attachments.bounded_map(work, chunks, workers=2))
+
+        assert results == chunks
+        assert max(peak) <= 2
@@ -0,0 +1,119 @@
+"""
+Unit Tests for the incremental Notes-to-Markdown exporter
+Runs the exporter against a fake JXA backend and checks what it rewrites
+"""
+
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-notes" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import export_notes_markdown as exporter
+import notes_folders
+from notes_html import html_to_markdown
+
+
+class FakeNotes:
+    """Answers the exporter's JXA programs from an in-memory notes tree"""
+
+    def __init__(self):
+        self.folders = {"Work": "f1", "Work/Q3": "f2"}
+        self.notes = {
+            "n1": {"folder": "f1", "name": "Budget", "modified": "2026-01-01T09:00:00.000Z",
+                   "body": "<div><h1>Budget</h1></div><div>Spend <b>less</b></div>",
+                   "attachments": [{"id": "a1", "name": "chart.png"}]},
+            "n2": {"folder": "f2", "name": "Plan", "modified": "2026-01-02T09:00:00.000Z",
+                   "body": "<ul><li>ship</li></ul>", "attachments": []},
+        }
+        self.fetched = []
+        self.saved = []
+
+    def __call__(self, script, payload=None, timeout=120):
+        if script is notes_folders.LIST_TREE_JXA:
+            return [{"name": "iCloud", "default": "f0", "folders": dict(self.folders)}]
+        if script is exporter.LIST_NOTES_JXA:
+            ids = [i for i, n in self.notes.items() if n["folder"] == payload["folder_id"]]
+            return {"ids": ids, "names": [self.notes[i]["name"] for i in ids],
+                    "created": ["2025-12-01T09:00:00.000Z"] * len(ids),
+                    "modified": [self.notes[i]["modified"] for i in ids]}
+        if script is exporter.FETCH_NOTES_JXA:
+            self.fetched.extend(payload["ids"])
+            return [{"id": i, "body": self.notes[i]["body"], "attachments": self.notes[i]["attachments"]}
+                    for i in payload["ids"]]
+        if script is exporter.SAVE_ATTACHMENTS_JXA:
+            for item in payload["items"]:
+                pathlib.Path(item["path"]).write_bytes(b"png")
+                self.saved.append(item["id"])
+            return [{"id": item["id"], "ok": True} for item in payload["items"]]
+        raise AssertionError("unexpected JXA program")
+
+
+class TestExportNotesMarkdown:
+    """Test suite for export_notes_markdown"""
+
+    @pytest.fixture
+    def fake_notes(self, monkeypatch, tmp_path):
+        fake = FakeNotes()
+        monkeypatch.setattr(exporter, "run_jxa", fake)
+        monkeypatch.setattr(notes_folders, "run_jxa", fake)
+        monkeypatch.setattr(notes_folders, "DEFAULT_CACHE_PATH", tmp_path / "cache" / "folders.json")
+        return fake
+
+    def test_html_to_markdown(self):
+        """Test the Notes HTML subset converts to Markdown"""
+        html = ('<div><h1>Title</h1></div><div>A <b>bold</b> <a href="https://x.com">link</a></div>'
+                '<ul><li>one<ul><li>two</li></ul></li></ul><ol><li>first</li></ol><div><tt>x&lt;y</tt></div>')
+
+        assert html_to_markdown(html) == ("# Title\n\nA **bold** [link](https://x.com)\n\n"
+                                          "- one\n  - two\n\n1. first\n\n`x<y`\n")
+
+    def test_slugify_is_stable(self):
+        """Test slugs are ascii, stable per note and distinct across notes"""
+        assert exporter.slugify("Café Plan: Q3!", "id-1") == exporter.slugify("Café Plan: Q3!", "id-1")
+        assert exporter.slugify("Café Plan: Q3!", "id-1").startswith("cafe-plan-q3-")
+        assert exporter.slugify("Same", "id-1") != exporter.slugify("Same", "id-2")
+        assert exporter.slugify("", "id-1").startswith("note-")
+
+    def test_full_export(self, fake_notes, tmp_path):
+        """Test the first export writes every note and each attachment once"""
+        assert exporter.export_notes_markdown(tmp_path)
+
+        budget = tmp_path / "Work" / f"{exporter.slugify('Budget', 'n1')}.md"
+        plan = tmp_path / "Work" / "Q3" / f"{exporter.slugify('Plan', 'n2')}.md"
+        assert budget.exists() and plan.exists()
+
+        text = budget.read_text()
+        assert 'title: "Budget"' in text
+        assert "Spend **less**" in text
+        assert f"(../_attachments/{exporter.attachment_filename({'id': 'a1', 'name': 'chart.png'})})" in text
+        assert fake_notes.saved == ["a1"]
+
+    def test_reexport_only_touches_changed_notes(self, fake_notes, tmp_path):
+        """Test incremental runs skip unchanged notes and remove deleted ones"""
+        exporter.export_notes_markdown(tmp_path)
+        fake_notes.fetched.clear()
+        fake_notes.saved.clear()
+
+        assert exporter.export_notes_markdown(tmp_path)
+        assert fake_notes.fetched == []
+
+        fake_notes.notes["n1"].update(modified="2026-02-01T09:00:00.000Z", name="Budget 2026")
+        del fake_notes.notes["n2"]
+        assert exporter.export_notes_markdown(tmp_path)
+
+        assert fake_notes.fetched == ["n1"]
+        assert fake_notes.saved == []
+        assert not (tmp_path / "Work" / f"{exporter.slugify('Budget', 'n1')}.md").exists()
+        assert (tmp_path / "Work" / f"{exporter.slugify('Budget 2026', 'n1')}.md").exists()
+        assert not list((tmp_path / "Work" / "Q3").glob("*.md"))
+
+    def test_folder_filter(self, fake_notes, tmp_path):
+        """Test exporting a single folder subtree"""
+        assert exporter.export_notes_markdown(tmp_path, folder_filter="Work/Q3")
+        assert fake_notes.fetched == ["n2"]
+        assert not exporter.export_notes_markdown(tmp_path, folder_filter="Missing")
@@ -0,0 +1,91 @@
+"""
+Unit Tests for the bulk Markdown-to-Notes importer
+Tests Markdown conversion, folder mapping and idempotent import planning
+"""
+
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-notes" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import import_markdown_notes
+from notes_html import markdown_title, markdown_to_html
+
+
+class TestImportMarkdownNotes:
+    """Test suite for import_markdown_notes and markdown_to_html"""
+
+    @pytest.fixture
+    def notes_dir(self, tmp_path):
+        """A small Markdown tree with a nested directory and a hidden one"""
+        (tmp_path / "Work" / "Q3").mkdir(parents=True)
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "inbox.md").write_text("Just text")
+        (tmp_path / "Work" / "Q3" / "plan.md").write_text("# Q3 Plan\n\n- ship\n- *celebrate*\n")
+        (tmp_path / ".git" / "ignored.md").write_text("# Hidden")
+        (tmp_path / "Work" / "readme.txt").write_text("not markdown")
+        return tmp_path
+
+    def test_markdown_to_html_blocks(self):
+        """Test headings, nested lists, code and quotes"""
+        html = markdown_to_html("# Title\n- a\n  - b\n- c\n1. one\n```\nx < y\n```\n> quoted")
+
+        assert html == ("<h1>Title</h1><ul><li>a<ul><li>b</li></ul></li><li>c</li></ul>"
+                        "<ol><li>one</li></ol><div><tt>x &lt; y</tt></div><blockquote>quoted</blockquote>")
+
+    def test_markdown_to_html_inline(self):
+        """Test inline formatting and escaping"""
+        html = markdown_to_html("**bold** _it_ `a<b>` [site](https://x.com/?a=1&b=2) 3 < 4")
+
+        assert html == ('<div><b>bold</b> <i>it</i> <tt>a&lt;b&gt;</tt> '
+                        '<a href="https://x.com/?a=1&amp;b=2">site</a> 3 &lt; 4</div>')
+
+    def test_markdown_title(self):
+        """Test the first H1 becomes the title, else the fallback"""
+        assert markdown_title("intro\n## Sub\n# Real Title\n", "file") == "Real Title"
+        assert markdown_title("no heading", "file") == "file"
+
+    def test_find_and_convert_files(self, notes_dir):
+        """Test discovery skips hidden directories and non-Markdown files"""
+        files = import_markdown_notes.find_markdown_files(notes_dir)
+        assert files == ["inbox.md", str(pathlib.Path("Work/Q3/plan.md"))]
+
+        converted = import_markdown_notes.convert_markdown_file((str(notes_dir), files[1]))
+        assert converted["title"] == "Q3 Plan"
+        assert "<li><i>celebrate</i></li>" in converted["html"]
+
+    def test_target_folder(self):
+        """Test subdirectories map onto nested folder paths under the root"""
+        assert import_markdown_notes.target_folder("Work/Q3/plan.md", "Imported") == "Imported/Work/Q3"
+        assert import_markdown_notes.target_folder("inbox.md", None) == ""
+
+    def test_plan_import_is_idempotent(self):
+        """Test unchanged files are skipped and edited files update in place"""
+        converted = [
+            {"path": "a.md", "hash": "h1", "title": "A", "html": "<div>A</div>"},
+            {"path": "b.md", "hash": "h2-new", "title": "B", "html": "<div>B</div>"},
+            {"path": "c.md", "hash": "h3", "title": "C", "html": "<div>C</div>"},
+        ]
+        manifest = {
+            "a.md": {"hash": "h1", "note_id": "x-a", "folder": "Imported"},
+            "b.md": {"hash": "h2", "note_id": "x-b", "folder": "Imported"},
+        }
+
+        create, update, unchanged = import_markdown_notes.plan_import(converted, manifest, "Imported")
+
+        assert [i["path"] for i in create] == ["c.md"]
+        assert [(i["path"], i["note_id"]) for i in update] == [("b.md", "x-b")]
+        assert [i["path"] for i in unchanged] == ["a.md"]
+
+    def test_manifest_round_trip(self, tmp_path):
+        """Test the manifest is written atomically and read back"""
+        path = tmp_path / import_markdown_notes.MANIFEST_NAME
+        import_markdown_notes.save_manifest(path, {"a.md": {"hash": "h", "note_id": "n"}})
+
+        assert import_markdown_notes.load_manifest(path) == {"a.md": {"hash": "h", "note_id": "n"}}
+        assert import_markdown_notes.load_manifest(tmp_path / "missing.json") == {}
@@ -0,0 +1,113 @@
+"""
+Unit Tests for the Notes folder registry
+Tests path resolution, the on-disk TTL cache and folder creation
+"""
+
+import json
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-notes" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import notes_folders
+from create_notes_folder import create_notes_folder
+from notes_folders import FolderRegistry, normalize_path
+
+
+class FakeNotes:
+    """Answers the registry's JXA programs and counts the calls"""
+
+    def __init__(self):
+        self.accounts = [
+            {"name": "iCloud", "default": "i0", "folders": {"Notes": "i0", "Work": "i1", "Work/Q3": "i2"}},
+            {"name": "On My Mac", "default": "m0", "folders": {"Notes": "m0", "Archive": "m1"}},
+        ]
+        self.calls = []
+
+    def __call__(self, script, payload=None, timeout=120):
+        self.calls.append(script)
+        if script is notes_folders.LIST_TREE_JXA:
+            return json.loads(json.dumps(self.accounts))
+        if script is notes_folders.ENSURE_FOLDERS_JXA:
+            account = next(a for a in self.accounts if a["name"] == payload["account"])
+            for path in payload["paths"]:
+                parts = path.split("/")
+                for depth in range(1, len(parts) + 1):
+                    prefix = "/".join(parts[:depth])
+                    account["folders"].setdefault(prefix, f"new-{prefix}")
+            return json.loads(json.dumps(account))
+        raise AssertionError("unexpected JXA program")
+
+
+class TestNotesFolders:
+    """Test suite for notes_folders.FolderRegistry"""
+
+    @pytest.fixture
+    def fake_notes(self, monkeypatch):
+        fake = FakeNotes()
+        monkeypatch.setattr(notes_folders, "run_jxa", fake)
+        return fake
+
+    @pytest.fixture
+    def cache_path(self, tmp_path):
+        return tmp_path / "folders.json"
+
+    def test_normalize_path(self):
+        """Test stray slashes and whitespace are dropped"""
+        assert normalize_path(" /Work//Q3/ ") == "Work/Q3"
+        assert normalize_path(None) == ""
+
+    def test_resolve_paths_and_names(self, fake_notes, cache_path):
+        """Test nested paths, bare nested names and account scoping"""
+        registry = FolderRegistry(cache_path)
+
+        assert registry.resolve("Work/Q3") == ("iCloud", "i2")
+        assert registry.resolve("Q3") == ("iCloud", "i2")
+        assert registry.resolve("Notes", "On My Mac") == ("On My Mac", "m0")
+        assert registry.resolve("Archive", "iCloud") is None
+        assert registry.resolve("Missing/Q3") is None
+        assert registry.account()["default"] == "i0"
+
+    def test_cache_is_shared_until_ttl(self, fake_notes, cache_path):
+        """Test a second registry reuses the cache and an expired one re-reads Notes"""
+        FolderRegistry(cache_path).resolve("Work")
+        FolderRegistry(cache_path).resolve("Work/Q3")
+        assert len(fake_notes.calls) == 1
+
+        FolderRegistry(cache_path, ttl=-1).resolve("Work")
+        assert len(fake_notes.calls) == 2
+
+    def test_invalidate(self, fake_notes, cache_path):
+        """Test invalidate drops the cache file"""
+        registry = FolderRegistry(cache_path)
+        registry.accounts()
+        registry.invalidate()
+
+        assert not cache_path.exists()
+        registry.accounts()
+        assert len(fake_notes.calls) == 2
+
+    def test_ensure_creates_only_missing_folders(self, fake_notes, cache_path):
+        """Test ensure skips the JXA call when everything exists and caches new folders"""
+        registry = FolderRegistry(cache_path)
+        assert registry.ensure(["Work", "Work/Q3"]) == {"Work": "i1", "Work/Q3": "i2"}
+        assert fake_notes.calls == [notes_folders.LIST_TREE_JXA]
+
+        assert registry.folder_id("Work/Q4/Plans", create=True) == "new-Work/Q4/Plans"
+        assert FolderRegistry(cache_path).resolve("Work/Q4") == ("iCloud", "new-Work/Q4")
+        assert fake_notes.calls.count(notes_folders.LIST_TREE_JXA) == 1
+
+    def test_create_notes_folder(self, fake_notes, cache_path):
+        """Test create_notes_folder reports existing folders and creates nested ones"""
+        registry = FolderRegistry(cache_path)
+
+        assert create_notes_folder("Work", registry=registry)
+        assert notes_folders.ENSURE_FOLDERS_JXA not in fake_notes.calls
+        assert create_notes_folder("Archive/2026", "On My Mac", registry=registry)
+        assert registry.resolve("Archive/2026", "On My Mac") == ("On My Mac", "new-Archive/2026")
+        assert not create_notes_folder("Work", "Exchange", registry=registry)
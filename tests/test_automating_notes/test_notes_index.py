@@ -0,0 +1,157 @@
+"""
+Unit Tests for the Notes search index
+Tests HTML stripping, incremental sync and ranked FTS5 search
+"""
+
+import pathlib
+import sys
+import types
+from datetime import datetime
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-notes" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from notes_html import html_to_text
+from notes_index import NotesIndex, PyXANotesSource, fts_query
+
+
+class FakeNotesSource:
+    """In-memory stand-in for Notes.app that records which bodies were fetched"""
+
+    def __init__(self, notes):
+        self.notes = notes
+        self.fetched = []
+
+    def list_notes(self):
+        return [{k: n[k] for k in ("id", "modified", "title", "folder", "account")}
+                for n in self.notes]
+
+    def fetch_texts(self, records):
+        ids = {r["id"] for r in records}
+        self.fetched.extend(sorted(ids))
+        return {n["id"]: html_to_text(n["body"]) for n in self.notes if n["id"] in ids}
+
+
+class FakePyXANotes:
+    """Folder and note lists shaped like PyXA's bulk accessors"""
+
+    def __init__(self, items):
+        self.items = items
+
+    def __call__(self):
+        return self
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def id(self):
+        return [item.id for item in self.items]
+
+    def name(self):
+        return [item.name for item in self.items]
+
+    def modification_date(self):
+        return [item.modified for item in self.items]
+
+    def body(self):
+        return [item.body for item in self.items]
+
+    def by_id(self, note_id):
+        return next(item for item in self.items if item.id == note_id)
+
+
+def pyxa_folder(folder_id, name, notes):
+    return types.SimpleNamespace(id=folder_id, name=name, notes=FakePyXANotes(
+        [types.SimpleNamespace(id=i, name="Untitled", modified=datetime(2026, 1, 1), body=f"<div>{i} text</div>")
+         for i in notes]))
+
+
+class TestNotesIndex:
+    """Test suite for notes_index and notes_html"""
+
+    @pytest.fixture
+    def source(self):
+        """Three notes across two folders"""
+        return FakeNotesSource([
+            {"id": "n1", "modified": datetime(2026, 1, 1, 9), "title": "Quarterly Budget",
+             "folder": "Work", "account": "iCloud",
+             "body": "<div><h1>Quarterly Budget</h1></div><div>Cloud spend is up 12%</div>"},
+            {"id": "n2", "modified": datetime(2026, 1, 2, 9), "title": "Groceries",
+             "folder": "Personal", "account": "iCloud",
+             "body": "<ul><li>Milk</li><li>Budget coffee</li></ul>"},
+            {"id": "n3", "modified": "2026-01-03T09:00:00", "title": "Offsite",
+             "folder": "Work", "account": "iCloud",
+             "body": "<div>Agenda &amp; travel</div>"},
+        ])
+
+    @pytest.fixture
+    def index(self):
+        index = NotesIndex(":memory:")
+        yield index
+        index.close()
+
+    def test_html_to_text(self):
+        """Test block tags become lines and entities are decoded"""
+        text = html_to_text("<div><b>Title</b></div><ul><li>One</li><li>Two</li></ul><div>A&nbsp;&amp;&nbsp;B<br>C</div>")
+        assert text == "Title\n- One\n- Two\nA & B\nC"
+
+    def test_fts_query_quotes_words(self):
+        """Test user input cannot inject FTS5 syntax"""
+        assert fts_query('budget "OR x') == '"budget"* """OR"* "x"*'
+        assert fts_query("   ") == ""
+
+    def test_initial_sync_indexes_everything(self, index, source):
+        """Test the first sync fetches every body"""
+        stats = index.sync(source)
+
+        assert stats == {"total": 3, "updated": 3, "removed": 0}
+        assert source.fetched == ["n1", "n2", "n3"]
+
+    def test_resync_only_fetches_changed_notes(self, index, source):
+        """Test unchanged notes are not re-downloaded and deletions are removed"""
+        index.sync(source)
+        source.fetched.clear()
+
+        source.notes[1]["modified"] = datetime(2026, 2, 1, 9)
+        source.notes[1]["body"] = "<div>Oat milk</div>"
+        del source.notes[2]
+
+        stats = index.sync(source)
+
+        assert stats == {"total": 2, "updated": 1, "removed": 1}
+        assert source.fetched == ["n2"]
+        assert index.search("coffee") == []
+        assert [r["id"] for r in index.search("oat")] == ["n2"]
+        assert index.search("agenda") == []
+
+    def test_search_ranks_title_matches_first(self, index, source):
+        """Test title hits outrank body hits and snippets highlight terms"""
+        index.sync(source)
+
+        results = index.search("budget")
+
+        assert [r["id"] for r in results] == ["n1", "n2"]
+        assert "[Budget]" in results[1]["snippet"]
+
+    def test_pyxa_source_same_named_folders(self, index, monkeypatch):
+        """Test notes in two folders with the same name get their own bodies"""
+        account = types.SimpleNamespace(name="iCloud", folders=FakePyXANotes([
+            pyxa_folder("f1", "Archive", ["a1", "a2"]),
+            pyxa_folder("f2", "Archive", ["b1", "b2", "b3", "b4", "b5"])]))
+        app = types.SimpleNamespace(accounts=FakePyXANotes([account]))
+        monkeypatch.setitem(sys.modules, "PyXA", types.SimpleNamespace(Application=lambda name: app))
+
+        index.sync(PyXANotesSource())
+        assert [r["id"] for r in index.search("a2")] == ["a2"]
+        assert [r["id"] for r in index.search("b5")] == ["b5"]
+
+    def test_search_prefix_and_folder_filter(self, index, source):
+        """Test prefix matching and folder restriction"""
+        index.sync(source)
+
+        assert [r["id"] for r in index.search("trav")] == ["n3"]
+        assert [r["id"] for r in index.search("budget", folder_name="Personal")] == ["n2"]
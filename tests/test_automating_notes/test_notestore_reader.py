@@ -0,0 +1,170 @@
+"""
+Unit Tests for the NoteStore.sqlite reader
+Builds synthetic NoteStore databases so the decoder runs on any platform
+"""
+
+import functools
+import gzip
+import pathlib
+import sqlite3
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-notes" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import notestore_reader
+from notes_index import NotesIndex
+from notestore_reader import NoteStoreError, NoteStoreReader, NoteStoreSource, decode_note_body
+
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _field(number, payload):
+    """Encode a length-delimited protobuf field"""
+    return _varint(number << 3 | 2) + _varint(len(payload)) + payload
+
+
+def encode_note_body(text):
+    """gzip(NoteStoreProto{1: 0, 2: Document{2: 1, 3: Note{2: text, 5: run}}})"""
+    note = _field(2, text.encode("utf-8")) + _field(5, _varint(1 << 3) + _varint(len(text)))
+    document = _varint(2 << 3) + _varint(1) + _field(3, note)
+    proto = _varint(1 << 3) + _varint(0) + _field(2, document)
+    return gzip.compress(proto)
+
+
+def core_data(dt):
+    return (dt - notestore_reader.CORE_DATA_EPOCH).total_seconds()
+
+
+def build_notestore(path, notes):
+    """Create a minimal NoteStore.sqlite with one account and two folders"""
+    db = sqlite3.connect(str(path))
+    db.executescript("""
+        CREATE TABLE ZICCLOUDSYNCINGOBJECT (
+            Z_PK INTEGER PRIMARY KEY, Z_ENT INTEGER, ZIDENTIFIER TEXT,
+            ZTITLE1 TEXT, ZTITLE2 TEXT, ZNAME TEXT, ZFOLDER INTEGER, ZOWNER INTEGER,
+            ZNOTEDATA INTEGER, ZCREATIONDATE1 REAL, ZMODIFICATIONDATE1 REAL,
+            ZMARKEDFORDELETION INTEGER, ZISPASSWORDPROTECTED INTEGER);
+        CREATE TABLE ZICNOTEDATA (Z_PK INTEGER PRIMARY KEY, ZNOTE INTEGER, ZDATA BLOB);
+        INSERT INTO ZICCLOUDSYNCINGOBJECT (Z_PK, ZIDENTIFIER, ZNAME) VALUES (1, 'acc', 'iCloud');
+        INSERT INTO ZICCLOUDSYNCINGOBJECT (Z_PK, ZIDENTIFIER, ZTITLE2, ZOWNER) VALUES (2, 'f-work', 'Work', 1);
+        INSERT INTO ZICCLOUDSYNCINGOBJECT (Z_PK, ZIDENTIFIER, ZTITLE2, ZOWNER) VALUES (3, 'f-home', 'Home', 1);
+    """)
+    for pk, note in enumerate(notes, start=10):
+        db.execute("INSERT INTO ZICNOTEDATA (Z_PK, ZNOTE, ZDATA) VALUES (?, ?, ?)",
+                   (pk, pk, note.get("blob", encode_note_body(note["text"]))))
+        db.execute(
+            "INSERT INTO ZICCLOUDSYNCINGOBJECT (Z_PK, ZIDENTIFIER, ZTITLE1, ZFOLDER, ZNOTEDATA, "
+            "ZCREATIONDATE1, ZMODIFICATIONDATE1, ZMARKEDFORDELETION, ZISPASSWORDPROTECTED) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (pk, note["id"], note["title"], note["folder_pk"], pk, core_data(note["modified"]),
+             core_data(note["modified"]), note.get("deleted", 0), note.get("locked", 0)))
+    db.commit()
+    db.close()
+
+
+class TestNoteStoreReader:
+    """Test suite for notestore_reader"""
+
+    @pytest.fixture
+    def notestore(self, tmp_path):
+        path = tmp_path / "NoteStore.sqlite"
+        build_notestore(path, [
+            {"id": "n1", "title": "Budget", "folder_pk": 2, "text": "Budget\nCloud spend ✓",
+             "modified": datetime(2026, 1, 2, 9, tzinfo=timezone.utc)},
+            {"id": "n2", "title": "Groceries", "folder_pk": 3, "text": "Milk",
+             "modified": datetime(2026, 1, 3, 9, tzinfo=timezone.utc)},
+            {"id": "n3", "title": "Old", "folder_pk": 2, "text": "gone", "deleted": 1,
+             "modified": datetime(2026, 1, 1, 9, tzinfo=timezone.utc)},
+            {"id": "n4", "title": "Secret", "folder_pk": 2, "text": "", "locked": 1,
+             "blob": b"\x00encrypted", "modified": datetime(2025, 12, 1, 9, tzinfo=timezone.utc)},
+        ])
+        return path
+
+    def test_decode_note_body(self):
+        """Test gzip + protobuf decoding of a note body"""
+        assert decode_note_body(encode_note_body("Hello\nworld")) == "Hello\nworld"
+        assert decode_note_body(b"not gzip or protobuf\xff") is None
+        assert decode_note_body(None) is None
+
+    def test_iter_notes(self, notestore):
+        """Test notes stream newest first with folder, account and dates"""
+        with NoteStoreReader(notestore) as reader:
+            notes = list(reader.iter_notes())
+
+        assert [n["id"] for n in notes] == ["n2", "n1", "n4"]
+        assert notes[1]["text"] == "Budget\nCloud spend ✓"
+        assert notes[1]["folder"] == "Work"
+        assert notes[1]["account"] == "iCloud"
+        assert notes[1]["modified"] == datetime(2026, 1, 2, 9, tzinfo=timezone.utc)
+        assert notes[2]["text"] is None
+
+    def test_folder_and_deleted_filters(self, notestore):
+        """Test folder restriction and opt-in deleted notes"""
+        with NoteStoreReader(notestore) as reader:
+            assert [n["id"] for n in reader.iter_notes(folder_name="Home")] == ["n2"]
+            assert "n3" in [n["id"] for n in reader.iter_notes(include_deleted=True)]
+
+    def test_opened_read_only(self, notestore):
+        """Test the reader cannot modify the database"""
+        with NoteStoreReader(notestore) as reader:
+            with pytest.raises(sqlite3.OperationalError):
+                reader.db.execute("DELETE FROM ZICNOTEDATA")
+
+    def test_copy_on_read_snapshot_is_removed(self, notestore):
+        """Test copy mode reads from a temporary snapshot and cleans it up"""
+        reader = NoteStoreReader(notestore, copy=True)
+        snapshot = pathlib.Path(reader._snapshot_dir)
+        assert (snapshot / "NoteStore.sqlite").exists()
+        assert len(list(reader.iter_notes())) == 3
+        reader.close()
+        assert not snapshot.exists()
+
+    def test_rejects_non_notestore(self, tmp_path):
+        """Test a random SQLite file is rejected"""
+        path = tmp_path / "other.sqlite"
+        sqlite3.connect(str(path)).execute("CREATE TABLE t (x)").connection.close()
+        with pytest.raises(NoteStoreError):
+            NoteStoreReader(path)
+
+    def test_feeds_notes_index(self, notestore, monkeypatch):
+        """Test the NoteStore source drives an incremental index sync from one snapshot"""
+        snapshots = []
+        mkdtemp = notestore_reader.tempfile.mkdtemp
+        monkeypatch.setattr(notestore_reader.tempfile, "mkdtemp", lambda **kw: snapshots.append(1) or mkdtemp(**kw))
+
+        index = NotesIndex(":memory:")
+        with NoteStoreSource(notestore) as source:
+            stats = index.sync(source)
+            snapshot = pathlib.Path(source.reader._snapshot_dir)
+
+        assert stats == {"total": 3, "updated": 3, "removed": 0}
+        assert len(snapshots) == 1 and not snapshot.exists()
+        assert [r["id"] for r in index.search("cloud")] == ["n1"]
+        with NoteStoreSource(notestore) as source:
+            assert index.sync(source)["updated"] == 0
+        index.close()
+
+    def test_search_without_pyxa(self, notestore, monkeypatch):
+        """Test search_notes --notestore imports and runs without PyXA installed"""
+        monkeypatch.setitem(sys.modules, "PyXA", None)
+        sys.modules.pop("search_notes", None)
+        import search_notes
+
+        monkeypatch.setattr(notestore_reader, "NoteStoreReader", functools.partial(NoteStoreReader, notestore))
+        assert [n["id"] for n in search_notes.search_notes("milk", use_notestore=True)] == ["n2"]
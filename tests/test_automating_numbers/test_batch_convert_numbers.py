@@ -0,0 +1,148 @@
+"""
+Unit Tests for batch_convert_numbers
+Tests the single-session pipeline, timeouts and the resumable manifest with a fake Numbers
+"""
+
+import json
+import os
+import pathlib
+import subprocess
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-numbers" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import batch_convert_numbers as converter
+import batch_export  # on the path through batch_convert_numbers
+
+
+class FakeNumbers:
+    """Records sessions, conversions and closes; files named slow* time out"""
+
+    def __init__(self, open_documents=()):
+        self.open_documents = list(open_documents)
+        self.sessions = 0
+        self.converted = []
+        self.closed = []
+
+    def __call__(self, script, payload=None, timeout=120):
+        if script is batch_export.START_SESSION_JXA:
+            self.sessions += 1
+            return self.open_documents
+        if script is converter.CONVERT_JXA:
+            if os.path.basename(payload["path"]).startswith("slow"):
+                raise subprocess.TimeoutExpired("osascript", timeout)
+            if os.path.basename(payload["path"]).startswith("bad"):
+                raise RuntimeError("Numbers got an error: Can't open file")
+            for output in payload["outputs"]:
+                pathlib.Path(output["path"]).write_bytes(b"")
+            self.converted.append((os.path.basename(payload["path"]), [o["as"] for o in payload["outputs"]],
+                                   payload["close"]))
+            return True
+        if script is batch_export.CLOSE_DOCUMENT_JXA:
+            self.closed.append(os.path.basename(payload["path"]))
+            return True
+        raise AssertionError("unexpected JXA program")
+
+
+class TestBatchConvertNumbers:
+    """Test suite for batch_convert_numbers"""
+
+    @pytest.fixture
+    def workbooks(self, tmp_path):
+        folder = tmp_path / "month-end"
+        folder.mkdir()
+        for name in ("a", "b", "slow", "bad"):
+            (folder / f"{name}.numbers").write_bytes(b"")
+        (folder / "notes.txt").write_text("ignored")
+        return folder
+
+    @pytest.fixture
+    def fake_numbers(self, monkeypatch):
+        fake = FakeNumbers()
+        monkeypatch.setattr(converter, "run_jxa", fake)
+        return fake
+
+    def read_manifest(self, path):
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_converts_in_one_session(self, workbooks, fake_numbers, tmp_path):
+        """Test every file is exported to every format within one session"""
+        out = tmp_path / "out"
+        result = converter.batch_convert_numbers([str(workbooks / "*.numbers")], out, formats=("csv", "xlsx"),
+                                                 queue_size=1)
+
+        assert result == (2, 0, 2)
+        assert fake_numbers.sessions == 1
+        assert fake_numbers.converted == [("a.numbers", ["CSV", "Microsoft Excel"], True),
+                                          ("b.numbers", ["CSV", "Microsoft Excel"], True)]
+
+        entries = {os.path.basename(e["file"]): e for e in self.read_manifest(out / converter.MANIFEST_NAME)}
+        assert entries["a.numbers"]["status"] == "ok"
+        assert entries["a.numbers"]["outputs"]["xlsx"].endswith("a.xlsx")
+        assert entries["bad.numbers"]["status"] == "failed"
+        assert entries["slow.numbers"]["status"] == "timeout"
+        assert "seconds" in entries["slow.numbers"]
+
+    def test_timeout_closes_document(self, workbooks, fake_numbers, tmp_path):
+        """Test a timed-out document is closed so it doesn't block the next file"""
+        converter.batch_convert_numbers([str(workbooks / "slow.numbers")], tmp_path / "out")
+        assert fake_numbers.closed == ["slow.numbers"]
+
+    def test_leaves_open_documents_open(self, workbooks, monkeypatch, tmp_path):
+        """Test documents open before the batch are not closed"""
+        fake = FakeNumbers(open_documents=[str((workbooks / "a.numbers").resolve())])
+        monkeypatch.setattr(converter, "run_jxa", fake)
+
+        converter.batch_convert_numbers([str(workbooks / "a.numbers"), str(workbooks / "b.numbers")],
+                                        tmp_path / "out")
+        assert [(name, close) for name, _, close in fake.converted] == [("a.numbers", False), ("b.numbers", True)]
+
+    def test_rerun_skips_converted_files(self, workbooks, fake_numbers, tmp_path):
+        """Test a re-run retries only failures and files changed since conversion"""
+        out = tmp_path / "out"
+        converter.batch_convert_numbers([str(workbooks)], out)
+        fake_numbers.converted.clear()
+        os.utime(workbooks / "b.numbers", (1, 1))
+
+        assert converter.batch_convert_numbers([str(workbooks)], out) == (1, 1, 2)
+        assert [name for name, _, _ in fake_numbers.converted] == ["b.numbers"]
+
+        fake_numbers.converted.clear()
+        converter.batch_convert_numbers([str(workbooks)], out, force=True)
+        assert len(fake_numbers.converted) == 2
+
+    def test_rerun_replaces_deleted_output(self, workbooks, fake_numbers, tmp_path):
+        """Test an unchanged file is converted again when one of its outputs was deleted"""
+        out = tmp_path / "out"
+        converter.batch_convert_numbers([str(workbooks)], out, formats=("csv", "pdf"))
+        fake_numbers.converted.clear()
+        os.remove(out / "a.pdf")
+
+        assert converter.batch_convert_numbers([str(workbooks)], out, formats=("csv", "pdf")) == (1, 1, 2)
+        assert fake_numbers.converted == [("a.numbers", ["PDF"], True)]
+
+    def test_same_names_do_not_collide(self, workbooks, fake_numbers, tmp_path):
+        """Test same-named files mirror their folders, and explicit files get a numbered name"""
+        for folder in ("q1", "q2"):
+            (workbooks / folder).mkdir()
+            (workbooks / folder / "a.numbers").write_bytes(b"")
+        out = tmp_path / "out"
+
+        converter.batch_convert_numbers([str(workbooks)], out)
+        assert (out / "q1" / "a.csv").exists() and (out / "q2" / "a.csv").exists()
+
+        other = tmp_path / "other"
+        converter.batch_convert_numbers([str(workbooks / "a.numbers"), str(workbooks / "q1" / "a.numbers")], other)
+        assert sorted(p.name for p in other.glob("*.csv")) == ["a-2.csv", "a.csv"]
+
+    def test_unknown_format(self, workbooks, fake_numbers, tmp_path):
+        """Test unsupported formats are rejected before Numbers is touched"""
+        with pytest.raises(ValueError):
+            converter.batch_convert_numbers([str(workbooks)], tmp_path / "out", formats=("docx",))
+        assert fake_numbers.sessions == 0
@@ -0,0 +1,100 @@
+"""
+Unit Tests for create_numbers_spreadsheet
+Tests table pre-sizing, chunked writes and the opt-in CSV import with a fake Numbers
+"""
+
+import csv
+import json
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-numbers" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import create_numbers_spreadsheet as creator
+
+
+class FakeNumbers:
+    """Records every JXA call; the write program fails when asked to"""
+
+    def __init__(self, fail_writes=False):
+        self.fail_writes = fail_writes
+        self.calls = []
+        self.imported = None
+
+    def __call__(self, script, payload=None, timeout=120):
+        if script is creator.CREATE_DOCUMENT_JXA:
+            self.calls.append(("create", payload["rows"], payload["columns"]))
+            return "doc-1"
+        if script is creator.WRITE_ROWS_JXA:
+            if self.fail_writes:
+                raise RuntimeError("Numbers got an error")
+            self.calls.append(("write", payload["first_row"], len(payload["rows"])))
+            return len(payload["rows"])
+        if script is creator.FINISH_DOCUMENT_JXA:
+            self.calls.append(("finish", payload["save_path"]))
+            return True
+        if script is creator.IMPORT_CSV_JXA:
+            with open(payload["csv"], newline='', encoding='utf-8') as f:
+                self.imported = (pathlib.Path(payload["csv"]).name, list(csv.reader(f)))
+            self.calls.append(("import", payload["save_path"]))
+            return True
+        raise AssertionError("unexpected JXA program")
+
+
+class TestCreateNumbersSpreadsheet:
+    """Test suite for create_numbers_spreadsheet"""
+
+    @pytest.fixture
+    def fake_numbers(self, monkeypatch):
+        fake = FakeNumbers()
+        monkeypatch.setattr(creator, "run_jxa", fake)
+        return fake
+
+    def test_sample_data(self, fake_numbers, tmp_path):
+        """Test the default sample table is sized once, written and saved"""
+        assert creator.create_numbers_spreadsheet("Sample", tmp_path / "s.numbers")
+        assert fake_numbers.calls == [("create", 2, 2), ("write", 1, 2),
+                                      ("finish", str((tmp_path / "s.numbers").resolve()))]
+
+    def test_chunks_follow_cell_budget(self, fake_numbers):
+        """Test chunk sizes are derived from the cell budget and table width"""
+        rows = [[i, i * 2, i * 3] for i in range(10)]
+        assert creator.create_numbers_spreadsheet("Budget", rows=rows, chunk_cells=12)
+        assert fake_numbers.calls == [("create", 10, 3), ("write", 1, 4), ("write", 5, 4), ("write", 9, 2),
+                                      ("finish", None)]
+
+    def test_import_is_opt_in(self, fake_numbers, tmp_path, monkeypatch):
+        """Test data over the import threshold is still written cell by cell without --import"""
+        monkeypatch.setattr(creator, "IMPORT_THRESHOLD", 1)
+        source = tmp_path / "rows.csv"
+        source.write_text("a,b\n00123,2\n3,4\n")
+
+        assert creator.create_numbers_spreadsheet("Direct", data_path=source)
+        assert fake_numbers.calls[0] == ("create", 3, 2)
+        assert ("write", 1, 3) in fake_numbers.calls
+        assert fake_numbers.imported is None
+
+    def test_import_flag(self, fake_numbers, tmp_path):
+        """Test --import goes through one CSV import named after the spreadsheet"""
+        source = tmp_path / "report.json"
+        source.write_text(json.dumps([["Region", "Sales"], ["North", 1200.5], ["South", None]]))
+
+        assert creator.create_numbers_spreadsheet("Q1/Q2 Report", tmp_path / "r.numbers", data_path=source,
+                                                  use_import=True)
+        assert [call[0] for call in fake_numbers.calls] == ["import"]
+        name, rows = fake_numbers.imported
+        assert name == "Q1-Q2 Report.csv"
+        assert rows[1] == ["North", "1200.5"] and rows[2] == ["South", ""]
+
+    def test_failed_write_discards_document(self, monkeypatch, tmp_path):
+        """Test a failed chunk closes the new document without saving it"""
+        fake = FakeNumbers(fail_writes=True)
+        monkeypatch.setattr(creator, "run_jxa", fake)
+
+        assert not creator.create_numbers_spreadsheet("Broken", tmp_path / "b.numbers")
+        assert fake.calls == [("create", 2, 2), ("finish", None)]
@@ -0,0 +1,85 @@
+"""
+Unit Tests for export_numbers_to_csv
+Tests chunked range reads and RFC 4180 output against a fake Numbers table
+"""
+
+import csv
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-numbers" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import export_numbers_to_csv as exporter
+import read_numbers_spreadsheet as reader
+from numbers_jxa import column_name
+
+
+class FakeNumbers:
+    """Serves a 5x3 table through the reader's JXA programs"""
+
+    TABLE = [
+        ["Name", "Amount", "Paid"],
+        ['Acme, "Inc"', 1200.5, True],
+        ["Line\nbreak", 7, False],
+        ["Due", {"$date": "2026-03-01T12:00:00.000Z"}, None],
+        ["Total", 1207.5, None],
+    ]
+
+    def __init__(self, was_open=False):
+        self.was_open = was_open
+        self.reads = []
+        self.closed = False
+
+    def __call__(self, script, payload=None, timeout=120):
+        if script is reader.DOCUMENT_LAYOUT_JXA:
+            return {"was_open": self.was_open, "sheets": [{"name": "Sheet 1", "tables": [
+                {"name": "Table 1", "rows": len(self.TABLE), "columns": 3, "header_rows": 1}]}]}
+        if script is reader.READ_BLOCK_JXA:
+            self.reads.append((payload["first_row"], payload["last_row"]))
+            return self.TABLE[payload["first_row"] - 1:payload["last_row"]]
+        if script is reader.CLOSE_DOCUMENT_JXA:
+            self.closed = True
+            return True
+        raise AssertionError("unexpected JXA program")
+
+
+class TestExportNumbersToCsv:
+    """Test suite for export_numbers_to_csv"""
+
+    @pytest.fixture
+    def fake_numbers(self, monkeypatch):
+        fake = FakeNumbers()
+        monkeypatch.setattr(reader, "run_jxa", fake)
+        return fake
+
+    def test_column_name(self):
+        """Test column letters for range addresses"""
+        assert [column_name(n) for n in (1, 26, 27, 52, 703)] == ["A", "Z", "AA", "AZ", "AAA"]
+
+    def test_export_round_trips_through_csv(self, fake_numbers, tmp_path):
+        """Test quoting, booleans, blanks and dates survive as real CSV"""
+        output = tmp_path / "out.csv"
+        assert exporter.export_numbers_to_csv("book.numbers", output, chunk_rows=2)
+
+        with open(output, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        assert fake_numbers.reads == [(1, 2), (3, 4), (5, 5)]
+        assert rows[1] == ['Acme, "Inc"', "1200.5", "TRUE"]
+        assert rows[2] == ["Line\nbreak", "7", "FALSE"]
+        assert rows[3][1].startswith("2026-03-0") and rows[3][2] == ""
+        assert len(rows) == 5
+        assert fake_numbers.closed
+
+    def test_leaves_already_open_document_open(self, monkeypatch, tmp_path):
+        """Test a document the user had open is not closed"""
+        fake = FakeNumbers(was_open=True)
+        monkeypatch.setattr(reader, "run_jxa", fake)
+
+        assert exporter.export_numbers_to_csv("book.numbers", tmp_path / "out.csv")
+        assert not fake.closed
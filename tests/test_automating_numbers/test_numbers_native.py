@@ -0,0 +1,272 @@
+"""
+Unit Tests for numbers_native
+Tests Snappy, IWA and cell storage decoding against .numbers fixtures built in the test and saved ones
+"""
+
+import csv
+import pathlib
+import struct
+import sys
+import zipfile
+from datetime import datetime
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-numbers" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import numbers_native
+from numbers_native import NumbersFile, NumbersFileError
+from read_numbers_spreadsheet import read_numbers_spreadsheet
+
+FIXTURES = pathlib.Path(__file__).resolve().parent / "fixtures"
+
+
+# --- fixture encoding helpers -------------------------------------------------
+
+def varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def field(number, value):
+    if isinstance(value, int):
+        return varint(number << 3) + varint(value)
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return varint(number << 3 | 2) + varint(len(value)) + value
+
+
+def message(*fields):
+    return b"".join(fields)
+
+
+def ref(identifier):
+    return message(field(1, identifier))
+
+
+def snappy_literals(data):
+    """Snappy block made only of literals (2-byte length tags)"""
+    out = bytearray(varint(len(data)))
+    for pos in range(0, len(data), 65536):
+        chunk = data[pos:pos + 65536]
+        out += bytes([61 << 2]) + (len(chunk) - 1).to_bytes(2, "little") + chunk
+    return bytes(out)
+
+
+def iwa(objects):
+    stream = b""
+    for identifier, message_type, payload in objects:
+        info = message(field(1, identifier), field(2, message(field(1, message_type), field(3, len(payload)))))
+        stream += varint(len(info)) + info + payload
+    block = snappy_literals(stream)
+    return b"\x00" + len(block).to_bytes(3, "little") + block
+
+
+def decimal128(mantissa, exponent):
+    bits = abs(mantissa) | ((exponent + 6176) << 113) | ((1 << 127) if mantissa < 0 else 0)
+    return bits.to_bytes(16, "little")
+
+
+def cell(cell_type, decimal=None, double=None, seconds=None, string_id=None, rich_id=None):
+    flags, body = 0, b""
+    if decimal is not None:
+        flags, body = flags | 0x1, body + decimal128(*decimal)
+    if double is not None:
+        flags, body = flags | 0x2, body + struct.pack("<d", double)
+    if seconds is not None:
+        flags, body = flags | 0x4, body + struct.pack("<d", seconds)
+    if string_id is not None:
+        flags, body = flags | 0x8, body + struct.pack("<I", string_id)
+    if rich_id is not None:
+        flags, body = flags | 0x10, body + struct.pack("<I", rich_id)
+    return bytes([5, cell_type, 0, 0, 0, 0, 0, 0]) + struct.pack("<I", flags) + body
+
+
+def row_info(index, cells, wide=False):
+    storage, offsets = b"", [-1] * 256
+    for column, data in cells.items():
+        offsets[column] = len(storage) // 4 if wide else len(storage)
+        storage += data
+    return message(field(1, index), field(2, len(cells)), field(6, storage),
+                   field(7, struct.pack("<256h", *offsets)), field(8, int(wide)))
+
+
+def build_objects():
+    """Document with a 'Sales' sheet (Orders table, a shape) and an empty sheet"""
+    string_list = message(field(1, 1), field(2, 4),
+                          *[field(3, message(field(1, key), field(2, 1), field(3, text)))
+                            for key, text in ((1, "Name"), (2, "Amount"), (3, "Paid"))])
+    rich_list = message(field(1, 8), field(2, 2), field(3, message(field(1, 1), field(2, 1), field(9, ref(11)))))
+    tile0 = message(field(1, 2), field(2, 3), field(3, 9), field(4, 3),
+                    field(5, row_info(0, {0: cell(3, string_id=1), 1: cell(3, string_id=2),
+                                          2: cell(3, string_id=3)})),
+                    field(5, row_info(1, {0: cell(9, rich_id=1), 1: cell(2, decimal=(12005, -1)),
+                                          2: cell(6, double=1.0)})),
+                    field(5, row_info(2, {0: cell(5, seconds=86400 * 31), 1: cell(10, double=7.0),
+                                          2: cell(6, double=0.0)}, wide=True)))
+    tile1 = message(field(1, 0), field(2, 1), field(3, 1), field(4, 1),
+                    field(5, row_info(1, {1: cell(2, decimal=(-42, 0))})))
+    tiles = message(field(1, message(field(1, 0), field(2, ref(5)))),
+                    field(1, message(field(1, 1), field(2, ref(10)))),
+                    field(2, 256))
+    data_store = message(field(3, tiles), field(4, ref(6)), field(17, ref(7)))
+    model = message(field(1, "table-1"), field(4, data_store), field(6, 258), field(7, 3),
+                    field(8, "Orders"), field(10, 1))
+    return [
+        (1, 1, message(field(1, ref(2)), field(1, ref(20)))),
+        (2, 2, message(field(1, "Sales"), field(2, ref(3)), field(2, ref(9)))),
+        (3, 6000, message(field(2, ref(4)))),
+        (4, 6001, model),
+        (5, 6002, tile0),
+        (6, 6005, string_list),
+        (7, 6005, rich_list),
+        (8, 2001, message(field(3, "Acme "), field(3, "Inc"))),
+        (9, 3004, message(field(1, "shape"))),
+        (10, 6002, tile1),
+        (11, 6218, message(field(1, ref(8)))),
+        (20, 2, message(field(1, "Empty"))),
+    ]
+
+
+def write_numbers(path, objects=None):
+    objects = objects or build_objects()
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("Index/Document.iwa", iwa(objects[:3] + objects[-1:]))
+        zf.writestr("Index/Tables/Tile.iwa", iwa(objects[3:-1]))
+        zf.writestr("Metadata/Properties.plist", b"")
+    return path
+
+
+class TestNumbersNative:
+    """Test suite for numbers_native"""
+
+    @pytest.fixture
+    def numbers_file(self, tmp_path):
+        return write_numbers(tmp_path / "Orders.numbers")
+
+    def test_snappy_copies(self):
+        """Test literal, overlapping and 2-byte-offset copy elements"""
+        overlapping = bytes([10, 0x08]) + b"abc" + bytes([0x09, 0x03, 0x00]) + b"X"
+        assert numbers_native.snappy_decompress(overlapping) == b"abcabcabcX"
+
+        two_byte = bytes([24, 12 << 2]) + b"hello world, " + bytes([(11 - 1) << 2 | 2, 13, 0])
+        assert numbers_native.snappy_decompress(two_byte) == b"hello world, hello world"
+
+        with pytest.raises(NumbersFileError):
+            numbers_native.snappy_decompress(bytes([4, 0x09, 0x05]))
+
+    def test_decimal128(self):
+        """Test decimal128 values decode exactly, integers as int"""
+        assert numbers_native.decode_decimal128(decimal128(12005, -1)) == 1200.5
+        assert numbers_native.decode_decimal128(decimal128(-42, 0)) == -42
+        assert numbers_native.decode_decimal128(decimal128(3, 2)) == 300
+
+    def test_layout(self, numbers_file):
+        """Test sheets and tables are found; non-table drawables are skipped"""
+        with NumbersFile(numbers_file) as doc:
+            assert [(sheet, table["name"], table["rows"], table["columns"], table["header_rows"])
+                    for sheet, table in doc.tables()] == [("Sales", "Orders", 258, 3, 1)]
+            assert [sheet["name"] for sheet in doc.layout["sheets"]] == ["Sales", "Empty"]
+
+    def test_cell_values(self, numbers_file):
+        """Test text, rich text, numbers, currency, booleans, dates and blanks"""
+        with NumbersFile(numbers_file) as doc:
+            rows = list(doc.iter_rows(rows=(1, 4)))
+
+        assert rows[0] == ["Name", "Amount", "Paid"]
+        assert rows[1] == ["Acme Inc", 1200.5, True]
+        assert rows[2] == [datetime(2001, 2, 1), 7, False]
+        assert rows[3] == [None, None, None]
+
+    def test_numbers_saved_document(self):
+        """Test a blank document saved by Numbers: real archive layout, one empty 1x1 table"""
+        with NumbersFile(FIXTURES / "numbers-saved-empty.numbers") as doc:
+            assert [(sheet, table["name"], table["rows"], table["columns"])
+                    for sheet, table in doc.tables()] == [("Sheet 1", "Table 1", 1, 1)]
+            assert list(doc.iter_rows()) == [[None]]
+
+    def test_saved_values(self):
+        """Test values written into the saved template by numbers-parser decode the same"""
+        with NumbersFile(FIXTURES / "orders-values.numbers") as doc:
+            [(sheet, table)] = doc.tables()
+            assert (sheet, table["name"], table["rows"], table["columns"], table["header_rows"]) == \
+                ("Sales", "Orders", 12, 8, 1)
+            rows = [row[:4] for row in doc.iter_rows(rows=(1, 4))]
+
+        assert rows == [["Name", "Amount", "Paid", "When"],
+                        ["Acme Inc", 1200.5, True, datetime(2026, 3, 1)],
+                        ["00123", -42, False, None],
+                        [None, None, None, None]]
+
+    def test_second_tile_and_windows(self, numbers_file):
+        """Test rows in later tiles land at tileid * tile size and windows apply"""
+        with NumbersFile(numbers_file) as doc:
+            assert list(doc.iter_rows(rows=(258, None), columns=(2, 3))) == [[-42, None]]
+            assert len(list(doc.iter_rows(chunk_rows=100))) == 258
+
+    def test_package_directory(self, tmp_path):
+        """Test a .numbers package directory with loose Index/*.iwa files"""
+        package = tmp_path / "Orders.numbers"
+        (package / "Index").mkdir(parents=True)
+        (package / "Index" / "Document.iwa").write_bytes(iwa(build_objects()))
+
+        with NumbersFile(package) as doc:
+            assert next(doc.iter_rows())[0] == "Name"
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test a non-.numbers file raises NumbersFileError"""
+        bogus = tmp_path / "notes.numbers"
+        bogus.write_text("not a zip")
+        with pytest.raises(NumbersFileError):
+            with NumbersFile(bogus):
+                pass
+
+    def test_read_spreadsheet_native(self, numbers_file, capsys):
+        """Test read_numbers_spreadsheet --native needs no Numbers.app"""
+        assert read_numbers_spreadsheet(numbers_file, rows=(1, 2), as_json=True, native=True)
+        assert '"Acme Inc"' in capsys.readouterr().out
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_batch_export(self, tmp_path, workers):
+        """Test folder export in-process and in a process pool, with one bad file"""
+        source = tmp_path / "in"
+        source.mkdir()
+        write_numbers(source / "a.numbers")
+        write_numbers(source / "b.numbers")
+        (source / "broken.numbers").write_bytes(b"PK\x05\x06" + b"\x00" * 18)
+
+        exported, failed = numbers_native.export_numbers_files([source], tmp_path / "out", workers=workers)
+
+        assert (exported, failed) == (2, 1)
+        with open(tmp_path / "out" / "a.csv", newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[1] == ["Acme Inc", "1200.5", "TRUE"]
+        assert rows[2] == ["2001-02-01", "7", "FALSE"]
+        assert len(rows) == 258
+
+    def test_batch_export_same_names(self, tmp_path):
+        """Test same-named files in different folders get their own CSV files"""
+        source = tmp_path / "in"
+        for folder in ("q1", "q2"):
+            (source / folder).mkdir(parents=True)
+            write_numbers(source / folder / "report.numbers")
+        write_numbers(tmp_path / "report.numbers")
+        out = tmp_path / "out"
+
+        assert numbers_native.export_numbers_files([source, tmp_path / "report.numbers"], out, workers=2) == (3, 0)
+        assert sorted(str(p.relative_to(out)) for p in out.rglob("*.csv")) == [
+            "q1/report.csv", "q2/report.csv", "report.csv"]
+
+        assert numbers_native.export_numbers_files([source / "q1" / "report.numbers",
+                                                    source / "q2" / "report.numbers"], out, workers=1) == (2, 0)
+        assert (out / "report-2.csv").exists()
@@ -0,0 +1,92 @@
+"""
+Unit Tests for read_numbers_spreadsheet
+Tests typed decoding, row/column windows and chunked reads over fake JXA results
+"""
+
+import json
+import pathlib
+import sys
+from datetime import datetime
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-numbers" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import read_numbers_spreadsheet as reader
+
+
+class FakeNumbers:
+    """Two sheets; 'Data' has a 10x4 table of numbers, 'Meta' a 2x2 typed table"""
+
+    def __init__(self):
+        self.sheets = {
+            ("Data", "Ledger"): [[r * 10 + c for c in range(1, 5)] for r in range(1, 11)],
+            ("Meta", "Info"): [["Created", {"$date": "2026-01-02T00:00:00.000Z"}], ["Final", True]],
+        }
+        self.reads = []
+
+    def __call__(self, script, payload=None, timeout=120):
+        if script is reader.DOCUMENT_LAYOUT_JXA:
+            return {"was_open": True, "sheets": [
+                {"name": "Data", "tables": [{"name": "Ledger", "rows": 10, "columns": 4, "header_rows": 0}]},
+                {"name": "Meta", "tables": [{"name": "Info", "rows": 2, "columns": 2, "header_rows": 0}]},
+            ]}
+        if script is reader.READ_BLOCK_JXA:
+            self.reads.append((payload["sheet"], payload["first_row"], payload["last_row"]))
+            rows = self.sheets[(payload["sheet"], payload["table"])]
+            return [row[payload["first_column"] - 1:payload["last_column"]]
+                    for row in rows[payload["first_row"] - 1:payload["last_row"]]]
+        raise AssertionError("unexpected JXA program")
+
+
+class TestReadNumbersSpreadsheet:
+    """Test suite for read_numbers_spreadsheet"""
+
+    @pytest.fixture
+    def fake_numbers(self, monkeypatch):
+        fake = FakeNumbers()
+        monkeypatch.setattr(reader, "run_jxa", fake)
+        return fake
+
+    def test_parse_and_clamp_windows(self):
+        """Test window syntax and clamping to the table size"""
+        assert reader.parse_window("2:5") == (2, 5)
+        assert reader.parse_window("3:") == (3, None)
+        assert reader.parse_window("7") == (7, 7)
+        assert reader.clamp_window((3, None), 10) == (3, 10)
+        assert reader.clamp_window((8, 50), 10) == (8, 10)
+        assert reader.clamp_window((11, None), 10) is None
+
+    def test_iter_rows_is_chunked_and_lazy(self, fake_numbers):
+        """Test rows stream block by block and windows are honored"""
+        rows = reader.iter_rows("book.numbers", rows=(2, 8), columns=(2, 3), chunk_rows=3)
+
+        assert next(rows) == [22, 23]
+        assert fake_numbers.reads == [("Data", 2, 4)]
+        remaining = list(rows)
+        assert remaining[-1] == [82, 83] and len(remaining) == 6
+        assert fake_numbers.reads == [("Data", 2, 4), ("Data", 5, 7), ("Data", 8, 8)]
+
+    def test_typed_values(self, fake_numbers):
+        """Test dates and booleans come back as Python types"""
+        rows = list(reader.iter_rows("book.numbers", sheet="Meta"))
+
+        assert isinstance(rows[0][1], datetime)
+        assert rows[1] == ["Final", True]
+
+    def test_missing_table(self, fake_numbers):
+        """Test unknown sheet or table names raise LookupError"""
+        with pytest.raises(LookupError):
+            list(reader.iter_rows("book.numbers", sheet="Data", table="Nope"))
+
+    def test_all_tables_as_json(self, fake_numbers, capsys):
+        """Test --all --json prints one JSON object per row across tables"""
+        assert reader.read_numbers_spreadsheet("book.numbers", all_tables=True, as_json=True)
+
+        lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert len(lines) == 12
+        assert lines[-1] == {"sheet": "Meta", "table": "Info", "row": ["Final", True]}
+        assert lines[-2]["row"][1].startswith("2026-01-0")
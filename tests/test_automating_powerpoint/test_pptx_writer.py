@@ -0,0 +1,259 @@
+"""
+Unit Tests for pptx_writer
+Tests the PowerPoint-free .pptx writer against package fixtures and the --native markdown build
+"""
+
+import pathlib
+import posixpath
+import struct
+import sys
+import time
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-powerpoint" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import markdown_to_powerpoint as builder
+import pptx_writer
+from pptx_writer import PptxError, PptxWriter, read_outline
+
+CT = "{http://schemas.openxmlformats.org/package/2006/content-types}"
+RELS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+PML = "application/vnd.openxmlformats-officedocument.presentationml"
+
+# Root element each content type must have
+ROOTS = {
+    f"{PML}.presentation.main+xml": f"{P}presentation",
+    f"{PML}.slide+xml": f"{P}sld",
+    f"{PML}.slideLayout+xml": f"{P}sldLayout",
+    f"{PML}.slideMaster+xml": f"{P}sldMaster",
+    f"{PML}.notesSlide+xml": f"{P}notes",
+    f"{PML}.notesMaster+xml": f"{P}notesMaster",
+    f"{PML}.presProps+xml": f"{P}presentationPr",
+    f"{PML}.viewProps+xml": f"{P}viewPr",
+    f"{PML}.tableStyles+xml": "{http://schemas.openxmlformats.org/drawingml/2006/main}tblStyleLst",
+    "application/vnd.openxmlformats-officedocument.theme+xml":
+        "{http://schemas.openxmlformats.org/drawingml/2006/main}theme",
+}
+
+# A bullets slide with nested items, a numbered item, code and a picture beside the text
+SLIDE_FIXTURE = (
+    '<p:sld xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" '
+    'xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><p:cSld><p:spTree>'
+    '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr><p:grpSpPr><a:xfrm>'
+    '<a:off x="0" y="0"/><a:ext cx="0" cy="0"/><a:chOff x="0" y="0"/><a:chExt cx="0" cy="0"/></a:xfrm>'
+    '</p:grpSpPr>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="2" name="Title 1"/><p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+    '<p:nvPr><p:ph type="title"/></p:nvPr></p:nvSpPr><p:spPr/><p:txBody><a:bodyPr/><a:lstStyle/>'
+    '<a:p><a:pPr marL="0" lvl="0" indent="0"><a:buNone/></a:pPr><a:r><a:rPr lang="en-US" dirty="0"/>'
+    '<a:t>Q3 &amp; Q4</a:t></a:r><a:endParaRPr lang="en-US" dirty="0"/></a:p></p:txBody></p:sp>'
+    '<p:sp><p:nvSpPr><p:cNvPr id="3" name="Content Placeholder 2"/><p:cNvSpPr><a:spLocks noGrp="1"/>'
+    '</p:cNvSpPr><p:nvPr><p:ph idx="1"/></p:nvPr></p:nvSpPr><p:spPr><a:xfrm><a:off x="838200" y="1825625"/>'
+    '<a:ext cx="5143500" cy="4351338"/></a:xfrm></p:spPr><p:txBody><a:bodyPr/><a:lstStyle/>'
+    '<a:p><a:pPr lvl="0"/><a:r><a:rPr lang="en-US" dirty="0"/><a:t>North</a:t></a:r>'
+    '<a:endParaRPr lang="en-US" dirty="0"/></a:p>'
+    '<a:p><a:pPr lvl="1"/><a:r><a:rPr lang="en-US" dirty="0"/><a:t>Stores open</a:t></a:r>'
+    '<a:endParaRPr lang="en-US" dirty="0"/></a:p>'
+    '<a:p><a:pPr marL="0" lvl="0" indent="0"><a:buNone/></a:pPr><a:r><a:rPr lang="en-US" dirty="0"/>'
+    '<a:t>1. First</a:t></a:r><a:endParaRPr lang="en-US" dirty="0"/></a:p>'
+    '<a:p><a:pPr marL="0" lvl="0" indent="0"><a:buNone/></a:pPr><a:r><a:rPr lang="en-US" dirty="0">'
+    '<a:latin typeface="Courier New"/></a:rPr><a:t>x = 1</a:t></a:r><a:endParaRPr lang="en-US" dirty="0"/></a:p>'
+    '</p:txBody></p:sp>'
+    '<p:pic><p:nvPicPr><p:cNvPr id="4" name="Picture 1" descr="chart.png"/><p:cNvPicPr>'
+    '<a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr><p:blipFill><a:blip r:embed="rId2"/>'
+    '<a:stretch><a:fillRect/></a:stretch></p:blipFill><p:spPr><a:xfrm><a:off x="6210300" y="2429955"/>'
+    '<a:ext cx="5143500" cy="3142678"/></a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr>'
+    '</p:pic></p:spTree></p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr></p:sld>'
+)
+
+DECK = '''# Weekly review
+Numbers for the week
+
+---
+
+## Highlights
+- Revenue **up**
+  - North
+1. Ship it
+
+```
+total = 1
+```
+
+Notes:
+Mention the North numbers.
+
+---
+
+## Chart
+![Sales](chart.png)
+
+---
+
+## Remote
+![Logo](https://example.com/logo.png)
+'''
+
+
+def png(width, height):
+    """A valid PNG of the given size"""
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+    raw = b"".join(b"\x00" + b"\x00\x00\x00" * width for _ in range(height))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)) +
+            chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+
+def canonical(xml):
+    return ET.canonicalize(xml, strip_text=True)
+
+
+def validate_package(path):
+    """Check the package the way an OOXML consumer would; returns {part name: bytes}"""
+    with zipfile.ZipFile(path) as package:
+        parts = {name: package.read(name) for name in package.namelist()}
+
+    types = ET.fromstring(parts["[Content_Types].xml"])
+    defaults = {d.get("Extension"): d.get("ContentType") for d in types.iter(f"{CT}Default")}
+    overrides = {o.get("PartName").lstrip("/"): o.get("ContentType") for o in types.iter(f"{CT}Override")}
+    assert set(overrides) <= set(parts), "content type for a missing part"
+
+    for name, data in parts.items():
+        if name == "[Content_Types].xml":
+            continue
+        content_type = overrides.get(name) or defaults.get(name.rsplit(".", 1)[-1])
+        assert content_type, f"no content type for {name}"
+        if content_type.startswith("image/"):
+            continue
+        root = ET.fromstring(data)
+        if content_type in ROOTS:
+            assert root.tag == ROOTS[content_type], name
+
+        if name.endswith(".rels"):
+            folder = name.split("_rels/")[0]
+            ids = [rel.get("Id") for rel in root.iter(f"{RELS}Relationship")]
+            assert len(ids) == len(set(ids)), f"duplicate relationship ids in {name}"
+            for rel in root.iter(f"{RELS}Relationship"):
+                target = posixpath.normpath(posixpath.join(folder, rel.get("Target")))
+                assert target in parts, f"{name} points at missing {target}"
+
+    presentation = ET.fromstring(parts["ppt/presentation.xml"])
+    slide_ids = [int(s.get("id")) for s in presentation.iter(f"{P}sldId")]
+    assert len(slide_ids) == len(set(slide_ids)) and all(256 <= i < 2147483648 for i in slide_ids)
+    master_ids = [int(e.get("id")) for e in presentation.iter(f"{P}sldMasterId")]
+    layout_ids = [int(e.get("id")) for e in ET.fromstring(parts["ppt/slideMasters/slideMaster1.xml"]).iter(
+        f"{P}sldLayoutId")]
+    assert all(i >= 2147483648 for i in master_ids + layout_ids)
+    assert len(set(master_ids + layout_ids)) == len(master_ids + layout_ids)
+    return parts
+
+
+class TestPptxWriter:
+    """Test suite for pptx_writer and markdown_to_powerpoint --native"""
+
+    @pytest.fixture(autouse=True)
+    def cache_home(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    def test_slide_matches_fixture(self, tmp_path):
+        """Test a bullets slide with a picture renders exactly as the fixture"""
+        (tmp_path / "chart.png").write_bytes(png(1000, 611))
+        deck = tmp_path / "deck.pptx"
+        with PptxWriter(deck, "Deck") as writer:
+            writer.add_slide("bullets", "Q3 & Q4", [(0, "North", "bullet"), (1, "Stores open", "bullet"),
+                                                     (0, "1. First", "plain"), (0, "x = 1", "code")],
+                             images=[str(tmp_path / "chart.png")])
+
+        parts = validate_package(deck)
+        assert canonical(parts["ppt/slides/slide1.xml"]) == canonical(SLIDE_FIXTURE)
+        assert "ppt/notesMasters/notesMaster1.xml" not in parts
+
+    def test_package_is_valid(self, tmp_path):
+        """Test every layout, notes and shared media produce a consistent package"""
+        (tmp_path / "a.png").write_bytes(png(4, 3))
+        deck = tmp_path / "deck.pptx"
+        with PptxWriter(deck, "Deck") as writer:
+            writer.add_slide("title", "Deck", [(0, "Subtitle", "plain")])
+            writer.add_slide("bullets", "Points", [(0, "a", "bullet")], notes="first\nsecond")
+            writer.add_slide("photo", "Picture", images=[str(tmp_path / "a.png"), str(tmp_path / "a.png")])
+            warnings = writer.add_slide("title_only", "End", images=[str(tmp_path / "missing.png"),
+                                                                      str(tmp_path / "a.svg")])
+
+        parts = validate_package(deck)
+        assert [name for name in parts if name.startswith("ppt/media/")] == ["ppt/media/image1.png"]
+        assert len(warnings) == 2 and "unsupported" in warnings[1]
+        assert [s["title"] for s in read_outline(deck)] == ["Deck", "Points", "Picture", "End"]
+        assert read_outline(deck)[1]["notes"] == "first\nsecond"
+        assert b'type="ctrTitle"' in parts["ppt/slides/slide1.xml"]
+
+    def test_text_is_escaped(self, tmp_path):
+        """Test markup characters and control characters can't break the XML"""
+        deck = tmp_path / "deck.pptx"
+        with PptxWriter(deck) as writer:
+            writer.add_slide("bullets", "<b>&", [(0, "a\x01b ]]> \"q\"", "bullet")])
+        validate_package(deck)
+        assert read_outline(deck) == [{"title": "<b>&", "body": ['ab ]]> "q"'], "notes": ""}]
+
+    def test_failure_removes_partial_file(self, tmp_path):
+        """Test an unknown layout raises and no half-written deck is left"""
+        deck = tmp_path / "deck.pptx"
+        with pytest.raises(PptxError):
+            with PptxWriter(deck) as writer:
+                writer.add_slide("bullets", "ok")
+                writer.add_slide("two_column", "nope")
+        assert not deck.exists()
+
+    def test_image_sizes(self):
+        """Test pixel sizes are read from PNG, GIF and JPEG headers"""
+        jpeg = (b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+                b"\xff\xc0\x00\x11\x08\x01\xe0\x02\x80\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01")
+        assert pptx_writer.image_size(png(640, 480)) == (640, 480)
+        assert pptx_writer.image_size(b"GIF89a\x20\x00\x10\x00" + b"\x00" * 8) == (32, 16)
+        assert pptx_writer.image_size(jpeg) == (640, 480)
+        assert pptx_writer.image_size(b"not an image") is None
+
+    def test_native_markdown_build(self, tmp_path, capsys):
+        """Test --native builds the deck from markdown without PowerPoint"""
+        (tmp_path / "chart.png").write_bytes(png(8, 6))
+        source = tmp_path / "weekly.md"
+        source.write_text(DECK, encoding="utf-8")
+
+        assert builder.create_powerpoint_from_markdown(str(source), "Weekly: Review", native=True)
+
+        deck = tmp_path / "Weekly- Review.pptx"
+        parts = validate_package(deck)
+        outline = read_outline(deck)
+        assert [s["title"] for s in outline] == ["Weekly review", "Highlights", "Chart", "Remote"]
+        assert outline[0]["body"] == ["Numbers for the week"]
+        assert outline[1]["body"] == ["Revenue up", "North", "1. Ship it", "total = 1"]
+        assert outline[1]["notes"] == "Mention the North numbers."
+        assert b"p:pic" in parts["ppt/slides/slide3.xml"] and b"p:pic" not in parts["ppt/slides/slide4.xml"]
+        assert "Saved to:" in capsys.readouterr().out
+
+    def test_output_path_needs_native(self, tmp_path, capsys):
+        """Test an output path without --native is rejected instead of silently dropped"""
+        source = tmp_path / "weekly.md"
+        source.write_text(DECK, encoding="utf-8")
+
+        assert not builder.create_powerpoint_from_markdown(str(source), "Weekly", str(tmp_path / "out.pptx"))
+        assert "needs --native" in capsys.readouterr().out
+        assert not (tmp_path / "out.pptx").exists()
+
+    @pytest.mark.slow
+    def test_large_deck_is_fast(self, tmp_path):
+        """Test a 1,000-slide deck is written in well under a few seconds"""
+        import slide_markdown  # on the path through markdown_to_powerpoint
+
+        slides = slide_markdown.parse_markdown_slides(slide_markdown.generate_corpus(1000))
+        started = time.monotonic()
+        builder.write_native(slides, tmp_path / "big.pptx", "Benchmark", str(tmp_path))
+        assert time.monotonic() - started < 5
+        assert len(read_outline(tmp_path / "big.pptx")) == 1000
@@ -0,0 +1,140 @@
+"""
+Unit Tests for batch reminder creation
+Tests row parsing, chunked creation, list resolution and manifest retries
+"""
+
+import json
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-reminders" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import batch_create_reminders as batch
+
+
+class FakeReminders:
+    """Creates reminders in memory; titles starting with FAIL are rejected"""
+
+    def __init__(self):
+        self.lists = {"Reminders": "L0"}
+        self.created = []
+        self.calls = []
+
+    def __call__(self, script, payload=None, timeout=120):
+        self.calls.append(script)
+        if script is batch.ENSURE_LISTS_JXA:
+            for name in payload["names"]:
+                self.lists.setdefault(name, f"L-{name}")
+            return dict(self.lists)
+        if script is batch.CREATE_REMINDERS_JXA:
+            results = []
+            for item in payload["items"]:
+                if item["title"].startswith("FAIL"):
+                    results.append({"row": item["row"], "error": "rejected"})
+                else:
+                    self.created.append(item)
+                    results.append({"row": item["row"], "id": f"R{item['row']}"})
+            return results
+        raise AssertionError("unexpected JXA program")
+
+
+class TestBatchCreateReminders:
+    """Test suite for batch_create_reminders"""
+
+    @pytest.fixture
+    def fake_reminders(self, monkeypatch):
+        fake = FakeReminders()
+        monkeypatch.setattr(batch, "run_jxa", fake)
+        return fake
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        path = tmp_path / "kickoff.csv"
+        path.write_text(
+            "title,list,due,priority,notes\n"
+            "Book room,Project,2026-05-01 09:00,high,Big one\n"
+            "Send invites,Project,2026-05-02,,\n"
+            "FAIL this,Project,,,\n"
+            ",Project,,,\n"
+            "Buy snacks,,,low,\n"
+        )
+        return path
+
+    def test_normalize_row(self):
+        """Test defaults, priority names and date validation"""
+        row = batch.normalize_row({"Name": " Call ", "Priority": "medium", "due": "2026-05-01"}, "Inbox")
+        assert row["title"] == "Call" and row["list"] == "Inbox" and row["priority"] == 5
+        assert row["due"].startswith("2026-05-01T00:00:00")
+
+        with pytest.raises(ValueError):
+            batch.normalize_row({"title": "x", "due": "next week"})
+        with pytest.raises(ValueError):
+            batch.normalize_row({"title": "x", "priority": "urgent"})
+        with pytest.raises(ValueError):
+            batch.normalize_row({"title": ""})
+
+    def test_iter_rows_jsonl(self, tmp_path):
+        """Test JSON Lines rows keep their line numbers and bad lines surface as rows"""
+        path = tmp_path / "rows.jsonl"
+        path.write_text('{"title": "a"}\n\n{broken\n{"title": "b"}\n')
+
+        rows = list(batch.iter_rows(path))
+        assert [number for number, _ in rows] == [1, 3, 4]
+        with pytest.raises(ValueError):
+            batch.normalize_row(rows[1][1])
+
+    def test_batch_creates_in_chunks(self, fake_reminders, csv_file):
+        """Test lists are resolved once and rows are sent in chunks"""
+        created, failed = batch.batch_create_reminders(csv_file, chunk_size=2)
+
+        assert (created, failed) == (3, 2)
+        assert fake_reminders.calls.count(batch.ENSURE_LISTS_JXA) == 1
+        assert fake_reminders.calls.count(batch.CREATE_REMINDERS_JXA) == 2
+        assert {item["list_id"] for item in fake_reminders.created} == {"L-Project", "L0"}
+
+        entries = [json.loads(line) for line in open(batch.manifest_path_for(csv_file))]
+        assert sorted(e["row"] for e in entries if e["status"] == "created") == [1, 2, 5]
+        assert sorted(e["row"] for e in entries if e["status"] == "failed") == [3, 4]
+
+    def test_rerun_retries_only_failed_rows(self, fake_reminders, csv_file):
+        """Test the manifest makes re-runs skip rows that were created"""
+        batch.batch_create_reminders(csv_file)
+        fake_reminders.created.clear()
+
+        csv_file.write_text(csv_file.read_text().replace("FAIL this", "Fixed this"))
+        created, failed = batch.batch_create_reminders(csv_file)
+
+        assert (created, failed) == (1, 1)
+        assert [item["title"] for item in fake_reminders.created] == ["Fixed this"]
+        assert sum(batch.load_created_keys(batch.manifest_path_for(csv_file)).values()) == 4
+
+    def test_rerun_matches_rows_by_content(self, fake_reminders, csv_file):
+        """Test rows inserted above created ones don't shift them into being created again"""
+        batch.batch_create_reminders(csv_file)
+        fake_reminders.created.clear()
+
+        header, rest = csv_file.read_text().split("\n", 1)
+        csv_file.write_text(f"{header}\nNew first,Project,,,\nBuy snacks,,,low,\n{rest}")
+        created, failed = batch.batch_create_reminders(csv_file)
+
+        assert (created, failed) == (2, 2)
+        assert [item["title"] for item in fake_reminders.created] == ["New first", "Buy snacks"]
+
+    def test_rerun_after_truncated_manifest(self, fake_reminders, csv_file):
+        """Test entries written after a cut-short manifest line are still read back"""
+        batch.batch_create_reminders(csv_file)
+        manifest = batch.manifest_path_for(csv_file)
+        with open(manifest, 'a', encoding='utf-8') as f:
+            f.write('{"row": 9, "key": "abc", "sta')
+
+        csv_file.write_text(csv_file.read_text().replace("FAIL this", "Fixed this"))
+        batch.batch_create_reminders(csv_file)
+        fake_reminders.created.clear()
+
+        assert batch.batch_create_reminders(csv_file) == (0, 1)
+        assert fake_reminders.created == []
@@ -0,0 +1,75 @@
+"""
+Unit Tests for complete_reminders
+Tests per-list counts and the dry-run diff over bulk JXA results
+"""
+
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-reminders" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import complete_reminders
+
+
+class TestCompleteReminders:
+    """Test suite for complete_reminders"""
+
+    @pytest.fixture
+    def fake_jxa(self, monkeypatch):
+        """Returns per-list matches; completes all but one in Home on a real run"""
+        calls = []
+
+        def fake_run_jxa(script, payload=None, timeout=120):
+            calls.append(payload)
+            dry = payload["dry_run"]
+            return [
+                {"list": "Work", "ids": ["w1", "w2"], "names": ["Sprint demo", "Sprint retro"],
+                 "completed": 0 if dry else 2},
+                {"list": "Home", "ids": ["h1", "h2"], "names": ["Sprint shopping", "Sprint plan"],
+                 "completed": 0 if dry else 1},
+                {"list": "Empty", "ids": [], "names": [], "completed": 0},
+            ]
+
+        monkeypatch.setattr(complete_reminders, "run_jxa", fake_run_jxa)
+        return calls
+
+    def test_format_diff(self):
+        """Test the diff has one hunk per list with matches"""
+        lines = complete_reminders.format_diff([
+            {"list": "Work", "ids": ["w1"], "names": ["Demo"], "completed": 0},
+            {"list": "Empty", "ids": [], "names": [], "completed": 0},
+        ])
+
+        assert lines == ["@@ Work (1 matching) @@", "- [ ] Demo", "+ [x] Demo"]
+
+    def test_dry_run_prints_diff(self, fake_jxa, capsys):
+        """Test dry run passes the flag through and reports what would change"""
+        count = complete_reminders.complete_reminders("sprint", dry_run=True)
+
+        out = capsys.readouterr().out
+        assert count == 4
+        assert fake_jxa == [{"pattern": "sprint", "list": None, "dry_run": True}]
+        assert "+ [x] Sprint retro" in out
+        assert "Empty" not in out
+
+    def test_completion_counts(self, fake_jxa, capsys):
+        """Test per-list counts and partial failures are reported"""
+        count = complete_reminders.complete_reminders("sprint")
+
+        out = capsys.readouterr().out
+        assert count == 3
+        assert "Work: completed 2 of 2" in out
+        assert "Home: completed 1 of 2" in out
+        assert "1 could not be completed" in out
+
+    def test_missing_list(self, monkeypatch, capsys):
+        """Test an unknown list name is reported"""
+        monkeypatch.setattr(complete_reminders, "run_jxa", lambda *args, **kwargs: [])
+
+        assert complete_reminders.complete_reminders("x", list_name="Nope") == 0
+        assert "List 'Nope' not found" in capsys.readouterr().out
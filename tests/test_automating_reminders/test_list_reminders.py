@@ -0,0 +1,85 @@
+"""
+Unit Tests for list_reminders
+Tests bulk column decoding, local filtering/sorting and JSON output
+"""
+
+import json
+import pathlib
+import sys
+from datetime import datetime
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-reminders" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import list_reminders
+
+
+class TestListReminders:
+    """Test suite for list_reminders"""
+
+    NOW = datetime(2026, 3, 10, 12, 0)
+
+    @pytest.fixture
+    def fake_columns(self, monkeypatch):
+        """One bulk-read result per list, as LIST_REMINDERS_JXA returns it"""
+        calls = []
+        columns = [
+            {"list": "Work", "ids": ["w1", "w2", "w3"], "names": ["Later", "Overdue", "Done"],
+             "completed": [False, False, True],
+             "due": ["2026-04-01T09:00:00.000Z", "2026-03-01T09:00:00.000Z", None],
+             "priority": [0, 1, 0]},
+            {"list": "Home", "ids": ["h1"], "names": ["No date"], "completed": [False],
+             "due": [None], "priority": [5]},
+        ]
+
+        def fake_run_jxa(script, payload=None, timeout=120):
+            calls.append(payload)
+            return columns
+
+        monkeypatch.setattr(list_reminders, "run_jxa", fake_run_jxa)
+        return calls
+
+    def test_fetch_decodes_columns(self, fake_columns):
+        """Test columns are zipped into records with parsed dates"""
+        records = list_reminders.fetch_reminders("Work", show_overdue_only=True)
+
+        assert fake_columns == [{"list": "Work", "completed": False, "overdue": True}]
+        assert [r["id"] for r in records] == ["w1", "w2", "w3", "h1"]
+        assert isinstance(records[0]["due_date"], datetime)
+        assert records[3]["due_date"] is None and records[3]["list"] == "Home"
+
+    def test_filter_and_sort(self, fake_columns):
+        """Test incomplete/overdue filters and per-list due-date ordering"""
+        records = list_reminders.fetch_reminders()
+
+        incomplete = list_reminders.filter_reminders(records, now=self.NOW)
+        assert [r["id"] for r in incomplete] == ["w2", "w1", "h1"]
+
+        overdue = list_reminders.filter_reminders(records, show_overdue_only=True, now=self.NOW)
+        assert [r["id"] for r in overdue] == ["w2"]
+
+        everything = list_reminders.filter_reminders(records, show_completed=True, now=self.NOW)
+        assert [r["id"] for r in everything] == ["w2", "w1", "w3", "h1"]
+
+    def test_render_groups_by_list(self, fake_columns, capsys):
+        """Test rendering prints one header per list and flags overdue items"""
+        records = list_reminders.filter_reminders(list_reminders.fetch_reminders(), now=self.NOW)
+        list_reminders.render_reminders(records, self.NOW)
+
+        out = capsys.readouterr().out
+        assert "📝 Work (2 reminders):" in out
+        assert "📝 Home (1 reminders):" in out
+        assert out.count("🚨 Overdue") == 1
+
+    def test_json_output(self, fake_columns, capsys):
+        """Test --json mode prints machine-readable records"""
+        count = list_reminders.list_reminders(show_completed=True, as_json=True)
+
+        data = json.loads(capsys.readouterr().out)
+        assert count == len(data) == 4
+        assert {"id", "name", "completed", "due_date", "priority", "list"} <= set(data[0])
+        assert data[-1]["due_date"] is None
@@ -0,0 +1,116 @@
+"""
+Unit Tests for the Reminders SQLite mirror
+Tests incremental refresh and the change feed against an in-memory fake backend
+"""
+
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-reminders" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from reminders_mirror import RemindersMirror
+
+
+class FakeBackend:
+    """In-memory Reminders: {list id: (name, {reminder id: record})}"""
+
+    def __init__(self):
+        self.lists = {"L1": ("Work", {}), "L2": ("Home", {})}
+        self.fetched = []
+        self.tick = 0
+
+    def put(self, list_id, reminder_id, name, completed=False, due=None):
+        for _, reminders in self.lists.values():
+            reminders.pop(reminder_id, None)
+        self.tick += 1
+        self.lists[list_id][1][reminder_id] = {"name": name, "completed": completed, "due": due,
+                                               "priority": 0, "body": "", "modified": f"t{self.tick}"}
+
+    def snapshot(self):
+        return [{"id": list_id, "name": name, "reminders": {rid: r["modified"] for rid, r in reminders.items()}}
+                for list_id, (name, reminders) in self.lists.items()]
+
+    def fetch(self, wanted, list_sizes):
+        out = {}
+        for list_id, ids in wanted.items():
+            self.fetched.extend(ids)
+            for rid in ids:
+                record = dict(self.lists[list_id][1][rid])
+                del record["modified"]
+                out[rid] = record
+        return out
+
+
+class TestRemindersMirror:
+    """Test suite for reminders_mirror.RemindersMirror"""
+
+    @pytest.fixture
+    def backend(self):
+        backend = FakeBackend()
+        backend.put("L1", "r1", "Write report", due="2026-05-01T09:00:00.000Z")
+        backend.put("L1", "r2", "Review PR")
+        backend.put("L2", "r3", "Groceries")
+        return backend
+
+    @pytest.fixture
+    def mirror(self):
+        mirror = RemindersMirror(":memory:")
+        yield mirror
+        mirror.close()
+
+    def test_initial_refresh(self, backend, mirror):
+        """Test the first refresh mirrors everything as created"""
+        assert mirror.refresh(backend) == {"created": 3, "updated": 0, "completed": 0, "deleted": 0}
+
+        assert [r["name"] for r in mirror.reminders()] == ["Write report", "Groceries", "Review PR"]
+        assert [r["id"] for r in mirror.reminders("Home")] == ["r3"]
+        assert mirror.cursor() == 3
+
+    def test_refresh_fetches_only_changes(self, backend, mirror):
+        """Test unchanged reminders are not fetched again"""
+        mirror.refresh(backend)
+        backend.fetched.clear()
+
+        assert mirror.refresh(backend) == {"created": 0, "updated": 0, "completed": 0, "deleted": 0}
+        assert backend.fetched == []
+
+        backend.put("L1", "r2", "Review PR #42")
+        mirror.refresh(backend)
+        assert backend.fetched == ["r2"]
+
+    def test_change_feed(self, backend, mirror):
+        """Test created/updated/completed/deleted events since a cursor"""
+        mirror.refresh(backend)
+        cursor = mirror.cursor()
+
+        backend.put("L1", "r1", "Write report", completed=True)
+        backend.put("L2", "r2", "Review PR")          # moved to another list
+        del backend.lists["L2"][1]["r3"]
+        backend.put("L2", "r4", "Call plumber")
+        mirror.refresh(backend)
+
+        changes, new_cursor = mirror.changes(cursor)
+        kinds = {change["id"]: change["kind"] for change in changes}
+        assert kinds == {"r1": "completed", "r2": "updated", "r3": "deleted", "r4": "created"}
+        assert new_cursor == mirror.cursor() == cursor + 4
+
+        by_id = {change["id"]: change for change in changes}
+        assert by_id["r2"]["reminder"]["list"] == "Home"
+        assert by_id["r3"]["reminder"] is None
+        assert mirror.changes(new_cursor) == ([], new_cursor)
+
+    def test_changes_limit_and_completed_filter(self, backend, mirror):
+        """Test paging through the feed and hiding completed reminders"""
+        mirror.refresh(backend)
+        backend.put("L1", "r1", "Write report", completed=True)
+        mirror.refresh(backend)
+
+        page, cursor = mirror.changes(0, limit=2)
+        assert [c["seq"] for c in page] == [1, 2] and cursor == 2
+        assert "r1" not in [r["id"] for r in mirror.reminders()]
+        assert "r1" in [r["id"] for r in mirror.reminders(include_completed=True)]
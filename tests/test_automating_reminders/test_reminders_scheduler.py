@@ -0,0 +1,165 @@
+"""
+Unit Tests for the Reminders due-date scheduler
+Tests heap ordering, incremental resync and hook dispatch with a fake clock
+"""
+
+import json
+import pathlib
+import sys
+
+import pytest
+
+SCRIPTS_DIR = (pathlib.Path(__file__).resolve().parents[2] / "plugins" / "automating-mac-apps-plugin"
+               / "skills" / "automating-reminders" / "scripts")
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+import reminders_scheduler
+from reminders_scheduler import DueScheduler, NoteAppendHook, ShellHook, WebhookHook
+
+
+class FakeSource:
+    """In-memory stand-in for JXARemindersSource"""
+
+    def __init__(self):
+        self.reminders = {}
+        self.reads = 0
+
+    def add(self, reminder_id, due, name=None, modified="m1"):
+        self.reminders[reminder_id] = {"id": reminder_id, "name": name or reminder_id, "list": "Work",
+                                       "due": due, "modified": modified}
+
+    def incomplete_reminders(self):
+        self.reads += 1
+        return {k: dict(v) for k, v in self.reminders.items()}
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestRemindersScheduler:
+    """Test suite for reminders_scheduler.DueScheduler"""
+
+    @pytest.fixture
+    def setup(self):
+        source, clock, fired = FakeSource(), FakeClock(), []
+        scheduler = DueScheduler(source, [lambda r: fired.append(r["id"])], clock=clock)
+        return source, clock, fired, scheduler
+
+    def test_fires_in_due_order(self, setup):
+        """Test reminders fire once each, earliest first, only when due"""
+        source, clock, fired, scheduler = setup
+        source.add("b", 1200)
+        source.add("a", 1100)
+        source.add("no-date", None)
+        scheduler.sync()
+
+        assert scheduler.next_due() == 1100
+        assert scheduler.run_pending() == []
+
+        clock.now = 1250
+        scheduler.run_pending()
+        assert fired == ["a", "b"]
+        assert scheduler.next_due() is None
+
+        scheduler.sync()
+        scheduler.run_pending()
+        assert fired == ["a", "b"]
+
+    def test_resync_reschedules_changes(self, setup):
+        """Test changed due dates replace old heap entries and removals cancel them"""
+        source, clock, fired, scheduler = setup
+        source.add("moved", 1100)
+        source.add("done", 1150)
+        source.add("same", 1300)
+        scheduler.sync()
+
+        source.add("moved", 1400, modified="m2")
+        del source.reminders["done"]
+        source.add("new", 1120)
+        assert scheduler.sync() == (1, 1, 1)
+
+        clock.now = 1350
+        scheduler.run_pending()
+        assert fired == ["new", "same"]
+
+        clock.now = 1400
+        scheduler.run_pending()
+        assert fired == ["new", "same", "moved"]
+
+    def test_overdue_at_startup(self, setup):
+        """Test reminders already overdue at startup fire only with catch_up"""
+        source, clock, fired, scheduler = setup
+        source.add("late", 900)
+        scheduler.sync()
+        assert scheduler.run_pending() == []
+
+        catch_up_fired = []
+        catching_up = DueScheduler(source, [lambda r: catch_up_fired.append(r["id"])],
+                                   clock=clock, catch_up=True)
+        catching_up.sync()
+        catching_up.run_pending()
+        assert catch_up_fired == ["late"]
+
+    def test_failing_hook_does_not_stop_others(self, setup, capsys):
+        """Test one hook's error is reported and the next hook still runs"""
+        source, clock, fired, scheduler = setup
+
+        def broken(reminder):
+            raise RuntimeError("boom")
+
+        scheduler.hooks.insert(0, broken)
+        source.add("x", 1010)
+        scheduler.sync()
+        clock.now = 1010
+        scheduler.run_pending()
+
+        assert fired == ["x"]
+        assert "boom" in capsys.readouterr().out
+
+    def test_shell_hook(self, tmp_path):
+        """Test the shell hook gets the reminder in env vars and on stdin"""
+        out = tmp_path / "out.json"
+        script = (f"import json, os, sys; d = json.load(sys.stdin); "
+                  f"open({str(out)!r}, 'w').write(json.dumps([os.environ['REMINDER_NAME'], d['id']]))")
+        hook = ShellHook(f"{sys.executable} -c \"{script}\"")
+
+        hook({"id": "r1", "name": "Standup", "list": "Work", "due": 1000.0, "modified": None})
+        assert json.loads(out.read_text()) == ["Standup", "r1"]
+
+    def test_note_hook_escapes_html(self, monkeypatch):
+        """Test reminder and list names can't inject markup into the note"""
+        calls = []
+        monkeypatch.setattr(reminders_scheduler.jxa_runner, "run_jxa",
+                            lambda app, script, payload, timeout: calls.append((app, payload)))
+        NoteAppendHook("Reminder Log")({"name": "<b>a & b</b>", "list": "R&D", "due": 0})
+        app, payload = calls[0]
+        assert app == "Notes" and payload["title"] == "Reminder Log"
+        assert payload["line"].endswith(" — &lt;b&gt;a &amp; b&lt;/b&gt; (R&amp;D)</div>")
+
+    def test_hook_failure_is_logged(self, monkeypatch, capsys):
+        """Test a failing Notes append is reported and doesn't stop the other hooks"""
+        def fail(app, script, payload, timeout):
+            raise reminders_scheduler.jxa_runner.JXAError("Notes got an error")
+
+        monkeypatch.setattr(reminders_scheduler.jxa_runner, "run_jxa", fail)
+        seen = []
+        source, clock = FakeSource(), FakeClock()
+        source.add("r1", 1001.0)
+        scheduler = DueScheduler(source, [NoteAppendHook("Reminder Log"), seen.append], clock=clock)
+        scheduler.sync()
+        clock.now = 1002.0
+        scheduler.run_pending()
+        assert [r["id"] for r in seen] == ["r1"]
+        assert "Hook NoteAppendHook failed for 'r1': Notes got an error" in capsys.readouterr().out
+
+    def test_webhook_must_be_local(self):
+        """Test webhooks are limited to local endpoints"""
+        assert WebhookHook("http://localhost:8080/due").url == "http://localhost:8080/due"
+        with pytest.raises(ValueError):
+            WebhookHook("https://example.com/hook")